@@ -136,6 +136,11 @@ from src.database.db import (
 from src.processors.summarizer import summarize_title
 from src.processors.argument_generator import generate_bill_arguments
 from src.utils.sponsor_formatter import format_sponsor_sentence
+from src.utils import http
+from src.fetchers import congress_quota
+
+# Web lookups get the highest Congress.gov quota priority
+congress_quota.set_default_priority("web")
 
 # --- Request ID + security headers ---
 @app.before_request
@@ -402,6 +407,19 @@ def healthz_db():
         return jsonify({"status": "degraded", "db": str(e)}), 503
 
 
+@app.route("/healthz/llm")
+@csrf.exempt
+@limiter.exempt
+def healthz_llm():
+    """LLM provider health: per-model circuit breaker state and call latency (no API call)."""
+    from src.processors.llm_circuit import OPEN, get_circuit_metrics
+    from src.processors.llm_client import get_latency_metrics
+    circuits = get_circuit_metrics()
+    down = bool(circuits) and all(c["state"] == OPEN for c in circuits.values())
+    body = {"status": "degraded" if down else "ok", "circuits": circuits, "latency": get_latency_metrics()}
+    return jsonify(body), 503 if down else 200
+
+
 # --- Routes ---
 @app.route("/")
 def index():
@@ -1481,7 +1499,7 @@ def zip_lookup():
             f"?postalcode={zip_code}&country=US&format=json&limit=1"
         )
         try:
-            resp = requests.get(nominatim_url, timeout=5, headers={
+            resp = http.get(nominatim_url, timeout=5, retries=0, headers={
                 "User-Agent": "TeenCivics/1.0 (civic education platform)"
             })
             resp.raise_for_status()
@@ -1502,7 +1520,7 @@ def zip_lookup():
                 "&benchmark=Public_AR_Current&format=json"
             )
             try:
-                resp2 = requests.get(census_geo_url, timeout=8)
+                resp2 = http.get(census_geo_url, timeout=8, retries=1)
                 resp2.raise_for_status()
                 geo_data2 = resp2.json()
                 matches2 = geo_data2.get("result", {}).get("addressMatches", [])
@@ -1528,7 +1546,7 @@ def zip_lookup():
         )
 
         try:
-            resp3 = requests.get(cd_url, timeout=8)
+            resp3 = http.get(cd_url, timeout=8, retries=1)
             resp3.raise_for_status()
             cd_data = resp3.json()
         except (requests.Timeout, requests.ConnectionError):
@@ -1643,7 +1661,7 @@ def rep_lookup():
         )
 
         try:
-            resp = requests.get(congress_url, timeout=5, headers={
+            resp = http.get(congress_url, timeout=5, retries=1, headers={
                 "Accept": "application/json",
                 "User-Agent": "TeenCivics/1.0"
             })
@@ -1654,6 +1672,11 @@ def rep_lookup():
             return jsonify({
                 "error": "The representative lookup service is slow. Please try again."
             }), 503
+        except congress_quota.QuotaExhausted:
+            logger.warning(f"Congress.gov API quota exhausted for {state}-{district}")
+            return jsonify({
+                "error": "The representative lookup service is busy. Please try again in a few minutes."
+            }), 503
         except Exception as e:
             logger.error(f"Congress.gov API error for {state}-{district}: {e}")
             return jsonify({
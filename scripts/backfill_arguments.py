@@ -17,7 +17,6 @@ Usage:
 
 import os
 import sys
-import time
 import logging
 import argparse
 
@@ -29,13 +28,15 @@ load_dotenv()
 
 from src.database.connection import postgres_connect
 from src.database.db import update_bill_arguments
+from src.fetchers import congress_quota
 from src.processors.argument_generator import generate_bill_arguments
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
-RATE_LIMIT_SECONDS = float(os.getenv("BACKFILL_RATE_LIMIT", "1.5"))
+# Venice calls are paced by the shared rate limiter; batch jobs use spare capacity only
+congress_quota.set_default_priority("backfill")
 
 logging.basicConfig(
     level=logging.INFO,
@@ -134,10 +135,6 @@ def backfill(limit: int = 0, dry_run: bool = False):
             logger.error(f"  ❌ Exception processing {bid}: {e}")
             failed += 1
 
-        # Rate limit between API calls
-        if i < total:
-            time.sleep(RATE_LIMIT_SECONDS)
-
     logger.info("=" * 60)
     logger.info(f"🏁 Backfill complete: {success} succeeded, {failed} failed, {total} total")
     logger.info("=" * 60)
@@ -29,7 +29,6 @@ import logging
 import os
 import re
 import sys
-import time
 from typing import Any, Dict, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
@@ -42,11 +41,12 @@ load_env()
 
 import psycopg2
 import psycopg2.extras
-import requests
 
 from src.database.connection import get_connection_string
 from src.orchestrator import derive_status_from_tracker
 from src.fetchers.congress_fetcher import derive_tracker_from_actions
+from src.fetchers import congress_quota
+from src.utils import http
 from src.utils.validation import is_bill_ready_for_posting
 
 logging.basicConfig(
@@ -104,7 +104,7 @@ def fetch_bill_actions_from_api(bill_type: str, bill_number: str, congress: str)
     url = f"{CONGRESS_API_BASE}/bill/{congress}/{api_type}/{bill_number}/actions"
     params = {"api_key": CONGRESS_API_KEY, "format": "json", "limit": 250}
     try:
-        resp = requests.get(url, params=params, timeout=30)
+        resp = http.get(url, params=params, timeout=30)
         resp.raise_for_status()
         data = resp.json()
         return data.get("actions", [])
@@ -214,6 +214,9 @@ def main() -> None:
 
     abort_if_production(db_url)
 
+    # Background job: pace API calls by the shared quota's backfill class
+    congress_quota.set_default_priority("backfill")
+
     connect_url = db_url
     if "sslmode" not in connect_url:
         sep = "&" if "?" in connect_url else "?"
@@ -301,10 +304,6 @@ def main() -> None:
                 else:
                     still_problematic += 1
 
-            # Rate limit: 1 req/sec to be polite to Congress.gov API
-            if i < len(bills) - 1:
-                time.sleep(0.5)
-
         # Summary
         mode = "APPLY" if args.apply else "DRY-RUN"
         print()
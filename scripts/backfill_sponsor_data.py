@@ -14,7 +14,6 @@ Options:
 import os
 import sys
 import re
-import time
 import logging
 import argparse
 
@@ -27,6 +26,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.database.db import get_bills_without_sponsor, update_bill_sponsor
 from src.fetchers.congress_fetcher import fetch_bill_details_from_api
+from src.fetchers import congress_quota
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -35,8 +35,9 @@ logger = logging.getLogger(__name__)
 # Congress.gov API key
 CONGRESS_API_KEY = os.getenv('CONGRESS_API_KEY')
 
-# Rate limiting: 1 request per second to be safe
-REQUEST_DELAY = 1.0
+# Pacing comes from the shared Congress.gov quota (backfill priority pauses
+# automatically when the hourly budget runs low).
+congress_quota.set_default_priority("backfill")
 
 
 def parse_bill_id(bill_id: str) -> tuple:
@@ -154,9 +155,6 @@ def backfill_sponsors(limit: int = None, dry_run: bool = False) -> dict:
                 logger.info(f"  🔍 Would update {bill_id} (dry run)")
                 stats['updated'] += 1
             
-            # Rate limiting
-            time.sleep(REQUEST_DELAY)
-            
         except Exception as e:
             logger.error(f"  ❌ Error processing {bill_id}: {e}")
             stats['failed'] += 1
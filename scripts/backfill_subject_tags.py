@@ -12,7 +12,6 @@ Usage:
 
 import os
 import sys
-import time
 import logging
 import argparse
 
@@ -23,6 +22,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from openai import OpenAI
+from src.fetchers import congress_quota
+from src.processors import llm_rate_limit
 from src.utils.subject_tags import validate_tags, SUBJECT_TAGS
 from src.database.connection import postgres_connect
 
@@ -32,7 +33,9 @@ from src.database.connection import postgres_connect
 
 VENICE_BASE_URL = os.getenv("VENICE_BASE_URL", "https://api.venice.ai/api/v1")
 PREFERRED_MODEL = os.getenv("SUMMARIZER_MODEL", "claude-sonnet-4-6")
-RATE_LIMIT_SECONDS = 1.5  # delay between API calls
+
+# Venice calls are paced by the shared rate limiter; batch jobs use spare capacity only
+congress_quota.set_default_priority("backfill")
 
 logging.basicConfig(
     level=logging.INFO,
@@ -71,6 +74,7 @@ def classify_bill(client: OpenAI, title: str, overview: str) -> str:
     """Call Venice AI to classify a bill and return validated tags CSV."""
     user_msg = f"Title: {title}\n\nSummary: {overview}"
     try:
+        llm_rate_limit.acquire(len(TAGGING_SYSTEM_PROMPT) + len(user_msg), 60)
         response = client.chat.completions.create(
             model=PREFERRED_MODEL,
             max_tokens=60,
@@ -162,10 +166,6 @@ def main():
             logger.warning("[%d/%d] No valid tags for %s — skipping", i, total, bill_id)
             skipped += 1
 
-        # Rate limiting between API calls
-        if i < total:
-            time.sleep(RATE_LIMIT_SECONDS)
-
     logger.info("Done. Tagged: %d, Skipped: %d, Total: %d", tagged, skipped, total)
 
 
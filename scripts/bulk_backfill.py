@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Seed the archive with every bill of a Congress.
+
+Pages /bill/{congress} from the Congress.gov API, enriches bills with a
+worker pool (paced by the shared API quota at ``backfill`` priority),
+inserts them in batches, and queues them for summarization. Progress is
+checkpointed after every page, so an interrupted run resumes where it
+stopped when started again.
+
+Summaries are produced separately by scripts/drain_summarization_queue.py.
+
+Tip: set TRACKER_SOURCE_MODE=api_only to keep the run off the browser.
+
+Usage:
+    PYTHONPATH=. python3 scripts/bulk_backfill.py                     # 119th Congress, resume
+    PYTHONPATH=. python3 scripts/bulk_backfill.py --congress 118      # another Congress
+    PYTHONPATH=. python3 scripts/bulk_backfill.py --limit 500         # cap this pass
+    PYTHONPATH=. python3 scripts/bulk_backfill.py --restart           # ignore the checkpoint
+    PYTHONPATH=. python3 scripts/bulk_backfill.py --dry-run           # enrich only, no writes
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+from src.load_env import load_env
+
+load_env()
+
+from src.bulk_backfill import BACKFILL_WORKERS, run_bulk_backfill
+from src.database.db import init_db
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("bulk_backfill")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk-ingest every bill of a Congress.")
+    parser.add_argument("--congress", default="119", help="Congress number (default: 119).")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Max bills to list this pass (0 = unlimited, default: 0).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BACKFILL_WORKERS,
+        help=f"Concurrent enrichments (default: {BACKFILL_WORKERS}).",
+    )
+    parser.add_argument("--restart", action="store_true", default=False,
+                        help="Start from the beginning instead of the saved checkpoint.")
+    parser.add_argument("--post-ready", action="store_true", default=False,
+                        help="Leave summarized bills unpublished (eligible for daily posting) "
+                             "instead of archiving them.")
+    parser.add_argument("--dry-run", action="store_true", default=False,
+                        help="Enrich bills but write nothing.")
+    args = parser.parse_args()
+
+    init_db()
+
+    try:
+        stats = run_bulk_backfill(
+            congress=args.congress,
+            limit=args.limit or None,
+            workers=args.workers,
+            restart=args.restart,
+            archive_only=not args.post_ready,
+            dry_run=args.dry_run,
+        )
+    except ValueError as e:
+        logger.error(f"{e}. Aborting.")
+        return 1
+
+    print(
+        f"\n  listed={stats['listed']}  already_in_db={stats['skipped_existing']}  "
+        f"inserted={stats['inserted']}  failed={stats['failed']}  queued={stats['queued']}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Drain the ``publish_outbox`` table: retry platform posts that failed during
+the orchestrator's first delivery attempt.
+
+Each due job is claimed, posted through PublisherManager, and either marked
+``succeeded`` (with its post URL) or rescheduled with exponential backoff.
+Jobs that exhaust OUTBOX_MAX_ATTEMPTS are marked ``dead``; jobs whose post
+timed out are parked as ``unknown`` for a manual check and never retried.
+
+Usage:
+    PYTHONPATH=. python3 scripts/drain_publish_outbox.py              # drain due jobs
+    PYTHONPATH=. python3 scripts/drain_publish_outbox.py --limit 10   # cap jobs per pass
+    PYTHONPATH=. python3 scripts/drain_publish_outbox.py --stats      # per-platform stats only
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+from src.load_env import load_env
+
+load_env()
+
+from src.database.db import get_publish_outbox_stats, init_db
+from src.publishers.publish_outbox import OUTBOX_BATCH_SIZE, drain_publish_outbox
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("drain_publish_outbox")
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def print_stats(days: int) -> None:
+    stats = get_publish_outbox_stats(since_days=days)
+    print(f"\n  Publish outbox (last {days} days)")
+    if not stats:
+        print("  (empty)\n")
+        return
+    print(f"  {'platform':<10} {'total':>6} {'ok':>6} {'pending':>8} {'dead':>6} {'unknown':>8} {'avg_try':>8} {'err_rate':>9}")
+    for platform, s in sorted(stats.items()):
+        print(
+            f"  {platform:<10} {s['total']:>6} {s['succeeded']:>6} "
+            f"{s['pending'] + s['in_progress']:>8} {s['dead']:>6} {s['unknown']:>8} "
+            f"{s['avg_attempts']:>8.2f} {s['error_rate']:>9.1%}"
+        )
+    print()
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Retry failed social posts from the publish outbox.")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=OUTBOX_BATCH_SIZE,
+        help=f"Max jobs to claim this pass (default: {OUTBOX_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help="Print per-platform throughput/error stats and exit.",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Stats window in days (default: 30).",
+    )
+    args = parser.parse_args()
+
+    init_db()
+
+    if args.stats:
+        print_stats(args.days)
+        return 0
+
+    summary = drain_publish_outbox(limit=args.limit)
+    if not summary["claimed"]:
+        logger.info("No due publish jobs.")
+    print_stats(args.days)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
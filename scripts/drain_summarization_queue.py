@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Drain the ``summarization_queue`` table: summarize bills that bulk backfill
+inserted without summaries.
+
+Each due job is claimed, summarized (summary, teen impact score, arguments)
+and marked ``done``, or rescheduled with exponential backoff. Jobs that
+exhaust SUMMARY_QUEUE_MAX_ATTEMPTS are marked ``dead``.
+
+Usage:
+    PYTHONPATH=. python3 scripts/drain_summarization_queue.py               # one pass
+    PYTHONPATH=. python3 scripts/drain_summarization_queue.py --limit 50    # cap jobs per pass
+    PYTHONPATH=. python3 scripts/drain_summarization_queue.py --until-empty # keep going
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+from src.load_env import load_env
+
+load_env()
+
+from src.database.db import init_db
+from src.fetchers import congress_quota
+from src.processors.summarization_queue import (
+    SUMMARY_QUEUE_BATCH_SIZE,
+    SUMMARY_QUEUE_WORKERS,
+    drain_summarization_queue,
+)
+
+# Venice calls are paced by the shared rate limiter; batch jobs use spare capacity only
+congress_quota.set_default_priority("backfill")
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("drain_summarization_queue")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarize bills queued by bulk backfill.")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=SUMMARY_QUEUE_BATCH_SIZE,
+        help=f"Max jobs to claim per pass (default: {SUMMARY_QUEUE_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SUMMARY_QUEUE_WORKERS,
+        help=f"Concurrent summaries (default: {SUMMARY_QUEUE_WORKERS}).",
+    )
+    parser.add_argument("--until-empty", action="store_true", default=False,
+                        help="Keep claiming passes until no jobs are due.")
+    args = parser.parse_args()
+
+    init_db()
+
+    total = 0
+    while True:
+        summary = drain_summarization_queue(limit=args.limit, workers=args.workers)
+        total += summary["succeeded"]
+        if not summary["claimed"] or not args.until_empty:
+            break
+    if not total:
+        logger.info("No summarization jobs completed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Ingest or refresh bills from GovInfo bulk-data XML dumps on local disk.
+
+Reads BILLSTATUS zips (and optionally BILLS text zips) downloaded from
+https://www.govinfo.gov/bulkdata, streams every record, and upserts the
+bills table in batches: status and sponsors are refreshed for bills already
+in the table, missing text is filled in, and new bills are inserted and
+queued for summarization. No Congress.gov API calls are made.
+
+Usage:
+    PYTHONPATH=. python3 scripts/ingest_bulk_xml.py --status dumps/BILLSTATUS-119-*.zip
+    PYTHONPATH=. python3 scripts/ingest_bulk_xml.py --status dumps/BILLSTATUS-119-hr.zip \\
+        --text dumps/BILLS-119-1-hr.zip                                  # with full text
+    PYTHONPATH=. python3 scripts/ingest_bulk_xml.py --status ... --refresh-only   # no new rows
+    PYTHONPATH=. python3 scripts/ingest_bulk_xml.py --status ... --dry-run        # parse only
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+from src.load_env import load_env
+
+load_env()
+
+from src.bulk_backfill import BULK_XML_BATCH_SIZE, run_bulk_xml_ingest
+from src.database.db import init_db
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("ingest_bulk_xml")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Upsert bills from BILLSTATUS/BILLS bulk XML zips.")
+    parser.add_argument("--status", nargs="+", required=True, metavar="ZIP",
+                        help="BILLSTATUS-*.zip files.")
+    parser.add_argument("--text", nargs="*", default=[], metavar="ZIP",
+                        help="BILLS-*.zip files to take full text from.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BULK_XML_BATCH_SIZE,
+        help=f"Rows per upsert statement (default: {BULK_XML_BATCH_SIZE}).",
+    )
+    parser.add_argument("--refresh-only", action="store_true", default=False,
+                        help="Only update bills already in the table.")
+    parser.add_argument("--post-ready", action="store_true", default=False,
+                        help="Leave summarized new bills unpublished (eligible for daily posting) "
+                             "instead of archiving them.")
+    parser.add_argument("--dry-run", action="store_true", default=False,
+                        help="Parse and map records but write nothing.")
+    args = parser.parse_args()
+
+    missing = [p for p in args.status + args.text if not os.path.isfile(p)]
+    if missing:
+        logger.error(f"Missing dump file(s): {', '.join(missing)}. Aborting.")
+        return 1
+
+    if not args.dry_run:
+        init_db()
+
+    stats = run_bulk_xml_ingest(
+        args.status,
+        args.text,
+        batch_size=max(1, args.batch_size),
+        insert_new=not args.refresh_only,
+        archive_only=not args.post_ready,
+        dry_run=args.dry_run,
+    )
+
+    print(
+        f"\n  read={stats['read']}  with_text={stats['with_text']}  inserted={stats['inserted']}  "
+        f"updated={stats['updated']}  queued={stats['queued']}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
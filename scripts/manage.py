@@ -173,6 +173,7 @@ def _fetch_and_process_bill_data(bill_id: str) -> Optional[dict]:
 @app.command()
 def reprocess_bills(
     bill_ids: List[str] = typer.Argument(..., help="List of bill IDs to reprocess (e.g., sres428-119 sres429-119)"),
+    force: bool = typer.Option(False, "--force", "-f", help="Ignore cached LLM responses and regenerate"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging")
 ):
     """
@@ -207,7 +208,7 @@ def reprocess_bills(
             continue
 
         try:
-            summaries = summarize_bill_enhanced(bill_data)
+            summaries = summarize_bill_enhanced(bill_data, force_refresh=force)
             
             if summaries and all(len(summaries.get(k, '')) > 50 for k in ['overview', 'detailed', 'tweet']):
                 if _update_bill_in_database(bill_id, summaries):
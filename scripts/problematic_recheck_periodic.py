@@ -31,7 +31,6 @@ import json
 import logging
 import os
 import sys
-import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -265,6 +264,10 @@ With DB writes (staging only, after review):
     args = parser.parse_args()
     dry_run = not args.allow_writes
 
+    # Background job: pace API calls by the shared quota's backfill class
+    from src.fetchers import congress_quota
+    congress_quota.set_default_priority("backfill")
+
     # -- Connection -----------------------------------------------------------
     db_url = get_connection_string()
     if not db_url:
@@ -316,9 +319,6 @@ With DB writes (staging only, after review):
             logger.error(f"  💥 Unexpected error for {bill_id}: {exc}")
             enrichment_results.append((bill, False, bill, [f"Exception: {exc}"]))
 
-        # Polite delay between API calls
-        if idx < len(bills):
-            time.sleep(1.0)
 
     # -- Phase 2: Re-evaluate & optionally update ----------------------------
     recovered: List[Dict[str, Any]] = []
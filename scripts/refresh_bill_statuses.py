@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Refresh status / normalized_status of published bills that changed on Congress.gov.
+
+Lists bills whose updateDate moved since the last run (watermark in
+ingestion_watermarks), re-derives the status of the published ones from
+their actions, and applies every change in one batched UPDATE. Meant to run
+on a schedule; see .github/workflows/status-refresh.yml.
+
+Usage:
+    PYTHONPATH=. python3 scripts/refresh_bill_statuses.py                  # 119th Congress
+    PYTHONPATH=. python3 scripts/refresh_bill_statuses.py --congress 118
+    PYTHONPATH=. python3 scripts/refresh_bill_statuses.py --dry-run        # log changes only
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+from src.load_env import load_env
+
+load_env()
+
+from src.database.db import init_db
+from src.fetchers.bill_updates import INGEST_CONGRESS
+from src.status_refresh import STATUS_REFRESH_WORKERS, refresh_published_statuses
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger("refresh_bill_statuses")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Refresh statuses of published bills updated since the last run.")
+    parser.add_argument("--congress", default=INGEST_CONGRESS, help=f"Congress number (default: {INGEST_CONGRESS}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=STATUS_REFRESH_WORKERS,
+        help=f"Concurrent actions requests (default: {STATUS_REFRESH_WORKERS}).",
+    )
+    parser.add_argument("--dry-run", action="store_true", default=False,
+                        help="Log status changes but write nothing.")
+    args = parser.parse_args()
+
+    init_db()
+
+    try:
+        stats = refresh_published_statuses(congress=args.congress, workers=args.workers, dry_run=args.dry_run)
+    except ValueError as e:
+        logger.error(f"{e}. Aborting.")
+        return 1
+
+    print(
+        f"\n  changed={stats['changed']}  published={stats['published']}  "
+        f"updated={stats['updated']}  failed={stats['failed']}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
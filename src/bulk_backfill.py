@@ -0,0 +1,299 @@
+"""
+Bulk backfill: ingest every bill of a Congress into the archive.
+
+The daily orchestrator adds roughly one bill per run. This job pages the
+whole ``/bill/{congress}`` list instead, enriches bills with a worker pool,
+and writes them in batches, so a full Congress can be seeded over a weekend.
+
+- Rate: every API call goes through the shared quota accountant at
+  ``backfill`` priority, so workers pause when the hourly budget runs low
+  and never starve the daily run or web lookups.
+- Resumable: the list cursor is checkpointed in ``backfill_checkpoints``
+  after every page; rerunning the job continues from there. Pages are read
+  in ``updateDate`` order by keyset (``fromDateTime`` + offset within equal
+  timestamps) rather than plain offsets, so bills updated mid-run move to
+  the end of the list instead of shifting unread bills out of reach.
+  Bills whose enrichment fails are kept in the checkpoint (``failed``, with
+  an attempt count) and retried with every later page and on resume, up to
+  BACKFILL_MAX_ATTEMPTS, so moving the cursor past them never loses them.
+- Writes: new rows go in with one ``execute_values`` statement per batch;
+  bills already in the DB are skipped before any detail requests are made.
+- Summaries: rows are inserted without summaries and queued in
+  ``summarization_queue`` for ``scripts/drain_summarization_queue.py``;
+  LLM latency never sits on the ingestion path.
+
+``run_bulk_xml_ingest()`` does the same from the GovInfo BILLSTATUS/BILLS
+zip dumps on local disk (no API calls at all), and also refreshes status,
+sponsors and missing text for bills already in the table in the same pass.
+
+Run via ``scripts/bulk_backfill.py`` or ``scripts/ingest_bulk_xml.py``.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from src.database.db import (
+    bulk_insert_bills,
+    bulk_upsert_bills,
+    enqueue_summarization_jobs,
+    generate_website_slug,
+    get_backfill_checkpoint,
+    get_existing_bill_ids,
+    normalize_bill_id,
+    save_backfill_checkpoint,
+)
+from src.fetchers import congress_quota
+from src.fetchers.bill_updates import bill_id_from_list_item, format_from_datetime, parse_update_date
+from src.fetchers.bulk_data import iter_bill_records
+from src.fetchers.feed_parser import enrich_single_bill
+from src.orchestrator import derive_status_from_tracker
+from src.utils import http
+from src.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+BACKFILL_WORKERS = max(1, int(os.getenv("BACKFILL_WORKERS", "4")))
+BACKFILL_PAGE_SIZE = min(250, int(os.getenv("BACKFILL_PAGE_SIZE", "250")))
+BACKFILL_BILL_TIMEOUT_SECONDS = int(os.getenv("BACKFILL_BILL_TIMEOUT_SECONDS", "180"))
+BULK_XML_BATCH_SIZE = int(os.getenv("BULK_XML_BATCH_SIZE", "500"))
+BACKFILL_MAX_ATTEMPTS = int(os.getenv("BACKFILL_MAX_ATTEMPTS", "3"))
+
+BILL_LIST_URL = "https://api.congress.gov/v3/bill/{congress}"
+
+
+def backfill_job_name(congress: str) -> str:
+    return f"bulk_backfill_{congress}"
+
+
+def initial_cursor() -> Dict[str, Any]:
+    """Start of the list: no lower bound, offset 0."""
+    return {"from": None, "offset": 0}
+
+
+def advance_cursor(cursor: Dict[str, Any], bills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Cursor for the page after ``bills`` (which were read at ``cursor``).
+
+    When the page reaches a newer ``updateDate`` the lower bound moves up to
+    it and the offset restarts at the number of bills already read with that
+    exact date (``fromDateTime`` is inclusive). Otherwise the page was all
+    one timestamp and the offset simply grows.
+    """
+    dates = [d for d in (parse_update_date(b) for b in bills) if d is not None]
+    if not dates:
+        return {"from": cursor.get("from"), "offset": cursor.get("offset", 0) + len(bills)}
+    newest = max(dates)
+    current = cursor.get("from")
+    if current is None or format_from_datetime(newest) != current:
+        return {"from": format_from_datetime(newest), "offset": sum(1 for d in dates if d == newest)}
+    return {"from": current, "offset": cursor.get("offset", 0) + len(bills)}
+
+
+def fetch_bill_list_page(congress: str, cursor: Dict[str, Any], api_key: str,
+                         page_size: int = BACKFILL_PAGE_SIZE) -> Tuple[List[Dict[str, Any]], bool]:
+    """One page of the bill list at ``cursor``. Returns (bills, has_more)."""
+    params = {
+        'sort': 'updateDate asc',
+        'limit': page_size,
+        'offset': cursor.get("offset", 0),
+        'format': 'json',
+        'api_key': api_key,
+    }
+    if cursor.get("from"):
+        params['fromDateTime'] = cursor["from"]
+    resp = http.get(BILL_LIST_URL.format(congress=congress), params=params,
+                    headers={"Accept": "application/json"}, timeout=60)
+    resp.raise_for_status()
+    data = resp.json()
+    bills = data.get('bills', [])
+    has_more = bool((data.get('pagination') or {}).get('next')) and len(bills) == page_size
+    return bills, has_more
+
+
+def build_bill_row(enriched: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an enrich_single_bill() result onto insert columns (no summaries yet)."""
+    bill_id = normalize_bill_id(enriched.get("bill_id", ""))
+    status_text, normalized_status = derive_status_from_tracker(enriched.get("tracker") or [])
+    title = (enriched.get("title") or "").strip()
+    if len(title) > 300:
+        title = title[:300] + "..."
+    return {
+        "bill_id": bill_id,
+        "title": title,
+        "status": status_text,
+        "normalized_status": normalized_status,
+        "congress_session": str(enriched.get("congress", "") or "").strip(),
+        "date_introduced": enriched.get("date_introduced") or "",
+        "latest_action_date": enriched.get("latest_action_date"),
+        "source_url": enriched.get("source_url", ""),
+        "website_slug": generate_website_slug(title, bill_id),
+        "published": False,
+        "full_text": enriched.get("full_text", ""),
+        "sponsor_name": enriched.get("sponsor_name", ""),
+        "sponsor_party": enriched.get("sponsor_party", ""),
+        "sponsor_state": enriched.get("sponsor_state", ""),
+    }
+
+
+def _enrich(bill_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        return enrich_single_bill(bill_id, Deadline(BACKFILL_BILL_TIMEOUT_SECONDS))
+    except Exception as e:
+        logger.warning(f"❌ Enrichment failed for {bill_id}: {e}")
+        return None
+
+
+def run_bulk_backfill(congress: str = "119", limit: Optional[int] = None,
+                      workers: int = BACKFILL_WORKERS, restart: bool = False,
+                      archive_only: bool = True, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Page, enrich and insert every bill in ``congress``, resuming from the
+    last checkpoint unless ``restart``.
+
+    Args:
+        limit: Stop after this many listed bills (None = whole Congress)
+        workers: Concurrent enrichments (each also fans out internally)
+        archive_only: Queue summaries so bills go to the site archive
+            without being posted to social media
+        dry_run: Enrich but don't write bills, queue rows or checkpoints
+
+    Returns:
+        Counts: {"listed", "skipped_existing", "enriched", "inserted", "failed", "queued"}
+    """
+    api_key = os.getenv('CONGRESS_API_KEY')
+    if not api_key:
+        raise ValueError("CONGRESS_API_KEY environment variable not set")
+
+    congress_quota.set_default_priority("backfill")
+    job = backfill_job_name(congress)
+    stats = {"listed": 0, "skipped_existing": 0, "enriched": 0, "inserted": 0, "failed": 0, "queued": 0}
+
+    checkpoint = None if restart else get_backfill_checkpoint(job)
+    if checkpoint and checkpoint.get("completed_at"):
+        logger.info(f"✅ {job} already completed at {checkpoint['completed_at']}; use restart to run again")
+        return stats
+    cursor = checkpoint["cursor"] if checkpoint else initial_cursor()
+    processed = checkpoint["processed"] if checkpoint else 0
+    if checkpoint:
+        logger.info(f"↩️ Resuming {job} after {processed} bills (cursor {cursor})")
+    else:
+        logger.info(f"🚀 Starting {job} with {workers} worker(s)")
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="backfill") as pool:
+        while True:
+            try:
+                bills, has_more = fetch_bill_list_page(congress, cursor, api_key)
+            except (requests.RequestException, ValueError) as e:
+                logger.error(f"❌ Bill list page failed at {cursor}: {e}. Rerun to resume.")
+                break
+            if limit is not None:
+                bills = bills[: max(0, limit - stats["listed"])]
+            if not bills:
+                has_more = False
+            stats["listed"] += len(bills)
+
+            bill_ids = [bid for bid in (bill_id_from_list_item(b) for b in bills) if bid]
+            # Earlier failures ride along with this page's bills
+            failed = dict(cursor.get("failed") or {})
+            retry_ids = [bid for bid in failed if bid not in bill_ids]
+            existing = get_existing_bill_ids(bill_ids + retry_ids)
+            todo = [bid for bid in bill_ids if normalize_bill_id(bid) not in existing]
+            stats["skipped_existing"] += len(bill_ids) - len(todo)
+            todo += [bid for bid in retry_ids if normalize_bill_id(bid) not in existing]
+
+            rows = []
+            for bid, enriched in zip(todo, pool.map(_enrich, todo)):
+                if enriched and (enriched.get("title") or "").strip():
+                    rows.append(build_bill_row(enriched))
+                    failed.pop(bid, None)
+                    continue
+                stats["failed"] += 1
+                failed[bid] = failed.get(bid, 0) + 1
+                if failed[bid] >= BACKFILL_MAX_ATTEMPTS:
+                    logger.error(f"❌ Giving up on {bid} after {failed[bid]} failed enrichments")
+                    del failed[bid]
+            stats["enriched"] += len(rows)
+
+            if not dry_run:
+                inserted = bulk_insert_bills(rows)
+                stats["inserted"] += len(inserted)
+                stats["queued"] += enqueue_summarization_jobs(inserted, archive_only=archive_only)
+
+            cursor = advance_cursor(cursor, bills)
+            # Bills already inserted by someone else drop out of the retry list
+            failed = {bid: n for bid, n in failed.items() if normalize_bill_id(bid) not in existing}
+            if failed:
+                cursor["failed"] = failed
+            processed += len(bills)
+            done = not has_more or (limit is not None and stats["listed"] >= limit)
+            if not dry_run:
+                save_backfill_checkpoint(job, cursor, processed, completed=not has_more and not failed)
+
+            rate = stats["listed"] / max(1e-6, time.monotonic() - started) * 3600
+            logger.info(
+                f"📦 {job}: {processed} listed, +{len(rows)} enriched this page "
+                f"({stats['inserted']} inserted, {stats['failed']} failed, ~{rate:.0f} bills/h)"
+            )
+            if done:
+                break
+
+    logger.info(f"🏁 {job} pass finished: {stats}")
+    return stats
+
+
+def _flush_xml_batch(rows: List[Dict[str, Any]], stats: Dict[str, int], insert_new: bool,
+                     archive_only: bool, dry_run: bool) -> None:
+    if dry_run or not rows:
+        return
+    result = bulk_upsert_bills(rows, insert_new=insert_new)
+    stats["inserted"] += len(result["inserted"])
+    stats["updated"] += len(result["updated"])
+    # Only bills with usable text can be summarized; the rest wait for a later dump
+    with_text = {r["bill_id"] for r in rows if len((r.get("full_text") or "").strip()) >= 100}
+    stats["queued"] += enqueue_summarization_jobs(
+        [bid for bid in result["inserted"] if bid in with_text], archive_only=archive_only
+    )
+
+
+def run_bulk_xml_ingest(status_zips: Iterable[str], text_zips: Iterable[str] = (),
+                        batch_size: int = BULK_XML_BATCH_SIZE, insert_new: bool = True,
+                        archive_only: bool = True, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Upsert every bill in local BILLSTATUS zips, in batches of ``batch_size``.
+
+    Args:
+        status_zips: BILLSTATUS-*.zip paths
+        text_zips: BILLS-*.zip paths used to fill in full text
+        insert_new: Insert bills not yet in the table (False = refresh only)
+        archive_only: Queue summaries so new bills go to the site archive
+            without being posted to social media
+        dry_run: Parse and map but don't write anything
+
+    Returns:
+        Counts: {"read", "with_text", "inserted", "updated", "queued"}
+    """
+    stats = {"read": 0, "with_text": 0, "inserted": 0, "updated": 0, "queued": 0}
+    started = time.monotonic()
+    batch: List[Dict[str, Any]] = []
+    for record in iter_bill_records(status_zips, text_zips):
+        if not (record.get("title") or "").strip():
+            continue
+        stats["read"] += 1
+        if record.get("full_text"):
+            stats["with_text"] += 1
+        batch.append(build_bill_row(record))
+        if len(batch) >= batch_size:
+            _flush_xml_batch(batch, stats, insert_new, archive_only, dry_run)
+            batch = []
+            logger.info(f"📦 Bulk XML: {stats['read']} read ({time.monotonic() - started:.0f}s)")
+    _flush_xml_batch(batch, stats, insert_new, archive_only, dry_run)
+
+    logger.info(f"🏁 Bulk XML ingest finished in {time.monotonic() - started:.0f}s: {stats}")
+    return stats
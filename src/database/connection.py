@@ -568,6 +568,98 @@ def init_db_tables() -> None:
                 """)
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_rep_contact_state_district ON rep_contact_forms(state, district);")
 
+                # Publish outbox: one durable delivery job per (bill, platform)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS publish_outbox (
+                    id SERIAL PRIMARY KEY,
+                    bill_id VARCHAR(50) NOT NULL,
+                    platform VARCHAR(20) NOT NULL,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    locked_at TIMESTAMP,
+                    post_url TEXT,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    UNIQUE(bill_id, platform)
+                );
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_publish_outbox_due ON publish_outbox(status, next_attempt_at);")
+
+                # Shared API quota buckets (token bucket per API key / service)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS api_quota (
+                    name VARCHAR(50) PRIMARY KEY,
+                    tokens DOUBLE PRECISION NOT NULL,
+                    capacity DOUBLE PRECISION NOT NULL,
+                    refill_per_sec DOUBLE PRECISION NOT NULL,
+                    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+                """)
+
+                # Incremental ingestion watermarks (last Congress.gov updateDate seen)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ingestion_watermarks (
+                    name VARCHAR(50) PRIMARY KEY,
+                    watermark TIMESTAMPTZ NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                """)
+
+                # Resumable bulk-backfill progress (one row per job)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+                    job VARCHAR(100) PRIMARY KEY,
+                    cursor_state TEXT NOT NULL,
+                    processed INTEGER NOT NULL DEFAULT 0,
+                    completed_at TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                """)
+
+                # Summarization work queue: bills inserted without summaries
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS summarization_queue (
+                    bill_id VARCHAR(50) PRIMARY KEY,
+                    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                    archive_only BOOLEAN NOT NULL DEFAULT FALSE,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    locked_at TIMESTAMP,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP
+                );
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_summarization_queue_due ON summarization_queue(status, next_attempt_at);")
+
+                # LLM response cache (key = hash of model, prompts and temperature)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key CHAR(64) PRIMARY KEY,
+                    model VARCHAR(100) NOT NULL,
+                    response TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_hit_at TIMESTAMP
+                );
+                """)
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_response_cache_created ON llm_response_cache(created_at);")
+
+                # Persisted social platform sessions (e.g. Bluesky session strings)
+                cursor.execute("""
+                CREATE TABLE IF NOT EXISTS social_sessions (
+                    platform VARCHAR(20) NOT NULL,
+                    account VARCHAR(255) NOT NULL,
+                    session_data TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (platform, account)
+                );
+                """)
+
         logger.info("Database tables initialized successfully.")
     except Exception as e:
         logger.error("Failed to initialize database tables: %s", e)
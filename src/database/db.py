@@ -9,12 +9,14 @@ TODO: Future improvements (SAVE FOR LATER):
 - Add database query performance monitoring
 """
 
+import copy
+import json
 import os
 import logging
 import re
 import functools
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Iterator, Tuple
+from typing import Dict, Any, Optional, List, Iterator, Set, Tuple
 from contextlib import contextmanager
 
 # Import the database connection manager
@@ -32,16 +34,19 @@ logger = logging.getLogger(__name__)
 _SIMULATE = False
 
 
-def simulate_safe(fn):
+def simulate_safe(fn=None, *, result: Any = True):
     """Decorator that short-circuits DB write functions when _SIMULATE is True.
-    Logs what would have happened and returns True (success) without touching DB."""
-    @functools.wraps(fn)
-    def wrapper(*args, **kwargs):
-        if _SIMULATE:
-            logger.info(f"🧪 SIMULATE: {fn.__name__}({args!r}, {kwargs!r}) — skipped (read-only)")
-            return True
-        return fn(*args, **kwargs)
-    return wrapper
+    Logs what would have happened and returns ``result`` (True, i.e. success,
+    unless given, e.g. ``@simulate_safe(result=[])``) without touching DB."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _SIMULATE:
+                logger.info(f"🧪 SIMULATE: {fn.__name__}({args!r}, {kwargs!r}) — skipped (read-only)")
+                return copy.copy(result)
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorate(fn) if fn is not None else decorate
 
 # Bill ID pattern for exact matching
 BILL_ID_REGEX = re.compile(r'^[a-z]+[0-9]+(?:-[0-9]+)?$', re.IGNORECASE)
@@ -248,6 +253,19 @@ def update_tweet_info(bill_id: str, tweet_url: str) -> bool:
     Note: tweet_url parameter is kept for API compat but is no longer stored
     (the tweet_url column has been dropped).
     """
+    return mark_bill_published(bill_id) is not None
+
+
+@simulate_safe
+def mark_bill_published(bill_id: str) -> Optional[bool]:
+    """
+    Mark a bill as published (see update_tweet_info), reporting whether this
+    call did it.
+
+    Returns:
+        True if the bill was marked now, False if it was already published,
+        None on error.
+    """
     normalized_id = normalize_bill_id(bill_id)
     try:
         with db_connect() as conn:
@@ -263,14 +281,14 @@ def update_tweet_info(bill_id: str, tweet_url: str) -> bool:
                 result = cursor.fetchone()
                 if not result:
                     logger.error(f"Bill {normalized_id} not found in database")
-                    return False
+                    return None
                 
                 current_published = result[0]
                 
                 # Check if already published (idempotent)
                 if current_published:
                     logger.info(f"Bill {normalized_id} already published (idempotent success)")
-                    return True
+                    return False
                 
                 # Update the bill (we have the lock, so this is safe)
                 logger.debug(f"Marking bill {normalized_id} as published")
@@ -286,11 +304,11 @@ def update_tweet_info(bill_id: str, tweet_url: str) -> bool:
                     return True
                 else:
                     logger.error(f"Failed to update bill {normalized_id}: no rows affected")
-                    return False
+                    return None
                 
     except Exception as e:
         logger.error(f"Error updating publish status for {normalized_id}: {e}")
-        return False
+        return None
 
 
 def normalize_bill_id(bill_id: str) -> str:
@@ -1925,3 +1943,831 @@ def get_voter_votes(voter_id: str) -> List[Dict[str, str]]:
     except Exception as e:
         logger.error(f"Error retrieving votes for voter {voter_id[:8]}...: {e}")
         return []
+
+
+# ── Publish outbox ───────────────────────────────────────────────────────────
+# One row per (bill, platform). The orchestrator enqueues rows; a drain worker
+# (src/publishers/publish_outbox.py) claims due rows, posts, and records the
+# outcome with exponential backoff on failure. A post that timed out (it may
+# still have gone out) is parked as 'unknown' and never retried automatically.
+
+@simulate_safe
+def enqueue_publish_jobs(bill_id: str, platforms: List[str]) -> bool:
+    """
+    Enqueue one pending publish job per platform for a bill, due now.
+
+    A platform that already succeeded, or whose last post timed out
+    ('unknown'), is left untouched, so a re-run never re-posts it. Dead or
+    backed-off rows for the bill are made due again
+    (dead ones with a fresh attempt count): enqueueing means the
+    orchestrator is about to post this bill.
+    """
+    normalized_id = normalize_bill_id(bill_id)
+    if not platforms:
+        return False
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                psycopg2.extras.execute_values(cursor, '''
+                    INSERT INTO publish_outbox (bill_id, platform)
+                    VALUES %s
+                    ON CONFLICT (bill_id, platform) DO UPDATE
+                    SET status = 'pending',
+                        attempts = CASE WHEN publish_outbox.status = 'dead' THEN 0
+                                        ELSE publish_outbox.attempts END,
+                        next_attempt_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE publish_outbox.status IN ('pending', 'dead')
+                ''', [(normalized_id, p) for p in platforms])
+                logger.info(f"Enqueued {cursor.rowcount} publish job(s) for {normalized_id}: {', '.join(platforms)}")
+                return True
+    except Exception as e:
+        logger.error(f"Error enqueueing publish jobs for {normalized_id}: {e}")
+        return False
+
+
+@simulate_safe(result=[])
+def claim_publish_jobs(limit: int = 25, bill_id: Optional[str] = None,
+                       stale_after_seconds: int = 900) -> List[Dict[str, Any]]:
+    """
+    Atomically claim due publish jobs and mark them in_progress.
+
+    Uses 'FOR UPDATE SKIP LOCKED' so concurrent drain workers never claim the
+    same row. Jobs stuck in_progress longer than ``stale_after_seconds``
+    (e.g. a crashed worker) are reclaimed. Each claim increments ``attempts``.
+    """
+    params: List[Any] = [stale_after_seconds]
+    bill_clause = ""
+    if bill_id:
+        bill_clause = "AND bill_id = %s"
+        params.append(normalize_bill_id(bill_id))
+    params.append(limit)
+    try:
+        with db_connect() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+                cursor.execute(f'''
+                    UPDATE publish_outbox
+                    SET status = 'in_progress',
+                        attempts = attempts + 1,
+                        locked_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id IN (
+                        SELECT id FROM publish_outbox
+                        WHERE ((status = 'pending' AND next_attempt_at <= CURRENT_TIMESTAMP)
+                               OR (status = 'in_progress'
+                                   AND locked_at < CURRENT_TIMESTAMP - make_interval(secs => %s)))
+                          {bill_clause}
+                        ORDER BY next_attempt_at ASC
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, bill_id, platform, attempts
+                ''', params)
+                return [dict(row) for row in cursor.fetchall()]
+    except Exception as e:
+        logger.error(f"Error claiming publish jobs: {e}")
+        return []
+
+
+@simulate_safe
+def complete_publish_job(job_id: int, post_url: Optional[str]) -> bool:
+    """Mark a claimed publish job as succeeded and store the returned post URL."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE publish_outbox
+                    SET status = 'succeeded',
+                        post_url = %s,
+                        last_error = NULL,
+                        locked_at = NULL,
+                        completed_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s
+                ''', (post_url, job_id))
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error completing publish job {job_id}: {e}")
+        return False
+
+
+@simulate_safe
+def fail_publish_job(job_id: int, error: str, retry_in_seconds: Optional[float]) -> bool:
+    """
+    Record a failed publish attempt.
+
+    If ``retry_in_seconds`` is None the job is marked 'dead' (no more
+    retries); otherwise it goes back to 'pending' with next_attempt_at
+    pushed out by that many seconds.
+    """
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                if retry_in_seconds is None:
+                    cursor.execute('''
+                        UPDATE publish_outbox
+                        SET status = 'dead',
+                            last_error = %s,
+                            locked_at = NULL,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = %s
+                    ''', (error[:1000], job_id))
+                else:
+                    cursor.execute('''
+                        UPDATE publish_outbox
+                        SET status = 'pending',
+                            last_error = %s,
+                            locked_at = NULL,
+                            next_attempt_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE id = %s
+                    ''', (error[:1000], float(retry_in_seconds), job_id))
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error recording failure for publish job {job_id}: {e}")
+        return False
+
+
+@simulate_safe
+def mark_publish_job_unknown(job_id: int, error: str) -> bool:
+    """
+    Park a claimed publish job whose post timed out as 'unknown'.
+
+    The abandoned post may still have landed, so the job is never claimed
+    or re-enqueued again; an operator checks the platform and resolves it.
+    """
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE publish_outbox
+                    SET status = 'unknown',
+                        last_error = %s,
+                        locked_at = NULL,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %s
+                ''', (error[:1000], job_id))
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error marking publish job {job_id} unknown: {e}")
+        return False
+
+
+@simulate_safe(result=0)
+def cancel_publish_jobs(bill_id: str, reason: str) -> int:
+    """
+    Dead-letter a bill's queued (pending or in_progress) publish jobs, so
+    the drain worker never posts a bill the orchestrator has given up on.
+    Platforms that already succeeded are left alone.
+
+    Returns:
+        Number of jobs cancelled (0 on error).
+    """
+    normalized_id = normalize_bill_id(bill_id)
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE publish_outbox
+                    SET status = 'dead',
+                        last_error = %s,
+                        locked_at = NULL,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE bill_id = %s AND status IN ('pending', 'in_progress')
+                ''', (reason[:1000], normalized_id))
+                return cursor.rowcount
+    except Exception as e:
+        logger.error(f"Error cancelling publish jobs for {normalized_id}: {e}")
+        return 0
+
+
+def get_publish_outbox_stats(since_days: int = 30) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-platform outbox throughput and error rates over the last ``since_days``.
+
+    Returns:
+        {platform: {"pending": n, "in_progress": n, "succeeded": n, "dead": n,
+                    "unknown": n, "total": n, "avg_attempts": float, "error_rate": float}}
+        where error_rate is dead / (succeeded + dead).
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+    try:
+        with db_connect() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+                cursor.execute('''
+                    SELECT platform, status, COUNT(*) AS n, AVG(attempts) AS avg_attempts
+                    FROM publish_outbox
+                    WHERE created_at >= CURRENT_TIMESTAMP - make_interval(days => %s)
+                    GROUP BY platform, status
+                ''', (since_days,))
+                rows = cursor.fetchall()
+    except Exception as e:
+        logger.error(f"Error fetching publish outbox stats: {e}")
+        return stats
+
+    attempt_sums: Dict[str, float] = {}
+    for row in rows:
+        entry = stats.setdefault(row["platform"], {
+            "pending": 0, "in_progress": 0, "succeeded": 0, "dead": 0, "unknown": 0, "total": 0,
+        })
+        entry[row["status"]] = int(row["n"])
+        entry["total"] += int(row["n"])
+        attempt_sums[row["platform"]] = attempt_sums.get(row["platform"], 0.0) + float(row["avg_attempts"] or 0) * int(row["n"])
+    for platform, entry in stats.items():
+        finished = entry["succeeded"] + entry["dead"]
+        entry["avg_attempts"] = round(attempt_sums[platform] / entry["total"], 2) if entry["total"] else 0.0
+        entry["error_rate"] = round(entry["dead"] / finished, 3) if finished else 0.0
+    return stats
+
+
+# ── Social platform sessions ─────────────────────────────────────────────────
+
+def get_social_session(platform: str, account: str) -> Optional[str]:
+    """Return the stored session blob for a platform account, or None."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT session_data FROM social_sessions
+                    WHERE platform = %s AND account = %s
+                ''', (platform, account))
+                row = cursor.fetchone()
+                return row[0] if row else None
+    except Exception as e:
+        logger.error(f"Error loading {platform} session: {e}")
+        return None
+
+
+@simulate_safe
+def save_social_session(platform: str, account: str, session_data: str) -> bool:
+    """Insert or replace the stored session blob for a platform account."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO social_sessions (platform, account, session_data, updated_at)
+                    VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (platform, account)
+                    DO UPDATE SET session_data = EXCLUDED.session_data,
+                                  updated_at = CURRENT_TIMESTAMP
+                ''', (platform, account, session_data))
+                return True
+    except Exception as e:
+        logger.error(f"Error saving {platform} session: {e}")
+        return False
+
+
+@simulate_safe
+def delete_social_session(platform: str, account: str) -> bool:
+    """Remove a stored session (e.g. after it was rejected by the server)."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    DELETE FROM social_sessions WHERE platform = %s AND account = %s
+                ''', (platform, account))
+                return True
+    except Exception as e:
+        logger.error(f"Error deleting {platform} session: {e}")
+        return False
+
+
+# ── Bulk backfill ────────────────────────────────────────────────────────────
+
+# Column order for bulk_insert_bills(); mirrors insert_bill()
+_BULK_BILL_COLUMNS = (
+    "bill_id", "title", "short_title", "status", "summary_tweet", "summary_long",
+    "summary_overview", "summary_detailed",
+    "congress_session", "date_introduced", "date_processed", "source_url",
+    "website_slug", "tags", "published", "full_text",
+    "normalized_status", "teen_impact_score",
+    "sponsor_name", "sponsor_party", "sponsor_state",
+    "subject_tags",
+)
+
+
+def _bulk_date_processed(row: Dict[str, Any], now: str) -> str:
+    """
+    date_processed for a bulk-loaded row: the bill's own introduced (or latest
+    action) date rather than the load time, so archived backfill sorts among
+    bills of its era and never looks like today's post to the homepage or
+    has_posted_today().
+    """
+    return (row.get('date_processed') or row.get('date_introduced')
+            or row.get('latest_action_date') or now)
+
+
+def get_existing_bill_ids(bill_ids: List[str]) -> Set[str]:
+    """Return the subset of ``bill_ids`` (normalized) that already have a row."""
+    normalized = [normalize_bill_id(b) for b in bill_ids if b]
+    if not normalized:
+        return set()
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT bill_id FROM bills WHERE bill_id = ANY(%s)', (normalized,))
+                return {row[0] for row in cursor.fetchall()}
+    except Exception as e:
+        logger.error(f"Error checking existing bill IDs: {e}")
+        return set()
+
+
+@simulate_safe
+def bulk_insert_bills(rows: List[Dict[str, Any]], page_size: int = 100) -> List[str]:
+    """
+    Insert many bills in one statement with ``execute_values``.
+
+    Rows use the same keys as insert_bill(). Bills that already exist are
+    skipped (ON CONFLICT DO NOTHING), so re-running a batch is harmless.
+    date_processed defaults to the bill's own date (_bulk_date_processed).
+
+    Returns:
+        bill_ids actually inserted (empty on error).
+    """
+    if not rows:
+        return []
+    now = datetime.now().isoformat()
+    values = []
+    for row in rows:
+        title = row.get('title') or ""
+        values.append((
+            normalize_bill_id(row.get('bill_id', '')),
+            title,
+            row.get('short_title') or (deterministic_shorten_title(title, 80) if title else None),
+            row.get('status'),
+            row.get('summary_tweet') or '',
+            row.get('summary_long') or '',
+            row.get('summary_overview'),
+            row.get('summary_detailed'),
+            row.get('congress_session'),
+            row.get('date_introduced'),
+            _bulk_date_processed(row, now),
+            row.get('source_url') or '',
+            row.get('website_slug'),
+            row.get('tags'),
+            bool(row.get('published', False)),
+            row.get('full_text', ''),
+            row.get('normalized_status'),
+            row.get('teen_impact_score'),
+            row.get('sponsor_name'),
+            row.get('sponsor_party'),
+            row.get('sponsor_state'),
+            row.get('subject_tags'),
+        ))
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                inserted = psycopg2.extras.execute_values(cursor, f'''
+                    INSERT INTO bills ({", ".join(_BULK_BILL_COLUMNS)})
+                    VALUES %s
+                    ON CONFLICT (bill_id) DO NOTHING
+                    RETURNING bill_id
+                ''', values, page_size=page_size, fetch=True)
+                return [r[0] for r in inserted]
+    except Exception as e:
+        logger.error(f"Error bulk-inserting {len(rows)} bills: {e}")
+        return []
+
+
+@simulate_safe
+def bulk_upsert_bills(rows: List[Dict[str, Any]], insert_new: bool = True,
+                      page_size: int = 500) -> Dict[str, List[str]]:
+    """
+    Refresh metadata for many bills in one ``execute_values`` statement.
+
+    Existing rows get status, normalized_status and sponsor fields from
+    ``rows``; date_introduced and full_text are only filled where the row
+    has none (text that summaries were written from is never replaced).
+    Summaries, publication state and edits are left alone. New bills are
+    inserted unsummarized when ``insert_new``, otherwise skipped, dated by
+    the bill's own dates (_bulk_date_processed) rather than the load time.
+
+    Returns:
+        {"inserted": [bill_id, ...], "updated": [bill_id, ...]} (empty on error).
+    """
+    result: Dict[str, List[str]] = {"inserted": [], "updated": []}
+    if not rows:
+        return result
+    now = datetime.now().isoformat()
+    values = []
+    for row in rows:
+        title = row.get('title') or ""
+        values.append((
+            normalize_bill_id(row.get('bill_id', '')),
+            title,
+            row.get('short_title') or (deterministic_shorten_title(title, 80) if title else None),
+            row.get('status'),
+            row.get('normalized_status'),
+            row.get('congress_session'),
+            row.get('date_introduced'),
+            _bulk_date_processed(row, now),
+            row.get('source_url') or '',
+            row.get('website_slug'),
+            row.get('full_text') or '',
+            row.get('sponsor_name') or None,
+            row.get('sponsor_party') or None,
+            row.get('sponsor_state') or None,
+            '', '', False,
+        ))
+    conflict = '''
+        DO UPDATE SET
+            status = COALESCE(NULLIF(EXCLUDED.status, ''), bills.status),
+            normalized_status = COALESCE(NULLIF(EXCLUDED.normalized_status, ''), bills.normalized_status),
+            sponsor_name = COALESCE(EXCLUDED.sponsor_name, bills.sponsor_name),
+            sponsor_party = COALESCE(EXCLUDED.sponsor_party, bills.sponsor_party),
+            sponsor_state = COALESCE(EXCLUDED.sponsor_state, bills.sponsor_state),
+            date_introduced = COALESCE(NULLIF(bills.date_introduced, ''), EXCLUDED.date_introduced),
+            full_text = CASE WHEN COALESCE(LENGTH(bills.full_text), 0) < 100
+                             THEN EXCLUDED.full_text ELSE bills.full_text END
+    '''
+    if not insert_new:
+        # Only touch bills we already have: drop unknown IDs up front
+        known = get_existing_bill_ids([v[0] for v in values])
+        values = [v for v in values if v[0] in known]
+        if not values:
+            return result
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                returned = psycopg2.extras.execute_values(cursor, f'''
+                    INSERT INTO bills (
+                        bill_id, title, short_title, status, normalized_status,
+                        congress_session, date_introduced, date_processed, source_url,
+                        website_slug, full_text, sponsor_name, sponsor_party, sponsor_state,
+                        summary_tweet, summary_long, published
+                    )
+                    VALUES %s
+                    ON CONFLICT (bill_id) {conflict}
+                    RETURNING bill_id, (xmax = 0) AS inserted
+                ''', values, page_size=page_size, fetch=True)
+                for bill_id, was_inserted in returned:
+                    result["inserted" if was_inserted else "updated"].append(bill_id)
+                return result
+    except Exception as e:
+        logger.error(f"Error bulk-upserting {len(rows)} bills: {e}")
+        return {"inserted": [], "updated": []}
+
+
+def get_published_bill_statuses(bill_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Map each published bill in ``bill_ids`` to its (status, normalized_status).
+
+    Raises on database errors so callers don't mistake an outage for
+    "none of these bills are published".
+    """
+    normalized = [normalize_bill_id(b) for b in bill_ids if b]
+    if not normalized:
+        return {}
+    with db_connect() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                'SELECT bill_id, status, normalized_status FROM bills '
+                'WHERE published = TRUE AND bill_id = ANY(%s)',
+                (normalized,),
+            )
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+
+@simulate_safe
+def bulk_update_bill_statuses(changes: List[Tuple[str, str, str]], page_size: int = 500) -> int:
+    """
+    Apply (bill_id, status, normalized_status) changes in one UPDATE ... FROM (VALUES ...).
+
+    Returns:
+        Number of rows updated (0 on error).
+    """
+    if not changes:
+        return 0
+    values = [(normalize_bill_id(bill_id), status, normalized) for bill_id, status, normalized in changes]
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                updated = psycopg2.extras.execute_values(cursor, '''
+                    UPDATE bills
+                    SET status = v.status, normalized_status = v.normalized_status
+                    FROM (VALUES %s) AS v (bill_id, status, normalized_status)
+                    WHERE bills.bill_id = v.bill_id
+                    RETURNING bills.bill_id
+                ''', values, page_size=page_size, fetch=True)
+                return len(updated)
+    except Exception as e:
+        logger.error(f"Error updating statuses for {len(changes)} bills: {e}")
+        return 0
+
+
+def get_backfill_checkpoint(job: str) -> Optional[Dict[str, Any]]:
+    """
+    Return {"cursor": dict, "processed": int, "completed_at": datetime|None}
+    for a backfill job, or None if it has never run.
+    """
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    SELECT cursor_state, processed, completed_at
+                    FROM backfill_checkpoints WHERE job = %s
+                ''', (job,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                return {"cursor": json.loads(row[0]), "processed": row[1], "completed_at": row[2]}
+    except Exception as e:
+        logger.error(f"Error loading backfill checkpoint {job}: {e}")
+        return None
+
+
+@simulate_safe
+def save_backfill_checkpoint(job: str, cursor_state: Dict[str, Any], processed: int,
+                             completed: bool = False) -> bool:
+    """Upsert a backfill job's cursor; ``completed`` stamps completed_at."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO backfill_checkpoints (job, cursor_state, processed, completed_at, updated_at)
+                    VALUES (%s, %s, %s, CASE WHEN %s THEN CURRENT_TIMESTAMP END, CURRENT_TIMESTAMP)
+                    ON CONFLICT (job)
+                    DO UPDATE SET cursor_state = EXCLUDED.cursor_state,
+                                  processed = EXCLUDED.processed,
+                                  completed_at = EXCLUDED.completed_at,
+                                  updated_at = CURRENT_TIMESTAMP
+                ''', (job, json.dumps(cursor_state), processed, completed))
+                return True
+    except Exception as e:
+        logger.error(f"Error saving backfill checkpoint {job}: {e}")
+        return False
+
+
+# ── Summarization queue ──────────────────────────────────────────────────────
+# Bills inserted without summaries (bulk backfill) get one row here; a drain
+# worker (src/processors/summarization_queue.py) summarizes them off the
+# ingestion path.
+
+@simulate_safe
+def enqueue_summarization_jobs(bill_ids: List[str], archive_only: bool = False) -> int:
+    """Queue bills for summarization; already-queued bills are left alone. Returns rows added."""
+    normalized = [normalize_bill_id(b) for b in bill_ids if b]
+    if not normalized:
+        return 0
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                psycopg2.extras.execute_values(cursor, '''
+                    INSERT INTO summarization_queue (bill_id, archive_only)
+                    VALUES %s
+                    ON CONFLICT (bill_id) DO NOTHING
+                ''', [(b, archive_only) for b in normalized])
+                return cursor.rowcount
+    except Exception as e:
+        logger.error(f"Error enqueueing summarization jobs: {e}")
+        return 0
+
+
+def claim_summarization_jobs(limit: int = 10, stale_after_seconds: int = 1800) -> List[Dict[str, Any]]:
+    """
+    Atomically claim due summarization jobs (FOR UPDATE SKIP LOCKED), the same
+    way claim_publish_jobs() does. Each claim increments ``attempts``.
+    """
+    try:
+        with db_connect() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+                cursor.execute('''
+                    UPDATE summarization_queue
+                    SET status = 'in_progress',
+                        attempts = attempts + 1,
+                        locked_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE bill_id IN (
+                        SELECT bill_id FROM summarization_queue
+                        WHERE ((status = 'pending' AND next_attempt_at <= CURRENT_TIMESTAMP)
+                               OR (status = 'in_progress'
+                                   AND locked_at < CURRENT_TIMESTAMP - make_interval(secs => %s)))
+                        ORDER BY next_attempt_at ASC
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING bill_id, archive_only, attempts
+                ''', (stale_after_seconds, limit))
+                return [dict(row) for row in cursor.fetchall()]
+    except Exception as e:
+        logger.error(f"Error claiming summarization jobs: {e}")
+        return []
+
+
+@simulate_safe
+def complete_summarization_job(bill_id: str) -> bool:
+    """Mark a claimed summarization job as done."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE summarization_queue
+                    SET status = 'done', last_error = NULL, locked_at = NULL,
+                        completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                    WHERE bill_id = %s
+                ''', (normalize_bill_id(bill_id),))
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error completing summarization job {bill_id}: {e}")
+        return False
+
+
+@simulate_safe
+def fail_summarization_job(bill_id: str, error: str, retry_in_seconds: Optional[float]) -> bool:
+    """Record a failed attempt: back to 'pending' after a delay, or 'dead' if ``retry_in_seconds`` is None."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                if retry_in_seconds is None:
+                    cursor.execute('''
+                        UPDATE summarization_queue
+                        SET status = 'dead', last_error = %s, locked_at = NULL, updated_at = CURRENT_TIMESTAMP
+                        WHERE bill_id = %s
+                    ''', (error[:1000], normalize_bill_id(bill_id)))
+                else:
+                    cursor.execute('''
+                        UPDATE summarization_queue
+                        SET status = 'pending', last_error = %s, locked_at = NULL,
+                            next_attempt_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE bill_id = %s
+                    ''', (error[:1000], float(retry_in_seconds), normalize_bill_id(bill_id)))
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error recording summarization failure for {bill_id}: {e}")
+        return False
+
+
+@simulate_safe
+def archive_bill(bill_id: str) -> bool:
+    """
+    Make a bill visible on the site without posting it to social media.
+
+    Sets published = TRUE but, unlike update_tweet_info(), leaves
+    date_processed alone so archived backfill doesn't crowd out new bills.
+    """
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    'UPDATE bills SET published = TRUE WHERE bill_id = %s',
+                    (normalize_bill_id(bill_id),),
+                )
+                return cursor.rowcount == 1
+    except Exception as e:
+        logger.error(f"Error archiving bill {bill_id}: {e}")
+        return False
+
+
+# ── Ingestion watermarks ─────────────────────────────────────────────────────
+
+def get_ingestion_watermark(name: str) -> Optional[datetime]:
+    """
+    Return the stored watermark (timezone-aware) for an ingestion stream.
+
+    Returns None when the stream has never run. Raises on DB errors so the
+    caller can tell "no watermark" apart from "couldn't read it".
+    """
+    with db_connect() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT watermark FROM ingestion_watermarks WHERE name = %s', (name,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+
+@simulate_safe
+def save_ingestion_watermark(name: str, watermark: datetime) -> bool:
+    """Advance an ingestion watermark; it never moves backwards."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO ingestion_watermarks (name, watermark, updated_at)
+                    VALUES (%s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (name)
+                    DO UPDATE SET watermark = GREATEST(ingestion_watermarks.watermark, EXCLUDED.watermark),
+                                  updated_at = CURRENT_TIMESTAMP
+                ''', (name, watermark))
+                return True
+    except Exception as e:
+        logger.error(f"Error saving ingestion watermark {name}: {e}")
+        return False
+
+
+# ── LLM response cache ───────────────────────────────────────────────────────
+
+def get_llm_response(cache_key: str, max_age_days: float) -> Optional[str]:
+    """
+    Return a cached LLM response younger than ``max_age_days`` and count the hit.
+
+    Raises on DB errors; the cache layer decides how to degrade.
+    """
+    with db_connect() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute('''
+                UPDATE llm_response_cache
+                SET hits = hits + 1, last_hit_at = CURRENT_TIMESTAMP
+                WHERE cache_key = %s
+                  AND created_at > CURRENT_TIMESTAMP - make_interval(secs => %s)
+                RETURNING response
+            ''', (cache_key, max_age_days * 86400))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+
+@simulate_safe
+def save_llm_response(cache_key: str, model: str, response: str) -> bool:
+    """Store (or replace) a cached LLM response."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO llm_response_cache (cache_key, model, response, created_at)
+                    VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (cache_key)
+                    DO UPDATE SET response = EXCLUDED.response, model = EXCLUDED.model,
+                                  created_at = CURRENT_TIMESTAMP, hits = 0, last_hit_at = NULL
+                ''', (cache_key, model, response))
+                return True
+    except Exception as e:
+        logger.error(f"Error saving LLM response cache entry: {e}")
+        return False
+
+
+@simulate_safe
+def purge_llm_responses(max_age_days: float) -> int:
+    """Delete cached LLM responses older than ``max_age_days``. Returns rows removed."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    'DELETE FROM llm_response_cache '
+                    'WHERE created_at < CURRENT_TIMESTAMP - make_interval(secs => %s)',
+                    (max_age_days * 86400,),
+                )
+                return cursor.rowcount
+    except Exception as e:
+        logger.error(f"Error purging LLM response cache: {e}")
+        return 0
+
+
+# ── Shared API quota (token bucket) ──────────────────────────────────────────
+
+def consume_api_quota(name: str, cost: float, reserve: float,
+                      capacity: float, refill_per_sec: float) -> Tuple[bool, float]:
+    """
+    Atomically refill and try to take ``cost`` tokens from a shared bucket.
+
+    The take only succeeds if at least ``reserve`` tokens would remain, which
+    is how lower-priority callers leave headroom for higher-priority ones.
+    The bucket row is created on first use; capacity/refill are kept in sync
+    with the caller's configuration.
+
+    Returns:
+        (granted, level) where level is the token count after the attempt.
+        Raises on DB errors so the caller can decide to fail open.
+    """
+    with db_connect() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute('''
+                INSERT INTO api_quota (name, tokens, capacity, refill_per_sec, updated_at)
+                VALUES (%s, %s, %s, %s, clock_timestamp())
+                ON CONFLICT (name) DO UPDATE
+                SET capacity = EXCLUDED.capacity, refill_per_sec = EXCLUDED.refill_per_sec
+            ''', (name, capacity, capacity, refill_per_sec))
+            cursor.execute('''
+                WITH refilled AS (
+                    SELECT name,
+                           LEAST(capacity,
+                                 tokens + EXTRACT(EPOCH FROM (clock_timestamp() - updated_at)) * refill_per_sec
+                           ) AS level
+                    FROM api_quota
+                    WHERE name = %(name)s
+                    FOR UPDATE
+                )
+                UPDATE api_quota q
+                SET tokens = CASE WHEN r.level - %(cost)s >= %(reserve)s
+                                  THEN r.level - %(cost)s ELSE r.level END,
+                    updated_at = clock_timestamp()
+                FROM refilled r
+                WHERE q.name = r.name
+                RETURNING q.tokens, (r.level - %(cost)s >= %(reserve)s) AS granted
+            ''', {"name": name, "cost": cost, "reserve": reserve})
+            level, granted = cursor.fetchone()
+            return bool(granted), float(level)
+
+
+@simulate_safe
+def drain_api_quota(name: str) -> bool:
+    """Empty a quota bucket (e.g. after the upstream API returned 429)."""
+    try:
+        with db_connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute('''
+                    UPDATE api_quota SET tokens = 0, updated_at = clock_timestamp()
+                    WHERE name = %s
+                ''', (name,))
+                return True
+    except Exception as e:
+        logger.error(f"Error draining API quota {name}: {e}")
+        return False
@@ -0,0 +1,285 @@
+"""
+Incremental bill ingestion driven by Congress.gov ``updateDate``.
+
+Instead of re-scraping "Bill Texts Received Today" on every run, the
+orchestrator can ask Congress.gov for the bills that changed since the last
+run. The last ``updateDate`` seen is kept in Postgres
+(``ingestion_watermarks`` table) so it survives restarts; each run pages
+``/bill/{congress}?fromDateTime=...&sort=updateDate+asc`` from
+``watermark - INGEST_LOOKBACK_HOURS`` forward, so the work per run tracks
+the number of bills that actually changed.
+
+- First run (no watermark): starts ``INGEST_INITIAL_LOOKBACK_HOURS`` back.
+- Gaps: a watermark older than ``INGEST_MAX_GAP_HOURS`` is logged as a gap.
+  Pages are read oldest-first and capped at ``INGEST_MAX_PAGES``; when the
+  cap (or a failed page) cuts a run short, the watermark only advances to
+  the last bill actually read, so the next run resumes where this one
+  stopped instead of skipping the rest of the backlog.
+- The lookback overlap re-reads a little of the previous window; duplicates
+  are harmless because the orchestrator filters bills already in the DB.
+- Bills listed but not triaged yet (over the per-run text-check limit) are
+  passed to ``commit_bill_updates`` as ``pending``; the watermark then stops
+  at the oldest of them, so they are listed again next run instead of being
+  skipped. The hold is bounded: pending bills more than
+  ``INGEST_MAX_HOLD_HOURS`` older than the newest bill read no longer hold
+  it, so the watermark keeps moving and the window stays under the page cap.
+
+Usage:
+    from .bill_updates import fetch_bill_updates, commit_bill_updates
+
+    updates = fetch_bill_updates()
+    if updates is not None:
+        ... process updates.bill_ids ...
+        commit_bill_updates(updates, pending=ids_not_yet_stored)
+"""
+
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from src.utils import http
+from . import congress_quota  # noqa: F401  (meters api.congress.gov calls)
+from .congress_cache import cached_get
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+INGEST_CONGRESS = os.getenv("INGEST_CONGRESS", "119")
+INGEST_WATERMARK_NAME = os.getenv("INGEST_WATERMARK_NAME", f"bill_updates_{INGEST_CONGRESS}")
+INGEST_LOOKBACK_HOURS = float(os.getenv("INGEST_LOOKBACK_HOURS", "2"))
+INGEST_INITIAL_LOOKBACK_HOURS = float(os.getenv("INGEST_INITIAL_LOOKBACK_HOURS", "48"))
+INGEST_MAX_GAP_HOURS = float(os.getenv("INGEST_MAX_GAP_HOURS", "36"))
+INGEST_PAGE_SIZE = min(250, int(os.getenv("INGEST_PAGE_SIZE", "250")))
+INGEST_MAX_PAGES = int(os.getenv("INGEST_MAX_PAGES", "8"))
+INGEST_TEXT_CHECK_WORKERS = int(os.getenv("INGEST_TEXT_CHECK_WORKERS", "8"))
+# Text checks per run (one detail request each); later bills wait for the next run
+INGEST_TEXT_CHECK_LIMIT = int(os.getenv("INGEST_TEXT_CHECK_LIMIT", "40"))
+# Furthest the watermark is held behind the newest bill read for pending bills
+INGEST_MAX_HOLD_HOURS = float(os.getenv("INGEST_MAX_HOLD_HOURS", "24"))
+
+BILL_LIST_URL = "https://api.congress.gov/v3/bill/{congress}"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class BillUpdates:
+    """Bills changed since the watermark, plus what to record once they're handled."""
+    name: str
+    since: datetime
+    bills: List[Dict[str, Any]] = field(default_factory=list)
+    high_water: Optional[datetime] = None
+    complete: bool = True   # False if the page cap or an error cut the read short
+    gap: bool = False       # True if the previous run was too long ago (or never happened)
+
+    @property
+    def bill_ids(self) -> List[str]:
+        """Normalized IDs (``hr1234-119``), most recently updated first."""
+        ids = []
+        for bill in sorted(self.bills, key=lambda b: parse_update_date(b) or _EPOCH, reverse=True):
+            bill_id = bill_id_from_list_item(bill)
+            if bill_id and bill_id not in ids:
+                ids.append(bill_id)
+        return ids
+
+
+def bill_id_from_list_item(bill: Dict[str, Any]) -> Optional[str]:
+    """Normalized bill ID for a ``/bill`` list entry, or None if fields are missing."""
+    bill_type = (bill.get('type') or '').lower()
+    number = bill.get('number')
+    congress = bill.get('congress')
+    if bill_type and number and congress:
+        return f"{bill_type}{number}-{congress}"
+    return None
+
+
+def parse_update_date(bill: Dict[str, Any]) -> Optional[datetime]:
+    """``updateDate`` as an aware datetime (the list API sends dates or ISO timestamps)."""
+    raw = bill.get('updateDate')
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(raw).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_from_datetime(dt: datetime) -> str:
+    """Format for the API's ``fromDateTime`` / ``toDateTime`` parameters."""
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _load_watermark(name: str) -> Optional[datetime]:
+    from src.database import db
+    watermark = db.get_ingestion_watermark(name)
+    if watermark is not None and watermark.tzinfo is None:
+        watermark = watermark.replace(tzinfo=timezone.utc)
+    return watermark
+
+
+def fetch_bill_updates(congress: str = INGEST_CONGRESS, name: str = INGEST_WATERMARK_NAME,
+                       now: Optional[datetime] = None) -> Optional[BillUpdates]:
+    """
+    Page the bill list for everything updated since the stored watermark.
+
+    Returns None if the watermark can't be read or the first page fails, so
+    the caller can fall back to another discovery method.
+    """
+    api_key = os.getenv('CONGRESS_API_KEY')
+    if not api_key:
+        logger.warning("CONGRESS_API_KEY not set; cannot fetch bill updates")
+        return None
+
+    now = now or datetime.now(timezone.utc)
+    try:
+        watermark = _load_watermark(name)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read ingestion watermark {name}: {e}")
+        return None
+
+    if watermark is None:
+        since = now - timedelta(hours=INGEST_INITIAL_LOOKBACK_HOURS)
+        updates = BillUpdates(name=name, since=since, gap=True)
+        logger.info(f"🆕 No watermark for {name}; starting {INGEST_INITIAL_LOOKBACK_HOURS:g}h back")
+    else:
+        since = watermark - timedelta(hours=INGEST_LOOKBACK_HOURS)
+        behind_hours = (now - watermark).total_seconds() / 3600
+        updates = BillUpdates(name=name, since=since, gap=behind_hours > INGEST_MAX_GAP_HOURS)
+        if updates.gap:
+            logger.warning(
+                f"⚠️ Ingestion gap: watermark {watermark.isoformat()} is {behind_hours:.0f}h old "
+                f"(> {INGEST_MAX_GAP_HOURS:g}h); catching up from there"
+            )
+
+    url = BILL_LIST_URL.format(congress=congress)
+    params = {
+        'fromDateTime': format_from_datetime(since),
+        'sort': 'updateDate asc',
+        'limit': INGEST_PAGE_SIZE,
+        'format': 'json',
+        'api_key': api_key,
+    }
+    total = None
+    for page in range(INGEST_MAX_PAGES):
+        params['offset'] = page * INGEST_PAGE_SIZE
+        try:
+            resp = http.get(url, params=params, headers={"Accept": "application/json"}, timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
+        except (requests.RequestException, ValueError) as e:
+            if page == 0:
+                logger.warning(f"📡 Bill updates fetch failed: {e}")
+                return None
+            logger.warning(f"⚠️ Bill updates page {page + 1} failed ({e}); keeping the {len(updates.bills)} read so far")
+            updates.complete = False
+            break
+
+        batch = data.get('bills', [])
+        updates.bills.extend(batch)
+        total = (data.get('pagination') or {}).get('count', total)
+        if len(batch) < INGEST_PAGE_SIZE or not (data.get('pagination') or {}).get('next'):
+            break
+    else:
+        updates.complete = False
+
+    if not updates.complete:
+        logger.warning(
+            f"⚠️ Bill updates truncated at {len(updates.bills)}"
+            + (f" of {total}" if total is not None else "")
+            + "; the rest will be picked up next run"
+        )
+
+    # Pages are oldest-first, so the newest date read is a safe resume point
+    # even for a partial read.
+    dates = [d for d in (parse_update_date(b) for b in updates.bills) if d is not None]
+    updates.high_water = max(dates) if dates else None
+
+    logger.info(
+        f"📡 {len(updates.bills)} bill(s) updated since {params['fromDateTime']} "
+        f"({'complete' if updates.complete else 'partial'}{', gap' if updates.gap else ''})"
+    )
+    return updates
+
+
+def commit_bill_updates(updates: BillUpdates, pending: Iterable[str] = ()) -> bool:
+    """
+    Advance the stored watermark to the newest ``updateDate`` in ``updates``.
+
+    ``pending`` names bills from ``updates`` that haven't been triaged yet;
+    the watermark stops at the oldest of their ``updateDate``s so the next
+    run lists them again. Pending bills more than INGEST_MAX_HOLD_HOURS
+    older than the newest bill read are given up on rather than held for.
+    """
+    high_water = updates.high_water
+    if high_water is None:
+        return True
+    pending = set(pending)
+    floor = high_water - timedelta(hours=INGEST_MAX_HOLD_HOURS)
+    dates = [d for d in (parse_update_date(b) for b in updates.bills if bill_id_from_list_item(b) in pending)
+             if d is not None]
+    held = [d for d in dates if d >= floor]
+    if len(held) < len(dates):
+        logger.warning(
+            f"⚠️ {len(dates) - len(held)} pending bill(s) updated more than {INGEST_MAX_HOLD_HOURS:g}h "
+            f"before the newest; no longer holding the watermark for them"
+        )
+    if held:
+        high_water = min(high_water, min(held))
+        logger.info(f"🔖 {len(held)} listed bill(s) not triaged yet; holding the watermark at the oldest")
+    from src.database import db
+    saved = db.save_ingestion_watermark(updates.name, high_water)
+    if saved:
+        logger.info(f"🔖 Ingestion watermark {updates.name} → {high_water.isoformat()}")
+    return saved
+
+
+def _has_text_versions(bill_id: str, api_key: str) -> bool:
+    match = re.match(r'([a-z]+)(\d+)-(\d+)', bill_id)
+    if not match:
+        return False
+    bill_type, number, congress = match.groups()
+    url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{number}?format=json&api_key={api_key}"
+    try:
+        resp = cached_get(url, headers={"Accept": "application/json"}, timeout=30)
+        if resp.status_code != 200:
+            return False
+        versions = (resp.json().get('bill') or {}).get('textVersions') or {}
+        return int(versions.get('count') or 0) > 0
+    except (requests.RequestException, ValueError) as e:
+        logger.debug(f"Text check failed for {bill_id}: {e}")
+        return False
+
+
+def filter_bills_with_text(bill_ids: List[str],
+                           limit: int = INGEST_TEXT_CHECK_LIMIT) -> Tuple[List[str], List[str]]:
+    """
+    Keep only bills that have at least one published text version.
+
+    A metadata-only update (new cosponsor, committee referral) would
+    otherwise reach enrichment with no text and be marked problematic. The
+    detail responses land in the Congress.gov cache, so enrichment reuses them.
+    Only the first ``limit`` bills are checked (INGEST_TEXT_CHECK_WORKERS at
+    a time), so a large first-run backlog can't hold up the run.
+
+    Returns:
+        (bills with text, bills left unchecked)
+    """
+    api_key = os.getenv('CONGRESS_API_KEY')
+    if not bill_ids or not api_key:
+        return list(bill_ids), []
+    to_check, unchecked = list(bill_ids[:limit]), list(bill_ids[limit:])
+    with ThreadPoolExecutor(max_workers=max(1, INGEST_TEXT_CHECK_WORKERS), thread_name_prefix="text-check") as pool:
+        flags = list(pool.map(lambda bid: _has_text_versions(bid, api_key), to_check))
+    kept = [bid for bid, ok in zip(to_check, flags) if ok]
+    if len(kept) < len(to_check):
+        logger.info(f"📄 {len(to_check) - len(kept)} updated bill(s) have no text yet; skipping them")
+    if unchecked:
+        logger.info(f"📄 {len(unchecked)} updated bill(s) over the text-check limit; deferred to the next run")
+    return kept, unchecked
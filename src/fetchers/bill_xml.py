@@ -0,0 +1,243 @@
+"""
+Structure-aware reader for bill text XML (USLM and the legacy GPO bill DTD).
+
+``parse_bill_xml()`` streams a document with ``lxml.iterparse`` and returns
+both the readable text and a lightweight tree of its structural units
+(division, title, subtitle, part, chapter, section ...), each with its
+number, heading and character offsets into that text. Elements are cleared
+as soon as their text is taken, so a 2,000-page omnibus never sits in
+memory as a full DOM.
+
+Text layout, one line per block:
+
+    SEC. 2. Definitions.
+    (a) In general.—In this Act:
+    (1) Secretary.—The term "Secretary" means ...
+
+Legacy-DTD section and title numbers (``<enum>2.</enum>``) get the "SEC."
+and "TITLE" prefixes USLM already carries, so line starts mark real unit
+boundaries in both formats. Text quoted from other laws (``quotedContent`` /
+``quoted-block``) is kept in the text but never adds units to the tree.
+
+Usage:
+    from .bill_xml import parse_bill_xml
+
+    doc = parse_bill_xml(response.content)
+    for section in doc.walk():
+        print(section.label, doc.text[section.start:section.end][:80])
+"""
+
+import io
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional
+
+from lxml import etree
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Units that become nodes in the section tree
+STRUCTURAL_ELEMENTS = frozenset({
+    "division", "title", "subtitle", "part", "subpart", "chapter", "subchapter", "section",
+})
+# Every numbered level; a pending number/heading is flushed when one starts
+LEVEL_ELEMENTS = STRUCTURAL_ELEMENTS | frozenset({
+    "subsection", "paragraph", "subparagraph", "clause", "subclause", "item", "subitem",
+})
+# Blocks whose text becomes one line
+TEXT_ELEMENTS = frozenset({
+    "text", "content", "chapeau", "continuation", "continuation-text", "p",
+    "official-title", "officialTitle", "docTitle",
+})
+LABEL_ELEMENTS = frozenset({"num", "enum", "heading", "header"})
+QUOTE_ELEMENTS = frozenset({"quotedContent", "quoted-block"})
+SKIP_ELEMENTS = frozenset({"metadata", "meta", "dublinCore", "toc"})
+
+_LEGACY_PREFIXES = {"section": "SEC.", "title": "TITLE", "division": "DIVISION", "subtitle": "Subtitle"}
+
+
+@dataclass
+class BillSection:
+    """One structural unit; ``text[start:end]`` covers its heading and body."""
+    kind: str
+    num: str = ""
+    heading: str = ""
+    start: Optional[int] = None
+    end: int = 0
+    children: List["BillSection"] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return " ".join(part for part in (self.num, self.heading) if part)
+
+
+@dataclass
+class BillDocument:
+    text: str
+    sections: List[BillSection]
+
+    def walk(self) -> Iterator[BillSection]:
+        """Every unit, depth first in document order."""
+        stack = list(reversed(self.sections))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+def _local(tag: Any) -> str:
+    return etree.QName(tag).localname if isinstance(tag, str) else ""
+
+
+def _clean(elem: etree._Element) -> str:
+    return _WHITESPACE_RE.sub(" ", "".join(elem.itertext())).strip()
+
+
+def _take_text_before(host: etree._Element, stop: etree._Element) -> str:
+    """
+    Text of ``host`` that precedes its descendant ``stop``, removed from the
+    tree so it isn't read again when ``host`` ends.
+    """
+    ancestors = set(stop.iterancestors())
+    parts = [host.text or ""]
+    for node in host.iterdescendants():
+        if node is stop:
+            break
+        if isinstance(node.tag, str):
+            parts.append(node.text or "")
+        if node not in ancestors:
+            parts.append(node.tail or "")
+    node = stop
+    while node is not host:
+        parent = node.getparent()
+        parent.text = None
+        while node.getprevious() is not None:
+            del parent[0]
+        node = parent
+    return _WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+
+
+class _Builder:
+    """Accumulates lines and offsets while the parser walks the document."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.offset = 0
+        self.pending: List[str] = []    # number/heading waiting for its first line
+        self.unit_label = False         # pending holds a structural unit's own label
+        self.open: List[tuple] = []     # (element, BillSection) for open structural units
+        self.roots: List[BillSection] = []
+
+    def emit(self, line: str) -> None:
+        if self.pending:
+            line = " ".join(self.pending + [line]) if line else " ".join(self.pending)
+            self.pending = []
+            self.unit_label = False
+        if not line:
+            return
+        if self.lines:
+            self.offset += 1  # the joining newline
+        for _, node in self.open:
+            if node.start is None:
+                node.start = self.offset
+        self.lines.append(line)
+        self.offset += len(line)
+
+    def block(self, line: str) -> None:
+        """Emit a text block; a structural unit's heading gets a line of its own first."""
+        if self.unit_label:
+            self.flush()
+        self.emit(line)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.emit("")
+
+    def open_unit(self, elem: etree._Element, kind: str) -> None:
+        node = BillSection(kind=kind)
+        (self.open[-1][1].children if self.open else self.roots).append(node)
+        self.open.append((elem, node))
+
+    def close_unit(self) -> None:
+        _, node = self.open.pop()
+        if node.start is None:
+            node.start = self.offset
+        node.end = self.offset
+
+
+def parse_bill_xml(source: Any) -> BillDocument:
+    """
+    Parse bill text XML from a file object, path or bytes.
+
+    Malformed markup is recovered where possible; a document with no
+    readable text yields ``BillDocument("", [])``.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    out = _Builder()
+    skip_depth = 0
+    quote_depth = 0
+    for event, elem in etree.iterparse(source, events=("start", "end"), recover=True, huge_tree=True):
+        name = _local(elem.tag)
+        if name in SKIP_ELEMENTS:
+            skip_depth += 1 if event == "start" else -1
+            if event == "end":
+                elem.clear()
+            continue
+        if skip_depth:
+            continue
+
+        if event == "start":
+            if name in QUOTE_ELEMENTS:
+                quote_depth += 1
+                # Keep "... is amended by adding:" ahead of the quoted text
+                host = next((a for a in elem.iterancestors() if _local(a.tag) in TEXT_ELEMENTS), None)
+                if host is not None:
+                    out.block(_take_text_before(host, elem))
+            if name in LEVEL_ELEMENTS:
+                out.flush()
+                if name in STRUCTURAL_ELEMENTS and not quote_depth:
+                    out.open_unit(elem, name)
+            continue
+
+        if name in LABEL_ELEMENTS:
+            value = _clean(elem)
+            parent = elem.getparent()
+            unit = out.open[-1] if out.open else None
+            if value and unit is not None and parent is unit[0] and not quote_depth:
+                node = unit[1]
+                if name in ("num", "enum"):
+                    prefix = _LEGACY_PREFIXES.get(node.kind)
+                    if name == "enum" and prefix and not value.lower().startswith(prefix.lower()):
+                        value = f"{prefix} {value}"
+                    node.num = value
+                else:
+                    node.heading = value
+                out.unit_label = True
+            if value:
+                out.pending.append(value)
+            elem.clear(keep_tail=True)
+        elif name in TEXT_ELEMENTS:
+            out.block(_clean(elem))
+            elem.clear(keep_tail=True)
+        elif name in LEVEL_ELEMENTS:
+            out.flush()
+            if out.open and out.open[-1][0] is elem:
+                out.close_unit()
+            # Finished units are never looked at again; drop them and earlier siblings
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+        elif name in QUOTE_ELEMENTS:
+            quote_depth -= 1
+
+    out.flush()
+    while out.open:
+        out.close_unit()
+    return BillDocument("\n".join(out.lines), out.roots)
+
+
+def extract_bill_xml_text(source: Any) -> str:
+    """Plain text of a bill XML document (see ``parse_bill_xml``)."""
+    return parse_bill_xml(source).text
@@ -0,0 +1,326 @@
+"""
+Long-lived Playwright browser shared by the Congress.gov scrapers.
+
+Launching Chromium costs seconds; the tracker and "texts received today"
+scrapers used to pay that for every URL and every retry. This module keeps
+one headless Chromium running for the life of the process and hands out
+pages from a pool of reusable browser contexts.
+
+The browser is driven by Playwright's async API on a dedicated background
+thread, so any number of caller threads can submit fetches through the
+blocking ``BrowserPool.fetch()``; at most ``BROWSER_POOL_SIZE`` pages load
+at once. Images, fonts, media and analytics/tracking requests are aborted
+before they leave the browser.
+
+Usage:
+    from .browser_pool import get_browser_pool
+
+    result = get_browser_pool().fetch(url, timeout_ms=30000, wait_for="ol.bill_progress")
+    if result.status == 200:
+        soup = BeautifulSoup(result.html, "html.parser")
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.utils.deadline import DeadlineExceeded, clamp_timeout, remaining_time
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    async_playwright = None
+    PLAYWRIGHT_AVAILABLE = False
+
+# ── Configuration ────────────────────────────────────────────────────────────
+BROWSER_POOL_SIZE = max(1, int(os.getenv("BROWSER_POOL_SIZE", "3")))
+BROWSER_BLOCK_RESOURCES = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() not in ("0", "false", "no")
+BROWSER_LAUNCH_TIMEOUT_SECONDS = float(os.getenv("BROWSER_LAUNCH_TIMEOUT_SECONDS", "60"))
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
+)
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_URL_PATTERN = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|facebook\.net|"
+    r"hotjar\.com|nr-data\.net|newrelic\.com|siteimprove|adobedtm\.com|omtrdc\.net|demdex\.net|"
+    r"\.(png|jpe?g|gif|webp|svg|ico|woff2?|ttf|otf)(\?|$)",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class PageResult:
+    """Outcome of one page load."""
+    url: str
+    status: Optional[int]
+    html: str
+    elapsed: float
+
+
+class BrowserPool:
+    """
+    One Chromium instance plus a pool of reusable contexts/pages.
+
+    Thread-safe: ``fetch()`` may be called from any thread. The browser is
+    launched lazily on first use and relaunched if it disconnects.
+    """
+
+    _LATENCY_SAMPLE = 200
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, block_resources: bool = BROWSER_BLOCK_RESOURCES) -> None:
+        self.size = max(1, size)
+        self.block_resources = block_resources
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # Owned by the loop thread
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._idle: List[Any] = []
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            "launches": 0,
+            "launch_seconds": 0.0,
+            "pages_created": 0,
+            "fetches": 0,
+            "errors": 0,
+            "blocked_requests": 0,
+        }
+        self._latencies: List[float] = []
+
+    # ── Event loop thread ───────────────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _run(self, coro: Any, timeout: Optional[float]) -> Any:
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Cancel the page load so it frees its slot instead of running on
+            future.cancel()
+            raise DeadlineExceeded(f"Browser fetch exceeded {timeout:.1f}s")
+
+    # ── Browser lifecycle (loop thread) ─────────────────────────────────────
+
+    async def _ensure_browser(self) -> None:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.size)
+            # Created here so it belongs to the pool's loop
+            self._launch_lock = asyncio.Lock()
+        if self._browser is not None and self._browser.is_connected():
+            return
+        # Concurrent first fetches wait for one launch instead of each starting
+        # (and leaking) their own Playwright + Chromium
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            await self._launch()
+
+    async def _launch(self) -> None:
+        if self._browser is not None:
+            logger.warning("⚠️ Browser disconnected — relaunching Chromium")
+            self._idle.clear()
+        start = time.monotonic()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        elapsed = time.monotonic() - start
+        with self._metrics_lock:
+            self._metrics["launches"] += 1
+            self._metrics["launch_seconds"] += elapsed
+        logger.info(f"🌐 Chromium launched in {elapsed:.2f}s (pool size {self.size})")
+
+    async def _route(self, route: Any) -> None:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(request.url):
+            with self._metrics_lock:
+                self._metrics["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _checkout(self) -> Any:
+        if self._idle:
+            return self._idle.pop()
+        context = await self._browser.new_context(user_agent=DEFAULT_USER_AGENT, locale="en-US")
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        page = await context.new_page()
+        with self._metrics_lock:
+            self._metrics["pages_created"] += 1
+        return page
+
+    async def _checkin(self, page: Any, healthy: bool) -> None:
+        if healthy and self._browser is not None and self._browser.is_connected():
+            self._idle.append(page)
+            return
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+    async def _fetch(self, url: str, timeout_ms: int, wait_until: str, wait_for: Optional[str],
+                     wait_for_timeout_ms: int, user_agent: Optional[str]) -> PageResult:
+        await self._ensure_browser()
+        async with self._sem:
+            page = await self._checkout()
+            healthy = False
+            start = time.monotonic()
+            try:
+                await page.set_extra_http_headers({"User-Agent": user_agent} if user_agent else {})
+                response = await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
+                if wait_for:
+                    try:
+                        await page.wait_for_selector(wait_for, timeout=min(timeout_ms, wait_for_timeout_ms))
+                    except Exception:
+                        pass
+                html = await page.content()
+                healthy = True
+                return PageResult(url, response.status if response else None, html, time.monotonic() - start)
+            finally:
+                self._record(time.monotonic() - start, error=not healthy)
+                await self._checkin(page, healthy)
+
+    async def _shutdown(self) -> None:
+        for page in self._idle:
+            try:
+                await page.context.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    def fetch(self, url: str, timeout_ms: int = 30000, wait_until: str = "networkidle",
+              wait_for: Optional[str] = None, wait_for_timeout_ms: int = 10000,
+              user_agent: Optional[str] = None) -> PageResult:
+        """
+        Load ``url`` in a pooled page and return its status and rendered HTML.
+
+        ``wait_for`` is a best-effort selector wait after navigation. Raises
+        whatever Playwright raised (timeouts, navigation errors) so callers
+        keep their own retry policy.
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+        # Shrink page timeouts to the caller's deadline, if one is in scope
+        timeout_ms = max(1, int(1000 * clamp_timeout(timeout_ms / 1000.0, f"loading {url}")))
+        wait_for_timeout_ms = min(wait_for_timeout_ms, timeout_ms)
+        # Leave room for launch plus the page's own timeouts, but never past the deadline
+        overall = min(
+            BROWSER_LAUNCH_TIMEOUT_SECONDS + (timeout_ms + wait_for_timeout_ms) / 1000.0,
+            remaining_time(),
+        )
+        return self._run(
+            self._fetch(url, timeout_ms, wait_until, wait_for, wait_for_timeout_ms, user_agent),
+            timeout=overall,
+        )
+
+    def close(self) -> None:
+        """Close the browser and stop the loop thread."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=15)
+        except Exception as e:
+            logger.debug(f"Error shutting down browser pool: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    # ── Metrics ─────────────────────────────────────────────────────────────
+
+    def _record(self, elapsed: float, error: bool) -> None:
+        with self._metrics_lock:
+            self._metrics["fetches"] += 1
+            self._metrics["errors"] += int(error)
+            self._latencies.append(elapsed)
+            if len(self._latencies) > self._LATENCY_SAMPLE:
+                del self._latencies[: len(self._latencies) - self._LATENCY_SAMPLE]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Launch count/time, pages created, fetches, errors, blocked requests, page p50/p95 ms."""
+        with self._metrics_lock:
+            out = dict(self._metrics)
+            lat = sorted(self._latencies)
+        n = len(lat)
+        out["launch_seconds"] = round(out["launch_seconds"], 2)
+        out["page_avg_ms"] = round(1000 * sum(lat) / n, 1) if n else 0.0
+        out["page_p50_ms"] = round(1000 * lat[n // 2], 1) if n else 0.0
+        out["page_p95_ms"] = round(1000 * lat[min(n - 1, int(n * 0.95))], 1) if n else 0.0
+        return out
+
+    def log_metrics(self) -> None:
+        m = self.get_metrics()
+        if not m["fetches"]:
+            return
+        logger.info(
+            f"🌐 Browser pool: {m['launches']} launch(es) in {m['launch_seconds']}s, "
+            f"{m['fetches']} pages ({m['errors']} err), avg {m['page_avg_ms']}ms, p95 {m['page_p95_ms']}ms, "
+            f"{m['blocked_requests']} requests blocked"
+        )
+
+
+# ── Process-wide singleton ──────────────────────────────────────────────────
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get or create the BrowserPool singleton (closed automatically at exit)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+                atexit.register(_pool.close)
+    return _pool
+
+
+def shutdown_browser_pool() -> None:
+    """Log metrics and close the shared browser, if one was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.log_metrics()
+        pool.close()
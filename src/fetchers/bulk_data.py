@@ -0,0 +1,229 @@
+"""
+Readers for the GovInfo bulk-data dumps (BILLSTATUS and BILLS XML zips).
+
+Refreshing sponsors, status or text for thousands of bills through the
+per-bill JSON API costs several requests per bill. The bulk dumps carry the
+same data for a whole Congress in a few zip files, e.g.
+
+    BILLSTATUS-119-hr.zip   -> BILLSTATUS-119hr1.xml, BILLSTATUS-119hr2.xml, ...
+    BILLS-119-1-hr.zip      -> BILLS-119hr1ih.xml, BILLS-119hr1eh.xml, ...
+
+``iter_bill_records()`` streams BILLSTATUS records with ``lxml.iterparse``
+(elements are cleared as soon as they're mapped, so memory stays flat) and
+yields dicts in the same shape ``enrich_single_bill()`` returns. Bill text
+is looked up lazily in the BILLS zips: for each bill only the newest text
+version named in its BILLSTATUS ``textVersions`` is opened.
+
+Both BILLSTATUS schema generations are understood (``type``/``number`` and
+the older ``billType``/``billNumber``).
+"""
+
+import logging
+import os
+import re
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from .bill_xml import extract_bill_xml_text
+from .congress_fetcher import derive_tracker_from_actions
+from .feed_parser import construct_bill_url
+
+logger = logging.getLogger(__name__)
+
+_TEXT_FILE_RE = re.compile(r"BILLS-\d+[a-z]+\d+[a-z]+\.xml$", re.IGNORECASE)
+
+
+def _local(tag: Any) -> str:
+    """Tag name without its namespace (comments/PIs have non-string tags)."""
+    return etree.QName(tag).localname if isinstance(tag, str) else ""
+
+
+def _child(elem: Optional[etree._Element], *names: str) -> Optional[etree._Element]:
+    """First direct child whose local name is one of ``names``."""
+    if elem is None:
+        return None
+    for child in elem:
+        if _local(child.tag) in names:
+            return child
+    return None
+
+
+def _text(elem: Optional[etree._Element], *names: str) -> str:
+    child = _child(elem, *names) if names else elem
+    return (child.text or "").strip() if child is not None else ""
+
+
+def _items(elem: Optional[etree._Element], container: str) -> List[etree._Element]:
+    """The ``<item>`` children of ``elem/container`` (empty if absent)."""
+    parent = _child(elem, container)
+    return [c for c in parent if _local(c.tag) == "item"] if parent is not None else []
+
+
+# ── Bill text ────────────────────────────────────────────────────────────────
+
+class BillTextIndex:
+    """
+    Index of ``BILLS-*.xml`` members across text zips, keyed by file name.
+
+    Building it only reads the zip directories; a document is opened and
+    parsed when ``text_for()`` asks for it.
+    """
+
+    def __init__(self, zip_paths: Iterable[str]) -> None:
+        self._members: Dict[str, Tuple[str, str]] = {}
+        for path in zip_paths:
+            with zipfile.ZipFile(path) as zf:
+                for name in zf.namelist():
+                    base = os.path.basename(name)
+                    if _TEXT_FILE_RE.search(base):
+                        self._members[base.lower()] = (path, name)
+        self._open: Dict[str, zipfile.ZipFile] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name.lower() in self._members
+
+    def text_for(self, file_name: str) -> str:
+        """Plain text of one ``BILLS-*.xml`` document ("" if not in the dumps)."""
+        entry = self._members.get(file_name.lower())
+        if entry is None:
+            return ""
+        path, member = entry
+        zf = self._open.get(path)
+        if zf is None:
+            zf = self._open[path] = zipfile.ZipFile(path)
+        with zf.open(member) as fh:
+            return extract_bill_text(fh)
+
+    def close(self) -> None:
+        for zf in self._open.values():
+            zf.close()
+        self._open.clear()
+
+
+def extract_bill_text(source: Any) -> str:
+    """
+    Readable text of a bill-text XML document (USLM or the legacy bill DTD),
+    one line per block; see ``bill_xml.parse_bill_xml``.
+    """
+    return extract_bill_xml_text(source)
+
+
+# ── BILLSTATUS records ───────────────────────────────────────────────────────
+
+def _actions(bill: etree._Element) -> List[Dict[str, Any]]:
+    """Actions in the Congress.gov API JSON shape (``actionDate``, ``text``, ``type``)."""
+    actions = []
+    for item in _items(bill, "actions"):
+        text = _text(item, "text")
+        if text:
+            actions.append({
+                "actionDate": _text(item, "actionDate"),
+                "text": text,
+                "type": _text(item, "type"),
+                "actionCode": _text(item, "actionCode"),
+            })
+    return actions
+
+
+def latest_text_file(bill: etree._Element) -> Optional[str]:
+    """File name (``BILLS-119hr1ih.xml``) of the newest text version with an XML format."""
+    best: Tuple[str, str] = ("", "")
+    for version in _items(bill, "textVersions"):
+        date = _text(version, "date")
+        for fmt in _items(version, "formats"):
+            url = _text(fmt, "url")
+            if url.lower().endswith(".xml") and date >= best[0]:
+                best = (date, os.path.basename(url))
+    return best[1] or None
+
+
+def map_bill_status(bill: etree._Element, texts: Optional[BillTextIndex] = None) -> Optional[Dict[str, Any]]:
+    """
+    Map one BILLSTATUS ``<bill>`` element to the enrich_single_bill() dict.
+
+    Returns None for records without a type/number/congress.
+    """
+    bill_type = (_text(bill, "type", "billType")).lower()
+    number = _text(bill, "number", "billNumber")
+    congress = _text(bill, "congress")
+    if not (bill_type and number and congress):
+        return None
+    bill_id = f"{bill_type}{number}-{congress}"
+
+    actions = _actions(bill)
+    latest = _child(bill, "latestAction")
+    introduced_date = _text(bill, "introducedDate")
+    if not introduced_date:
+        for action in sorted(actions, key=lambda a: a["actionDate"]):
+            if "introduced" in action["text"].lower():
+                introduced_date = action["actionDate"]
+                break
+
+    sponsors = _items(bill, "sponsors")
+    primary = sponsors[0] if sponsors else None
+
+    full_text, text_source = "", "none"
+    text_file = latest_text_file(bill)
+    if texts is not None and text_file and text_file in texts:
+        full_text = texts.text_for(text_file)
+        if full_text:
+            text_source = "bulk-xml"
+
+    return {
+        "bill_id": bill_id,
+        "title": _text(bill, "title"),
+        "text_url": f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{number}/text",
+        "source_url": construct_bill_url(congress, bill_type, number),
+        "date_introduced": introduced_date or None,
+        "congress": congress,
+        "latest_action": _text(latest, "text") or None,
+        "latest_action_date": _text(latest, "actionDate") or None,
+        "tracker": derive_tracker_from_actions(actions),
+        "full_text": full_text,
+        "text_source": text_source,
+        "sponsor_name": _text(primary, "fullName"),
+        "sponsor_party": _text(primary, "party"),
+        "sponsor_state": _text(primary, "state"),
+        "update_date": _text(bill, "updateDate") or None,
+    }
+
+
+def _iter_status_documents(zip_paths: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    for path in zip_paths:
+        with zipfile.ZipFile(path) as zf:
+            for name in zf.namelist():
+                if name.lower().endswith(".xml"):
+                    with zf.open(name) as fh:
+                        yield f"{os.path.basename(path)}:{name}", fh
+
+
+def iter_bill_records(status_zips: Iterable[str], text_zips: Iterable[str] = ()) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every bill in the BILLSTATUS zips as an enrich_single_bill()-shaped
+    dict, with full text filled in from ``text_zips`` when available.
+    Unparseable documents are logged and skipped.
+    """
+    texts = BillTextIndex(text_zips) if text_zips else None
+    if texts is not None:
+        logger.info(f"📚 Indexed {len(texts)} bill text documents")
+    try:
+        for doc_name, fh in _iter_status_documents(status_zips):
+            try:
+                for _, elem in etree.iterparse(fh, events=("end",), tag=("bill", "{*}bill"), huge_tree=True):
+                    parent = elem.getparent()
+                    if parent is None or _local(parent.tag) != "billStatus":
+                        continue  # a nested <bill> reference, not the record itself
+                    record = map_bill_status(elem, texts)
+                    elem.clear()
+                    if record:
+                        yield record
+            except etree.XMLSyntaxError as e:
+                logger.warning(f"⚠️ Skipping unparseable BILLSTATUS document {doc_name}: {e}")
+    finally:
+        if texts is not None:
+            texts.close()
@@ -0,0 +1,351 @@
+"""
+On-disk cache for Congress.gov responses.
+
+The orchestrator, the Phase 4 problematic recheck and the backfills all
+re-download the same bill detail / actions / text-version JSON. This module
+keeps those responses on disk, keyed by a hash of the request URL with the
+``api_key`` stripped, so reruns over the same day's bills are served locally.
+
+- Per-endpoint TTLs (``ENDPOINT_TTLS``): actions change often, text versions
+  rarely, published bill documents never.
+- Stale entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+  when the server sent an ETag or Last-Modified; a 304 refreshes the entry.
+- Total size is capped (``CONGRESS_CACHE_MAX_MB``) with least-recently-used
+  eviction (entry mtime is touched on every hit).
+- Hit/miss counters via ``get_cache_stats()`` / ``log_cache_stats()``.
+
+Usage:
+    from .congress_cache import cached_get
+
+    resp = cached_get(url, params=params, timeout=30)
+    resp.raise_for_status()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.utils import http
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+CONGRESS_CACHE_ENABLED = os.getenv("CONGRESS_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+CONGRESS_CACHE_DIR = os.getenv(
+    "CONGRESS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "teencivics", "congress"),
+)
+CONGRESS_CACHE_MAX_MB = float(os.getenv("CONGRESS_CACHE_MAX_MB", "500"))
+CONGRESS_CACHE_TTL_DEFAULT = int(os.getenv("CONGRESS_CACHE_TTL_DEFAULT", "3600"))
+
+# (path pattern, TTL seconds) — first match wins
+ENDPOINT_TTLS: List[Tuple[Pattern[str], int]] = [
+    (re.compile(r"/bill/\d+/[a-z]+/\d+/actions/?$"), int(os.getenv("CONGRESS_CACHE_TTL_ACTIONS", "1800"))),
+    (re.compile(r"/bill/\d+/[a-z]+/\d+/text/?$"), int(os.getenv("CONGRESS_CACHE_TTL_TEXT", "86400"))),
+    (re.compile(r"/bill/\d+/[a-z]+/\d+/?$"), int(os.getenv("CONGRESS_CACHE_TTL_BILL", "10800"))),
+    # Published text documents (BILLS-119hr1ih.pdf etc.) are immutable
+    (re.compile(r"/BILLS-[\w-]+\.(pdf|htm|html|xml|txt)$", re.I), int(os.getenv("CONGRESS_CACHE_TTL_DOCUMENT", "2592000"))),
+]
+
+# Query parameters that never become part of the cache key
+_SECRET_PARAMS = frozenset({"api_key"})
+# Response headers kept with each entry
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Canonical URL for cache keys: merged, sorted query string without ``api_key``."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _SECRET_PARAMS]
+    for k, v in (params or {}).items():
+        if k not in _SECRET_PARAMS and v is not None:
+            query.append((k, str(v)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(sorted(query)), ""))
+
+
+def ttl_for(url: str) -> int:
+    """TTL in seconds for a (normalized) URL, from ``ENDPOINT_TTLS``."""
+    path = urlsplit(url).path
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.search(path):
+            return ttl
+    return CONGRESS_CACHE_TTL_DEFAULT
+
+
+class ResponseCache:
+    """
+    Content-addressed response store: ``<dir>/<aa>/<sha256>.json`` (metadata)
+    plus ``<sha256>.body`` (raw bytes).
+
+    Thread-safe within a process; concurrent processes are safe because every
+    write goes through a temp file and ``os.replace``.
+    """
+
+    def __init__(self, directory: str = CONGRESS_CACHE_DIR, max_bytes: int = int(CONGRESS_CACHE_MAX_MB * 1024 * 1024)) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # computed lazily on first store
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    @staticmethod
+    def key(normalized_url: str) -> str:
+        return hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key[:2], key)
+        return base + ".json", base + ".body"
+
+    # ── Read ────────────────────────────────────────────────────────────────
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry {key[:12]}: {e}")
+            self._remove(key)
+            return None
+        return meta, body
+
+    def touch(self, key: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Mark an entry as recently used (and optionally rewrite its metadata)."""
+        meta_path, body_path = self._paths(key)
+        try:
+            if meta is not None:
+                self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            os.utime(body_path, None)
+        except OSError:
+            pass
+
+    # ── Write ───────────────────────────────────────────────────────────────
+
+    def store(self, key: str, meta: Dict[str, Any], body: bytes) -> None:
+        meta_path, body_path = self._paths(key)
+        try:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        except (OSError, TypeError) as e:
+            self.stats["errors"] += 1
+            logger.debug(f"Could not write cache entry {key[:12]}: {e}")
+            return
+        with self._lock:
+            self.stats["stores"] += 1
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(body) - old_size
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _remove(self, key: str) -> int:
+        freed = 0
+        for path in self._paths(key):
+            try:
+                if path.endswith(".body"):
+                    freed = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+        return freed
+
+    # ── Size management ─────────────────────────────────────────────────────
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """(last_used, size, key) for every body file on disk."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for sub in os.listdir(self.directory):
+            subdir = os.path.join(self.directory, sub)
+            if not os.path.isdir(subdir):
+                continue
+            for name in os.listdir(subdir):
+                if not name.endswith(".body"):
+                    continue
+                try:
+                    st = os.stat(os.path.join(subdir, name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, name[: -len(".body")]))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until the cache is under 90% of its cap."""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, key in entries:
+            if total <= target:
+                break
+            self._remove(key)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._size = total
+            self.stats["evictions"] += evicted
+        if evicted:
+            logger.info(f"🧹 Congress cache evicted {evicted} entries ({total / 1048576:.1f} MB kept)")
+
+    def discard(self, key: str) -> bool:
+        """Remove one entry. Returns True if it was on disk."""
+        if not os.path.exists(self._paths(key)[1]):
+            return False
+        freed = self._remove(key)
+        with self._lock:
+            if self._size is not None:
+                self._size = max(0, self._size - freed)
+        return True
+
+    def clear(self) -> None:
+        for _, _, key in self._entries():
+            self._remove(key)
+        with self._lock:
+            self._size = 0
+
+    # ── Stats ───────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["revalidated"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] += 1
+
+
+def _build_response(meta: Dict[str, Any], body: bytes) -> requests.Response:
+    """Rebuild a ``requests.Response`` from a cached entry."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.reason = "OK"
+    resp._content = body
+    resp.headers = CaseInsensitiveDict(meta.get("headers") or {})
+    resp.url = meta.get("url", "")
+    resp.encoding = meta.get("encoding")
+    return resp
+
+
+# ── Singleton + fetch helper ─────────────────────────────────────────────────
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the ResponseCache singleton."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+def cached_get(url: str, params: Optional[Dict[str, Any]] = None, ttl: Optional[int] = None,
+               **kwargs: Any) -> requests.Response:
+    """
+    ``http.get`` with the on-disk cache in front of it.
+
+    Fresh entries are returned without touching the network. Stale entries
+    are revalidated with a conditional request when possible. Only 200
+    responses are stored; everything else is passed through untouched.
+    """
+    if not CONGRESS_CACHE_ENABLED:
+        return http.get(url, params=params, **kwargs)
+
+    cache = get_response_cache()
+    normalized = normalize_url(url, params)
+    key = cache.key(normalized)
+    ttl = ttl_for(normalized) if ttl is None else ttl
+
+    entry = cache.load(key)
+    if entry is not None:
+        meta, body = entry
+        if time.time() - meta.get("fetched_at", 0) < ttl:
+            cache.record("hits")
+            cache.touch(key)
+            return _build_response(meta, body)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entry is not None:
+        cached_headers = entry[0].get("headers") or {}
+        if cached_headers.get("ETag"):
+            headers["If-None-Match"] = cached_headers["ETag"]
+        if cached_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+    response = http.get(url, params=params, headers=headers or None, **kwargs)
+
+    if response.status_code == 304 and entry is not None:
+        meta, body = entry
+        meta["fetched_at"] = time.time()
+        cache.touch(key, meta)
+        cache.record("revalidated")
+        return _build_response(meta, body)
+
+    cache.record("misses")
+    if response.status_code == 200:
+        meta = {
+            "url": normalized,
+            "fetched_at": time.time(),
+            "encoding": response.encoding,
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if response.headers.get(h)},
+        }
+        cache.store(key, meta, response.content)
+    return response
+
+
+def invalidate(url: str, params: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Drop the cached response for ``url`` so the next ``cached_get`` refetches it.
+
+    For callers that know a resource changed (e.g. its ``updateDate`` moved)
+    before the endpoint TTL would expire. Returns True if an entry existed.
+    """
+    if not CONGRESS_CACHE_ENABLED:
+        return False
+    cache = get_response_cache()
+    return cache.discard(cache.key(normalize_url(url, params)))
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    return get_response_cache().get_stats()
+
+
+def log_cache_stats() -> None:
+    s = get_cache_stats()
+    logger.info(
+        f"🗄️ Congress cache: {s['hits']} hits, {s['revalidated']} revalidated, {s['misses']} misses "
+        f"(hit rate {s['hit_rate']:.0%}), {s['evictions']} evictions"
+    )
@@ -11,11 +11,17 @@ import requests
 from dotenv import load_dotenv
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
-import fitz  # PyMuPDF
 from datetime import datetime
 
 # Import headers from feed_parser to avoid 403 errors
 from .feed_parser import HEADERS, USER_AGENTS, get_random_user_agent, scrape_bill_tracker, running_in_ci
+from src.utils import http
+from src.utils import deadline
+from . import congress_quota  # noqa: F401  (meters api.congress.gov calls)
+from .congress_cache import cached_get
+from .bill_xml import extract_bill_xml_text
+from .pdf_text import extract_pdf_text
+import threading
 import time
 import random
 
@@ -30,13 +36,13 @@ CONGRESS_API_KEY = os.getenv('CONGRESS_API_KEY')
 BASE_URL = "https://api.congress.gov/v3/"
 BILL_TEXTS_FEED_URL = "https://www.congress.gov/bill-texts-received-today"
 
-# Create a session for persistent connections
-session = requests.Session()
-session.headers.update(HEADERS)
+# Browser-like headers for congress.gov page scraping. Connections are pooled
+# by the shared client in src.utils.http.
+session_headers = dict(HEADERS)
 
 def update_session_headers():
-    """Update session headers with a random user agent"""
-    session.headers.update({
+    """Update scraping headers with a random user agent"""
+    session_headers.update({
         'User-Agent': get_random_user_agent()
     })
 
@@ -60,7 +66,7 @@ def fetch_bill_details_from_api(congress: str, bill_type: str, bill_number: str,
             base_url += f'&api_key={api_key}'
         
         logger.info(f"Fetching bill details from API: {base_url}")
-        response = requests.get(base_url, timeout=30)
+        response = cached_get(base_url, timeout=30)
         response.raise_for_status()
         data = response.json().get('bill', {})
         
@@ -69,18 +75,26 @@ def fetch_bill_details_from_api(congress: str, bill_type: str, bill_number: str,
             logger.warning(f"⚠️ API response missing introducedDate for {bill_type}{bill_number}-{congress}")
         
         # Fetch actions separately if needed
-        actions_url = f'https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}/actions?format=json'
-        if api_key:
-            actions_url += f'&api_key={api_key}'
-        actions_response = requests.get(actions_url, timeout=30)
-        actions_response.raise_for_status()
-        data['actions'] = actions_response.json().get('actions', [])
+        data['actions'] = fetch_bill_actions_from_api(congress, bill_type, bill_number, api_key)
         
         return data
     except Exception as e:
         logger.error(f"Error fetching bill details from API: {e}")
         return {}
 
+def fetch_bill_actions_from_api(congress: str, bill_type: str, bill_number: str, api_key: str) -> List[Dict[str, Any]]:
+    """
+    Fetch a bill's actions list from the Congress.gov API.
+
+    Raises on HTTP errors (callers decide how to degrade).
+    """
+    actions_url = f'https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}/actions?format=json'
+    if api_key:
+        actions_url += f'&api_key={api_key}'
+    actions_response = cached_get(actions_url, timeout=30)
+    actions_response.raise_for_status()
+    return actions_response.json().get('actions', [])
+
 def fetch_bill_text_from_api(congress: str, bill_type: str, bill_number: str, api_key: str, timeout: int = 30) -> tuple[str, Optional[str]]:
     """
     Fetch the latest bill text via the Congress.gov API text endpoint.
@@ -102,7 +116,7 @@ def fetch_bill_text_from_api(congress: str, bill_type: str, bill_number: str, ap
             params["api_key"] = api_key
 
         logger.info(f"📡 Fetching bill text versions from API: {base_url}")
-        response = requests.get(base_url, params=params, timeout=timeout)
+        response = cached_get(base_url, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -136,7 +150,7 @@ def fetch_bill_text_from_api(congress: str, bill_type: str, bill_number: str, ap
 
         # Download and extract text based on format
         if fmt_type == "pdf":
-            r = session.get(url, timeout=timeout)
+            r = cached_get(url, headers=session_headers, timeout=timeout)
             r.raise_for_status()
             text = _extract_text_from_pdf(r.content)
         else:
@@ -209,6 +223,135 @@ def derive_tracker_from_actions(actions: List[Dict[str, Any]]) -> List[Dict[str,
     
     return steps
 
+# ── API-first tracker resolution ─────────────────────────────────────────────
+# api_first: trust the actions-derived tracker unless it is ambiguous or
+#            contradicted, then scrape; scrape: always scrape (legacy);
+#            api_only: never open a browser
+TRACKER_SOURCE_MODE = os.getenv("TRACKER_SOURCE_MODE", "api_first").lower()
+
+# Latest-action phrases that map to exactly one tracker step, most advanced first
+_LATEST_ACTION_STEPS = [
+    ("Became Law", ("became public law", "signed by president")),
+    ("To President", ("presented to president", "to president")),
+    ("Passed House", ("passed house", "agreed to in house", "passed/agreed to in house", "received in the senate")),
+    ("Passed Senate", ("passed senate", "agreed to in senate", "passed/agreed to in senate", "received in the house")),
+    ("Introduced", ("introduced in house", "introduced in senate", "referred to the", "referred to house",
+                    "read twice and referred", "sponsor introductory remarks")),
+]
+# Phrases whose stage the derived tracker can't represent (vetoes, failed
+# votes, committee reports); these always go to the browser
+_AMBIGUOUS_ACTION_PHRASES = ("veto", "failed", "reported", "calendar", "conference", "cloture")
+
+# Bill text version codes (from feed PDFs like BILLS-119hr1eh.pdf) -> tracker
+# steps consistent with that text having been published
+_TEXT_VERSION_STEPS = {
+    "ih": {"Introduced"},
+    "is": {"Introduced"},
+    "eh": {"Passed House"},
+    "es": {"Passed Senate"},
+    "enr": {"To President", "Became Law"},
+}
+
+_tracker_stats = {"api_trusted": 0, "ambiguous": 0, "contradiction": 0, "scrape_agreed": 0, "scrape_disagreed": 0, "scrape_failed": 0}
+_tracker_stats_lock = threading.Lock()
+
+
+def classify_latest_action(action_text: Optional[str]) -> Optional[str]:
+    """Map a latest-action text to a single tracker step name, or None if ambiguous."""
+    text = (action_text or "").lower()
+    if not text or any(phrase in text for phrase in _AMBIGUOUS_ACTION_PHRASES):
+        return None
+    for step, phrases in _LATEST_ACTION_STEPS:
+        if any(phrase in text for phrase in phrases):
+            return step
+    return None
+
+
+def _current_step(tracker: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+    """Name of the last selected step of a tracker list."""
+    for step in reversed(tracker or []):
+        if isinstance(step, dict) and step.get("selected"):
+            return str(step.get("name", "")).strip() or None
+    return None
+
+
+def _record_tracker_outcome(key: str) -> None:
+    with _tracker_stats_lock:
+        _tracker_stats[key] += 1
+
+
+def resolve_bill_tracker(actions: List[Dict[str, Any]], source_url: Optional[str] = None,
+                         latest_action: Optional[Dict[str, Any]] = None, text_version: Optional[str] = None,
+                         bill_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Build a bill's tracker, opening a browser only when the API can't be trusted.
+
+    The actions-derived tracker (``derive_tracker_from_actions``) is used as-is
+    when the latest action maps unambiguously to a step, that step matches
+    the derived tracker, and the feed's text version (if known) agrees.
+    Otherwise the Congress.gov tracker is scraped, and whether it agreed with
+    the API is counted (``get_tracker_agreement_stats``).
+    """
+    api_tracker = derive_tracker_from_actions(actions)
+    api_step = _current_step(api_tracker)
+    label = bill_id or source_url or "bill"
+
+    if TRACKER_SOURCE_MODE == "scrape":
+        reason = "scrape mode"
+    else:
+        if latest_action is None and actions:
+            latest_action = max(actions, key=lambda a: a.get("actionDate", ""))
+        latest_step = classify_latest_action((latest_action or {}).get("text"))
+        feed_steps = _TEXT_VERSION_STEPS.get((text_version or "").lower())
+
+        if latest_step is None:
+            reason, outcome = "latest action is ambiguous", "ambiguous"
+        elif latest_step != api_step:
+            reason, outcome = f"latest action says '{latest_step}' but actions say '{api_step}'", "contradiction"
+        elif feed_steps and api_step not in feed_steps:
+            reason, outcome = f"feed text version '{text_version}' contradicts '{api_step}'", "contradiction"
+        else:
+            _record_tracker_outcome("api_trusted")
+            logger.info(f"✅ Using API-derived tracker for {label}: {api_step}")
+            return api_tracker
+
+        _record_tracker_outcome(outcome)
+        if TRACKER_SOURCE_MODE == "api_only" or not source_url:
+            logger.info(f"ℹ️ Using API-derived tracker for {label} despite: {reason}")
+            return api_tracker
+
+    logger.info(f"🔍 Scraping tracker for {label} ({reason})")
+    scraped = scrape_bill_tracker(source_url, force_scrape=True) if source_url else None
+    if not scraped:
+        _record_tracker_outcome("scrape_failed")
+        return api_tracker
+    _record_tracker_outcome("scrape_agreed" if _current_step(scraped) == api_step else "scrape_disagreed")
+    return scraped
+
+
+def get_tracker_agreement_stats() -> Dict[str, Any]:
+    """Counts of tracker decisions plus the API/scrape agreement rate."""
+    with _tracker_stats_lock:
+        stats = dict(_tracker_stats)
+    decided = stats["api_trusted"] + stats["ambiguous"] + stats["contradiction"]
+    compared = stats["scrape_agreed"] + stats["scrape_disagreed"]
+    stats["api_trusted_rate"] = round(stats["api_trusted"] / decided, 3) if decided else 0.0
+    stats["scrape_agreement_rate"] = round(stats["scrape_agreed"] / compared, 3) if compared else 0.0
+    return stats
+
+
+def log_tracker_agreement_stats() -> None:
+    s = get_tracker_agreement_stats()
+    if not (s["api_trusted"] or s["ambiguous"] or s["contradiction"] or s["scrape_agreed"] or s["scrape_disagreed"]):
+        return
+    logger.info(
+        f"📊 Tracker source: {s['api_trusted']} API-trusted ({s['api_trusted_rate']:.0%}), "
+        f"{s['ambiguous']} ambiguous, {s['contradiction']} contradicted; "
+        f"scrapes agreed with API {s['scrape_agreed']}/{s['scrape_agreed'] + s['scrape_disagreed']} "
+        f"({s['scrape_agreement_rate']:.0%}), {s['scrape_failed']} failed"
+    )
+
+
 def get_recent_bills(limit: int = 10, include_text: bool = False, text_chars: int = 15000) -> List[Dict[str, str]]:
     """
     Fetch the most recent bills from the "Bill Texts Received Today" feed.
@@ -258,14 +401,6 @@ def fetch_bills_from_feed(limit: int = 10, include_text: bool = True, text_chars
         bills_with_text = 0
         bills_without_text = 0
         
-        # --- Pre-fetch scraped trackers for all bills for efficiency ---
-        source_urls = [b.get('source_url') for b in feed_bills if b.get('source_url')]
-        scraped_trackers = {}
-        if source_urls:
-            from .feed_parser import scrape_multiple_bill_trackers
-            scraped_trackers = scrape_multiple_bill_trackers(source_urls, force_scrape=True)
-        # --- End pre-fetch ---
-
         for bill in feed_bills:
             try:
                 # Fetch additional details from API
@@ -276,7 +411,14 @@ def fetch_bills_from_feed(limit: int = 10, include_text: bool = True, text_chars
                     details = fetch_bill_details_from_api(congress, bill_type, bill_number, CONGRESS_API_KEY)
                     bill['latest_action'] = details.get('latestAction', {})
                     actions = details.get('actions', [])
-                    bill['tracker'] = derive_tracker_from_actions(actions) # Default tracker
+                    # API-derived tracker; scrapes only when ambiguous or contradicted
+                    bill['tracker'] = resolve_bill_tracker(
+                        actions,
+                        source_url=bill.get('source_url'),
+                        latest_action=bill['latest_action'],
+                        text_version=bill.get('text_version'),
+                        bill_id=bill.get('bill_id'),
+                    )
                     
                     # Capture introducedDate from API if not already set
                     if not bill.get('date_introduced') and not bill.get('introduced_date'):
@@ -297,10 +439,6 @@ def fetch_bills_from_feed(limit: int = 10, include_text: bool = True, text_chars
                     else:
                         logger.debug(f"ℹ️ No sponsor data available from API for {bill.get('bill_id')}")
                 
-                # Override with more accurate scraped tracker if available
-                if bill.get('source_url') and scraped_trackers.get(bill['source_url']):
-                    bill['tracker'] = scraped_trackers[bill['source_url']]
-                
                 if include_text:
                     full_text = ""
                     text_source = 'none'
@@ -312,7 +450,7 @@ def fetch_bills_from_feed(limit: int = 10, include_text: bool = True, text_chars
                     while retry_count < max_retries and (not full_text or len(full_text.strip()) <= 100):
                         if retry_count > 0:
                             logger.info(f"🔁 Retry {retry_count}/{max_retries-1} for fetching text for {bill['bill_id']}")
-                            time.sleep(2 ** retry_count)  # Exponential backoff
+                            time.sleep(http.backoff_delay(retry_count))  # Jittered exponential backoff
                         
                         # First, try to fetch text using the API text endpoint (most reliable)
                         congress = bill.get('congress')
@@ -439,13 +577,13 @@ def download_bill_text(source_url: str, bill_id: Optional[str] = None) -> tuple[
         # Add small random delay to appear more human-like
         delay = random.uniform(1.0, 3.0)
         logger.info(f"Waiting {delay:.2f} seconds before fetching bill page for {bill_id or 'unknown'}")
-        time.sleep(delay)
+        deadline.sleep(delay)
         
         # Update headers with random user agent
         update_session_headers()
         
         logger.info(f"Fetching bill page for {bill_id or 'unknown'} at {source_url}")
-        main_page_response = session.get(source_url, timeout=30)
+        main_page_response = http.get(source_url, headers=session_headers, timeout=30)
         main_page_response.raise_for_status()
         
         soup = BeautifulSoup(main_page_response.content, 'html.parser')
@@ -498,13 +636,13 @@ def download_bill_text(source_url: str, bill_id: Optional[str] = None) -> tuple[
         # Add small delay before next request
         delay = random.uniform(0.5, 2.0)
         logger.info(f"Waiting {delay:.2f} seconds before fetching text versions page")
-        time.sleep(delay)
+        deadline.sleep(delay)
         
         # Update headers with random user agent
         update_session_headers()
             
         logger.info(f"Fetching text versions page: {text_page_url}")
-        text_page_response = session.get(text_page_url, timeout=30)
+        text_page_response = http.get(text_page_url, headers=session_headers, timeout=30)
         text_page_response.raise_for_status()
         
         text_soup = BeautifulSoup(text_page_response.content, 'html.parser')
@@ -562,14 +700,14 @@ def download_bill_text(source_url: str, bill_id: Optional[str] = None) -> tuple[
         # Add small delay before downloading text
         delay = random.uniform(0.5, 1.5)
         logger.info(f"Waiting {delay:.2f} seconds before downloading bill text")
-        time.sleep(delay)
+        deadline.sleep(delay)
         
         # Update headers with random user agent
         update_session_headers()
         
         logger.info(f"Downloading bill text from: {download_url}")
         
-        response = session.get(download_url, timeout=30)
+        response = http.get(download_url, headers=session_headers, timeout=30)
         response.raise_for_status()
         
         text = ""
@@ -602,6 +740,9 @@ def download_bill_text(source_url: str, bill_id: Optional[str] = None) -> tuple[
 def _extract_text_from_pdf(pdf_content: bytes) -> str:
     """
     Extract text from PDF content using PyMuPDF.
+
+    Runs in the PDF process pool and stops at PDF_TEXT_MAX_CHARS
+    (see src.fetchers.pdf_text).
     
     Args:
         pdf_content: Raw PDF file content as bytes
@@ -609,15 +750,7 @@ def _extract_text_from_pdf(pdf_content: bytes) -> str:
     Returns:
         Extracted text or empty string on failure
     """
-    try:
-        with fitz.open(stream=pdf_content, filetype="pdf") as doc:
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            return text
-    except Exception as e:
-        logger.error(f"Failed to extract text from PDF: {e}")
-        return ""
+    return extract_pdf_text(pdf_content)
 
 def _download_direct_text(url: str, bill_id: Optional[str] = None) -> str:
     """
@@ -638,10 +771,10 @@ def _download_direct_text(url: str, bill_id: Optional[str] = None) -> str:
         # Add small delay to appear more human-like
         delay = random.uniform(0.5, 2.0)
         logger.info(f"Waiting {delay:.2f} seconds before downloading direct text")
-        time.sleep(delay)
+        deadline.sleep(delay)
         
         logger.info(f"Downloading direct text for {bill_id or 'unknown'} from {url}")
-        response = session.get(url, timeout=30)
+        response = http.get(url, headers=session_headers, timeout=30)
         response.raise_for_status()
         
         content_type = response.headers.get('content-type', '').lower()
@@ -660,12 +793,19 @@ def _download_direct_text(url: str, bill_id: Optional[str] = None) -> str:
                 logger.info(f"Successfully downloaded TXT text from {url}")
                 return text
         
-        # Handle HTML/XML content - extract text from markup
-        elif url.endswith(('.html', '.xml')) or 'html' in content_type or 'xml' in content_type:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        # Handle bill XML (USLM / GPO bill DTD) - stream it with the structure-aware parser
+        elif url.endswith('.xml') or ('xml' in content_type and 'html' not in content_type):
+            text = extract_bill_xml_text(response.content)
+            if text and len(text.strip()) > 100:
+                logger.info(f"Successfully extracted bill XML text from {url}")
+                return text
+
+        # Handle HTML content - extract text from markup
+        elif url.endswith('.html') or 'html' in content_type:
+            soup = BeautifulSoup(response.content, 'lxml')
             text = soup.get_text()
             if text and len(text.strip()) > 100:
-                logger.info(f"Successfully extracted text from HTML/XML at {url}")
+                logger.info(f"Successfully extracted text from HTML at {url}")
                 return text
         
         # Fallback: try to extract text from any content
@@ -690,7 +830,7 @@ def fetch_bill_texts_from_feed(limit: int = 10) -> List[Dict[str, any]]:
     """
     logger.info(f"Fetching bill texts from feed: {BILL_TEXTS_FEED_URL}")
     try:
-        response = requests.get(BILL_TEXTS_FEED_URL, headers=HEADERS, timeout=30)
+        response = http.get(BILL_TEXTS_FEED_URL, headers=HEADERS, timeout=30)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -754,14 +894,9 @@ def _download_and_extract_pdf_text(pdf_url: str) -> str:
     Downloads a PDF from a URL and extracts its text content.
     """
     try:
-        response = requests.get(pdf_url, headers=HEADERS, timeout=30)
+        response = http.get(pdf_url, headers=HEADERS, timeout=30)
         response.raise_for_status()
-        
-        with fitz.open(stream=response.content, filetype="pdf") as doc:
-            text = ""
-            for page in doc:
-                text += page.get_text()
-        return text
+        return _extract_text_from_pdf(response.content)
     except Exception as e:
         logger.error(f"Failed to download or extract text from PDF {pdf_url}: {e}")
         return ""
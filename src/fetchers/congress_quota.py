@@ -0,0 +1,219 @@
+"""
+Shared Congress.gov API quota accountant.
+
+Every job that uses ``CONGRESS_API_KEY`` (daily orchestrator, problematic
+recheck, backfills, web rep lookups) spends the same hourly budget. This
+module keeps a token bucket for that budget in Postgres (``api_quota``
+table) so all processes see the same balance, and hands out tokens by
+priority class:
+
+    web      - user-facing lookups; may drain the bucket to zero, never waits
+    daily    - the daily posting run; keeps ``QUOTA_RESERVE_DAILY`` for web
+    backfill - bulk/background jobs; keeps ``QUOTA_RESERVE_BACKFILL`` free and
+               pauses until the bucket refills instead of sleeping blindly
+
+Tokens are leased from the database in small batches to avoid one DB round
+trip per API call. The accountant is wired into the shared HTTP client as a
+host hook for api.congress.gov, so callers don't need to do anything except
+declare their priority (``set_default_priority`` / ``with priority(...)``).
+If the database is unreachable the accountant fails open.
+"""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+import requests
+
+from src.utils import http
+from src.utils.deadline import current_deadline
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+CONGRESS_API_HOST = "api.congress.gov"
+QUOTA_NAME = "congress_api"
+CONGRESS_API_HOURLY_LIMIT = float(os.getenv("CONGRESS_API_HOURLY_LIMIT", "5000"))
+QUOTA_LEASE_SIZE = int(os.getenv("CONGRESS_QUOTA_LEASE_SIZE", "5"))
+QUOTA_RESERVE_DAILY = float(os.getenv("CONGRESS_QUOTA_RESERVE_DAILY", "0.10"))
+QUOTA_RESERVE_BACKFILL = float(os.getenv("CONGRESS_QUOTA_RESERVE_BACKFILL", "0.30"))
+QUOTA_DAILY_MAX_WAIT_SECONDS = float(os.getenv("CONGRESS_QUOTA_DAILY_MAX_WAIT", "300"))
+
+PRIORITIES = ("web", "daily", "backfill")
+
+# Fraction of capacity each class must leave untouched
+_RESERVE_FRACTION: Dict[str, float] = {
+    "web": 0.0,
+    "daily": QUOTA_RESERVE_DAILY,
+    "backfill": QUOTA_RESERVE_BACKFILL,
+}
+# Longest a class will pause for tokens (None = until available)
+_MAX_WAIT: Dict[str, Optional[float]] = {
+    "web": 0.0,
+    "daily": QUOTA_DAILY_MAX_WAIT_SECONDS,
+    "backfill": None,
+}
+
+
+class QuotaExhausted(requests.RequestException):
+    """Raised when no Congress.gov API quota is available within the caller's max wait."""
+
+
+class QuotaAccountant:
+    """Token-bucket client for the shared ``api_quota`` row."""
+
+    def __init__(self, name: str = QUOTA_NAME, hourly_limit: float = CONGRESS_API_HOURLY_LIMIT,
+                 lease_size: int = QUOTA_LEASE_SIZE) -> None:
+        self.name = name
+        self.capacity = float(hourly_limit)
+        self.refill_per_sec = self.capacity / 3600.0
+        self.lease_size = max(1, lease_size)
+        self._leased: Dict[str, int] = {p: 0 for p in PRIORITIES}
+        self._lock = threading.Lock()
+        self._fail_open_logged = False
+        self.stats = {"acquired": 0, "db_leases": 0, "waits": 0, "wait_seconds": 0.0, "exhausted": 0}
+
+    def _take(self, cost: int, priority: str) -> "tuple[bool, float]":
+        from src.database import db
+        if db._SIMULATE:
+            return True, self.capacity
+        reserve = self.capacity * _RESERVE_FRACTION[priority]
+        return db.consume_api_quota(self.name, cost, reserve, self.capacity, self.refill_per_sec)
+
+    def acquire(self, priority: str = "daily", max_wait: Optional[float] = -1.0) -> None:
+        """
+        Take one API call's worth of quota for ``priority``.
+
+        Blocks (pauses) until enough tokens are above the class's reserve,
+        up to ``max_wait`` seconds (default: the class's configured limit).
+        Raises QuotaExhausted if the wait would exceed it.
+        """
+        if priority not in _RESERVE_FRACTION:
+            priority = "daily"
+        if max_wait == -1.0:
+            max_wait = _MAX_WAIT[priority]
+
+        with self._lock:
+            if self._leased[priority] > 0:
+                self._leased[priority] -= 1
+                self.stats["acquired"] += 1
+                return
+
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            try:
+                granted, level = self._take(self.lease_size, priority)
+                cost = self.lease_size
+                if not granted and self.lease_size > 1:
+                    granted, level = self._take(1, priority)
+                    cost = 1
+            except Exception as e:
+                if not self._fail_open_logged:
+                    logger.warning(f"⚠️ Congress API quota tracking unavailable, proceeding untracked: {e}")
+                    self._fail_open_logged = True
+                return
+
+            if granted:
+                with self._lock:
+                    self._leased[priority] += cost - 1
+                    self.stats["acquired"] += 1
+                    self.stats["db_leases"] += 1
+                return
+
+            reserve = self.capacity * _RESERVE_FRACTION[priority]
+            wait = max(1.0, (reserve + 1 - level) / self.refill_per_sec)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or wait > remaining:
+                    self.stats["exhausted"] += 1
+                    raise QuotaExhausted(
+                        f"Congress.gov API quota exhausted for '{priority}' ({level:.0f} tokens left)"
+                    )
+            wait = min(wait, 60.0)
+            logger.info(f"⏸️ Congress API quota low ({level:.0f} left) — '{priority}' pausing {wait:.0f}s")
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += wait
+            time.sleep(wait)
+
+    def on_response(self, response: requests.Response) -> None:
+        """Empty the shared bucket when the API says we're over the limit."""
+        if response.status_code == 429:
+            logger.warning("⚠️ Congress API returned 429 — draining shared quota bucket")
+            with self._lock:
+                self._leased = {p: 0 for p in PRIORITIES}
+            try:
+                from src.database.db import drain_api_quota
+                drain_api_quota(self.name)
+            except Exception as e:
+                logger.debug(f"Could not drain quota bucket: {e}")
+
+
+# ── Priority context ─────────────────────────────────────────────────────────
+_default_priority = os.getenv("CONGRESS_QUOTA_PRIORITY", "daily")
+_local = threading.local()
+
+
+def set_default_priority(priority: str) -> None:
+    """Set the process-wide priority class (e.g. 'backfill' at script start)."""
+    global _default_priority
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown quota priority: {priority}")
+    _default_priority = priority
+
+
+def current_priority() -> str:
+    return getattr(_local, "priority", None) or _default_priority
+
+
+@contextlib.contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Temporarily use a priority class for API calls made on this thread."""
+    if name not in PRIORITIES:
+        raise ValueError(f"Unknown quota priority: {name}")
+    previous = getattr(_local, "priority", None)
+    _local.priority = name
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+# ── Singleton + HTTP hook ────────────────────────────────────────────────────
+_accountant: Optional[QuotaAccountant] = None
+_accountant_lock = threading.Lock()
+
+
+def get_quota_accountant() -> QuotaAccountant:
+    """Get or create the QuotaAccountant singleton."""
+    global _accountant
+    if _accountant is None:
+        with _accountant_lock:
+            if _accountant is None:
+                _accountant = QuotaAccountant()
+    return _accountant
+
+
+def _before_request(method: str, url: str) -> None:
+    priority_name = current_priority()
+    max_wait: Optional[float] = -1.0
+    deadline = current_deadline()
+    if deadline is not None:
+        # Don't pause for quota past the caller's deadline
+        class_wait = _MAX_WAIT.get(priority_name)
+        max_wait = deadline.remaining() if class_wait is None else min(class_wait, deadline.remaining())
+    get_quota_accountant().acquire(priority_name, max_wait=max_wait)
+
+
+def _after_response(response: requests.Response) -> None:
+    get_quota_accountant().on_response(response)
+
+
+def install() -> None:
+    """Attach the accountant to api.congress.gov requests on the shared HTTP client."""
+    http.register_host_hook(CONGRESS_API_HOST, "congress_quota", before=_before_request, after=_after_response)
+
+
+install()
@@ -11,6 +11,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from src.database.connection import postgres_connect
+from src.utils import http
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,7 @@ def fetch_legislators_json() -> List[Dict]:
     Returns list of legislator dicts or empty list on failure.
     """
     try:
-        response = requests.get(LEGISLATORS_URL, timeout=SYNC_TIMEOUT)
+        response = http.get(LEGISLATORS_URL, timeout=SYNC_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         if isinstance(data, list):
@@ -107,7 +108,7 @@ def crawl_contact_url(official_website: Optional[str]) -> Optional[str]:
         return None
 
     try:
-        response = requests.get(official_website, timeout=CRAWL_TIMEOUT)
+        response = http.get(official_website, timeout=CRAWL_TIMEOUT)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
         anchors = soup.find_all("a", href=True)
@@ -144,7 +145,7 @@ def validate_contact_url(url: Optional[str]) -> bool:
         return False
 
     try:
-        response = requests.head(url, timeout=VALIDATE_TIMEOUT, allow_redirects=True)
+        response = http.head(url, timeout=VALIDATE_TIMEOUT, allow_redirects=True)
         status = response.status_code
         final_url = response.url or url
 
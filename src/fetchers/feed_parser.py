@@ -6,33 +6,92 @@ Fetches recent bills from the Congress.gov API and enriches them with tracker da
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import os
 import requests
 from bs4 import BeautifulSoup
 
+from src.utils import http
+from src.utils.deadline import Deadline, DeadlineExceeded, bind, check_deadline, deadline_scope, remaining_time
+from . import congress_quota  # noqa: F401  (meters api.congress.gov calls)
+from .congress_cache import cached_get
+
 # Configure logging first
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
+from .browser_pool import BROWSER_POOL_SIZE, PLAYWRIGHT_AVAILABLE, get_browser_pool
+
+if PLAYWRIGHT_AVAILABLE:
     logger.info("✅ Playwright successfully imported and available")
-except ImportError as e:
-    PLAYWRIGHT_AVAILABLE = False
-    logger.warning(f"⚠️ Playwright not available: {e}")
+else:
+    logger.warning("⚠️ Playwright not available")
 
 def running_in_ci() -> bool:
     """Check if the code is running in a CI environment."""
     return bool(os.getenv('CI')) or bool(os.getenv('GITHUB_ACTIONS'))
 
+def _parse_tracker_html(html: str, source_url: str) -> Optional[List[Dict[str, Any]]]:
+    """Extract tracker steps (or the a11y status paragraph) from a rendered bill page."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 1) Primary: ordered list tracker (support old/new class names)
+    tracker = soup.find('ol', class_=['bill_progress', 'bill-progress'])
+    steps: List[Dict[str, Any]] = []
+
+    if tracker:
+        for li in tracker.find_all('li'):
+            # Get only the direct text from the li element, excluding hidden div content
+            text_parts = []
+            for content in li.contents:
+                # Skip hidden divs with class 'sol-step-info'
+                if hasattr(content, 'name') and content.name == 'div' and 'sol-step-info' in (content.get('class', [])):
+                    continue
+                # Extract text from text nodes and direct strings
+                elif hasattr(content, 'string') and content.string:
+                    text_parts.append(content.string)
+                elif isinstance(content, str):
+                    text_parts.append(content)
+
+            name = ''.join(text_parts).strip()
+            classes = (li.get('class') or [])
+            selected = ('selected' in classes) or ('current' in classes)
+            if name:
+                steps.append({"name": name, "selected": selected})
+
+        if steps:
+            logger.info(f"✅ Scraped {len(steps)} tracker steps from {source_url}")
+            return steps
+
+    # 2) Fallback: A11y paragraph explicitly states status
+    status_text = None
+    try:
+        for p_tag in soup.find_all('p', class_='hide_fromsighted'):
+            text = p_tag.get_text(" ", strip=True)
+            m = re.search(r'This bill has the status\s*(.+)$', text, re.IGNORECASE)
+            if m:
+                status_text = m.group(1).strip()
+                break
+    except Exception:
+        status_text = None
+
+    if status_text:
+        logger.info(f"✅ Parsed status from hidden paragraph for {source_url}: {status_text}")
+        # Return a minimal steps list with the current status selected
+        return [{"name": status_text, "selected": True}]
+
+    logger.warning(f"⚠️ Could not find bill tracker or status on page: {source_url}")
+    return None
+
 def scrape_bill_tracker(source_url: str, force_scrape=False, max_retries: int = 3, base_timeout: int = 30000) -> Optional[List[Dict[str, any]]]:
     """
     Scrapes the bill progress tracker from a Congress.gov bill page.
     Tries multiple selector variants and an accessibility fallback.
     Includes retry logic and increased timeout to prevent failures.
+    Pages come from the shared browser pool, so retries and repeated calls
+    don't relaunch Chromium.
     """
     if running_in_ci() and not force_scrape:
         logger.debug("Skipping HTML tracker scraping in CI mode")
@@ -41,101 +100,35 @@ def scrape_bill_tracker(source_url: str, force_scrape=False, max_retries: int =
         logger.warning("Playwright not available, cannot scrape tracker")
         return None
 
+    pool = get_browser_pool()
     for attempt in range(max_retries):
         try:
             # Increase timeout with each retry (exponential backoff)
             timeout = base_timeout * (2 ** attempt)
             logger.info(f"Attempt {attempt + 1}/{max_retries} with timeout {timeout}ms for {source_url}")
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                try:
-                    context = browser.new_context(
-                        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                                   'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
-                    )
-                    page = context.new_page()
-                    time.sleep(1)  # Small delay
-                    response = page.goto(source_url, timeout=timeout, wait_until='networkidle')
-
-                    if not response or response.status != 200:
-                        logger.warning(f"⚠️ Failed to load page: {source_url} (status: {response.status if response else 'unknown'})")
-                        if attempt < max_retries - 1:
-                            logger.info(f"Retrying in 2 seconds...")
-                            time.sleep(2)
-                            continue
-                        return None
-
-                    # Best-effort wait for either tracker list or the hidden status paragraph
-                    try:
-                        page.wait_for_selector("ol.bill_progress, ol.bill-progress, p.hide_fromsighted", timeout=min(timeout, 10000))
-                    except Exception:
-                        pass
-
-                    content = page.content()
-                    soup = BeautifulSoup(content, 'html.parser')
-
-                    # 1) Primary: ordered list tracker (support old/new class names)
-                    tracker = soup.find('ol', class_=['bill_progress', 'bill-progress'])
-                    steps: List[Dict[str, Any]] = []
-
-                    if tracker:
-                        for li in tracker.find_all('li'):
-                            # Get only the direct text from the li element, excluding hidden div content
-                            text_parts = []
-                            for content in li.contents:
-                                # Skip hidden divs with class 'sol-step-info'
-                                if hasattr(content, 'name') and content.name == 'div' and 'sol-step-info' in (content.get('class', [])):
-                                    continue
-                                # Extract text from text nodes and direct strings
-                                elif hasattr(content, 'string') and content.string:
-                                    text_parts.append(content.string)
-                                elif isinstance(content, str):
-                                    text_parts.append(content)
-                            
-                            name = ''.join(text_parts).strip()
-                            classes = (li.get('class') or [])
-                            selected = ('selected' in classes) or ('current' in classes)
-                            if name:
-                                steps.append({"name": name, "selected": selected})
-
-                        if steps:
-                            logger.info(f"✅ Scraped {len(steps)} tracker steps from {source_url}")
-                            return steps
-
-                    # 2) Fallback: A11y paragraph explicitly states status
-                    status_text = None
-                    try:
-                        for p_tag in soup.find_all('p', class_='hide_fromsighted'):
-                            text = p_tag.get_text(" ", strip=True)
-                            m = re.search(r'This bill has the status\s*(.+)$', text, re.IGNORECASE)
-                            if m:
-                                status_text = m.group(1).strip()
-                                break
-                    except Exception:
-                        status_text = None
-
-                    if status_text:
-                        logger.info(f"✅ Parsed status from hidden paragraph for {source_url}: {status_text}")
-                        # Return a minimal steps list with the current status selected
-                        return [{"name": status_text, "selected": True}]
-
-                    logger.warning(f"⚠️ Could not find bill tracker or status on page: {source_url}")
-                finally:
-                    try:
-                        if 'context' in locals():
-                            context.close()
-                    except Exception as e:
-                        logger.debug(f"Error closing context: {e}")
-                    try:
-                        browser.close()
-                    except Exception as e:
-                        logger.debug(f"Error closing browser: {e}")
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying in 2 seconds...")
-                    time.sleep(2)
-                    continue
-                return None
+
+            result = pool.fetch(
+                source_url,
+                timeout_ms=timeout,
+                wait_until='networkidle',
+                # Best-effort wait for either tracker list or the hidden status paragraph
+                wait_for="ol.bill_progress, ol.bill-progress, p.hide_fromsighted",
+            )
+
+            if result.status != 200:
+                logger.warning(f"⚠️ Failed to load page: {source_url} (status: {result.status or 'unknown'})")
+            else:
+                steps = _parse_tracker_html(result.html, source_url)
+                if steps:
+                    return steps
+            if attempt < max_retries - 1 and remaining_time() > 2:
+                logger.info(f"Retrying in 2 seconds...")
+                time.sleep(2)
+                continue
+            return None
+        except DeadlineExceeded as e:
+            logger.warning(f"⏰ Giving up on tracker scrape for {source_url}: {e}")
+            return None
         except Exception as e:
             logger.warning(f"⚠️ Attempt {attempt + 1} failed to scrape tracker from {source_url}: {e}")
             if attempt < max_retries - 1:
@@ -217,7 +210,7 @@ def fetch_bill_ids_from_api(limit: int = 20) -> List[str]:
     try:
         url = f"https://api.congress.gov/v3/bill/119?sort=updateDate+desc&limit={limit}&api_key={api_key}"
         logger.info(f"📡 API fallback: fetching recent bill IDs from Congress API (limit={limit})")
-        resp = requests.get(url, headers={"Accept": "application/json"}, timeout=30)
+        resp = http.get(url, headers={"Accept": "application/json"}, timeout=30)
         resp.raise_for_status()
         bills = resp.json().get('bills', [])
         for b in bills:
@@ -256,65 +249,47 @@ def fetch_bill_ids_from_texts_received_today() -> List[str]:
             try:
                 timeout = base_timeout * (attempt + 1)  # 15 s, then 30 s
                 logger.info(f"Playwright attempt {attempt + 1}/{max_retries} with timeout {timeout}ms")
-                with sync_playwright() as p:
-                    browser = p.chromium.launch(headless=True)
-                    try:
-                        ua = USER_AGENTS[attempt % len(USER_AGENTS)] if 'USER_AGENTS' in globals() and USER_AGENTS else HEADERS.get('User-Agent')
-                        context = browser.new_context(
-                            user_agent=ua,
-                            locale='en-US'
-                        )
-                        page = context.new_page()
-                        time.sleep(0.5)  # small delay (reduced from 1 s)
-                        page.goto(url, timeout=timeout, wait_until='domcontentloaded')
-
-                        # Best-effort wait for table presence (short)
-                        try:
-                            page.wait_for_selector("table.item_table", timeout=min(timeout, 8000))
-                        except Exception:
-                            pass
-
-                        html = page.content()
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        bill_ids: List[str] = []
-                        table = soup.find('table', class_='item_table')
-                        if not table:
-                            logger.info("No bill texts table found on page (may be empty today or Cloudflare blocked).")
-                            # Don't return [] yet — let the API fallback run
-                            break
-
-                        tbody = table.find('tbody')
-                        if not tbody:
-                            logger.info("No table body found in bill texts page.")
-                            break
-
-                        for row in tbody.find_all('tr'):
-                            strong_tag = row.find('strong')
-                            if strong_tag:
-                                # Text is like: S.2392 [119th]
-                                match = re.search(r'([a-zA-Z\.]+)(\d+)\s*\[(\d+)th\]', strong_tag.text)
-                                if match:
-                                    bill_type, bill_number, congress = match.groups()
-                                    bill_type = bill_type.replace('.', '').lower()
-                                    bill_id = f"{bill_type}{bill_number}-{congress}"
-                                    bill_ids.append(bill_id)
-
-                        if bill_ids:
-                            logger.info(f"Found {len(bill_ids)} bills on 'Texts Received Today' page: {bill_ids}")
-                            return bill_ids
-                        else:
-                            logger.info("Playwright loaded page but found 0 bill rows. Will try API fallback.")
-                            break
-                    finally:
-                        try:
-                            context.close()
-                        except Exception:
-                            pass
-                        try:
-                            browser.close()
-                        except Exception:
-                            pass
+                ua = USER_AGENTS[attempt % len(USER_AGENTS)] if 'USER_AGENTS' in globals() and USER_AGENTS else HEADERS.get('User-Agent')
+                result = get_browser_pool().fetch(
+                    url,
+                    timeout_ms=timeout,
+                    wait_until='domcontentloaded',
+                    # Best-effort wait for table presence (short)
+                    wait_for="table.item_table",
+                    wait_for_timeout_ms=8000,
+                    user_agent=ua,
+                )
+                soup = BeautifulSoup(result.html, 'html.parser')
+
+                bill_ids: List[str] = []
+                table = soup.find('table', class_='item_table')
+                if not table:
+                    logger.info("No bill texts table found on page (may be empty today or Cloudflare blocked).")
+                    # Don't return [] yet — let the API fallback run
+                    break
+
+                tbody = table.find('tbody')
+                if not tbody:
+                    logger.info("No table body found in bill texts page.")
+                    break
+
+                for row in tbody.find_all('tr'):
+                    strong_tag = row.find('strong')
+                    if strong_tag:
+                        # Text is like: S.2392 [119th]
+                        match = re.search(r'([a-zA-Z\.]+)(\d+)\s*\[(\d+)th\]', strong_tag.text)
+                        if match:
+                            bill_type, bill_number, congress = match.groups()
+                            bill_type = bill_type.replace('.', '').lower()
+                            bill_id = f"{bill_type}{bill_number}-{congress}"
+                            bill_ids.append(bill_id)
+
+                if bill_ids:
+                    logger.info(f"Found {len(bill_ids)} bills on 'Texts Received Today' page: {bill_ids}")
+                    return bill_ids
+                else:
+                    logger.info("Playwright loaded page but found 0 bill rows. Will try API fallback.")
+                    break
             except Exception as e:
                 logger.warning(f"Playwright scrape failed (attempt {attempt + 1}/{max_retries}) for '{url}': {e}")
                 if attempt < max_retries - 1:
@@ -337,7 +312,7 @@ def fetch_bill_ids_from_texts_received_today() -> List[str]:
             if attempt > 0 and 'USER_AGENTS' in globals() and USER_AGENTS:
                 headers['User-Agent'] = USER_AGENTS[attempt % len(USER_AGENTS)]
 
-            response = requests.get(url, headers=headers, timeout=30)
+            response = http.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -389,7 +364,7 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
     and falls back to the general API if that fails.
     """
     # Local import to avoid circular dependency with congress_fetcher
-    from .congress_fetcher import fetch_bill_text_from_api, download_bill_text
+    from .congress_fetcher import fetch_bill_text_from_api, fetch_bill_actions_from_api, resolve_bill_tracker, download_bill_text
     logger.info(f"🎯 Fetching and enriching bills (limit={limit})")
     api_key = os.getenv('CONGRESS_API_KEY')
     if not api_key:
@@ -409,7 +384,7 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
                 bill_type, bill_number, congress = match.groups()
                 detail_url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}?api_key={api_key}"
                 try:
-                    detail_resp = requests.get(detail_url, headers={"Accept": "application/json"}, timeout=30)
+                    detail_resp = cached_get(detail_url, headers={"Accept": "application/json"}, timeout=30)
                     if detail_resp.status_code == 200:
                         bill_data = detail_resp.json().get('bill')
                         if bill_data:
@@ -430,7 +405,7 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
         # introduced bills, not old bills with recent metadata updates
         url = f"https://api.congress.gov/v3/bill/119?sort=introducedDate-desc&limit={limit}&api_key={api_key}"
         try:
-            response = requests.get(url, headers={"Accept": "application/json"})
+            response = http.get(url, headers={"Accept": "application/json"}, timeout=30)
             response.raise_for_status()
             data = response.json()
             bills_from_api = data.get('bills', [])
@@ -455,8 +430,20 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
         
         source_url = construct_bill_url(congress, bill_type, bill_number)
         tracker_data = None
+        bill_actions: List[Dict[str, Any]] = []
         if source_url:
-            tracker_data = scrape_bill_tracker(source_url, force_scrape=True)
+            # API-derived tracker first; the browser is used only when it's ambiguous.
+            # bill_data already holds the bill's details, so only the actions are fetched.
+            try:
+                bill_actions = fetch_bill_actions_from_api(str(congress), bill_type, str(bill_number), api_key)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to fetch actions for {bill_type}{bill_number}-{congress}: {e}")
+            tracker_data = resolve_bill_tracker(
+                bill_actions,
+                source_url=source_url,
+                latest_action=bill_data.get('latestAction'),
+                bill_id=f"{bill_type}{bill_number}-{congress}",
+            )
 
         # Fetch full text via API; fallback to scrape if needed
         full_text = ""
@@ -496,9 +483,8 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
 
         # Fallback 2: Scan full actions history for an Introduced event
         if not introduced_date:
-            actions = bill_data.get('actions') or []
             introduced_action_date = None
-            for action in actions:
+            for action in bill_actions:
                 text = (action.get('text') or '').lower()
                 if 'introduced' in text:
                     introduced_action_date = action.get('actionDate')
@@ -518,7 +504,7 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
                 logger.info(
                     f"🔍 Fetching bill detail for introducedDate fallback: {bill_type}{bill_number}-{congress}"
                 )
-                detail_resp = requests.get(detail_url, headers={"Accept": "application/json"}, timeout=30)
+                detail_resp = cached_get(detail_url, headers={"Accept": "application/json"}, timeout=30)
                 if detail_resp.status_code == 200:
                     detail_bill = detail_resp.json().get("bill") or {}
                     introduced_date = detail_bill.get("introducedDate")
@@ -596,7 +582,7 @@ def fetch_and_enrich_bills(limit: int = 5) -> List[Dict[str, Any]]:
     return enriched_bills
 
 
-def enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
+def enrich_single_bill(bill_id: str, deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
     """
     Enrich a single bill by its ID (e.g., 'hr1234-119').
     Fetches details, tracker, sponsor, and full text for just one bill.
@@ -607,12 +593,22 @@ def enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
     
     Args:
         bill_id: Normalized bill ID like 'hr1234-119'
+        deadline: Optional Deadline; every HTTP call, page load and PDF
+            extraction underneath is bounded by the time it has left
     
     Returns:
-        Enriched bill dict or None if enrichment fails.
+        Enriched bill dict or None if enrichment fails or runs out of time.
     """
-    from .congress_fetcher import fetch_bill_text_from_api, fetch_bill_details_from_api, derive_tracker_from_actions, download_bill_text
-    import time as _time
+    with deadline_scope(deadline):
+        try:
+            return _enrich_single_bill(bill_id)
+        except DeadlineExceeded as e:
+            logger.warning(f"⏰ Enrichment for {bill_id} ran out of time: {e}")
+            return None
+
+
+def _enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
+    from .congress_fetcher import fetch_bill_text_from_api, fetch_bill_actions_from_api, resolve_bill_tracker, download_bill_text
     
     api_key = os.getenv('CONGRESS_API_KEY')
     if not api_key:
@@ -627,37 +623,80 @@ def enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
     bill_type, bill_number, congress = match.groups()
     logger.info(f"🔧 Enriching single bill: {bill_id}")
     
-    # 1) Fetch bill details from API
-    detail_url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}?api_key={api_key}"
-    bill_data = None
-    try:
-        detail_resp = requests.get(detail_url, headers={"Accept": "application/json"}, timeout=30)
-        if detail_resp.status_code == 200:
-            bill_data = detail_resp.json().get('bill')
-        else:
-            logger.warning(f"⚠️ API returned status {detail_resp.status_code} for {bill_id}")
-    except requests.RequestException as e:
-        logger.warning(f"❌ API call failed for {bill_id}: {e}")
+    source_url = construct_bill_url(congress, bill_type, bill_number)
+    timings: Dict[str, float] = {}
+    started = time.monotonic()
     
-    if not bill_data:
-        logger.error(f"❌ Could not fetch bill details for {bill_id}")
+    def timed(step, fn, *args, **kwargs):
+        t0 = time.monotonic()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings[step] = round(time.monotonic() - t0, 2)
+    
+    def fetch_details() -> Optional[Dict[str, Any]]:
+        detail_url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}?api_key={api_key}"
+        try:
+            detail_resp = cached_get(detail_url, headers={"Accept": "application/json"}, timeout=30)
+            if detail_resp.status_code == 200:
+                return detail_resp.json().get('bill')
+            logger.warning(f"⚠️ API returned status {detail_resp.status_code} for {bill_id}")
+        except requests.RequestException as e:
+            logger.warning(f"❌ API call failed for {bill_id}: {e}")
         return None
     
-    # 2) Fetch actions and derive tracker
-    tracker_data = None
-    try:
-        details = fetch_bill_details_from_api(congress, bill_type, bill_number, api_key)
-        actions = details.get('actions', [])
-        tracker_data = derive_tracker_from_actions(actions)
-    except Exception as e:
-        logger.warning(f"⚠️ Failed to fetch actions for {bill_id}: {e}")
+    def fetch_actions() -> Optional[List[Dict[str, Any]]]:
+        try:
+            return fetch_bill_actions_from_api(congress, bill_type, bill_number, api_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to fetch actions for {bill_id}: {e}")
+            return None
     
-    # 3) Build source URL and optionally scrape tracker
-    source_url = construct_bill_url(congress, bill_type, bill_number)
-    if source_url:
-        scraped = scrape_bill_tracker(source_url, force_scrape=True)
-        if scraped:
-            tracker_data = scraped
+    def fetch_text():
+        try:
+            return fetch_bill_text_from_api(str(congress), str(bill_type), str(bill_number), api_key, timeout=30)
+        except Exception:
+            return ("", None)
+    
+    # Details, actions and text versions don't depend on each other: fetch
+    # them side by side so the bill costs the slowest branch, not the sum.
+    # Workers don't inherit this thread's deadline scope, hence bind().
+    pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix=f"enrich-{bill_id}")
+    try:
+        details_future = pool.submit(bind(timed), 'details', fetch_details)
+        actions_future = pool.submit(bind(timed), 'actions', fetch_actions)
+        text_future = pool.submit(bind(timed), 'text', fetch_text)
+        
+        # 1) Bill details are required
+        bill_data = details_future.result()
+        if not bill_data:
+            check_deadline("bill details")
+            logger.error(f"❌ Could not fetch bill details for {bill_id}")
+            return None
+        
+        # 2) Derive tracker from actions (browser only if the API is ambiguous);
+        #    the text branch keeps downloading meanwhile
+        tracker_data = None
+        actions = actions_future.result()
+        if actions is not None:
+            try:
+                tracker_data = timed(
+                    'tracker', resolve_bill_tracker, actions,
+                    source_url=source_url,
+                    latest_action=bill_data.get('latestAction'),
+                    bill_id=bill_id,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to resolve tracker for {bill_id}: {e}")
+        
+        # 3) Scrape tracker only if the API path produced nothing
+        check_deadline("tracker")
+        if tracker_data is None and source_url:
+            tracker_data = timed('tracker_scrape', scrape_bill_tracker, source_url, force_scrape=True)
+        
+        ft, fmt = text_future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
     
     # 4) Extract introduced date with fallbacks
     introduced_date = bill_data.get('introducedDate')
@@ -686,20 +725,16 @@ def enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
         sponsor_state = primary.get('state', '')
         logger.info(f"✅ Sponsor: {sponsor_name} ({sponsor_party}-{sponsor_state})")
     
-    # 6) Fetch full text (API then scrape fallback)
+    # 6) Full text from the API branch, scrape fallback otherwise
     full_text = ""
     text_source = "none"
-    try:
-        ft, fmt = fetch_bill_text_from_api(str(congress), str(bill_type), str(bill_number), api_key, timeout=30)
-    except Exception:
-        ft, fmt = ("", None)
     if ft and len(ft.strip()) > 100:
         full_text = ft
         text_source = f"api-{fmt or 'unknown'}"
         logger.info(f"✅ Fetched {len(ft)} chars for {bill_id} from {text_source}")
     elif source_url and not running_in_ci():
         try:
-            ft2, status = download_bill_text(source_url, bill_id)
+            ft2, status = timed('text_scrape', download_bill_text, source_url, bill_id)
             if ft2 and len(ft2.strip()) > 100:
                 full_text = ft2
                 text_source = "scraped"
@@ -707,8 +742,20 @@ def enrich_single_bill(bill_id: str) -> Optional[Dict[str, Any]]:
         except Exception as e:
             logger.warning(f"⚠️ Scrape fallback failed for {bill_id}: {e}")
     
+    # Steps above swallow their own errors; a half-enriched bill that ran out
+    # of time must not reach validation (it would be marked problematic)
+    check_deadline("full text")
+    
     text_versions_url = f"https://api.congress.gov/v3/bill/{congress}/{bill_type}/{bill_number}/text"
     
+    # Timings are logged, not returned: the bill dict is sent to the LLM as-is,
+    # and per-run values would change every prompt (and its cache key)
+    timings['total'] = round(time.monotonic() - started, 2)
+    logger.info(
+        f"⏱️ Enrichment timings for {bill_id}: "
+        + ", ".join(f"{step}={secs}s" for step, secs in timings.items())
+    )
+    
     enriched = {
         'bill_id': bill_id,
         'title': bill_data.get('title'),
@@ -776,25 +823,15 @@ def _extract_introduced_date_from_bill_page(url: str, timeout: int = 30) -> Opti
         # 1) Try browser-based fetch to avoid anti-bot challenges
         if PLAYWRIGHT_AVAILABLE:
             try:
-                with sync_playwright() as p:
-                    browser = p.chromium.launch(headless=True)
-                    context = browser.new_context(
-                        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                                   'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
-                    )
-                    page = context.new_page()
-                    time.sleep(0.5)
-                    response = page.goto(url, timeout=20000, wait_until='networkidle')
-                    if response and response.status == 200:
-                        html = page.content()
-                    context.close()
-                    browser.close()
+                result = get_browser_pool().fetch(url, timeout_ms=20000, wait_until='networkidle')
+                if result.status == 200:
+                    html = result.html
             except Exception as e:
                 logger.debug(f"Playwright introduced-date fetch failed for {url}: {e}")
 
         # 2) Fallback to simple HTTP GET
         if html is None:
-            resp = requests.get(url, headers=HEADERS, timeout=timeout)
+            resp = http.get(url, headers=HEADERS, timeout=timeout)
             resp.raise_for_status()
             html = resp.content
 
@@ -941,7 +978,7 @@ def parse_bill_texts_feed(limit: int = 10) -> List[Dict[str, Any]]:
     """
     FEED_URL = "https://www.congress.gov/bill-texts-received-today"
     logger.info(f"Fetching bill texts feed: {FEED_URL}")
-    response = requests.get(FEED_URL, headers=HEADERS, timeout=30)  # Allow exceptions to propagate
+    response = http.get(FEED_URL, headers=HEADERS, timeout=30)  # Allow exceptions to propagate
     response.raise_for_status()
 
     soup = BeautifulSoup(response.content, "html.parser")
@@ -981,7 +1018,8 @@ def parse_bill_texts_feed(limit: int = 10) -> List[Dict[str, Any]]:
 
 def scrape_multiple_bill_trackers(urls: List[str], force_scrape: bool = False) -> Dict[str, Optional[List[Dict[str, Any]]]]:
     """
-    Convenience helper to scrape multiple bill trackers. Returns {url: steps or None}.
+    Scrape multiple bill trackers concurrently (up to BROWSER_POOL_SIZE pages
+    at once). Returns {url: steps or None}.
     Skips entirely in CI unless force_scrape=True.
     """
     results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
@@ -989,10 +1027,20 @@ def scrape_multiple_bill_trackers(urls: List[str], force_scrape: bool = False) -
         logger.debug("Skipping scrape_multiple_bill_trackers in CI mode")
         return {u: None for u in urls or []}
 
-    for u in (urls or []):
+    unique_urls = list(dict.fromkeys(u for u in (urls or []) if u))
+    if not unique_urls:
+        return results
+
+    def _scrape(u: str) -> Optional[List[Dict[str, Any]]]:
         try:
-            results[u] = scrape_bill_tracker(u, force_scrape=force_scrape)
+            return scrape_bill_tracker(u, force_scrape=force_scrape)
         except Exception as e:
             logger.debug(f"Tracker scrape failed for {u}: {e}")
-            results[u] = None
+            return None
+
+    # Pages load concurrently in the shared browser, bounded by BROWSER_POOL_SIZE
+    workers = min(BROWSER_POOL_SIZE, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tracker") as executor:
+        for u, steps in zip(unique_urls, executor.map(_scrape, unique_urls)):
+            results[u] = steps
     return results
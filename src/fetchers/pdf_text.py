@@ -0,0 +1,157 @@
+"""
+Capped, streaming PDF text extraction off the calling thread.
+
+Appropriations and omnibus bills run to thousands of pages. Extracting them
+page by page with ``text += page.get_text()`` built the whole document with
+quadratic string copies, on the orchestrator thread, only for the summarizer
+to cut it to 750k characters afterwards. Here:
+
+- Page texts are collected in a list and extraction stops as soon as
+  ``PDF_TEXT_MAX_CHARS`` characters are in hand.
+- Parsing runs in a small process pool (``PDF_PROCESS_WORKERS``), so
+  PyMuPDF's CPU time doesn't hold the GIL against concurrent enrichment
+  threads. ``PDF_PROCESS_WORKERS=0`` (or a broken pool) extracts in-process.
+- The caller's deadline travels as a number of seconds; the worker checks
+  it before every page and gives up with ``DeadlineExceeded`` like the
+  in-process path always did.
+- Every extraction logs pages, characters and pages/sec.
+
+Usage:
+    from .pdf_text import extract_pdf_text
+
+    text = extract_pdf_text(response.content)
+"""
+
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional
+
+import fitz  # PyMuPDF
+
+from src.utils import deadline
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+PDF_TEXT_MAX_CHARS = int(os.getenv("PDF_TEXT_MAX_CHARS", "750000"))
+PDF_PROCESS_WORKERS = max(0, int(os.getenv("PDF_PROCESS_WORKERS", "2")))
+
+
+@dataclass
+class PdfExtraction:
+    """Result of one extraction (picklable, returned from pool workers)."""
+    text: str
+    pages_read: int
+    page_count: int
+    truncated: bool
+    seconds: float
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages_read / self.seconds if self.seconds > 0 else float(self.pages_read)
+
+
+def extract_pdf_pages(pdf_content: bytes, max_chars: Optional[int] = PDF_TEXT_MAX_CHARS,
+                      budget_seconds: Optional[float] = None) -> PdfExtraction:
+    """
+    Extract text page by page, stopping once ``max_chars`` is reached.
+
+    Runs in pool workers, so the deadline arrives as ``budget_seconds``
+    rather than through the thread-local scope. Raises DeadlineExceeded
+    when the budget runs out before the document is done.
+    """
+    started = time.monotonic()
+    budget = deadline.Deadline(budget_seconds)
+    parts = []
+    total = 0
+    pages_read = 0
+    truncated = False
+    with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+        page_count = doc.page_count
+        for page in doc:
+            budget.check("extracting PDF page")
+            chunk = page.get_text()
+            pages_read += 1
+            if max_chars and total + len(chunk) >= max_chars:
+                parts.append(chunk[: max_chars - total])
+                truncated = True
+                break
+            parts.append(chunk)
+            total += len(chunk)
+    return PdfExtraction("".join(parts), pages_read, page_count, truncated, time.monotonic() - started)
+
+
+# ── Process pool ─────────────────────────────────────────────────────────────
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared pool, created on first use (None when disabled)."""
+    global _pool
+    if PDF_PROCESS_WORKERS <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn, not fork: the parent has live threads (HTTP pool, browser)
+                _pool = ProcessPoolExecutor(max_workers=PDF_PROCESS_WORKERS,
+                                            mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes (registered with atexit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def _run(pdf_content: bytes, max_chars: Optional[int]) -> PdfExtraction:
+    remaining = deadline.remaining_time()
+    budget = None if remaining == math.inf else remaining
+    deadline.check_deadline("extracting PDF")
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            future = pool.submit(extract_pdf_pages, pdf_content, max_chars, budget)
+            # Small grace period so the worker's own deadline check fires first
+            return future.result(timeout=None if budget is None else budget + 5)
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️ PDF process pool broke ({e}); extracting in-process")
+            shutdown_pool()
+    return extract_pdf_pages(pdf_content, max_chars, budget)
+
+
+def extract_pdf_text(pdf_content: bytes, max_chars: Optional[int] = PDF_TEXT_MAX_CHARS) -> str:
+    """
+    Text of a PDF, at most ``max_chars`` characters ("" on failure or timeout).
+    """
+    try:
+        result = _run(pdf_content, max_chars)
+    except (deadline.DeadlineExceeded, FutureTimeout) as e:
+        logger.warning(f"⏰ PDF extraction stopped: {e}")
+        return ""
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF: {e}")
+        return ""
+    logger.info(
+        f"📄 PDF text: {result.pages_read}/{result.page_count} pages, {len(result.text)} chars "
+        f"in {result.seconds:.2f}s ({result.pages_per_second:.0f} pages/s)"
+        + (" — stopped at character cap" if result.truncated else "")
+    )
+    return result.text
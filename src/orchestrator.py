@@ -9,7 +9,8 @@ import sys
 import logging
 import json
 import time as time_module  # For time.sleep()
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime, time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 import pytz
@@ -26,12 +27,21 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.fetchers.feed_parser import fetch_and_enrich_bills, normalize_status, fetch_bill_ids_from_texts_received_today, fetch_bill_ids_from_api, enrich_single_bill
-from src.processors.summarizer import summarize_bill_enhanced
-from src.processors.argument_generator import generate_bill_arguments
-from src.publishers.twitter_publisher import post_tweet, format_bill_tweet, validate_tweet_content, is_twitter_configured
-from src.publishers.facebook_publisher import FacebookPublisher
+from src.fetchers.congress_cache import log_cache_stats
+from src.fetchers.browser_pool import shutdown_browser_pool
+from src.fetchers.congress_fetcher import log_tracker_agreement_stats
+from src.fetchers.bill_updates import BillUpdates, commit_bill_updates, fetch_bill_updates, filter_bills_with_text
+from src.processors.llm_cache import log_cache_stats as log_llm_cache_stats
+from src.processors.llm_circuit import log_circuit_metrics as log_llm_circuit_metrics
+from src.processors.llm_client import log_latency_metrics as log_llm_latency_metrics
+from src.processors.summarizer import log_hedge_stats, summarize_bill_enhanced
+from src.processors.argument_generator import arguments_for_summary
+from src.publishers.twitter_publisher import format_bill_tweet, validate_tweet_content
+from src.publishers.publisher_manager import get_publisher_manager
+from src.publishers.publish_outbox import drain_publish_outbox
 from src.database.db import (
-    bill_already_posted, get_bill_by_id, insert_bill, update_tweet_info,
+    bill_already_posted, get_bill_by_id, get_existing_bill_ids, insert_bill,
+    cancel_publish_jobs, enqueue_publish_jobs,
     generate_website_slug, init_db, normalize_bill_id,
     select_and_lock_unposted_bill, has_posted_today, mark_bill_as_problematic,
     get_all_problematic_bills, unmark_bill_as_problematic,
@@ -40,6 +50,7 @@ from src.database.db import (
     get_unposted_count, get_problematic_count, get_post_ready_count,
 )
 from src.utils.validation import validate_bill_data, is_bill_ready_for_posting
+from src.utils.deadline import Deadline
 
 # NOTE: Substack posting is disabled (Cloudflare blocks datacenter IPs).
 # Implementation archived in archives/orchestrator_pre_substack.py
@@ -143,21 +154,109 @@ REPLENISH_TARGET = int(os.getenv("REPLENISH_TARGET", "10"))
 # avoid hitting the 30-minute GitHub Actions job timeout.
 REPLENISH_TIME_BUDGET_SECONDS = int(os.getenv("REPLENISH_TIME_BUDGET_SECONDS", "1080"))  # 18 min
 
+# ── Bill discovery ───────────────────────────────────────────────────────────
+# "updates": bills changed since the stored updateDate watermark (falls back
+# to the scrape if the API call fails); "texts_today": scrape the
+# "Bill Texts Received Today" page every run.
+INGEST_SOURCE = os.getenv("INGEST_SOURCE", "updates").lower()
+
+# ── Speculative enrichment settings ──────────────────────────────────────────
+# While one Phase 3 candidate is validated/summarized/posted, enrich up to this
+# many of the next candidates in the background (0 = strictly sequential).
+SPECULATIVE_ENRICH_AHEAD = max(0, int(os.getenv("SPECULATIVE_ENRICH_AHEAD", "2")))
+# Don't start new speculative enrichments after this many seconds into the run.
+SPECULATIVE_ENRICH_BUDGET_SECONDS = int(os.getenv("SPECULATIVE_ENRICH_BUDGET_SECONDS", "900"))  # 15 min
+
 def enrich_with_timeout(bill_id: str, timeout: int = ENRICHMENT_TIMEOUT_SECONDS) -> Optional[Dict]:
     """
     Wrap enrich_single_bill() with a timeout so one slow scrape cannot kill
     the entire workflow run.  Returns None on timeout.
+
+    The worker gets a Deadline, so its HTTP calls, page loads and PDF
+    extraction wind down on their own; we don't wait for it past the
+    timeout either way.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrich")
+    future = executor.submit(enrich_single_bill, bill_id, Deadline(timeout))
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        logger.warning(f"⏰ Enrichment for {bill_id} timed out after {timeout}s. Skipping.")
+        return None
+    except Exception as e:
+        logger.warning(f"❌ Enrichment failed for {bill_id}: {e}")
+        return None
+    finally:
+        executor.shutdown(wait=False)
+
+
+class SpeculativeEnricher:
+    """
+    Enrich Phase 3 candidates in order, keeping up to ``ahead`` of the next
+    candidates enriching in background threads while the caller works on
+    the current one.
+
+    Iterating yields ``(bill_id, enriched_or_None)`` in candidate order, each
+    bounded by ``timeout`` from when its enrichment started. No new
+    enrichment starts after ``deadline`` (epoch seconds). Once the caller is
+    done, ``drain_surplus()`` collects enrichments that already started so
+    they can go to the reservoir instead of being thrown away.
     """
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(enrich_single_bill, bill_id)
+
+    def __init__(self, candidate_ids: List[str], ahead: int = SPECULATIVE_ENRICH_AHEAD,
+                 timeout: int = ENRICHMENT_TIMEOUT_SECONDS, deadline: Optional[float] = None) -> None:
+        self._queue = deque(candidate_ids)
+        self._width = 1 + max(0, ahead)
+        self._timeout = timeout
+        self._deadline = deadline
+        self._pending: deque = deque()  # (bill_id, future, started_monotonic)
+        self._executor = ThreadPoolExecutor(max_workers=self._width, thread_name_prefix="enrich")
+
+    def _fill(self) -> None:
+        while self._queue and len(self._pending) < self._width:
+            if self._deadline is not None and time_module.time() >= self._deadline:
+                if self._queue:
+                    logger.info(f"⏱️ Speculative enrichment budget reached — not starting {len(self._queue)} more candidate(s)")
+                    self._queue.clear()
+                return
+            bid = self._queue.popleft()
+            future = self._executor.submit(enrich_single_bill, bid, Deadline(self._timeout))
+            self._pending.append((bid, future, time_module.monotonic()))
+
+    def _result(self, bid: str, future: Any, started: float) -> Optional[Dict]:
+        remaining = self._timeout - (time_module.monotonic() - started)
         try:
-            return future.result(timeout=timeout)
+            return future.result(timeout=max(0.0, remaining))
         except FuturesTimeoutError:
-            logger.warning(f"⏰ Enrichment for {bill_id} timed out after {timeout}s. Skipping.")
-            return None
+            future.cancel()
+            logger.warning(f"⏰ Enrichment for {bid} timed out after {self._timeout}s. Skipping.")
         except Exception as e:
-            logger.warning(f"❌ Enrichment failed for {bill_id}: {e}")
-            return None
+            logger.warning(f"❌ Enrichment failed for {bid}: {e}")
+        return None
+
+    def __iter__(self) -> Iterator[Tuple[str, Optional[Dict]]]:
+        self._fill()
+        while self._pending:
+            bid, future, started = self._pending.popleft()
+            enriched = self._result(bid, future, started)
+            # Start the next candidate before handing this one to the caller
+            self._fill()
+            yield bid, enriched
+
+    def drain_surplus(self) -> List[Tuple[str, Dict]]:
+        """Wait for already-started enrichments and return the successful ones."""
+        surplus = []
+        while self._pending:
+            bid, future, started = self._pending.popleft()
+            enriched = self._result(bid, future, started)
+            if enriched:
+                surplus.append((bid, enriched))
+        self.close()
+        return surplus
+
+    def close(self) -> None:
+        self._queue.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _recheck_problematic_bill(
@@ -274,7 +373,8 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
     1. Phase 0 (Pre): If problematic count > 50, run Phase 4 healing first (capped at 10)
     2. Phase 1 (Fast): Fetch just the bill IDs from "Texts Received Today" (~10s)
     3. Phase 2 (Fast): Filter out bills already in DB (already posted)
-    4. Phase 3 (Lazy): Enrich candidate bills ONE AT A TIME until one posts successfully
+    4. Phase 3 (Lazy): Enrich candidate bills in order (next SPECULATIVE_ENRICH_AHEAD
+       in the background) until one posts successfully; surplus goes to the reservoir
        - Reservoir logic: if unposted backlog > 10, skip new feed inserts & post from backlog
     5. Phase 4 (Recovery): Re-check eligible problematic bills (15-day delay, single attempt)
 
@@ -406,8 +506,15 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
 
                 # ── Phase 1 (Fast): Fetch bill IDs only ──────────────────────
                 phase1_start = time_module.time()
-                logger.info("📥 Phase 1: Fetching bill IDs from 'Texts Received Today'...")
-                bill_ids = fetch_bill_ids_from_texts_received_today()
+                updates = None
+                if INGEST_SOURCE == "updates":
+                    logger.info("📥 Phase 1: Fetching bills updated since the last run...")
+                    updates = fetch_bill_updates()
+                if updates is not None:
+                    bill_ids = updates.bill_ids
+                else:
+                    logger.info("📥 Phase 1: Fetching bill IDs from 'Texts Received Today'...")
+                    bill_ids = fetch_bill_ids_from_texts_received_today()
                 phase1_elapsed = time_module.time() - phase1_start
                 logger.info(f"⏱️ Phase 1: Fetched {len(bill_ids)} bill IDs in {phase1_elapsed:.1f}s")
 
@@ -421,6 +528,7 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
                 logger.info("🔍 Phase 2: Filtering candidates against database...")
                 candidate_ids = []
                 db_hit_bills = []  # Bills in DB but not yet posted (can skip enrichment)
+                deferred: List[str] = []  # New bills from `updates` not text-checked this run
                 for bid in bill_ids:
                     bid = normalize_bill_id(bid)
                     if bill_already_posted(bid):
@@ -437,6 +545,9 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
                     else:
                         logger.info(f"   🆕 {bid} is new. Adding to enrichment candidates.")
                         candidate_ids.append(bid)
+                if updates is not None:
+                    # Metadata-only updates have nothing to summarize yet
+                    candidate_ids, deferred = filter_bills_with_text(candidate_ids)
                 phase2_elapsed = time_module.time() - phase2_start
                 logger.info(f"⏱️ Phase 2: Filtered to {len(db_hit_bills)} DB hits + {len(candidate_ids)} new in {phase2_elapsed:.1f}s")
 
@@ -462,17 +573,24 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
                         phase3_elapsed = time_module.time() - phase3_start
                         logger.info(f"⏱️ Phase 3: Successfully processed {bid} in {phase3_elapsed:.1f}s")
                         logger.info(f"✅ Successfully processed bill {bid}")
+                        _commit_ingestion(updates, deferred)
                         return 0
                     else:
                         logger.info(f"⏭️  DB candidate {bid} failed processing, trying next...")
 
-                # 3b) Enrich new candidates one at a time (with timeout)
-                for bid in candidate_ids:
-                    logger.info(f"🔧 Enriching new candidate: {bid}")
-                    enrich_start = time_module.time()
-                    enriched = enrich_with_timeout(bid)
-                    enrich_elapsed = time_module.time() - enrich_start
-                    logger.info(f"⏱️ Enriched {bid} in {enrich_elapsed:.1f}s")
+                # 3b) Enrich new candidates in order, with the next
+                #     SPECULATIVE_ENRICH_AHEAD enriching in the background
+                logger.info(
+                    f"🔧 Enriching {len(candidate_ids)} new candidate(s) "
+                    f"({SPECULATIVE_ENRICH_AHEAD} ahead, {ENRICHMENT_TIMEOUT_SECONDS}s timeout each)"
+                )
+                enricher = SpeculativeEnricher(
+                    candidate_ids,
+                    deadline=run_start + SPECULATIVE_ENRICH_BUDGET_SECONDS,
+                )
+                enrich_start = time_module.time()
+                for bid, enriched in enricher:
+                    logger.info(f"⏱️ Enrichment result for {bid} after {time_module.time() - enrich_start:.1f}s")
 
                     if not enriched:
                         logger.warning(f"⏭️  Enrichment returned None for {bid}, skipping.")
@@ -500,9 +618,13 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
                         phase3_elapsed = time_module.time() - phase3_start
                         logger.info(f"⏱️ Phase 3: Successfully processed {bid} in {phase3_elapsed:.1f}s")
                         logger.info(f"✅ Successfully processed bill {bid}")
+                        # Bills enriched ahead of time go to the reservoir, not the bin
+                        _store_surplus_in_reservoir(enricher.drain_surplus(), run_start, dry_run, simulate, sim_log)
+                        _commit_ingestion(updates, deferred)
                         return 0
                     else:
                         logger.info(f"⏭️  Enriched candidate {bid} failed processing, trying next...")
+                enricher.close()
 
                 # All 3a+3b candidates exhausted without a successful post.
                 # Try to replenish the reservoir with any valid candidates that
@@ -528,11 +650,13 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
                         if result == 0:
                             phase3_elapsed = time_module.time() - phase3_start
                             logger.info(f"⏱️ Phase 3: Successfully processed {bid} in {phase3_elapsed:.1f}s")
+                            _commit_ingestion(updates, deferred)
                             return 0
                         else:
                             logger.info(f"   ⏭️  DB fallback bill {bid} failed, trying next...")
                             continue
 
+                _commit_ingestion(updates, deferred)
                 phase3_elapsed = time_module.time() - phase3_start
                 logger.info(f"⏱️ Phase 3: All candidates exhausted in {phase3_elapsed:.1f}s (scrape attempt {scrape_attempt})")
 
@@ -594,6 +718,19 @@ def main(dry_run: bool = False, simulate: bool = False) -> int:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
         return 1
 
+def _commit_ingestion(updates: Optional[BillUpdates], deferred: List[str]) -> None:
+    """
+    Advance the bill-updates watermark past every bill that was triaged this
+    run. Deferred bills (over the text-check limit) that still have no DB
+    row hold it back, within INGEST_MAX_HOLD_HOURS, so the next run lists
+    them again.
+    """
+    if updates is None:
+        return
+    stored = get_existing_bill_ids(deferred) if deferred else set()
+    commit_bill_updates(updates, pending=[bid for bid in deferred if bid not in stored])
+
+
 def _replenish_reservoir(
     candidate_ids: list,
     run_start: float,
@@ -639,33 +776,62 @@ def _replenish_reservoir(
             logger.info(f"   ⏭️  Enrichment returned None for {bid}. Skipping.")
             continue
 
-        is_valid, reasons = validate_bill_data(enriched)
-        if not is_valid:
-            reason_str = "; ".join(reasons)
-            logger.info(f"   🚫 {bid} invalid during replenishment: {reason_str}. Marking problematic.")
-            if simulate:
-                sim_log["would_mark_problematic"].append(bid)
-                logger.info(f"   🧪 SIMULATE: would mark {bid} problematic")
-            else:
-                mark_bill_as_problematic(bid, f"Validation failed (replenishment): {reason_str}")
-            continue
-
-        if simulate:
-            sim_log["would_post"].append(f"{bid}[reservoir]")
-            logger.info(f"   🧪 SIMULATE: would insert {bid} into reservoir (no posting)")
-            inserted += 1
-            continue
-
-        result = process_single_bill(enriched, None, dry_run, post_to_social=False)
-        if result == 0:
+        if _insert_into_reservoir(bid, enriched, dry_run, simulate, sim_log):
             inserted += 1
             logger.info(f"   ✅ {bid} added to reservoir ({inserted} inserted this run)")
-        else:
-            logger.info(f"   ⏭️  {bid} failed insertion during replenishment. Continuing.")
 
     logger.info(f"📦 Reservoir replenishment complete: {inserted} bill(s) inserted.")
 
 
+def _insert_into_reservoir(bid: str, enriched: Dict, dry_run: bool, simulate: bool, sim_log: Dict) -> bool:
+    """Validate an enriched bill and store it without posting. Returns True if inserted."""
+    is_valid, reasons = validate_bill_data(enriched)
+    if not is_valid:
+        reason_str = "; ".join(reasons)
+        logger.info(f"   🚫 {bid} invalid during replenishment: {reason_str}. Marking problematic.")
+        if simulate:
+            sim_log["would_mark_problematic"].append(bid)
+            logger.info(f"   🧪 SIMULATE: would mark {bid} problematic")
+        else:
+            mark_bill_as_problematic(bid, f"Validation failed (replenishment): {reason_str}")
+        return False
+
+    if simulate:
+        sim_log["would_post"].append(f"{bid}[reservoir]")
+        logger.info(f"   🧪 SIMULATE: would insert {bid} into reservoir (no posting)")
+        return True
+
+    if process_single_bill(enriched, None, dry_run, post_to_social=False) == 0:
+        return True
+    logger.info(f"   ⏭️  {bid} failed insertion during replenishment. Continuing.")
+    return False
+
+
+def _store_surplus_in_reservoir(
+    surplus: List[Tuple[str, Dict]],
+    run_start: float,
+    dry_run: bool,
+    simulate: bool,
+    sim_log: Dict,
+) -> None:
+    """Insert speculatively enriched bills that weren't needed for posting."""
+    if not surplus:
+        return
+    logger.info(f"📦 Storing {len(surplus)} speculatively enriched bill(s) in the reservoir")
+    inserted = 0
+    for bid, enriched in surplus:
+        elapsed = time_module.time() - run_start
+        if elapsed >= REPLENISH_TIME_BUDGET_SECONDS:
+            logger.info(
+                f"⏱️ Surplus storage: time budget ({REPLENISH_TIME_BUDGET_SECONDS}s) "
+                f"reached after {elapsed:.0f}s — stopping early."
+            )
+            break
+        if _insert_into_reservoir(bid, enriched, dry_run, simulate, sim_log):
+            inserted += 1
+    logger.info(f"📦 Surplus storage complete: {inserted} bill(s) inserted.")
+
+
 def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict], dry_run: bool, post_to_social: bool = True) -> int:
     """
     Process a single bill candidate. Returns 0 on success, 1 on failure.
@@ -730,8 +896,8 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
                 selected_bill["status"] = derived_status_text or bill_data.get("status")
                 selected_bill["normalized_status"] = derived_normalized_status or bill_data.get("normalized_status")
 
-                # Generate new summaries
-                summary = summarize_bill_enhanced(selected_bill)
+                # Generate new summaries (the stored ones were weak, so skip the LLM cache)
+                summary = summarize_bill_enhanced(selected_bill, force_refresh=True)
                 logger.info("✅ Summaries generated successfully (regen path)")
 
                 # Validate summary content
@@ -770,11 +936,7 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
                         # ── Generate arguments on regen path ──
                         logger.info(f"💬 Generating support/oppose arguments for {bill_id} (regen)...")
                         try:
-                            args = generate_bill_arguments(
-                                bill_title=bill_data.get("title", ""),
-                                summary_overview=bill_data.get("summary_overview", ""),
-                                summary_detailed=bill_data.get("summary_detailed", ""),
-                            )
+                            args = arguments_for_summary(bill_data.get("title", ""), summary)
                             bill_data["argument_support"] = args.get("support", "")
                             bill_data["argument_oppose"] = args.get("oppose", "")
                             from src.database.db import update_bill_arguments as _uba
@@ -831,7 +993,7 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
                 logger.error(f"❌ Summary contains 'full bill text' phrase for bill {bill_id}. Regenerating.")
                 # Try one more time with a retry mechanism
                 time_module.sleep(2)  # Small delay before retry
-                summary = summarize_bill_enhanced(selected_bill)
+                summary = summarize_bill_enhanced(selected_bill, force_refresh=True)
                 summary_fields = [summary.get("overview", ""), summary.get("detailed", ""), summary.get("tweet", "")]
                 if any("full bill text" in field.lower() for field in summary_fields):
                     logger.error(f"❌ Summary still contains 'full bill text' phrase after retry for bill {bill_id}. Marking as problematic.")
@@ -889,11 +1051,7 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
             # ── Generate arguments (support/oppose) after summarization ──
             logger.info(f"💬 Generating support/oppose arguments for {bill_id}...")
             try:
-                args = generate_bill_arguments(
-                    bill_title=bill_data.get("title", ""),
-                    summary_overview=bill_data.get("summary_overview", ""),
-                    summary_detailed=bill_data.get("summary_detailed", ""),
-                )
+                args = arguments_for_summary(bill_data.get("title", ""), summary)
                 bill_data["argument_support"] = args.get("support", "")
                 bill_data["argument_oppose"] = args.get("oppose", "")
                 logger.info(f"✅ Arguments generated for {bill_id} "
@@ -988,7 +1146,7 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
                 logger.info(f"🔄 Attempting one-shot summary regeneration for {bill_id}")
                 try:
                     # Regenerate summaries
-                    summary = summarize_bill_enhanced(bill_data)
+                    summary = summarize_bill_enhanced(bill_data, force_refresh=True)
                     
                     # Update bill_data with new summaries
                     bill_data["summary_tweet"] = summary.get("tweet", "")
@@ -1026,101 +1184,45 @@ def process_single_bill(selected_bill: Dict, selected_bill_data: Optional[Dict],
             logger.info(f"🔵 Tweet content:\n{formatted_tweet}")
             return 0
 
-        # ── Post to all configured platforms ──
-        any_posted = False
-        tweet_url = None
-
-        # Twitter
-        if not is_twitter_configured():
-            logger.info("ℹ️ Twitter not configured, skipping")
-        else:
-            logger.info("🚀 Posting tweet...")
-            tw_success, tw_url = post_tweet(formatted_tweet)
-            if tw_success:
-                logger.info(f"✅ Tweet posted: {tw_url}")
-                any_posted = True
-                tweet_url = tw_url
-            else:
-                logger.error("❌ Twitter posting failed")
-
-        # Bluesky
-        try:
-            from src.publishers.bluesky_publisher import BlueskyPublisher
-            bluesky = BlueskyPublisher()
-            if bluesky.is_configured():
-                logger.info("🦋 Posting to Bluesky...")
-                bsky_post = bluesky.format_post(bill_data)
-                bsky_success, bsky_url = bluesky.post(bsky_post)
-                if bsky_success:
-                    logger.info(f"✅ Bluesky posted: {bsky_url}")
-                    any_posted = True
-                    if not tweet_url:
-                        tweet_url = bsky_url
-                else:
-                    logger.warning("⚠️ Bluesky posting failed (non-fatal)")
-            else:
-                logger.info("ℹ️ Bluesky not configured, skipping")
-        except ImportError:
-            logger.info("ℹ️ Bluesky publisher not available, skipping")
-        except Exception as e:
-            logger.warning(f"⚠️ Bluesky posting error (non-fatal): {e}")
-
-        # Threads
-        try:
-            from src.publishers.threads_publisher import ThreadsPublisher
-            threads = ThreadsPublisher()
-            if threads.is_configured():
-                logger.info("🧵 Posting to Threads...")
-                threads_post = threads.format_post(bill_data)
-                threads_success, threads_url = threads.post(threads_post)
-                if threads_success:
-                    logger.info(f"✅ Threads posted: {threads_url}")
-                    any_posted = True
-                    if not tweet_url:
-                        tweet_url = threads_url
-                else:
-                    logger.warning("⚠️ Threads posting failed (non-fatal)")
-            else:
-                logger.info("ℹ️ Threads not configured, skipping")
-        except ImportError:
-            logger.info("ℹ️ Threads publisher not available, skipping")
-        except Exception as e:
-            logger.warning(f"⚠️ Threads posting error (non-fatal): {e}")
-
-        # Facebook
-        try:
-            facebook = FacebookPublisher()
-            if facebook.is_configured():
-                logger.info("📘 Posting to Facebook...")
-                facebook_post = facebook.format_post(bill_data)
-                facebook_success, facebook_url = facebook.post(facebook_post)
-                if facebook_success:
-                    logger.info(f"✅ Facebook posted: {facebook_url}")
-                    any_posted = True
-                    if not tweet_url:
-                        tweet_url = facebook_url
-                else:
-                    logger.warning("⚠️ Facebook posting failed (non-fatal)")
-            else:
-                logger.info("ℹ️ Facebook not configured, skipping")
-        except ImportError:
-            logger.info("ℹ️ Facebook publisher not available, skipping")
-        except Exception as e:
-            logger.warning(f"⚠️ Facebook posting error (non-fatal): {e}")
+        # ── Enqueue one outbox job per configured platform ──
+        platforms = get_publisher_manager().get_configured_platforms()
+        if not platforms:
+            logger.error("❌ No publishing platforms configured. The bill will be retried in the next run.")
+            return 1
+        if not enqueue_publish_jobs(bill_id, platforms):
+            logger.error("❌ Failed to enqueue publish jobs. The bill will be retried in the next run.")
+            return 1
 
-        # ── Mark bill as published if at least one platform succeeded ──
-        if any_posted:
-            logger.info("💾 Updating database with tweet information...")
-            if update_tweet_info(bill_id, tweet_url or "posted-no-url"):
+        # ── First delivery attempt now; once any platform posts, the bill is
+        # published and failed platforms stay queued for the drain worker ──
+        logger.info(f"🚀 Publishing to {', '.join(platforms)}...")
+        outbox = drain_publish_outbox(bill_id=bill_id, bill=bill_data, tweet_text=formatted_tweet)
+        if outbox["succeeded"] or outbox["unknown"]:
+            if not outbox["succeeded"]:
+                # A timed-out post may have landed: keep the bill published and its
+                # jobs queued rather than cancelling and risking a second post
+                logger.warning(
+                    f"⏱️ {outbox['unknown']} platform(s) timed out with no confirmed post; "
+                    "treating the bill as published (outcome unknown)"
+                )
+            if outbox["retrying"]:
+                logger.info(f"📦 {outbox['retrying']} platform(s) queued for retry in publish_outbox")
+            if outbox["published"] or outbox["already_published"]:
                 logger.info("✅ Database updated successfully")
                 logger.info("🎉 Orchestrator completed successfully!")
                 return 0
-            else:
-                logger.error("❌ Database update failed. Bill will be marked as problematic.")
-                mark_bill_as_problematic(bill_id, "update_tweet_info() returned False")
-                return 1
+            logger.error("❌ Database update failed. Bill will be marked as problematic.")
+            mark_bill_as_problematic(bill_id, "update_tweet_info() returned False")
+            return 1
         else:
-            logger.error("❌ No platforms posted successfully. The bill will be retried in the next run.")
+            # Nothing went out: cancel the queued retries so the drain worker can't
+            # publish this bill later on top of whichever bill the next run posts.
+            # Re-enqueueing (a later run picking this bill again) revives them.
+            cancelled = cancel_publish_jobs(bill_id, "no platform posted on the first attempt")
+            logger.error(
+                "❌ No platforms posted successfully on the first attempt. "
+                f"Cancelled {cancelled} queued publish job(s); the bill stays unpublished for a later run."
+            )
             return 1
 
     except Exception as e:
@@ -1134,4 +1236,12 @@ if __name__ == "__main__":
     parser.add_argument("--simulate", action="store_true",
                         help="Full pipeline run with ZERO database writes. Logs what would happen.")
     args = parser.parse_args()
-    sys.exit(main(dry_run=args.dry_run, simulate=args.simulate))
+    exit_code = main(dry_run=args.dry_run, simulate=args.simulate)
+    log_cache_stats()
+    log_llm_cache_stats()
+    log_llm_latency_metrics()
+    log_llm_circuit_metrics()
+    log_hedge_stats()
+    log_tracker_agreement_stats()
+    shutdown_browser_pool()
+    sys.exit(exit_code)
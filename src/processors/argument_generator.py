@@ -6,7 +6,8 @@ import time
 from typing import Optional, List, Dict, Any
 
 from src.database.db import get_bill_by_id, update_bill_arguments
-from src.processors.summarizer import _get_venice_client
+from src.processors import llm_circuit, llm_rate_limit
+from src.processors.llm_client import get_client
 
 # ── Logging ─────────────────────────────────────────────────────────────────
 logger = logging.getLogger(__name__)
@@ -42,22 +43,29 @@ def _truncate_at_sentence(text: str, max_length: int) -> str:
 
 
 def _call_venice_argument_generation(prompt: str, model: str) -> Optional[str]:
-    """Call Venice AI to generate argument text."""
+    """Call Venice AI to generate argument text (None on failure or while the model's circuit is open)."""
     try:
-        client = _get_venice_client()
+        client = get_client()
+        llm_circuit.check(model)
+        llm_rate_limit.acquire(len(prompt), 1024)
         start_time = time.time()
         
-        response = client.chat.completions.create(
-            model=model,
-            max_tokens=1024,
-            temperature=0.7,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            timeout=20.0,
-        )
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                max_tokens=1024,
+                temperature=0.7,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                timeout=20.0,
+            )
+        except Exception as e:
+            llm_circuit.record(model, time.time() - start_time, e)
+            raise
         
         duration = time.time() - start_time
+        llm_circuit.record(model, duration)
         logger.info(f"Argument generation ({model}) took {duration:.2f}s")
         
         content = response.choices[0].message.content.strip()
@@ -72,6 +80,35 @@ def _call_venice_argument_generation(prompt: str, model: str) -> Optional[str]:
         return None
 
 
+def _clean_argument(text: Optional[str]) -> Optional[str]:
+    """Normalize a generated argument into a sentence continuation; None if unusable."""
+    if not text:
+        return None
+    t = text.strip()
+    # Remove common prefixes from chatty models
+    t = re.sub(r"^(because|that|it is because)\s+", "", t, flags=re.IGNORECASE)
+    # Remove accidental "I support/oppose" prefixes
+    t = re.sub(r"^(i\s+support\s+.*?because\s+|i\s+oppose\s+.*?because\s+)", "", t, flags=re.IGNORECASE).strip()
+    # Ensure it acts as a continuation (start lowercase generally, unless proper noun)
+    if len(t) > 0 and t[0].isupper() and " " in t:
+        first_word = t.split(" ")[0]
+        # Common proper nouns to protect
+        protected = {
+            "I", "American", "Congress", "Senate", "House", "Federal",
+            "Government", "Constitution", "America", "United", "States",
+            "President", "Supreme", "Court", "Democrat", "Republican",
+            "Bill", "Act",
+        }
+        if first_word.rstrip('.,;:') not in protected:
+            t = t[0].lower() + t[1:]
+    # Remove textual artifacts
+    t = t.replace('"', '').replace("'", "'")
+    # Quality check
+    if len(t) < 20:
+        return None
+    return _truncate_at_sentence(t, MAX_ARGUMENT_CHARS)
+
+
 def generate_bill_arguments(bill_title: str,
                             summary_overview: str = "",
                             summary_detailed: str = "") -> Dict[str, str]:
@@ -156,36 +193,8 @@ def generate_bill_arguments(bill_title: str,
         o_gen = _call_venice_argument_generation(prompt_oppose, ARGUMENT_FALLBACK)
 
     # ── 5. Process & Validation ──────────────────────────────────────────────
-    
-    def validate_and_clean(text: Optional[str]) -> Optional[str]:
-        if not text:
-            return None
-        t = text.strip()
-        # Remove common prefixes from chatty models
-        t = re.sub(r"^(because|that|it is because)\s+", "", t, flags=re.IGNORECASE)
-        # Remove accidental "I support/oppose" prefixes
-        t = re.sub(r"^(i\s+support\s+.*?because\s+|i\s+oppose\s+.*?because\s+)", "", t, flags=re.IGNORECASE).strip()
-        # Ensure it acts as a continuation (start lowercase generally, unless proper noun)
-        if len(t) > 0 and t[0].isupper() and " " in t:
-            first_word = t.split(" ")[0]
-            # Common proper nouns to protect
-            protected = {
-                "I", "American", "Congress", "Senate", "House", "Federal",
-                "Government", "Constitution", "America", "United", "States",
-                "President", "Supreme", "Court", "Democrat", "Republican",
-                "Bill", "Act",
-            }
-            if first_word.rstrip('.,;:') not in protected:
-                t = t[0].lower() + t[1:]
-        # Remove textual artifacts
-        t = t.replace('"', '').replace("'", "'")
-        # Quality check
-        if len(t) < 20:
-            return None
-        return _truncate_at_sentence(t, MAX_ARGUMENT_CHARS)
-
-    support_text = validate_and_clean(s_gen)
-    oppose_text = validate_and_clean(o_gen)
+    support_text = _clean_argument(s_gen)
+    oppose_text = _clean_argument(o_gen)
     
     # ── 6. Generic Template Fallback (last resort) ───────────────────────────
     # If AI generation failed completely, use a generic template.
@@ -199,6 +208,26 @@ def generate_bill_arguments(bill_title: str,
     return {"support": support_text, "oppose": oppose_text}
 
 
+def arguments_for_summary(bill_title: str, summary: Dict[str, str]) -> Dict[str, str]:
+    """
+    Support/oppose arguments for a freshly summarized bill.
+
+    Uses the ``argument_support`` / ``argument_oppose`` fields the combined
+    summary call returned; only when either is missing or unusable does it
+    fall back to ``generate_bill_arguments()`` (one extra call per side).
+    """
+    support = _clean_argument(summary.get("argument_support"))
+    oppose = _clean_argument(summary.get("argument_oppose"))
+    if support and oppose:
+        logger.info("💬 Using arguments from the combined summary response")
+        return {"support": support, "oppose": oppose}
+    return generate_bill_arguments(
+        bill_title=bill_title,
+        summary_overview=summary.get("overview", ""),
+        summary_detailed=summary.get("detailed", ""),
+    )
+
+
 def _extractive_fallback(bill_title: str, summary_text: str = "") -> Dict[str, str]:
     """Legacy stub — delegates to generic template fallback."""
     return _generic_template_fallback(bill_title)
@@ -0,0 +1,262 @@
+"""
+Incremental validation of a JSON object arriving as streamed model output.
+
+A malformed summary used to be discovered only after the whole completion
+had arrived and ``_try_parse_json_with_fallback`` gave up, so the entire
+call (minutes for a large bill) was repeated. ``JsonStreamValidator`` is
+fed the text chunk by chunk and raises ``StreamValidationError`` as soon as
+the output can no longer become the expected object:
+
+- no ``{`` within the first ``_MAX_PREFIX_CHARS`` characters (a short
+  preamble such as a code fence or "Here is the JSON:" is skipped);
+- a syntax error in the object structure (a key that isn't a string, a
+  missing colon or comma, a mismatched bracket);
+- a top-level string value that fails its check (e.g. ``detailed`` without
+  the summary's section headers), checked the moment the string closes;
+- a closed object missing a required key (an empty ``{}`` is accepted; the
+  prompt asks for it when there is no bill text).
+
+``finish()`` returns the object's text. If the stream ended early (token
+limit, dropped connection) the open string, arrays and objects are closed
+locally instead of throwing the response away; a cut-off string still has
+to pass its check, and a cut-off number or literal is dropped.
+
+Usage:
+    validator = JsonStreamValidator(JsonExpectation(required=("overview", "detailed")))
+    for piece in stream:
+        validator.feed(piece)
+        if validator.done:
+            break
+    text = validator.finish()
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Leading text skipped before the object starts (fences, a short preamble)
+_MAX_PREFIX_CHARS = 200
+_SCALAR_START = set("-0123456789tfn")
+_SCALAR_CHARS = set("+-.0123456789eEtruefalsn")
+
+
+class StreamValidationError(ValueError):
+    """The streamed output can no longer be the expected JSON object."""
+
+
+@dataclass
+class JsonExpectation:
+    """What the streamed object must contain."""
+    required: Tuple[str, ...] = ()
+    # Top-level string values checked as soon as they close: key -> predicate
+    checks: Dict[str, Callable[[str], bool]] = field(default_factory=dict)
+
+
+class JsonStreamValidator:
+    """Character-level state machine over one top-level JSON object."""
+
+    def __init__(self, expect: Optional[JsonExpectation] = None) -> None:
+        self.expect = expect or JsonExpectation()
+        self.parts: List[str] = []
+        self.prefix = ""
+        self.started = False
+        self.done = False
+        self.repaired = False
+        self.keys: List[str] = []
+        # Frames: [kind ("obj"/"arr"), state]; obj states: key/colon/value/next, arr: value/next
+        self._stack: List[List[str]] = []
+        self._in_string = False
+        self._escape = False
+        self._string_role = ""
+        self._capture: Optional[List[str]] = None
+        self._in_scalar = False
+        self._scalar_at = 0
+        self._current_key = ""
+
+    # ── Feeding ─────────────────────────────────────────────────────────────
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of output. Raises StreamValidationError."""
+        for c in chunk:
+            if self.done:
+                return
+            if not self.started:
+                if c == "{":
+                    self.started = True
+                    self.parts.append(c)
+                    self._stack.append(["obj", "key"])
+                    continue
+                self.prefix += c
+                if len(self.prefix) > _MAX_PREFIX_CHARS:
+                    raise StreamValidationError(f"no JSON object in the first {_MAX_PREFIX_CHARS} chars: {self.prefix[:40]!r}")
+                continue
+            self.parts.append(c)
+            self._step(c)
+
+    def _step(self, c: str) -> None:
+        if self._in_string:
+            self._string_char(c)
+            return
+        if self._in_scalar:
+            if c in _SCALAR_CHARS:
+                return
+            self._in_scalar = False
+            self._after_value()
+        if c.isspace():
+            return
+        frame = self._stack[-1]
+        kind, state = frame
+        if kind == "obj":
+            if state == "key":
+                if c == '"':
+                    self._open_string("key")
+                elif c == "}":
+                    self._close("}")
+                else:
+                    self._fail(f"expected a key, got {c!r}")
+            elif state == "colon":
+                if c != ":":
+                    self._fail(f"expected ':', got {c!r}")
+                frame[1] = "value"
+            elif state == "value":
+                self._start_value(c)
+            elif c == ",":
+                frame[1] = "key"
+            elif c == "}":
+                self._close("}")
+            else:
+                self._fail(f"expected ',' or '}}', got {c!r}")
+        else:
+            if state == "value":
+                if c == "]":
+                    self._close("]")
+                else:
+                    self._start_value(c)
+            elif c == ",":
+                frame[1] = "value"
+            elif c == "]":
+                self._close("]")
+            else:
+                self._fail(f"expected ',' or ']', got {c!r}")
+
+    def _start_value(self, c: str) -> None:
+        if c == '"':
+            self._open_string("value")
+        elif c == "{":
+            self._stack.append(["obj", "key"])
+        elif c == "[":
+            self._stack.append(["arr", "value"])
+        elif c in _SCALAR_START:
+            self._in_scalar = True
+            self._scalar_at = len(self.parts) - 1
+        else:
+            self._fail(f"unexpected {c!r} where a value should start")
+
+    def _open_string(self, role: str) -> None:
+        self._in_string = True
+        self._string_role = role
+        top_level = len(self._stack) == 1
+        wanted = role == "key" or self._current_key in self.expect.checks
+        self._capture = [] if top_level and wanted else None
+
+    def _string_char(self, c: str) -> None:
+        if self._escape:
+            self._escape = False
+        elif c == "\\":
+            self._escape = True
+        elif c == '"':
+            self._in_string = False
+            self._end_string("".join(self._capture) if self._capture is not None else None)
+            return
+        if self._capture is not None:
+            self._capture.append(c)
+
+    def _end_string(self, raw: Optional[str]) -> None:
+        self._capture = None
+        if self._string_role == "key":
+            if raw is not None:
+                self._current_key = _decode(raw)
+                self.keys.append(self._current_key)
+            self._stack[-1][1] = "colon"
+            return
+        self._check_value(raw)
+        self._after_value()
+
+    def _check_value(self, raw: Optional[str]) -> None:
+        if raw is None:
+            return
+        check = self.expect.checks.get(self._current_key)
+        if check is not None and not check(_decode(raw)):
+            self._fail(f"'{self._current_key}' failed validation")
+
+    def _after_value(self) -> None:
+        self._stack[-1][1] = "next"
+
+    def _close(self, bracket: str) -> None:
+        kind, _ = self._stack.pop()
+        if (kind == "obj") != (bracket == "}"):
+            self._fail(f"mismatched {bracket!r}")
+        if self._stack:
+            self._after_value()
+            return
+        self.done = True
+        self._check_required()
+
+    def _check_required(self) -> None:
+        if not self.keys:
+            return  # an empty object is an accepted answer
+        missing = [k for k in self.expect.required if k not in self.keys]
+        if missing:
+            self._fail(f"missing required keys {missing}")
+
+    def _fail(self, reason: str) -> None:
+        raise StreamValidationError(f"{reason} after {self.length} chars")
+
+    # ── Result ──────────────────────────────────────────────────────────────
+
+    @property
+    def length(self) -> int:
+        return sum(len(p) for p in self.parts)
+
+    def finish(self) -> str:
+        """
+        The object's text; a truncated object is closed locally first.
+        Raises StreamValidationError if nothing usable arrived.
+        """
+        if not self.started:
+            raise StreamValidationError("no JSON object in output")
+        if self.done:
+            return "".join(self.parts)
+        text = "".join(self.parts)
+        if self._in_string:
+            if self._escape:
+                text = text[:-1]  # dangling backslash
+                if self._capture:
+                    self._capture.pop()
+            text += '":""' if self._string_role == "key" else '"'
+            if self._string_role == "value":
+                # The cut-off value must still pass its check
+                self._check_value("".join(self._capture) if self._capture is not None else None)
+                self._after_value()
+        else:
+            if self._in_scalar:
+                # "tru" or "1e" isn't valid JSON; drop it like a dangling key's value
+                text = text[:self._scalar_at]
+                self._in_scalar = False
+            text = text.rstrip().rstrip(",")
+            kind, state = self._stack[-1]
+            if kind == "obj" and state == "colon":
+                text += ':""'
+            elif kind == "obj" and state == "value":
+                text += '""'
+        text += "".join("}" if kind == "obj" else "]" for kind, _ in reversed(self._stack))
+        self.repaired = True
+        self._check_required()
+        return text
+
+
+def _decode(raw: str) -> str:
+    try:
+        return json.loads(f'"{raw}"', strict=False)
+    except ValueError:
+        return raw
@@ -0,0 +1,148 @@
+"""
+Persistent cache for LLM responses.
+
+Orchestrator retries, ``scripts/manage.py reprocess``, the summarization
+queue and the Phase 4 recheck all re-send identical prompts. Responses are
+kept in Postgres (``llm_response_cache``) under a SHA-256 of
+(model, system prompt hash, user prompt hash, temperature), so the same
+request on the same text costs one DB round trip instead of an LLM call —
+across processes and CI runners, not just within one run.
+
+- Age-based eviction: entries older than ``LLM_CACHE_MAX_AGE_DAYS`` are
+  ignored on lookup and purged (at most once per process, on first store).
+- Bypass: ``with bypass():`` (or ``LLM_CACHE_FORCE=true``) skips lookups
+  but still stores the fresh response, so a forced regeneration replaces
+  the cached one. Worker threads inherit the bypass via ``bind(fn)``.
+- Fails open: a DB error is counted and treated as a miss.
+- Hit/miss counters via ``get_cache_stats()`` / ``log_cache_stats()``.
+
+Usage:
+    from src.processors import llm_cache
+
+    cached = llm_cache.lookup(model, system, user, temperature)
+    if cached is None:
+        text = call_model(...)
+        llm_cache.store(model, system, user, temperature, text)
+"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ── Configuration ────────────────────────────────────────────────────────────
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+LLM_CACHE_FORCE = os.getenv("LLM_CACHE_FORCE", "false").lower() in ("1", "true", "yes")
+LLM_CACHE_MAX_AGE_DAYS = float(os.getenv("LLM_CACHE_MAX_AGE_DAYS", "30"))
+
+_stats = {"hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "errors": 0}
+_stats_lock = threading.Lock()
+_purged = False
+_local = threading.local()
+
+
+def _record(outcome: str) -> None:
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(model: str, system: str, user: str, temperature: float) -> str:
+    """Stable key for one request."""
+    return _sha(json.dumps([model, _sha(system), _sha(user), round(float(temperature), 4)]))
+
+
+# ── Bypass ───────────────────────────────────────────────────────────────────
+
+def is_bypassed() -> bool:
+    return LLM_CACHE_FORCE or getattr(_local, "bypass", False)
+
+
+@contextlib.contextmanager
+def bypass(active: bool = True) -> Iterator[None]:
+    """Skip cache lookups on this thread while active (responses are still stored)."""
+    previous = getattr(_local, "bypass", False)
+    _local.bypass = previous or active
+    try:
+        yield
+    finally:
+        _local.bypass = previous
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """Wrap ``fn`` so it runs with the calling thread's bypass setting (for executors)."""
+    active = getattr(_local, "bypass", False)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with bypass(active):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# ── Lookup / store ───────────────────────────────────────────────────────────
+
+def lookup(model: str, system: str, user: str, temperature: float) -> Optional[str]:
+    """Cached response for this request, or None (miss, bypass, disabled or DB error)."""
+    if not LLM_CACHE_ENABLED:
+        return None
+    if is_bypassed():
+        _record("bypassed")
+        return None
+    from src.database import db
+    try:
+        response = db.get_llm_response(cache_key(model, system, user, temperature), LLM_CACHE_MAX_AGE_DAYS)
+    except Exception as e:
+        _record("errors")
+        logger.debug(f"LLM cache lookup failed: {e}")
+        return None
+    _record("hits" if response is not None else "misses")
+    if response is not None:
+        logger.info(f"🗃️ LLM cache hit ({model})")
+    return response
+
+
+def store(model: str, system: str, user: str, temperature: float, response: str) -> None:
+    """Remember a response; purges expired entries on the first store of the process."""
+    global _purged
+    if not LLM_CACHE_ENABLED or not response:
+        return
+    from src.database import db
+    if db.save_llm_response(cache_key(model, system, user, temperature), model, response):
+        _record("stores")
+    else:
+        _record("errors")
+    if not _purged:
+        _purged = True
+        removed = db.purge_llm_responses(LLM_CACHE_MAX_AGE_DAYS)
+        if removed:
+            logger.info(f"🧹 LLM cache purged {removed} entries older than {LLM_CACHE_MAX_AGE_DAYS:g} days")
+
+
+# ── Stats ────────────────────────────────────────────────────────────────────
+
+def get_cache_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def log_cache_stats() -> None:
+    s = get_cache_stats()
+    logger.info(
+        f"🗃️ LLM cache: {s['hits']} hits, {s['misses']} misses (hit rate {s['hit_rate']:.0%}), "
+        f"{s['bypassed']} bypassed, {s['stores']} stored, {s['errors']} errors"
+    )
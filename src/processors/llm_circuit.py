@@ -0,0 +1,213 @@
+"""
+Per-model circuit breaker for Venice AI calls.
+
+When Venice degrades, every orchestrator candidate and every web argument
+request used to wait through its own timeouts and retries. Each model now
+has a breaker, built like the database one in ``connection.py`` but fed by
+the outcome and latency of every call:
+
+    closed    - calls go through; the last LLM_CB_WINDOW outcomes are kept
+    open      - tripped by LLM_CB_CONSECUTIVE_FAILURES failures in a row, or
+                (after LLM_CB_MIN_CALLS calls) an error rate of at least
+                LLM_CB_ERROR_RATE or a slow-call rate (calls taking at least
+                LLM_CB_SLOW_SECONDS) of at least LLM_CB_SLOW_RATE; calls
+                raise LlmCircuitOpen immediately
+    half_open - after LLM_CB_RECOVERY_SECONDS one probe call is let through;
+                a healthy answer closes the circuit, anything else reopens it
+
+Only provider failures count: timeouts, connection errors and 5xx
+responses. Malformed output, 4xx responses and 429s (handled by
+``llm_rate_limit``) are answers from a working provider.
+
+Usage:
+    llm_circuit.check(model)                 # raises LlmCircuitOpen
+    started = time.monotonic()
+    try:
+        resp = client.chat.completions.create(model=model, ...)
+    except Exception as e:
+        llm_circuit.record(model, time.monotonic() - started, e)
+        raise
+    llm_circuit.record(model, time.monotonic() - started)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+LLM_CB_WINDOW = int(os.getenv("LLM_CB_WINDOW", "20"))
+LLM_CB_MIN_CALLS = int(os.getenv("LLM_CB_MIN_CALLS", "6"))
+LLM_CB_CONSECUTIVE_FAILURES = int(os.getenv("LLM_CB_CONSECUTIVE_FAILURES", "3"))
+LLM_CB_ERROR_RATE = float(os.getenv("LLM_CB_ERROR_RATE", "0.5"))
+LLM_CB_SLOW_SECONDS = float(os.getenv("LLM_CB_SLOW_SECONDS", "60"))
+LLM_CB_SLOW_RATE = float(os.getenv("LLM_CB_SLOW_RATE", "0.8"))
+LLM_CB_RECOVERY_SECONDS = float(os.getenv("LLM_CB_RECOVERY_SECONDS", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LlmCircuitOpen(RuntimeError):
+    """Raised instead of calling a model whose circuit is open."""
+
+
+class _ModelCircuit:
+    def __init__(self) -> None:
+        self.state = CLOSED
+        # (failed, slow) per call, most recent last
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=LLM_CB_WINDOW)
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_started: Optional[float] = None
+        self.reason = ""
+        self.times_opened = 0
+        self.rejected = 0
+
+
+_circuits: Dict[str, _ModelCircuit] = defaultdict(_ModelCircuit)
+_lock = threading.Lock()
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """True for errors that say the provider is unhealthy (timeouts, connection errors, 5xx)."""
+    if isinstance(error, (ValueError, LlmCircuitOpen)):
+        return False  # malformed output, or a call that never went out
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status >= 500
+    return True
+
+
+def _effective_state(c: _ModelCircuit, now: float) -> str:
+    if c.state == OPEN and now - c.opened_at >= LLM_CB_RECOVERY_SECONDS:
+        return HALF_OPEN
+    return c.state
+
+
+def _probe_free(c: _ModelCircuit, now: float) -> bool:
+    # A probe that never reported back (e.g. it gave up waiting for rate-limit
+    # capacity) stops blocking the next one after a recovery period
+    return c.probe_started is None or now - c.probe_started >= LLM_CB_RECOVERY_SECONDS
+
+
+def check(model: str) -> None:
+    """Raise LlmCircuitOpen unless a call to ``model`` may go out now."""
+    now = time.monotonic()
+    with _lock:
+        c = _circuits[model]
+        state = _effective_state(c, now)
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and _probe_free(c, now):
+            if c.state == OPEN:
+                logger.info(f"🔌 LLM circuit for {model} half-open — allowing a probe call")
+            c.state = HALF_OPEN
+            c.probe_started = now
+            return
+        c.rejected += 1
+        raise LlmCircuitOpen(f"{model} circuit is {state} ({c.reason})")
+
+
+def available(model: str) -> bool:
+    """Whether ``check(model)`` would let a call through (without claiming a probe)."""
+    now = time.monotonic()
+    with _lock:
+        if model not in _circuits:
+            return True
+        c = _circuits[model]
+        state = _effective_state(c, now)
+        return state == CLOSED or (state == HALF_OPEN and _probe_free(c, now))
+
+
+def _trip_reason(c: _ModelCircuit) -> str:
+    if c.consecutive_failures >= LLM_CB_CONSECUTIVE_FAILURES:
+        return f"{c.consecutive_failures} consecutive failures"
+    n = len(c.outcomes)
+    if n < LLM_CB_MIN_CALLS:
+        return ""
+    error_rate = sum(failed for failed, _ in c.outcomes) / n
+    if error_rate >= LLM_CB_ERROR_RATE:
+        return f"error rate {error_rate:.0%} over {n} calls"
+    slow_rate = sum(slow for _, slow in c.outcomes) / n
+    if slow_rate >= LLM_CB_SLOW_RATE:
+        return f"{slow_rate:.0%} of {n} calls slower than {LLM_CB_SLOW_SECONDS:g}s"
+    return ""
+
+
+def _open(c: _ModelCircuit, model: str, reason: str) -> None:
+    c.state = OPEN
+    c.opened_at = time.monotonic()
+    c.probe_started = None
+    c.reason = reason
+    c.times_opened += 1
+    logger.warning(
+        f"🔌 LLM circuit for {model} OPENED ({reason}); "
+        f"failing fast for {LLM_CB_RECOVERY_SECONDS:g}s"
+    )
+
+
+def record(model: str, seconds: float, error: Optional[BaseException] = None) -> None:
+    """Record the outcome of one call to ``model`` that took ``seconds``."""
+    failed = error is not None and is_provider_failure(error)
+    slow = not failed and seconds >= LLM_CB_SLOW_SECONDS
+    with _lock:
+        c = _circuits[model]
+        if c.state == HALF_OPEN:
+            # The probe decides
+            c.probe_started = None
+            if failed or slow:
+                _open(c, model, "probe failed" if failed else f"probe took {seconds:.0f}s")
+                return
+            c.state = CLOSED
+            c.outcomes.clear()
+            c.consecutive_failures = 0
+            c.reason = ""
+            logger.info(f"🔌 LLM circuit for {model} CLOSED — probe succeeded")
+            return
+        if c.state == OPEN:
+            return  # a call that started before the circuit opened
+        c.outcomes.append((failed, slow))
+        c.consecutive_failures = c.consecutive_failures + 1 if failed else 0
+        reason = _trip_reason(c)
+        if reason:
+            _open(c, model, reason)
+
+
+def get_circuit_metrics() -> Dict[str, Dict[str, Any]]:
+    """Per-model breaker state, recent error/slow rates and open/reject counts."""
+    now = time.monotonic()
+    out: Dict[str, Dict[str, Any]] = {}
+    with _lock:
+        for model, c in _circuits.items():
+            n = len(c.outcomes)
+            out[model] = {
+                "state": _effective_state(c, now),
+                "recent_calls": n,
+                "error_rate": round(sum(f for f, _ in c.outcomes) / n, 2) if n else 0.0,
+                "slow_rate": round(sum(s for _, s in c.outcomes) / n, 2) if n else 0.0,
+                "times_opened": c.times_opened,
+                "rejected": c.rejected,
+                "reason": c.reason,
+            }
+    return out
+
+
+def log_circuit_metrics() -> None:
+    """Log a one-line summary per model."""
+    for model, m in sorted(get_circuit_metrics().items()):
+        logger.info(
+            f"🔌 LLM circuit {model}: {m['state']}, {m['error_rate']:.0%} errors / "
+            f"{m['slow_rate']:.0%} slow over {m['recent_calls']} calls, "
+            f"opened {m['times_opened']}x, {m['rejected']} calls failed fast"
+        )
+
+
+def reset_circuits() -> None:
+    with _lock:
+        _circuits.clear()
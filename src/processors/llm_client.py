@@ -0,0 +1,191 @@
+"""
+Process-wide Venice AI client and prompt-caching helpers.
+
+Every summary, title and argument call used to build its own ``OpenAI``
+client, and with it a fresh HTTP connection pool, so each request paid a
+new TLS handshake before its first token. ``get_client()`` returns one
+thread-safe client per process whose keep-alive pool is shared by the
+orchestrator, the summarization queue workers and the chunked map-reduce
+threads.
+
+Large, static system prompts are sent with a ``cache_control`` marker when
+the model supports provider-side prompt caching (Claude models on Venice),
+so repeat calls read the cached prefix instead of paying for it as fresh
+input. Short prompts and other models get the plain string content.
+
+Per-model call latencies are kept (a bounded sample for p50/p95 plus a
+coarse bucket histogram) so callers can size hedging and timeouts from what
+each model actually does; ``log_latency_metrics()`` prints them per run.
+
+Usage:
+    from src.processors import llm_client
+
+    client = llm_client.get_client()
+    client.chat.completions.create(
+        model=model,
+        messages=[llm_client.system_message(system, model), {"role": "user", "content": user}],
+    )
+"""
+
+import atexit
+import bisect
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+VENICE_BASE_URL = os.getenv("VENICE_BASE_URL", "https://api.venice.ai/api/v1")
+LLM_HTTP_MAX_CONNECTIONS = max(1, int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20")))
+LLM_PROMPT_CACHING = os.getenv("LLM_PROMPT_CACHING", "true").lower() not in ("0", "false", "no")
+# Providers don't cache short prefixes (Claude's minimum is ~1024 tokens)
+LLM_PROMPT_CACHE_MIN_CHARS = int(os.getenv("LLM_PROMPT_CACHE_MIN_CHARS", "4096"))
+
+_PROMPT_CACHING_MODEL_PREFIXES = ("claude-",)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is open-ended
+LATENCY_BUCKETS = (5.0, 10.0, 20.0, 40.0, 80.0)
+# Keep a bounded latency sample per model for percentile estimates
+_LATENCY_SAMPLE = 200
+
+_client: Optional[OpenAI] = None
+_client_api_key: Optional[str] = None
+_client_lock = threading.Lock()
+
+
+def _api_key() -> str:
+    api_key = os.getenv("VENICE_API_KEY")
+    if not api_key:
+        logger.error("VENICE_API_KEY not found in environment variables")
+        raise ValueError("VENICE_API_KEY not found in environment variables")
+    return api_key
+
+
+def get_client() -> OpenAI:
+    """
+    The shared Venice AI client (OpenAI-compatible), created on first use.
+
+    Rebuilt if ``VENICE_API_KEY`` changes. Raises ValueError when the key is
+    not set.
+    """
+    global _client, _client_api_key
+    api_key = _api_key()
+    if _client is None or _client_api_key != api_key:
+        with _client_lock:
+            if _client is None or _client_api_key != api_key:
+                previous = _client
+                http_client = httpx.Client(limits=httpx.Limits(
+                    max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_HTTP_MAX_CONNECTIONS,
+                ))
+                _client = OpenAI(api_key=api_key, base_url=VENICE_BASE_URL, http_client=http_client)
+                _client_api_key = api_key
+                if previous is not None:
+                    previous.close()
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared client's connection pool (registered with atexit)."""
+    global _client, _client_api_key
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            _client_api_key = None
+
+
+atexit.register(close_client)
+
+
+def supports_prompt_caching(model: str) -> bool:
+    return LLM_PROMPT_CACHING and model.startswith(_PROMPT_CACHING_MODEL_PREFIXES)
+
+
+def system_message(system: str, model: str) -> Dict[str, Any]:
+    """
+    A system message for ``model``, marked as a cacheable prefix when the
+    prompt is long enough and the model supports prompt caching.
+    """
+    if len(system) >= LLM_PROMPT_CACHE_MIN_CHARS and supports_prompt_caching(model):
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+        }
+    return {"role": "system", "content": system}
+
+
+# ── Latency metrics ──────────────────────────────────────────────────────────
+
+class _ModelLatency:
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latencies: List[float] = []
+
+
+_latency: Dict[str, _ModelLatency] = defaultdict(_ModelLatency)
+_latency_lock = threading.Lock()
+
+
+def record_latency(model: str, seconds: float, error: bool = False) -> None:
+    """Record one call to ``model`` that took ``seconds`` (successful or not)."""
+    with _latency_lock:
+        stats = _latency[model]
+        stats.count += 1
+        stats.errors += int(error)
+        stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if not error:
+            stats.latencies.append(seconds)
+            if len(stats.latencies) > _LATENCY_SAMPLE:
+                del stats.latencies[: len(stats.latencies) - _LATENCY_SAMPLE]
+
+
+def latency_quantile(model: str, q: float, min_samples: int = 1) -> Optional[float]:
+    """The ``q`` quantile of successful call latencies, or None with fewer than ``min_samples``."""
+    with _latency_lock:
+        lat = sorted(_latency[model].latencies) if model in _latency else []
+    n = len(lat)
+    if n < max(1, min_samples):
+        return None
+    return lat[min(n - 1, int(n * q))]
+
+
+def get_latency_metrics() -> Dict[str, Dict[str, Any]]:
+    """Per-model call metrics: count, errors, p50/p95 seconds and bucket histogram."""
+    out: Dict[str, Dict[str, Any]] = {}
+    with _latency_lock:
+        for model, stats in _latency.items():
+            lat = sorted(stats.latencies)
+            n = len(lat)
+            labels = [f"<={b:g}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+            out[model] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "p50_s": round(lat[n // 2], 2) if n else 0.0,
+                "p95_s": round(lat[min(n - 1, int(n * 0.95))], 2) if n else 0.0,
+                "histogram": dict(zip(labels, stats.buckets)),
+            }
+    return out
+
+
+def log_latency_metrics() -> None:
+    """Log a one-line summary per model."""
+    for model, m in sorted(get_latency_metrics().items()):
+        buckets = " ".join(f"{label}:{n}" for label, n in m["histogram"].items() if n)
+        logger.info(
+            f"🤖 LLM {model}: {m['count']} calls, {m['errors']} err, "
+            f"p50 {m['p50_s']}s, p95 {m['p95_s']}s [{buckets}]"
+        )
+
+
+def reset_latency_metrics() -> None:
+    with _latency_lock:
+        _latency.clear()
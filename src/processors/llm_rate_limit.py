@@ -0,0 +1,195 @@
+"""
+Shared Venice AI rate limiter (requests per minute and tokens per minute).
+
+The summarizer only reacted to 429s after the fact, the backfill scripts
+slept a fixed interval between calls, and web-triggered argument generation
+had no limit at all, so a backfill could starve the site. Every Venice call
+now takes from two token buckets kept in Postgres (the ``api_quota`` table
+used by ``congress_quota``), so all processes see the same balance:
+
+    venice_requests  - VENICE_REQUESTS_PER_MINUTE, one per call
+    venice_tokens    - VENICE_TOKENS_PER_MINUTE, the call's estimated
+                       prompt + completion tokens
+
+Priority lanes are the ones ``congress_quota`` already uses (a process or
+thread declares its class once, e.g. ``set_default_priority("backfill")``):
+
+    web      - user-facing; may drain the buckets, waits at most a few seconds
+    daily    - the daily pipeline; leaves ``LLM_RATE_RESERVE_DAILY`` for web
+    backfill - batch jobs; leaves ``LLM_RATE_RESERVE_BACKFILL`` untouched, so
+               they only soak up spare capacity and pause as soon as web or
+               daily traffic eats into it
+
+A 429 from Venice empties both buckets for everyone. If the database is
+unreachable the limiter fails open.
+
+Usage:
+    from src.processors import llm_rate_limit
+
+    llm_rate_limit.acquire(prompt_chars=len(system) + len(user), max_tokens=4096)
+    client.chat.completions.create(...)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from src.fetchers.congress_quota import current_priority
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+VENICE_REQUESTS_PER_MINUTE = float(os.getenv("VENICE_REQUESTS_PER_MINUTE", "60"))
+VENICE_TOKENS_PER_MINUTE = float(os.getenv("VENICE_TOKENS_PER_MINUTE", "400000"))
+LLM_RATE_RESERVE_DAILY = float(os.getenv("LLM_RATE_RESERVE_DAILY", "0.10"))
+LLM_RATE_RESERVE_BACKFILL = float(os.getenv("LLM_RATE_RESERVE_BACKFILL", "0.40"))
+LLM_RATE_WEB_MAX_WAIT = float(os.getenv("LLM_RATE_WEB_MAX_WAIT", "5"))
+LLM_RATE_DAILY_MAX_WAIT = float(os.getenv("LLM_RATE_DAILY_MAX_WAIT", "300"))
+# Completions rarely use their whole max_tokens; charge this share of it up front
+LLM_RATE_OUTPUT_SHARE = float(os.getenv("LLM_RATE_OUTPUT_SHARE", "0.5"))
+
+REQUESTS_BUCKET = "venice_requests"
+TOKENS_BUCKET = "venice_tokens"
+CHARS_PER_TOKEN = 4
+
+# Fraction of capacity each class must leave untouched
+_RESERVE_FRACTION: Dict[str, float] = {
+    "web": 0.0,
+    "daily": LLM_RATE_RESERVE_DAILY,
+    "backfill": LLM_RATE_RESERVE_BACKFILL,
+}
+# Longest a class will pause for capacity (None = until available)
+_MAX_WAIT: Dict[str, Optional[float]] = {
+    "web": LLM_RATE_WEB_MAX_WAIT,
+    "daily": LLM_RATE_DAILY_MAX_WAIT,
+    "backfill": None,
+}
+
+
+class RateLimitExhausted(RuntimeError):
+    """Raised when no Venice capacity frees up within the caller's max wait."""
+
+
+class LlmRateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets in the shared ``api_quota`` table."""
+
+    def __init__(self, requests_per_minute: float = VENICE_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = VENICE_TOKENS_PER_MINUTE) -> None:
+        # bucket name -> (capacity, refill per second)
+        self.buckets = {
+            REQUESTS_BUCKET: (float(requests_per_minute), float(requests_per_minute) / 60.0),
+            TOKENS_BUCKET: (float(tokens_per_minute), float(tokens_per_minute) / 60.0),
+        }
+        self._fail_open_logged = False
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "waits": 0, "wait_seconds": 0.0, "exhausted": 0, "drained": 0}
+
+    def _take(self, bucket: str, cost: float, priority: str) -> "tuple[bool, float]":
+        from src.database import db
+        capacity, refill = self.buckets[bucket]
+        if db._SIMULATE:
+            return True, capacity
+        reserve = capacity * _RESERVE_FRACTION[priority]
+        return db.consume_api_quota(bucket, min(cost, capacity), reserve, capacity, refill)
+
+    def _wait_for(self, bucket: str, cost: float, level: float, priority: str) -> float:
+        capacity, refill = self.buckets[bucket]
+        reserve = capacity * _RESERVE_FRACTION[priority]
+        return max(0.5, (reserve + min(cost, capacity) - level) / refill)
+
+    def acquire(self, tokens: float = 0, priority: Optional[str] = None, max_wait: Optional[float] = -1.0) -> None:
+        """
+        Take one request and ``tokens`` tokens for ``priority`` (default: the
+        current lane), pausing until both fit above the lane's reserve.
+        Raises RateLimitExhausted if that would take longer than ``max_wait``
+        seconds (default: the lane's configured limit).
+        """
+        priority = priority or current_priority()
+        if priority not in _RESERVE_FRACTION:
+            priority = "daily"
+        if max_wait == -1.0:
+            max_wait = _MAX_WAIT[priority]
+
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            try:
+                granted, level = self._take(TOKENS_BUCKET, tokens, priority) if tokens else (True, 0.0)
+                short = TOKENS_BUCKET
+                if granted:
+                    granted, level = self._take(REQUESTS_BUCKET, 1, priority)
+                    short = REQUESTS_BUCKET
+                    if not granted and tokens:
+                        self._take(TOKENS_BUCKET, -tokens, "web")  # hand the tokens back
+            except Exception as e:
+                if not self._fail_open_logged:
+                    logger.warning(f"⚠️ Venice rate limiting unavailable, proceeding unthrottled: {e}")
+                    self._fail_open_logged = True
+                return
+
+            if granted:
+                with self._lock:
+                    self.stats["acquired"] += 1
+                return
+
+            wait = self._wait_for(short, tokens if short == TOKENS_BUCKET else 1, level, priority)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or wait > remaining:
+                    with self._lock:
+                        self.stats["exhausted"] += 1
+                    raise RateLimitExhausted(f"Venice {short} limit reached for '{priority}' ({level:.0f} left)")
+            wait = min(wait, 30.0)
+            logger.info(f"⏸️ Venice {short} bucket low ({level:.0f} left) — '{priority}' pausing {wait:.1f}s")
+            with self._lock:
+                self.stats["waits"] += 1
+                self.stats["wait_seconds"] += wait
+            time.sleep(wait)
+
+    def on_rate_limited(self) -> bool:
+        """
+        Empty both shared buckets after a 429 so every process backs off.
+        Returns False if that wasn't possible (the caller should sleep itself).
+        """
+        from src.database.db import drain_api_quota
+        logger.warning("⚠️ Venice returned 429 — draining shared rate-limit buckets")
+        try:
+            drained = all([drain_api_quota(REQUESTS_BUCKET), drain_api_quota(TOKENS_BUCKET)])
+        except Exception as e:
+            logger.debug(f"Could not drain Venice rate-limit buckets: {e}")
+            return False
+        if drained:
+            with self._lock:
+                self.stats["drained"] += 1
+        return drained
+
+
+# ── Singleton ────────────────────────────────────────────────────────────────
+_limiter: Optional[LlmRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> LlmRateLimiter:
+    """Get or create the LlmRateLimiter singleton."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = LlmRateLimiter()
+    return _limiter
+
+
+def estimate_tokens(prompt_chars: int, max_tokens: int) -> int:
+    """Tokens to charge for a call: prompt estimate plus a share of the completion budget."""
+    return prompt_chars // CHARS_PER_TOKEN + int(max_tokens * LLM_RATE_OUTPUT_SHARE)
+
+
+def acquire(prompt_chars: int = 0, max_tokens: int = 0, priority: Optional[str] = None) -> None:
+    """Wait for capacity for one Venice call (see ``LlmRateLimiter.acquire``)."""
+    get_rate_limiter().acquire(estimate_tokens(prompt_chars, max_tokens), priority)
+
+
+def on_rate_limited() -> bool:
+    return get_rate_limiter().on_rate_limited()
+
@@ -0,0 +1,129 @@
+"""
+Summarization queue drain worker.
+
+Bulk backfill inserts bills with full text and metadata but no summaries,
+and queues one ``summarization_queue`` row per bill. This worker claims due
+rows, runs the same summarize → teen impact score → arguments steps as the
+orchestrator's insert path, and writes the results back. Failures are
+retried with exponential backoff until SUMMARY_QUEUE_MAX_ATTEMPTS, then the
+job is marked ``dead``.
+
+Jobs queued with ``archive_only`` are published to the site archive once
+summarized (without social posting), so backfilled bills never enter the
+daily posting reservoir.
+
+Run on a schedule via ``scripts/drain_summarization_queue.py``.
+"""
+
+import logging
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from src.database.db import (
+    archive_bill,
+    claim_summarization_jobs,
+    complete_summarization_job,
+    fail_summarization_job,
+    get_bill_by_id,
+    update_bill_arguments,
+    update_bill_summaries,
+    update_bill_teen_impact_score,
+)
+from src.processors.argument_generator import arguments_for_summary
+from src.processors.summarizer import summarize_bill_enhanced
+
+logger = logging.getLogger(__name__)
+
+# ── Retry configuration ──────────────────────────────────────────────────────
+SUMMARY_QUEUE_MAX_ATTEMPTS = int(os.getenv("SUMMARY_QUEUE_MAX_ATTEMPTS", "4"))
+SUMMARY_QUEUE_BACKOFF_BASE_SECONDS = float(os.getenv("SUMMARY_QUEUE_BACKOFF_BASE_SECONDS", "600"))
+SUMMARY_QUEUE_BACKOFF_MAX_SECONDS = float(os.getenv("SUMMARY_QUEUE_BACKOFF_MAX_SECONDS", "43200"))
+SUMMARY_QUEUE_BATCH_SIZE = int(os.getenv("SUMMARY_QUEUE_BATCH_SIZE", "20"))
+SUMMARY_QUEUE_WORKERS = max(1, int(os.getenv("SUMMARY_QUEUE_WORKERS", "2")))
+
+
+def compute_backoff(attempts: int) -> float:
+    """Exponential backoff with ±20% jitter, capped at SUMMARY_QUEUE_BACKOFF_MAX_SECONDS."""
+    delay = SUMMARY_QUEUE_BACKOFF_BASE_SECONDS * (2 ** max(0, attempts - 1))
+    return min(delay, SUMMARY_QUEUE_BACKOFF_MAX_SECONDS) * random.uniform(0.8, 1.2)
+
+
+def summarize_queued_bill(bill_id: str, archive_only: bool, force_refresh: bool = False) -> None:
+    """
+    Summarize one queued bill and persist the results. Raises on failure.
+
+    ``force_refresh`` skips the LLM response cache (used on retries, where a
+    cached copy of the response that failed would fail the same way).
+    """
+    from src.orchestrator import extract_teen_impact_score
+
+    bill = get_bill_by_id(bill_id)
+    if not bill:
+        raise ValueError("bill row not found")
+    if len((bill.get("full_text") or "").strip()) < 100:
+        raise ValueError("no full text to summarize")
+
+    summary = summarize_bill_enhanced(bill, force_refresh=force_refresh)
+    if not summary.get("overview") or "full bill text needed" in summary.get("detailed", "").lower():
+        raise ValueError("invalid summary content")
+
+    if not update_bill_summaries(bill_id, summary.get("overview", ""), summary.get("detailed", ""),
+                                 summary.get("tweet", ""), subject_tags=summary.get("subject_tags", "")):
+        raise RuntimeError("update_bill_summaries failed")
+
+    score = extract_teen_impact_score(summary.get("detailed", ""))
+    if score is not None:
+        update_bill_teen_impact_score(bill_id, score)
+
+    try:
+        args = arguments_for_summary(bill.get("title", ""), summary)
+        update_bill_arguments(bill_id, args.get("support", ""), args.get("oppose", ""))
+    except Exception as e:
+        logger.warning(f"⚠️ Argument generation failed for {bill_id}: {e} — continuing without arguments")
+
+    if archive_only:
+        archive_bill(bill_id)
+
+
+def _run_job(job: Dict[str, Any]) -> str:
+    bill_id = job["bill_id"]
+    attempts = int(job.get("attempts") or 1)
+    try:
+        summarize_queued_bill(bill_id, bool(job.get("archive_only")), force_refresh=attempts > 1)
+    except Exception as e:
+        if attempts >= SUMMARY_QUEUE_MAX_ATTEMPTS:
+            logger.error(f"💀 Summarization for {bill_id} gave up after {attempts} attempts: {e}")
+            fail_summarization_job(bill_id, str(e), None)
+            return "dead"
+        delay = compute_backoff(attempts)
+        logger.warning(f"🔁 Summarization for {bill_id} failed ({e}); retrying in {delay:.0f}s")
+        fail_summarization_job(bill_id, str(e), delay)
+        return "retrying"
+    complete_summarization_job(bill_id)
+    logger.info(f"✅ Summarized queued bill {bill_id}")
+    return "succeeded"
+
+
+def drain_summarization_queue(limit: int = SUMMARY_QUEUE_BATCH_SIZE,
+                              workers: int = SUMMARY_QUEUE_WORKERS) -> Dict[str, int]:
+    """
+    Claim up to ``limit`` due jobs and summarize them ``workers`` at a time.
+
+    Returns:
+        Counts: {"claimed", "succeeded", "retrying", "dead"}
+    """
+    summary = {"claimed": 0, "succeeded": 0, "retrying": 0, "dead": 0}
+    jobs = claim_summarization_jobs(limit=limit)
+    if not jobs:
+        return summary
+    summary["claimed"] = len(jobs)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="summarize") as pool:
+        for outcome in pool.map(_run_job, jobs):
+            summary[outcome] += 1
+    logger.info(
+        f"🧠 Summarization queue: {summary['succeeded']} done, "
+        f"{summary['retrying']} retrying, {summary['dead']} dead (of {summary['claimed']})"
+    )
+    return summary
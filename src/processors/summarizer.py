@@ -2,13 +2,20 @@ import os
 import re
 import ast
 import json
+import functools
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from src.processors import llm_cache, llm_circuit, llm_client, llm_rate_limit
+from src.processors.llm_circuit import LlmCircuitOpen
+from src.processors.json_stream import JsonExpectation, JsonStreamValidator, StreamValidationError
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -16,13 +23,72 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Venice AI Configuration
-VENICE_BASE_URL = os.getenv("VENICE_BASE_URL", "https://api.venice.ai/api/v1")
-
 # Model configuration — Venice AI model names use dashes.
 PREFERRED_MODEL = os.getenv("SUMMARIZER_MODEL", "claude-sonnet-4-6")
 FALLBACK_MODEL = os.getenv("VENICE_MODEL_FALLBACK", "kimi-k2-5")
 
+SUMMARIZER_TEMPERATURE = 0.2
+TWEET_CHAR_LIMIT = 200
+
+# Combined mode: one call returns the summary, tweet, tags and both arguments
+SUMMARIZER_COMBINED_OUTPUT = os.getenv("SUMMARIZER_COMBINED_OUTPUT", "true").lower() not in ("0", "false", "no")
+SUMMARIZER_RESPONSE_SCHEMA = os.getenv("SUMMARIZER_RESPONSE_SCHEMA", "true").lower() not in ("0", "false", "no")
+
+_COMBINED_OUTPUT_INSTRUCTIONS = (
+    "\n\n**COMBINED OUTPUT:** In the same JSON object also return:\n"
+    f"- 'tweet': one complete sentence of at most {TWEET_CHAR_LIMIT} characters (no emojis, hashtags or ellipsis).\n"
+    "- 'subject_tags' as described above.\n"
+    "- 'argument_support' and 'argument_oppose': each completes the sentence "
+    "'I [support/oppose] this bill because...' for a young constituent writing to Congress. "
+    "Start lowercase with the continuation itself (no 'I support', no 'because'), 1-2 sentences, "
+    "max 200 characters. Make a real argument: name who is affected and how, and appeal to a concrete "
+    "value (safety, fairness, opportunity, accountability, freedom, fiscal responsibility). "
+    "Do not just restate the bill. No quotation marks.\n"
+    "Keys: 'overview', 'detailed', 'tweet', 'subject_tags', 'argument_support', 'argument_oppose'."
+)
+
+# Stream JSON-producing calls and validate them as tokens arrive (see json_stream)
+SUMMARIZER_STREAMING = os.getenv("SUMMARIZER_STREAMING", "true").lower() not in ("0", "false", "no")
+
+# Hedging: when the preferred model is slower than its recent p95, the fallback
+# model is called in parallel and the first valid JSON wins (capped per run)
+SUMMARIZER_HEDGE_ENABLED = os.getenv("SUMMARIZER_HEDGE_ENABLED", "true").lower() not in ("0", "false", "no")
+SUMMARIZER_HEDGE_MAX_PER_RUN = int(os.getenv("SUMMARIZER_HEDGE_MAX_PER_RUN", "10"))
+SUMMARIZER_HEDGE_QUANTILE = float(os.getenv("SUMMARIZER_HEDGE_QUANTILE", "0.95"))
+SUMMARIZER_HEDGE_MIN_SAMPLES = int(os.getenv("SUMMARIZER_HEDGE_MIN_SAMPLES", "5"))
+SUMMARIZER_HEDGE_DEFAULT_SECONDS = float(os.getenv("SUMMARIZER_HEDGE_DEFAULT_SECONDS", "45"))
+SUMMARIZER_HEDGE_FLOOR_SECONDS = float(os.getenv("SUMMARIZER_HEDGE_FLOOR_SECONDS", "10"))
+
+_COMBINED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "bill_summary",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "overview": {"type": "string"},
+                "detailed": {"type": "string"},
+                "tweet": {"type": "string"},
+                "subject_tags": {"type": "string"},
+                "argument_support": {"type": "string"},
+                "argument_oppose": {"type": "string"},
+            },
+            "required": ["overview", "detailed", "tweet", "subject_tags", "argument_support", "argument_oppose"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Large-bill map-reduce: chunk size and the partial-summary budget are in estimated tokens
+CHARS_PER_TOKEN = 4
+SUMMARIZER_CHUNK_TOKENS = int(os.getenv("SUMMARIZER_CHUNK_TOKENS", "12000"))
+SUMMARIZER_CHUNK_WORKERS = max(1, int(os.getenv("SUMMARIZER_CHUNK_WORKERS", "4")))
+SUMMARIZER_REDUCE_MAX_TOKENS = int(os.getenv("SUMMARIZER_REDUCE_MAX_TOKENS", "60000"))
+
+# Start of a section/title/division heading line in extracted bill text
+_SECTION_BOUNDARY_RE = re.compile(r"^[ \t]*(?:SEC(?:TION)?\.?\s+\d|TITLE\s+[IVXLC\d]|DIVISION\s+[A-Z])", re.MULTILINE)
+
 VALID_MODELS = {
     "claude-sonnet-4-5",
     "claude-opus-4-5",
@@ -41,17 +107,15 @@ def _ensure_api_key() -> str:
     return api_key
 
 def _get_venice_client() -> OpenAI:
-    """Create Venice AI client using OpenAI-compatible API."""
-    api_key = _ensure_api_key()
-    return OpenAI(
-        api_key=api_key,
-        base_url=VENICE_BASE_URL
-    )
+    """Shared Venice AI client (OpenAI-compatible API, one connection pool per process)."""
+    return llm_client.get_client()
 
+@functools.lru_cache(maxsize=None)
 def _build_enhanced_system_prompt() -> str:
     """
     System prompt for Claude Opus 4-6 to summarize bills for teens.
     All classification logic (teen impact scoring) is in the prompt, not Python code.
+    Static, so it is built once per process.
     """
     return (
         "You are a careful, non-partisan summarizer for civic education targeting teens aged 13-19.\n"
@@ -547,42 +611,254 @@ def _try_parse_json_with_fallback(text: str) -> Dict[str, Any]:
             "tweet": text[:200] if text else ""
         }
 
-def _call_venice_once(client: OpenAI, model: str, system: str, user: str):
-    """Single API call to Venice AI (OpenAI-compatible)."""
-    return client.chat.completions.create(
+def _request_kwargs(model: str, system: str, user: str,
+                    response_format: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    extra = {"response_format": response_format} if response_format else {}
+    return dict(
+        extra,
         model=model,
         max_tokens=4096,
-        temperature=0.2,
+        temperature=SUMMARIZER_TEMPERATURE,
         messages=[
-            {"role": "system", "content": system},
+            llm_client.system_message(system, model),
             {"role": "user", "content": user}
         ],
         timeout=90.0,
     )
 
-def _model_call_with_fallback(client: OpenAI, system: str, user: str) -> str:
-    """Call Venice AI with preferred model, fallback on errors."""
+def _call_venice_once(client: OpenAI, model: str, system: str, user: str,
+                      response_format: Optional[Dict[str, Any]] = None):
+    """Single API call to Venice AI (OpenAI-compatible). Raises LlmCircuitOpen while the model is down."""
+    llm_circuit.check(model)
+    llm_rate_limit.acquire(len(system) + len(user), 4096)
+    started = time.monotonic()
+    try:
+        resp = client.chat.completions.create(**_request_kwargs(model, system, user, response_format))
+    except Exception as e:
+        llm_client.record_latency(model, time.monotonic() - started, error=True)
+        llm_circuit.record(model, time.monotonic() - started, e)
+        raise
+    llm_client.record_latency(model, time.monotonic() - started)
+    llm_circuit.record(model, time.monotonic() - started)
+    return resp
+
+class _RepairedText(str):
+    """Output that was cut off mid-object and closed locally: usable once, never cached."""
+
+
+def _stream_venice_once(client: OpenAI, model: str, system: str, user: str, expect: JsonExpectation,
+                        response_format: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Streamed API call whose output is validated as it arrives (see json_stream).
+
+    Raises StreamValidationError as soon as the output can't become the
+    expected object; a response cut off mid-object is closed locally and
+    returned as ``_RepairedText``.
+    """
+    llm_circuit.check(model)
+    llm_rate_limit.acquire(len(system) + len(user), 4096)
+    started = time.monotonic()
+    validator = JsonStreamValidator(expect)
+    stream = None
+    try:
+        stream = client.chat.completions.create(**_request_kwargs(model, system, user, response_format), stream=True)
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if piece:
+                validator.feed(piece)
+                if validator.done:
+                    break
+        text = validator.finish()
+    except Exception as e:
+        llm_client.record_latency(model, time.monotonic() - started, error=True)
+        llm_circuit.record(model, time.monotonic() - started, e)
+        raise
+    finally:
+        if stream is not None:
+            stream.close()
+    llm_client.record_latency(model, time.monotonic() - started)
+    llm_circuit.record(model, time.monotonic() - started)
+    if validator.repaired:
+        logger.warning(f"⚠️ {model} output ended mid-object after {validator.length} chars; closed it locally")
+        return _RepairedText(text)
+    return text
+
+def _complete(client: OpenAI, model: str, system: str, user: str,
+              response_format: Optional[Dict[str, Any]] = None, expect: Optional[JsonExpectation] = None) -> str:
+    """Response text for one call; streamed and validated when ``expect`` is given."""
+    if expect is not None and SUMMARIZER_STREAMING:
+        return _stream_venice_once(client, model, system, user, expect, response_format)
+    return _extract_text_from_response(_call_venice_once(client, model, system, user, response_format))
+
+# ── Hedged requests ──────────────────────────────────────────────────────────
+# Each call gets its own thread rather than a slot in a shared pool: a losing
+# call keeps running until its own timeout, and in a fixed pool those losers
+# would queue the next primaries, whose queue time would then count toward
+# the hedge threshold and trigger more hedges.
+_hedge_stats = {"hedged": 0, "hedge_wins": 0}
+_hedge_lock = threading.Lock()
+
+
+def _start_call(fn, *args) -> Future:
+    """Run ``fn(*args)`` on a new daemon thread; the Future settles when it returns."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="llm-hedge", daemon=True).start()
+    return future
+
+
+def _hedge_threshold(model: str) -> float:
+    """Seconds to wait for ``model`` before hedging: its recent p95, or a default until sampled."""
+    observed = llm_client.latency_quantile(model, SUMMARIZER_HEDGE_QUANTILE, SUMMARIZER_HEDGE_MIN_SAMPLES)
+    if observed is None:
+        return SUMMARIZER_HEDGE_DEFAULT_SECONDS
+    return max(SUMMARIZER_HEDGE_FLOOR_SECONDS, observed)
+
+
+def _take_hedge() -> bool:
+    """Claim one hedge from the per-run budget."""
+    with _hedge_lock:
+        if _hedge_stats["hedged"] >= SUMMARIZER_HEDGE_MAX_PER_RUN:
+            return False
+        _hedge_stats["hedged"] += 1
+        return True
+
+
+def _is_json_object(text: str) -> bool:
+    try:
+        return isinstance(_try_parse_json_strict(text), dict)
+    except ValueError:
+        return False
+
+
+def _hedged_call(client: OpenAI, primary: str, secondary: str, system: str, user: str,
+                 response_format: Optional[Dict[str, Any]] = None,
+                 expect: Optional[JsonExpectation] = None) -> Tuple[str, str]:
+    """
+    Call ``primary``; if it hasn't answered within its hedge threshold, call
+    ``secondary`` in parallel and return (model, text) of the first valid
+    JSON. Non-JSON text is returned only when neither produces JSON. Raises
+    the primary's error when no call returns text.
+    """
+    def call(model: str) -> str:
+        return _complete(client, model, system, user, response_format, expect)
+
+    futures = {_start_call(call, primary): primary}
+    threshold = _hedge_threshold(primary)
+    done, _ = wait(futures, timeout=threshold)
+    if not done and _take_hedge():
+        logger.info(f"⏱️ {primary} has not answered in {threshold:.1f}s; hedging with {secondary}")
+        futures[_start_call(call, secondary)] = secondary
+
+    errors: Dict[str, Exception] = {}
+    plain: Optional[Tuple[str, str]] = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            model = futures[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                errors[model] = e
+                continue
+            if text and _is_json_object(text):
+                if model != primary:
+                    with _hedge_lock:
+                        _hedge_stats["hedge_wins"] += 1
+                    logger.info(f"🏁 Hedged call answered first by {model}")
+                return model, text
+            if text and plain is None:
+                plain = (model, text)
+    if plain is not None:
+        return plain
+    if primary in errors:
+        raise errors[primary]
+    if errors:
+        raise next(iter(errors.values()))
+    return primary, ""
+
+
+def get_hedge_stats() -> Dict[str, int]:
+    with _hedge_lock:
+        return dict(_hedge_stats, max_per_run=SUMMARIZER_HEDGE_MAX_PER_RUN)
+
+
+def log_hedge_stats() -> None:
+    s = get_hedge_stats()
+    logger.info(f"⏱️ LLM hedging: {s['hedged']}/{s['max_per_run']} hedges, {s['hedge_wins']} won by the fallback")
+
+
+def _model_call_with_fallback(client: OpenAI, system: str, user: str,
+                              response_format: Optional[Dict[str, Any]] = None,
+                              expect: Optional[JsonExpectation] = None, hedge: bool = True) -> str:
+    """
+    Call Venice AI with preferred model, fallback on errors.
+
+    ``response_format`` (a JSON schema) is dropped for a model that rejects
+    it with a 400, and the call retried as plain JSON-in-text. With
+    ``expect`` the response is streamed and validated as it arrives; a
+    malformed one is abandoned and retried right away. With ``hedge`` (for
+    JSON-producing calls), a slow first attempt on the preferred model is
+    hedged with the fallback model; see ``_hedged_call``. A model whose
+    circuit is open is skipped without a call; if every model's is, raises
+    LlmCircuitOpen right away.
+    """
     models_to_try = [m for m in (PREFERRED_MODEL, FALLBACK_MODEL) if m in VALID_MODELS]
     
     if not models_to_try:
         raise ValueError(f"No valid models configured. Valid: {', '.join(VALID_MODELS)}")
     
+    hedge_with = models_to_try[1] if hedge and SUMMARIZER_HEDGE_ENABLED and len(models_to_try) > 1 else None
+    if hedge_with and not llm_circuit.available(hedge_with):
+        hedge_with = None
     last_err: Optional[Exception] = None
     
     for model in models_to_try:
+        cached = llm_cache.lookup(model, system, user, SUMMARIZER_TEMPERATURE)
+        if cached:
+            return cached
         delay = 1.0
+        model_format = response_format
         for attempt in range(1, 4):
             try:
                 logger.info(f"Calling Venice AI: {model} (attempt {attempt})")
-                resp = _call_venice_once(client, model, system, user)
-                text = _extract_text_from_response(resp)
+                if hedge_with and model == models_to_try[0] and attempt == 1:
+                    answered_by, text = _hedged_call(client, model, hedge_with, system, user, model_format, expect)
+                else:
+                    answered_by = model
+                    text = _complete(client, model, system, user, model_format, expect)
                 if text:
+                    # A locally repaired answer may be good enough for this run, but a
+                    # fresh call should get the chance to do better next time
+                    if not isinstance(text, _RepairedText):
+                        llm_cache.store(answered_by, system, user, SUMMARIZER_TEMPERATURE, text)
                     return text
                 else:
                     last_err = RuntimeError("Empty response")
                     logger.warning(f"Empty response from {model}")
             except Exception as e:
                 last_err = e
+                
+                # Model is known to be down: go straight to the next one
+                if isinstance(e, LlmCircuitOpen):
+                    logger.warning(f"Skipping {model}: {e}")
+                    break
+                
+                # Malformed output, caught mid-stream: retry without waiting out a full call
+                if isinstance(e, StreamValidationError):
+                    logger.warning(f"Malformed output from {model} ({e}); retrying")
+                    continue
+                
                 emsg = str(e).lower()
                 
                 # Handle model not found
@@ -590,11 +866,19 @@ def _model_call_with_fallback(client: OpenAI, system: str, user: str) -> str:
                     logger.error(f"Model {model} not found")
                     break
                 
-                # Handle rate limiting with exponential backoff
+                # Model doesn't accept the response schema; ask for plain JSON instead
+                if model_format and getattr(e, "status_code", None) == 400:
+                    logger.warning(f"{model} rejected the response schema; retrying without it")
+                    model_format = None
+                    continue
+                
+                # Rate limited: empty the shared buckets so the next acquire (here and in
+                # every other process) waits for capacity; back off locally if that failed
                 if "429" in emsg or "rate_limit" in emsg:
-                    logger.info(f"Rate limited, sleeping {delay:.1f}s (attempt {attempt}/3)")
-                    time.sleep(delay)
-                    delay *= 2.0
+                    if not llm_rate_limit.on_rate_limited():
+                        logger.info(f"Rate limited, sleeping {delay:.1f}s (attempt {attempt}/3)")
+                        time.sleep(delay)
+                        delay *= 2.0
                     continue
                 
                 logger.warning(f"Call failed for {model}: {str(e)[:100]}")
@@ -605,66 +889,173 @@ def _model_call_with_fallback(client: OpenAI, system: str, user: str) -> str:
     raise RuntimeError("No response from Venice AI")
 
 
-def _summarize_large_bill_in_chunks(client: OpenAI, bill: Dict[str, Any], system: str) -> Dict[str, Any]:
-    """Summarize large bill text via chunk summaries and final synthesis."""
-    full_text = str(bill.get("full_text") or "")
-    chunk_size = 10000
-    overlap = 1000
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars per token, same rule as _build_user_prompt)."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _split_oversized(segment: str, max_chars: int) -> List[str]:
+    """Split one over-long section on line breaks, hard-cutting only single huge lines."""
+    pieces: List[str] = []
+    current = ""
+    for line in segment.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _split_bill_text(full_text: str, max_tokens: int) -> List[str]:
+    """
+    Cut bill text into chunks of at most ``max_tokens`` estimated tokens.
+
+    Cuts fall on SEC./TITLE/DIVISION headings where possible, so each chunk
+    holds whole sections; a single section bigger than the budget is split
+    on line breaks.
+    """
+    max_chars = max(1000, max_tokens * CHARS_PER_TOKEN)
+    starts = sorted({0} | {m.start() for m in _SECTION_BOUNDARY_RE.finditer(full_text)})
+    segments = [full_text[a:b] for a, b in zip(starts, starts[1:] + [len(full_text)])]
 
     chunks: List[str] = []
-    start = 0
-    while start < len(full_text):
-        end = min(start + chunk_size, len(full_text))
-        chunks.append(full_text[start:end])
-        if end >= len(full_text):
-            break
-        start = end - overlap
-
-    logger.info(f"Large bill detected ({len(full_text)} chars); summarizing in {len(chunks)} chunks")
-
-    partial_summaries: List[str] = []
-    total_chunks = len(chunks)
-
-    for index, chunk in enumerate(chunks, start=1):
-        chunk_bill = dict(bill)
-        chunk_bill["full_text"] = chunk
-        chunk_user = (
-            f"This is part {index} of {total_chunks} of a long bill. Summarize this section:\n\n"
-            f"{_build_user_prompt(chunk_bill)}"
-        )
-        partial_raw = _model_call_with_fallback(client, system, chunk_user)
-        partial_parsed = _try_parse_json_with_fallback(partial_raw)
+    current = ""
+    for segment in segments:
+        if len(segment) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(_split_oversized(segment, max_chars))
+            continue
+        if current and len(current) + len(segment) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += segment
+    if current:
+        chunks.append(current)
+    return [c for c in chunks if c.strip()]
+
 
-        partial_sections: List[str] = []
+def _format_partial(parsed: Dict[str, Any], raw: str, label: str) -> str:
+    """Render one partial summary as labelled text for the next reduce step."""
+    sections: List[str] = []
+    overview = _normalize_structured_text(parsed.get("overview", ""))
+    if overview:
+        sections.append(f"{label} overview:\n{overview}")
+    detailed = _normalize_structured_text(parsed.get("detailed", ""))
+    if detailed:
+        sections.append(f"{label} detailed:\n{detailed}")
+    tweet = str(parsed.get("tweet", "")).strip()
+    if tweet:
+        sections.append(f"{label} tweet:\n{tweet}")
+    subject_tags = str(parsed.get("subject_tags", "")).strip()
+    if subject_tags:
+        sections.append(f"{label} subject_tags:\n{subject_tags}")
+    if sections:
+        return "\n\n".join(sections)
+    return f"{label} raw summary:\n{raw.strip()}" if raw.strip() else ""
 
-        partial_overview = _normalize_structured_text(partial_parsed.get("overview", ""))
-        if partial_overview:
-            partial_sections.append(f"Part {index} of {total_chunks} overview:\n{partial_overview}")
 
-        partial_detailed = _normalize_structured_text(partial_parsed.get("detailed", ""))
-        if partial_detailed:
-            partial_sections.append(f"Part {index} of {total_chunks} detailed:\n{partial_detailed}")
+def _summarize_part(client: OpenAI, bill: Dict[str, Any], system: str, text: str, intro: str, label: str) -> str:
+    part_bill = dict(bill)
+    part_bill["full_text"] = text
+    raw = _model_call_with_fallback(client, system, f"{intro}\n\n{_build_user_prompt(part_bill)}",
+                                    expect=_PART_EXPECT)
+    return _format_partial(_try_parse_json_with_fallback(raw), raw, label)
 
-        partial_tweet = str(partial_parsed.get("tweet", "")).strip()
-        if partial_tweet:
-            partial_sections.append(f"Part {index} of {total_chunks} tweet:\n{partial_tweet}")
 
-        partial_subject_tags = str(partial_parsed.get("subject_tags", "")).strip()
-        if partial_subject_tags:
-            partial_sections.append(f"Part {index} of {total_chunks} subject_tags:\n{partial_subject_tags}")
+def _map_parts(client: OpenAI, bill: Dict[str, Any], system: str, texts: List[str], intro: str, label: str) -> List[str]:
+    """Summarize ``texts`` concurrently (SUMMARIZER_CHUNK_WORKERS at a time), keeping order."""
+    total = len(texts)
 
-        if partial_sections:
-            partial_summaries.append("\n\n".join(partial_sections))
-        elif partial_raw.strip():
-            partial_summaries.append(f"Part {index} of {total_chunks} raw summary:\n{partial_raw.strip()}")
+    def run(item):
+        index, text = item
+        return _summarize_part(client, bill, system, text,
+                               intro.format(index=index, total=total),
+                               label.format(index=index, total=total))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(SUMMARIZER_CHUNK_WORKERS, total)),
+                            thread_name_prefix="summarize-chunk") as pool:
+        return [p for p in pool.map(llm_cache.bind(run), enumerate(texts, start=1)) if p]
+
+
+def _group_partials(partials: List[str], max_tokens: int) -> List[List[str]]:
+    groups: List[List[str]] = [[]]
+    size = 0
+    for partial in partials:
+        tokens = _estimate_tokens(partial)
+        if groups[-1] and size + tokens > max_tokens:
+            groups.append([])
+            size = 0
+        groups[-1].append(partial)
+        size += tokens
+    return groups
+
+
+def _summarize_large_bill_in_chunks(client: OpenAI, bill: Dict[str, Any], system: str,
+                                    combined: bool = False) -> Dict[str, Any]:
+    """
+    Summarize large bill text map-reduce style.
+
+    Map: section-aligned chunks of about SUMMARIZER_CHUNK_TOKENS are
+    summarized concurrently. Reduce: while the partial summaries together
+    exceed SUMMARIZER_REDUCE_MAX_TOKENS they are merged group by group
+    (also concurrently); the last level feeds the final synthesis, which
+    is the only step that asks for the combined output.
+    """
+    started = time.monotonic()
+    full_text = str(bill.get("full_text") or "")
+    chunks = _split_bill_text(full_text, SUMMARIZER_CHUNK_TOKENS)
+    logger.info(
+        f"Large bill detected ({len(full_text)} chars); summarizing in {len(chunks)} section-aligned chunks "
+        f"with up to {SUMMARIZER_CHUNK_WORKERS} workers"
+    )
+
+    partials = _map_parts(
+        client, bill, system, chunks,
+        "This is part {index} of {total} of a long bill. Summarize this section:",
+        "Part {index} of {total}",
+    )
+
+    level = 1
+    while len(partials) > 1 and _estimate_tokens("\n\n".join(partials)) > SUMMARIZER_REDUCE_MAX_TOKENS:
+        groups = _group_partials(partials, SUMMARIZER_REDUCE_MAX_TOKENS)
+        if len(groups) == len(partials):
+            break  # every partial is already at the limit on its own; merging can't shrink further
+        logger.info(f"Partial summaries exceed {SUMMARIZER_REDUCE_MAX_TOKENS} tokens; reducing {len(partials)} → {len(groups)} (level {level})")
+        partials = _map_parts(
+            client, bill, system, ["\n\n".join(g) for g in groups],
+            "These are partial summaries (group {index} of {total}) of consecutive parts of a long bill. "
+            "Combine them into one summary of those parts:",
+            "Combined group {index} of {total}",
+        )
+        level += 1
 
     final_bill = dict(bill)
-    final_bill["full_text"] = "\n\n".join(partial_summaries)
+    final_bill["full_text"] = "\n\n".join(partials)
 
-    final_raw = _model_call_with_fallback(client, system, _build_user_prompt(final_bill))
+    final_raw = _model_call_with_fallback(client, system, *_final_prompt(final_bill, combined))
+    logger.info(f"Chunked summarization of {len(chunks)} chunks finished in {time.monotonic() - started:.1f}s")
     return _try_parse_json_with_fallback(final_raw)
 
 
+def _final_prompt(bill: Dict[str, Any], combined: bool) -> tuple:
+    """(user prompt, response_format, expectation) for the call that produces the bill's summary."""
+    user = _build_user_prompt(bill)
+    if not combined:
+        return user, None, _SUMMARY_EXPECT
+    response_format = _COMBINED_RESPONSE_FORMAT if SUMMARIZER_RESPONSE_SCHEMA else None
+    return user + _COMBINED_OUTPUT_INSTRUCTIONS, response_format, _SUMMARY_EXPECT
+
+
 def _normalize_structured_text(value: Any) -> str:
     """Normalize structured text that may arrive as list or string."""
     if isinstance(value, (list, tuple)):
@@ -748,7 +1139,7 @@ def _tighten_tweet_model(client: OpenAI, raw_tweet: str, bill: Dict[str, Any], l
         f"Bill context: {json.dumps(bill, ensure_ascii=False, cls=DateTimeEncoder)}"
     )
     
-    rewritten = _model_call_with_fallback(client, system, user)
+    rewritten = _model_call_with_fallback(client, system, user, hedge=False)
     tightened = rewritten.strip().strip("`")
     
     if len(tightened) > limit:
@@ -830,6 +1221,9 @@ def _generate_from_metadata_model(client: OpenAI, bill: Dict[str, Any]) -> Dict[
     try:
         raw = _model_call_with_fallback(client, system, user)
         return _try_parse_json_with_fallback(raw)
+    except LlmCircuitOpen as e:
+        logger.warning(f"Metadata-only generation skipped ({e}); using deterministic synthesis")
+        return _synthesize_from_metadata_py(bill)
     except Exception as e:
         logger.warning(f"Metadata-only generation failed: {e}")
         return {}
@@ -969,19 +1363,16 @@ def _deduplicate_headers_and_scores(text: str) -> str:
     
     return '\n'.join(new_lines)
 
-def _validate_summary_format(detailed: str) -> bool:
-    """Validate summary structure (non-production only)."""
-    if not detailed:
-        return False
-    
-    required = [
-        "overview",
-        "who does this affect?",
-        "what this bill does",
-        "in short",
-        "why should i care?"
-    ]
-    
+_SUMMARY_SECTIONS = [
+    "overview",
+    "who does this affect?",
+    "what this bill does",
+    "in short",
+    "why should i care?"
+]
+
+def _found_summary_sections(detailed: str) -> List[str]:
+    """Section headers from _SUMMARY_SECTIONS present in ``detailed``, in first-seen order."""
     found = []
     for line in detailed.lower().split('\n'):
         stripped = line.strip()
@@ -989,21 +1380,44 @@ def _validate_summary_format(detailed: str) -> bool:
             continue
         
         # Check for section headers
-        for section in required:
+        for section in _SUMMARY_SECTIONS:
             if section in stripped and section not in found:
                 found.append(section)
+    return found
+
+def _validate_summary_format(detailed: str) -> bool:
+    """Validate summary structure (non-production only)."""
+    if not detailed:
+        return False
     
     # Allow missing "Legislative Status" (it's optional)
-    return len(found) >= len(required) - 1
+    return len(_found_summary_sections(detailed)) >= len(_SUMMARY_SECTIONS) - 1
+
+def _has_section_structure(detailed: str) -> bool:
+    """Streaming check: a non-empty 'detailed' must already show the summary's section headers."""
+    return not detailed.strip() or len(_found_summary_sections(detailed)) >= 2
 
-def summarize_bill_enhanced(bill: Dict[str, Any]) -> Dict[str, str]:
+# What the streamed summary JSON must contain (see json_stream)
+_SUMMARY_EXPECT = JsonExpectation(required=("overview", "detailed"), checks={"detailed": _has_section_structure})
+_PART_EXPECT = JsonExpectation(required=("overview", "detailed"))
+
+def summarize_bill_enhanced(bill: Dict[str, Any], force_refresh: bool = False) -> Dict[str, str]:
     """
     Enhanced bill summarization for teens.
     
     Returns dict with keys: overview, detailed, tweet, subject_tags
     
     All scoring logic is in the Claude prompt, not Python code.
+    
+    Model responses are served from the LLM response cache when the same
+    prompt was answered before; ``force_refresh=True`` skips those lookups
+    (and replaces the cached responses with the fresh ones).
     """
+    with llm_cache.bypass(force_refresh):
+        return _summarize_bill_enhanced(bill)
+
+
+def _summarize_bill_enhanced(bill: Dict[str, Any]) -> Dict[str, str]:
     start = time.monotonic()
     logger.info(f"Summarizing bill: {bill.get('bill_id', 'unknown')}")
     
@@ -1014,24 +1428,27 @@ def summarize_bill_enhanced(bill: Dict[str, Any]) -> Dict[str, str]:
     
     system = _build_enhanced_system_prompt()
     full_text = str(bill.get("full_text") or "")
+    combined = SUMMARIZER_COMBINED_OUTPUT
     
     # Primary attempt
     try:
         if len(full_text) > 50000:
-            parsed = _summarize_large_bill_in_chunks(client, bill, system)
+            parsed = _summarize_large_bill_in_chunks(client, bill, system, combined)
         else:
-            user = _build_user_prompt(bill)
-            raw = _model_call_with_fallback(client, system, user)
+            raw = _model_call_with_fallback(client, system, *_final_prompt(bill, combined))
             parsed = _try_parse_json_with_fallback(raw)
+    except LlmCircuitOpen:
+        raise  # every model is down; retrying would only fail the same way
     except Exception as e:
         logger.warning(f"Initial parse failed, retrying: {e}")
         try:
-            if len(full_text) > 50000:
-                parsed = _summarize_large_bill_in_chunks(client, bill, system)
-            else:
-                user = _build_user_prompt(bill)
-                raw2 = _model_call_with_fallback(client, system, user)
-                parsed = _try_parse_json_with_fallback(raw2)
+            # A cached copy of the response that just failed would fail again
+            with llm_cache.bypass():
+                if len(full_text) > 50000:
+                    parsed = _summarize_large_bill_in_chunks(client, bill, system, combined)
+                else:
+                    raw2 = _model_call_with_fallback(client, system, *_final_prompt(bill, combined))
+                    parsed = _try_parse_json_with_fallback(raw2)
         except Exception as e2:
             logger.error(f"Retry failed: {e2}")
             raise
@@ -1055,7 +1472,7 @@ def summarize_bill_enhanced(bill: Dict[str, Any]) -> Dict[str, str]:
     
     # Process tweet
     tweet_raw = str(parsed.get("tweet", "")).strip()
-    tweet = _coherent_tighten_tweet(client, tweet_raw, bill, limit=200)
+    tweet = _coherent_tighten_tweet(client, tweet_raw, bill, limit=TWEET_CHAR_LIMIT)
     
     # If full text is not available, return empty summaries
     if not bill.get("full_text"):
@@ -1088,12 +1505,26 @@ def summarize_bill_enhanced(bill: Dict[str, Any]) -> Dict[str, str]:
     if any("full bill text" in field.lower() for field in summary_fields):
         logger.warning(f"Summary for bill {bill.get('bill_id')} contains 'full bill text' phrase")
     
-    return {
+    result = {
         "overview": overview,
         "detailed": detailed,
         "tweet": tweet,
         "subject_tags": subject_tags
     }
+    if combined:
+        # Consumed by argument_generator.arguments_for_summary()
+        result["argument_support"] = str(parsed.get("argument_support", "") or "").strip()
+        result["argument_oppose"] = str(parsed.get("argument_oppose", "") or "").strip()
+    return result
+
+
+_TITLE_SYSTEM_PROMPT = (
+    "You are an expert at summarizing long, complex legislative titles into short, informative phrases for a general audience. "
+    "Your response must be a single, concise sentence. Do not include any introductory phrases like 'This bill...' or 'A resolution...'. "
+    "Directly summarize the title's content."
+)
+
+
 def summarize_title(bill_title: str) -> str:
     """
     Summarizes a long bill title to be more informative than simple truncation.
@@ -1101,24 +1532,26 @@ def summarize_title(bill_title: str) -> str:
     try:
         client = _get_venice_client()
         
-        system_prompt = (
-            "You are an expert at summarizing long, complex legislative titles into short, informative phrases for a general audience. "
-            "Your response must be a single, concise sentence. Do not include any introductory phrases like 'This bill...' or 'A resolution...'. "
-            "Directly summarize the title's content."
-        )
-        
         user_prompt = f"Summarize the following bill title: \"{bill_title}\""
+        llm_circuit.check(PREFERRED_MODEL)
+        llm_rate_limit.acquire(len(_TITLE_SYSTEM_PROMPT) + len(user_prompt), 256)
         
-        response = client.chat.completions.create(
-            model=PREFERRED_MODEL,
-            max_tokens=256,
-            temperature=0.5,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            timeout=10.0,
-        )
+        started = time.monotonic()
+        try:
+            response = client.chat.completions.create(
+                model=PREFERRED_MODEL,
+                max_tokens=256,
+                temperature=0.5,
+                messages=[
+                    llm_client.system_message(_TITLE_SYSTEM_PROMPT, PREFERRED_MODEL),
+                    {"role": "user", "content": user_prompt}
+                ],
+                timeout=10.0,
+            )
+        except Exception as e:
+            llm_circuit.record(PREFERRED_MODEL, time.monotonic() - started, e)
+            raise
+        llm_circuit.record(PREFERRED_MODEL, time.monotonic() - started)
         
         summarized_title = _extract_text_from_response(response)
         return summarized_title.strip()
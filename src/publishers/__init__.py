@@ -4,7 +4,8 @@ Publishers package - Multi-platform social media posting for TeenCivics.
 Supported platforms:
 - Twitter/X (via tweepy)
 - Bluesky (via atproto)
-- Threads (via Meta API - future)
+- Threads (via Meta API)
+- Facebook (via Meta Graph API)
 """
 
 from src.publishers.base_publisher import BasePublisher
@@ -20,6 +21,8 @@ from src.publishers.bluesky_publisher import (
 )
 from src.publishers.publisher_manager import (
     PublisherManager,
+    PublishResult,
+    PlatformResult,
     get_publisher_manager,
 )
 
@@ -36,5 +39,7 @@ __all__ = [
     "format_bill_for_bluesky",
     # Manager
     "PublisherManager",
+    "PublishResult",
+    "PlatformResult",
     "get_publisher_manager",
 ]
@@ -1,11 +1,21 @@
 """
 Bluesky publisher for posting bill updates via AT Protocol.
 Uses the atproto library for authentication and posting.
+
+Sessions are persisted and reused across runs: ``createSession`` is heavily
+rate limited, so a fresh login only happens when the stored session string
+is missing or rejected. Sessions are stored in the ``social_sessions`` table,
+or in ``BLUESKY_SESSION_FILE`` if set, always encrypted with
+``BLUESKY_SESSION_KEY`` (needs the optional ``cryptography`` package). Without
+a key nothing is persisted or loaded and every run logs in with the password.
 """
 
+import base64
+import hashlib
 import os
 import re
 import logging
+import threading
 from typing import Dict, Tuple, Optional
 from datetime import datetime, timezone
 
@@ -24,6 +34,110 @@ load_dotenv()
 BLUESKY_HANDLE = os.getenv('BLUESKY_HANDLE')
 BLUESKY_APP_PASSWORD = os.getenv('BLUESKY_APP_PASSWORD')
 
+# Session persistence
+BLUESKY_SESSION_FILE = os.getenv('BLUESKY_SESSION_FILE')
+BLUESKY_SESSION_KEY = os.getenv('BLUESKY_SESSION_KEY')
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# Authenticated clients shared by every BlueskyPublisher in the process
+_shared_clients: Dict[str, object] = {}
+_shared_clients_lock = threading.Lock()
+
+# Substrings of atproto errors that mean the session itself is no good
+_AUTH_ERROR_MARKERS = ("expiredtoken", "invalidtoken", "authenticationrequired", "unauthorized", "401")
+
+_warned_no_session_key = False
+
+
+# ── Session store ────────────────────────────────────────────────────────────
+
+def _fernet():
+    """Cipher for stored sessions, or None (warned once) when persistence is off."""
+    global _warned_no_session_key
+    if not (BLUESKY_SESSION_KEY and CRYPTOGRAPHY_AVAILABLE):
+        if not _warned_no_session_key:
+            _warned_no_session_key = True
+            missing = "BLUESKY_SESSION_KEY is not set" if not BLUESKY_SESSION_KEY else "cryptography is not installed"
+            logger.warning(f"⚠️ Bluesky: {missing}; sessions will not be persisted between runs")
+        return None
+    key = base64.urlsafe_b64encode(hashlib.sha256(BLUESKY_SESSION_KEY.encode()).digest())
+    return Fernet(key)
+
+
+def _encode_session(session_string: str) -> Optional[str]:
+    f = _fernet()
+    return f.encrypt(session_string.encode()).decode() if f else None
+
+
+def _decode_session(blob: str) -> Optional[str]:
+    f = _fernet()
+    if not f:
+        return None
+    try:
+        return f.decrypt(blob.encode()).decode()
+    except InvalidToken:
+        logger.warning("Bluesky: Stored session could not be decrypted (key changed?)")
+        return None
+
+
+def load_stored_session(handle: str) -> Optional[str]:
+    """Return the persisted session string for ``handle``, or None."""
+    if _fernet() is None:
+        return None
+    try:
+        if BLUESKY_SESSION_FILE:
+            if not os.path.exists(BLUESKY_SESSION_FILE):
+                return None
+            with open(BLUESKY_SESSION_FILE, "r", encoding="utf-8") as fh:
+                blob = fh.read().strip()
+        else:
+            from src.database.db import get_social_session
+            blob = get_social_session("bluesky", handle)
+        return _decode_session(blob) if blob else None
+    except Exception as e:
+        logger.warning(f"Bluesky: Could not load stored session - {e}")
+        return None
+
+
+def store_session(handle: str, session_string: str) -> None:
+    """Persist a session string for ``handle`` (best effort; never in plaintext)."""
+    try:
+        blob = _encode_session(session_string)
+        if blob is None:
+            return
+        if BLUESKY_SESSION_FILE:
+            fd = os.open(BLUESKY_SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(blob)
+        else:
+            from src.database.db import save_social_session
+            save_social_session("bluesky", handle, blob)
+    except Exception as e:
+        logger.warning(f"Bluesky: Could not persist session - {e}")
+
+
+def clear_stored_session(handle: str) -> None:
+    """Forget the persisted session for ``handle`` (best effort)."""
+    try:
+        if BLUESKY_SESSION_FILE:
+            if os.path.exists(BLUESKY_SESSION_FILE):
+                os.remove(BLUESKY_SESSION_FILE)
+        else:
+            from src.database.db import delete_social_session
+            delete_social_session("bluesky", handle)
+    except Exception as e:
+        logger.warning(f"Bluesky: Could not clear stored session - {e}")
+
+
+def _is_auth_error(exc: Exception) -> bool:
+    text = f"{type(exc).__name__} {exc}".lower()
+    return any(marker in text for marker in _AUTH_ERROR_MARKERS)
+
 
 class BlueskyPublisher(BasePublisher):
     """
@@ -61,25 +175,70 @@ class BlueskyPublisher(BasePublisher):
     def _get_client(self):
         """
         Get or create an authenticated Bluesky client.
+
+        Reuses, in order: this instance's client, a client already shared in
+        this process, then the persisted session string (refreshed by atproto
+        if its access token expired). Falls back to a fresh password login
+        only when no stored session exists or it is rejected.
         Lazy initialization to avoid import errors when atproto isn't installed.
         """
         if self._client is not None:
             return self._client
-        
-        try:
-            from atproto import Client
-            
-            self._client = Client()
-            self._client.login(self._handle, self._app_password)
-            logger.info(f"Bluesky: Authenticated as {self._handle}")
-            return self._client
-            
-        except ImportError:
-            logger.error("Bluesky: atproto package not installed. Run: pip install atproto")
-            raise
-        except Exception as e:
-            logger.error(f"Bluesky: Failed to authenticate - {e}")
-            raise
+
+        with _shared_clients_lock:
+            shared = _shared_clients.get(self._handle)
+            if shared is not None:
+                self._client = shared
+                return self._client
+
+            try:
+                from atproto import Client
+
+                stored = load_stored_session(self._handle)
+                if stored:
+                    try:
+                        client = self._new_client(Client)
+                        client.login(session_string=stored)
+                        logger.info(f"Bluesky: Reused stored session for {self._handle}")
+                        self._client = _shared_clients[self._handle] = client
+                        return self._client
+                    except Exception as e:
+                        logger.warning(f"Bluesky: Stored session rejected, logging in fresh - {e}")
+                        clear_stored_session(self._handle)
+
+                client = self._new_client(Client)
+                client.login(self._handle, self._app_password)
+                logger.info(f"Bluesky: Authenticated as {self._handle}")
+                self._client = _shared_clients[self._handle] = client
+                return self._client
+
+            except ImportError:
+                logger.error("Bluesky: atproto package not installed. Run: pip install atproto")
+                raise
+            except Exception as e:
+                logger.error(f"Bluesky: Failed to authenticate - {e}")
+                raise
+
+    def _new_client(self, client_cls):
+        """Create a client that persists its session on create/refresh."""
+        client = client_cls()
+        handle = self._handle
+
+        def _on_session_change(event, session) -> None:
+            if getattr(event, "value", event) in ("create", "refresh"):
+                store_session(handle, session.export())
+                logger.debug(f"Bluesky: Session {getattr(event, 'value', event)} persisted")
+
+        client.on_session_change(_on_session_change)
+        return client
+
+    def _reset_client(self) -> None:
+        """Drop the cached client and stored session after an auth failure."""
+        with _shared_clients_lock:
+            if _shared_clients.get(self._handle) is self._client:
+                _shared_clients.pop(self._handle, None)
+        self._client = None
+        clear_stored_session(self._handle)
     
     def _extract_link_positions(self, text: str) -> list:
         """
@@ -302,18 +461,26 @@ class BlueskyPublisher(BasePublisher):
             return False, None
         
         try:
-            client = self._get_client()
-            
             # Build facets for clickable links
             facets = self._build_facets(text)
             
             logger.info(f"Bluesky: Posting with {len(facets)} link facet(s)...")
             
-            # Create the post
-            response = client.send_post(
-                text=text,
-                facets=facets if facets else None
-            )
+            # Create the post; a rejected session gets one fresh-login retry
+            try:
+                response = self._get_client().send_post(
+                    text=text,
+                    facets=facets if facets else None
+                )
+            except Exception as e:
+                if not _is_auth_error(e):
+                    raise
+                logger.warning(f"Bluesky: Session rejected while posting, re-authenticating - {e}")
+                self._reset_client()
+                response = self._get_client().send_post(
+                    text=text,
+                    facets=facets if facets else None
+                )
             
             if response and hasattr(response, 'uri'):
                 # Convert AT URI to web URL
@@ -12,6 +12,7 @@ import requests
 from dotenv import load_dotenv
 
 from src.publishers.base_publisher import BasePublisher
+from src.utils import http
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -187,7 +188,7 @@ class FacebookPublisher(BasePublisher):
         }
 
         try:
-            response = requests.post(url, params=params)
+            response = http.post(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -0,0 +1,153 @@
+"""
+Publish outbox drain worker.
+
+The orchestrator enqueues one ``publish_outbox`` row per (bill, platform)
+and makes a single immediate delivery attempt. Anything that fails is left
+in the outbox and retried here with exponential backoff until it succeeds
+or runs out of attempts (status ``dead``). A post that timed out may still
+have gone out, so its job is parked as ``unknown`` instead and never retried.
+
+Run on a schedule via ``scripts/drain_publish_outbox.py``.
+"""
+
+import logging
+import os
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from src.database.db import (
+    claim_publish_jobs,
+    complete_publish_job,
+    fail_publish_job,
+    get_bill_by_id,
+    mark_bill_published,
+    mark_publish_job_unknown,
+    normalize_bill_id,
+)
+from src.publishers.publisher_manager import get_publisher_manager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# ── Retry configuration ──────────────────────────────────────────────────────
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+OUTBOX_BACKOFF_BASE_SECONDS = float(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", "300"))
+OUTBOX_BACKOFF_MAX_SECONDS = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", "21600"))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "25"))
+
+
+def compute_backoff(attempts: int) -> float:
+    """
+    Delay before the next attempt after ``attempts`` failures.
+
+    Exponential (base * 2^(attempts-1)), capped at OUTBOX_BACKOFF_MAX_SECONDS,
+    with ±20% jitter so retries for different platforms don't align.
+    """
+    delay = OUTBOX_BACKOFF_BASE_SECONDS * (2 ** max(0, attempts - 1))
+    delay = min(delay, OUTBOX_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def drain_publish_outbox(
+    limit: int = OUTBOX_BATCH_SIZE,
+    bill_id: Optional[str] = None,
+    bill: Optional[Dict] = None,
+    tweet_text: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Claim due outbox jobs, publish them, and record each outcome.
+
+    Jobs are grouped by bill so every platform for one bill is published
+    concurrently through PublisherManager. A bill is marked published on
+    its first successful platform post, or when a post timed out (it may
+    have landed, and re-selecting the bill could post it twice).
+
+    Args:
+        limit: Maximum number of jobs to claim in this pass
+        bill_id: Only drain jobs for this bill (used by the orchestrator)
+        bill: Pre-loaded bill data for ``bill_id`` (skips a DB read)
+        tweet_text: Pre-validated tweet text for ``bill_id``
+
+    Returns:
+        Counts: {"claimed", "succeeded", "retrying", "dead", "unknown",
+        "published", "already_published"} where "published" is the number of bills this
+        pass marked published and "already_published" the number that were
+        marked before (e.g. by an earlier pass for another platform)
+    """
+    summary = {"claimed": 0, "succeeded": 0, "retrying": 0, "dead": 0, "unknown": 0,
+               "published": 0, "already_published": 0}
+    if bill_id:
+        bill_id = normalize_bill_id(bill_id)
+    jobs = claim_publish_jobs(limit=limit, bill_id=bill_id)
+    if not jobs:
+        return summary
+    summary["claimed"] = len(jobs)
+
+    by_bill: "OrderedDict[str, List[Dict]]" = OrderedDict()
+    for job in jobs:
+        by_bill.setdefault(job["bill_id"], []).append(job)
+
+    manager = get_publisher_manager()
+    for job_bill_id, bill_jobs in by_bill.items():
+        bill_data = bill if (bill is not None and job_bill_id == bill_id) else get_bill_by_id(job_bill_id)
+        if not bill_data:
+            for job in bill_jobs:
+                _record_failure(job, "bill not found", summary, retry=False)
+            continue
+
+        platforms = [job["platform"] for job in bill_jobs]
+        logger.info(f"📦 Outbox: publishing {job_bill_id} to {', '.join(platforms)}")
+        result = manager.publish_bill_to_all(
+            bill_data,
+            tweet_text=tweet_text if job_bill_id == bill_id else None,
+            platforms=platforms,
+        )
+
+        for job in bill_jobs:
+            platform_result = result.platforms.get(job["platform"])
+            if platform_result is None:
+                _record_failure(job, "platform not configured", summary)
+            elif platform_result.success:
+                complete_publish_job(job["id"], platform_result.url)
+                summary["succeeded"] += 1
+            elif platform_result.timed_out:
+                logger.warning(
+                    f"⏱️ Outbox: {job['platform']} timed out for {job_bill_id}; the post may have gone out. "
+                    f"Parked as 'unknown' - check the platform before re-posting."
+                )
+                mark_publish_job_unknown(job["id"], platform_result.error or "timed out")
+                summary["unknown"] += 1
+            else:
+                _record_failure(job, platform_result.error or "post failed", summary)
+
+        if result.any_posted or result.unknown:
+            marked = mark_bill_published(job_bill_id)
+            if marked:
+                summary["published"] += 1
+            elif marked is False:
+                summary["already_published"] += 1
+
+    logger.info(
+        f"📦 Outbox drain: {summary['claimed']} claimed, {summary['succeeded']} succeeded, "
+        f"{summary['retrying']} retrying, {summary['dead']} dead, {summary['unknown']} unknown"
+    )
+    return summary
+
+
+def _record_failure(job: Dict, error: str, summary: Dict[str, int], retry: bool = True) -> None:
+    attempts = int(job.get("attempts") or 1)
+    if retry and attempts < OUTBOX_MAX_ATTEMPTS:
+        delay = compute_backoff(attempts)
+        logger.warning(
+            f"⚠️ Outbox: {job['platform']} failed for {job['bill_id']} "
+            f"(attempt {attempts}/{OUTBOX_MAX_ATTEMPTS}): {error}; retrying in {delay:.0f}s"
+        )
+        fail_publish_job(job["id"], error, delay)
+        summary["retrying"] += 1
+    else:
+        logger.error(
+            f"❌ Outbox: {job['platform']} gave up for {job['bill_id']} after {attempts} attempt(s): {error}"
+        )
+        fail_publish_job(job["id"], error, None)
+        summary["dead"] += 1
@@ -1,16 +1,122 @@
 """
 Publisher Manager - Orchestrates posting to multiple social media platforms.
-Handles Twitter, Bluesky, and Threads in a unified way.
+Handles Twitter, Bluesky, Threads, and Facebook in a unified way.
+
+Platforms are published concurrently on a small thread pool so one slow or
+hung platform API cannot hold up the others. Each platform has its own
+timeout (``PUBLISH_TIMEOUT_SECONDS``, overridable per platform via
+``PUBLISH_TIMEOUT_<PLATFORM>_SECONDS``).
 """
 
 import logging
-from typing import Dict, List, Tuple, Optional
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 
 from src.publishers.base_publisher import BasePublisher
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# ── Concurrency / timeout configuration ──────────────────────────────────────
+PUBLISH_TIMEOUT_SECONDS = float(os.getenv("PUBLISH_TIMEOUT_SECONDS", "45"))
+
+# Order used to pick the canonical post URL stored on the bill row
+# (Twitter first, matching the historical tweet_url semantics).
+PLATFORM_PRIORITY = ("twitter", "bluesky", "threads", "facebook")
+
+
+def get_platform_timeout(platform: str) -> float:
+    """Return the publish timeout in seconds for a platform."""
+    override = os.getenv(f"PUBLISH_TIMEOUT_{platform.upper()}_SECONDS")
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            logger.warning(f"Invalid PUBLISH_TIMEOUT_{platform.upper()}_SECONDS={override!r}, using default")
+    return PUBLISH_TIMEOUT_SECONDS
+
+
+@dataclass
+class PlatformResult:
+    """
+    Outcome of publishing to a single platform.
+
+    Unpacks like the legacy ``(success, url)`` tuple so existing callers keep
+    working: ``success, url = result``.
+
+    ``timed_out`` means the outcome is unknown rather than failed: the
+    abandoned worker may still complete the post, so callers must not
+    re-post such a platform automatically.
+    """
+    platform: str
+    success: bool
+    url: Optional[str] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    def __iter__(self) -> Iterator:
+        return iter((self.success, self.url))
+
+
+@dataclass
+class PublishResult:
+    """Aggregate outcome of publishing one bill to every configured platform."""
+    platforms: Dict[str, PlatformResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def any_posted(self) -> bool:
+        return any(r.success for r in self.platforms.values())
+
+    @property
+    def succeeded(self) -> List[str]:
+        return [name for name, r in self.platforms.items() if r.success]
+
+    @property
+    def failed(self) -> List[str]:
+        """Platforms that definitely did not post (timeouts excluded)."""
+        return [name for name, r in self.platforms.items() if not r.success and not r.timed_out]
+
+    @property
+    def unknown(self) -> List[str]:
+        """Platforms that timed out; their post may or may not have gone out."""
+        return [name for name, r in self.platforms.items() if r.timed_out]
+
+    @property
+    def primary_url(self) -> Optional[str]:
+        """URL of the highest-priority successful post (Twitter preferred)."""
+        ordered = [p for p in PLATFORM_PRIORITY if p in self.platforms]
+        ordered += [p for p in self.platforms if p not in PLATFORM_PRIORITY]
+        for name in ordered:
+            result = self.platforms[name]
+            if result.success and result.url:
+                return result.url
+        return None
+
+    # Dict-style access for backward compatibility with the old
+    # Dict[str, Tuple[bool, Optional[str]]] return value.
+    def __getitem__(self, platform: str) -> PlatformResult:
+        return self.platforms[platform]
+
+    def __contains__(self, platform: str) -> bool:
+        return platform in self.platforms
+
+    def __len__(self) -> int:
+        return len(self.platforms)
+
+    def items(self):
+        return self.platforms.items()
+
+    def values(self):
+        return self.platforms.values()
+
+    def keys(self):
+        return self.platforms.keys()
+
 
 class PublisherManager:
     """
@@ -76,6 +182,21 @@ class PublisherManager:
         except Exception as e:
             logger.warning(f"PublisherManager: Error loading Threads publisher - {e}")
         
+        # Facebook publisher
+        try:
+            from src.publishers.facebook_publisher import FacebookPublisher
+
+            facebook = FacebookPublisher()
+            if facebook.is_configured():
+                self.publishers.append(facebook)
+                logger.info("PublisherManager: Facebook is configured")
+            else:
+                logger.info("PublisherManager: Facebook not configured")
+        except ImportError:
+            logger.debug("PublisherManager: Facebook publisher not available")
+        except Exception as e:
+            logger.warning(f"PublisherManager: Error loading Facebook publisher - {e}")
+
         logger.info(f"PublisherManager: Loaded {len(self.publishers)} BasePublisher platforms")
     
     def get_configured_platforms(self) -> List[str]:
@@ -90,65 +211,114 @@ class PublisherManager:
         
         return platforms
     
-    def publish_bill_to_all(self, bill: Dict) -> Dict[str, Tuple[bool, Optional[str]]]:
+    def _publish_twitter(self, bill: Dict, tweet_text: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """
-        Publish a bill to all configured platforms.
-        
+        Post a bill to Twitter (legacy publisher, not BasePublisher).
+
+        If ``tweet_text`` is given it is assumed to be already formatted and
+        validated by the caller (the orchestrator's quality gate) and is
+        posted as-is.
+        """
+        from src.publishers import twitter_publisher
+
+        if tweet_text is None:
+            tweet_text = twitter_publisher.format_bill_tweet(bill)
+            is_valid, reason = twitter_publisher.validate_tweet_content(tweet_text, bill)
+            if not is_valid:
+                logger.error(f"PublisherManager: Twitter validation failed - {reason}")
+                return False, None
+
+        return twitter_publisher.post_tweet(tweet_text)
+
+    def _publish_jobs(self, bill: Dict, tweet_text: Optional[str]) -> Dict[str, Callable[[], Tuple[bool, Optional[str]]]]:
+        """Build the platform -> zero-arg publish callable map."""
+        jobs: Dict[str, Callable[[], Tuple[bool, Optional[str]]]] = {}
+        if self._twitter_configured:
+            jobs["twitter"] = lambda: self._publish_twitter(bill, tweet_text)
+        for publisher in self.publishers:
+            jobs[publisher.platform_name] = (lambda p=publisher: p.publish_bill(bill))
+        return jobs
+
+    @staticmethod
+    def _timed_call(fn: Callable[[], Tuple[bool, Optional[str]]]) -> Tuple[bool, Optional[str], float]:
+        start = time.monotonic()
+        success, url = fn()
+        return bool(success), url, time.monotonic() - start
+
+    def publish_bill_to_all(
+        self,
+        bill: Dict,
+        tweet_text: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+    ) -> PublishResult:
+        """
+        Publish a bill to all configured platforms concurrently.
+
+        Each platform runs on its own worker thread and is bounded by its
+        own timeout. A platform that exceeds its timeout is reported with
+        ``timed_out=True`` and listed in ``PublishResult.unknown``, not
+        ``failed``: its worker is abandoned rather than joined (so a hung API
+        never blocks the caller) and may still complete the post.
+
         Args:
             bill: Dictionary containing bill data
-            
+            tweet_text: Optional pre-formatted, pre-validated tweet text
+            platforms: Optional subset of platform names to publish to
+                (default: every configured platform)
+
         Returns:
-            Dict mapping platform name to (success, url) tuple
+            PublishResult mapping platform name to PlatformResult
         """
-        results = {}
-        
-        # Handle Twitter separately (legacy publisher, not BasePublisher)
-        if self._twitter_configured:
-            try:
-                from src.publishers.twitter_publisher import (
-                    format_bill_tweet, post_tweet, validate_tweet_content
-                )
-                
-                tweet_text = format_bill_tweet(bill)
-                is_valid, reason = validate_tweet_content(tweet_text, bill)
-                
-                if is_valid:
-                    success, url = post_tweet(tweet_text)
-                    results["twitter"] = (success, url)
+        jobs = self._publish_jobs(bill, tweet_text)
+        if platforms is not None:
+            jobs = {name: fn for name, fn in jobs.items() if name in platforms}
+        result = PublishResult()
+        if not jobs:
+            logger.warning("PublisherManager: No platforms configured")
+            return result
+
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="publish")
+        try:
+            futures = {name: executor.submit(self._timed_call, fn) for name, fn in jobs.items()}
+            for name, future in futures.items():
+                timeout = get_platform_timeout(name)
+                remaining = max(0.0, start + timeout - time.monotonic())
+                try:
+                    success, url, elapsed = future.result(timeout=remaining)
+                    result.platforms[name] = PlatformResult(name, success, url, elapsed)
                     if success:
-                        logger.info(f"PublisherManager: Twitter posted - {url}")
+                        logger.info(f"PublisherManager: {name} posted in {elapsed:.1f}s - {url}")
                     else:
-                        logger.error(f"PublisherManager: Twitter failed to post")
-                else:
-                    logger.error(f"PublisherManager: Twitter validation failed - {reason}")
-                    results["twitter"] = (False, None)
-                    
-            except Exception as e:
-                logger.error(f"PublisherManager: Twitter error - {e}", exc_info=True)
-                results["twitter"] = (False, None)
-        
-        # Handle all BasePublisher platforms
-        for publisher in self.publishers:
-            try:
-                success, url = publisher.publish_bill(bill)
-                results[publisher.platform_name] = (success, url)
-            except Exception as e:
-                logger.error(f"PublisherManager: {publisher.platform_name} error - {e}", exc_info=True)
-                results[publisher.platform_name] = (False, None)
-        
-        # Log summary
-        success_count = sum(1 for s, _ in results.values() if s)
-        total_count = len(results)
-        logger.info(f"PublisherManager: Posted to {success_count}/{total_count} platforms")
-        
-        return results
-    
+                        logger.error(f"PublisherManager: {name} failed to post ({elapsed:.1f}s)")
+                except FuturesTimeoutError:
+                    elapsed = time.monotonic() - start
+                    logger.error(f"⏱️ PublisherManager: {name} timed out after {timeout:.0f}s (outcome unknown)")
+                    result.platforms[name] = PlatformResult(
+                        name, False, None, elapsed, error=f"timed out after {timeout:.0f}s", timed_out=True
+                    )
+                except Exception as e:
+                    elapsed = time.monotonic() - start
+                    logger.error(f"PublisherManager: {name} error - {e}", exc_info=True)
+                    result.platforms[name] = PlatformResult(name, False, None, elapsed, error=str(e))
+        finally:
+            # Don't join hung workers; they finish (or die) in the background.
+            executor.shutdown(wait=False)
+
+        result.elapsed = time.monotonic() - start
+        logger.info(
+            f"PublisherManager: Posted to {len(result.succeeded)}/{len(result)} platforms "
+            f"in {result.elapsed:.1f}s"
+            + (f" ({len(result.unknown)} outcome unknown)" if result.unknown else "")
+        )
+        return result
+
     def publish_to_platform(self, platform: str, bill: Dict) -> Tuple[bool, Optional[str]]:
         """
         Publish to a specific platform only.
         
         Args:
-            platform: Platform name ('twitter', 'bluesky', 'threads')
+            platform: Platform name ('twitter', 'bluesky', 'threads', 'facebook')
             bill: Dictionary containing bill data
             
         Returns:
@@ -156,18 +326,7 @@ class PublisherManager:
         """
         if platform == "twitter" and self._twitter_configured:
             try:
-                from src.publishers.twitter_publisher import (
-                    format_bill_tweet, post_tweet, validate_tweet_content
-                )
-                
-                tweet_text = format_bill_tweet(bill)
-                is_valid, reason = validate_tweet_content(tweet_text, bill)
-                
-                if is_valid:
-                    return post_tweet(tweet_text)
-                else:
-                    logger.error(f"Twitter validation failed: {reason}")
-                    return False, None
+                return self._publish_twitter(bill)
             except Exception as e:
                 logger.error(f"Twitter error: {e}")
                 return False, None
@@ -13,6 +13,7 @@ from typing import Dict, Tuple, Optional
 from dotenv import load_dotenv
 
 from src.publishers.base_publisher import BasePublisher
+from src.utils import http
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -219,7 +220,7 @@ class ThreadsPublisher(BasePublisher):
         }
         
         try:
-            response = requests.post(url, params=params)
+            response = http.post(url, params=params)
             response.raise_for_status()
             data = response.json()
             container_id = data.get("id")
@@ -257,7 +258,7 @@ class ThreadsPublisher(BasePublisher):
         elapsed = 0
         while elapsed < max_wait:
             try:
-                response = requests.get(url, params=params)
+                response = http.get(url, params=params, retries=0)
                 response.raise_for_status()
                 data = response.json()
                 status = data.get("status", "UNKNOWN")
@@ -295,7 +296,7 @@ class ThreadsPublisher(BasePublisher):
         }
         
         try:
-            response = requests.post(url, params=params)
+            response = http.post(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -0,0 +1,147 @@
+"""
+Incremental status refresh for published bills.
+
+Once a bill is published nothing in the daily pipeline looks at it again, so
+its ``status`` / ``normalized_status`` (and with them the archive's status
+filter and "became law" facet) freeze at whatever they were on posting day.
+This job asks Congress.gov which bills changed since its own watermark
+(``ingestion_watermarks`` row ``status_refresh_{congress}``, read through
+the same ``updateDate`` paging as Phase 1 ingestion), re-derives the status
+of the published ones from their actions, and writes every change in one
+batched UPDATE.
+
+- Only bills whose ``updateDate`` moved are touched, so a run costs one list
+  page plus one actions request per changed published bill.
+- The cached Congress.gov detail/actions responses for those bills are
+  dropped first; their ``updateDate`` says the cached copies are stale.
+- The watermark only advances when every changed bill was refreshed (or
+  there was nothing to refresh); otherwise the next run re-reads the window.
+
+Site pages are rendered from Postgres on each request, so the UPDATE is all
+it takes for the archive and bill pages to show the new status.
+
+Run on a schedule via ``scripts/refresh_bill_statuses.py``.
+"""
+
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from src.database.db import bulk_update_bill_statuses, get_published_bill_statuses
+from src.fetchers import congress_quota
+from src.fetchers.bill_updates import INGEST_CONGRESS, commit_bill_updates, fetch_bill_updates
+from src.fetchers.congress_cache import invalidate
+from src.fetchers.congress_fetcher import derive_tracker_from_actions, fetch_bill_actions_from_api
+from src.orchestrator import derive_status_from_tracker
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+STATUS_REFRESH_WORKERS = max(1, int(os.getenv("STATUS_REFRESH_WORKERS", "4")))
+
+API_BASE = "https://api.congress.gov/v3/bill"
+
+
+def status_refresh_watermark_name(congress: str) -> str:
+    return f"status_refresh_{congress}"
+
+
+def invalidate_bill_cache(bill_id: str) -> int:
+    """Drop cached detail and actions responses for ``bill_id``. Returns entries removed."""
+    match = re.match(r'([a-z]+)(\d+)-(\d+)$', bill_id)
+    if not match:
+        return 0
+    bill_type, number, congress = match.groups()
+    base = f"{API_BASE}/{congress}/{bill_type}/{number}"
+    return sum(invalidate(url) for url in (f"{base}?format=json", f"{base}/actions?format=json"))
+
+
+def derive_current_status(bill_id: str, api_key: str) -> Optional[Tuple[str, str]]:
+    """
+    (status, normalized_status) from the bill's current actions, or None if
+    it has none. Raises on API errors.
+    """
+    match = re.match(r'([a-z]+)(\d+)-(\d+)$', bill_id)
+    if not match:
+        return None
+    bill_type, number, congress = match.groups()
+    actions = fetch_bill_actions_from_api(congress, bill_type, number, api_key)
+    if not actions:
+        return None
+    return derive_status_from_tracker(derive_tracker_from_actions(actions))
+
+
+def _derive_or_fail(bill_id: str, api_key: str) -> Tuple[bool, Optional[Tuple[str, str]]]:
+    try:
+        return True, derive_current_status(bill_id, api_key)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"⚠️ Could not fetch actions for {bill_id}: {e}")
+        return False, None
+
+
+def refresh_published_statuses(congress: str = INGEST_CONGRESS, workers: int = STATUS_REFRESH_WORKERS,
+                               dry_run: bool = False) -> Dict[str, int]:
+    """
+    Re-derive and store the status of published bills updated since the last run.
+
+    Args:
+        workers: Concurrent actions requests
+        dry_run: Log the changes but don't write statuses or the watermark
+
+    Returns:
+        Counts: {"changed", "published", "refreshed", "updated", "failed"}
+    """
+    stats = {"changed": 0, "published": 0, "refreshed": 0, "updated": 0, "failed": 0}
+    api_key = os.getenv('CONGRESS_API_KEY')
+    if not api_key:
+        raise ValueError("CONGRESS_API_KEY environment variable not set")
+
+    congress_quota.set_default_priority("backfill")
+    updates = fetch_bill_updates(congress, name=status_refresh_watermark_name(congress))
+    if updates is None:
+        logger.warning("⚠️ Could not list updated bills; statuses not refreshed")
+        return stats
+    stats["changed"] = len(updates.bill_ids)
+
+    try:
+        current = get_published_bill_statuses(updates.bill_ids)
+    except Exception as e:
+        logger.error(f"❌ Could not read published bill statuses: {e}")
+        return stats
+    stats["published"] = len(current)
+
+    bill_ids = sorted(current)
+    for bill_id in bill_ids:
+        invalidate_bill_cache(bill_id)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="status-refresh") as pool:
+        derived = list(pool.map(lambda bid: _derive_or_fail(bid, api_key), bill_ids))
+
+    changes: List[Tuple[str, str, str]] = []
+    for bill_id, (ok, new) in zip(bill_ids, derived):
+        if not ok:
+            stats["failed"] += 1
+            continue
+        stats["refreshed"] += 1
+        if new is not None and new != current[bill_id]:
+            logger.info(f"🔄 {bill_id}: {current[bill_id][1] or 'unknown'} → {new[1]}")
+            changes.append((bill_id, new[0], new[1]))
+
+    if dry_run:
+        logger.info(f"🧪 Dry run: {len(changes)} status change(s) not written")
+        return stats
+
+    stats["updated"] = bulk_update_bill_statuses(changes)
+    if stats["failed"] or stats["updated"] < len(changes):
+        logger.warning("⚠️ Some bills were not refreshed; keeping the watermark so the next run retries them")
+    else:
+        commit_bill_updates(updates)
+
+    logger.info(
+        f"🏁 Status refresh: {stats['changed']} changed bill(s), {stats['published']} published, "
+        f"{stats['updated']} status update(s), {stats['failed']} failed"
+    )
+    return stats
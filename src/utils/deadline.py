@@ -0,0 +1,142 @@
+"""
+Deadlines that propagate through a unit of work.
+
+A ``Deadline`` is an absolute point in (monotonic) time. Installing one with
+``deadline_scope()`` makes it the current deadline for that thread; the
+shared HTTP client, the browser pool, PDF extraction and the scrapers
+consult ``current_deadline()`` and shrink their own timeouts to the budget
+that is left, raising ``DeadlineExceeded`` once it is gone. That is what
+lets ``enrich_with_timeout`` actually bound wall time instead of merely
+giving up on waiting for a hung worker.
+
+Usage:
+    from src.utils.deadline import Deadline, deadline_scope
+
+    with deadline_scope(Deadline(120)):
+        enrich(...)  # every HTTP call/page load inside gets at most the remaining time
+"""
+
+import contextlib
+import functools
+import math
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(requests.Timeout):
+    """
+    Raised when a step starts (or would wait) after its deadline has passed.
+
+    Subclasses ``requests.Timeout`` so existing network error handling
+    treats it like any other timeout.
+    """
+
+
+class Deadline:
+    """An absolute monotonic deadline; ``Deadline(None)`` never expires."""
+
+    def __init__(self, seconds: Optional[float]) -> None:
+        self.budget = seconds
+        self.expires_at = None if seconds is None else time.monotonic() + max(0.0, seconds)
+
+    def remaining(self) -> float:
+        """Seconds left (``math.inf`` for an unbounded deadline, never negative)."""
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, what: str = "") -> None:
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceeded(f"Deadline of {self.budget}s exceeded" + (f" before {what}" if what else ""))
+
+    def clamp(self, timeout: Any, what: str = "") -> Any:
+        """
+        Shrink a timeout (seconds, a (connect, read) tuple, or None) to the
+        remaining budget. Raises DeadlineExceeded if nothing is left.
+        """
+        self.check(what)
+        remaining = self.remaining()
+        if remaining == math.inf:
+            return timeout
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.1f}s)"
+
+
+# ── Thread-local propagation ─────────────────────────────────────────────────
+_local = threading.local()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline installed on this thread, if any."""
+    return getattr(_local, "deadline", None)
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make ``deadline`` current for this thread; ``None`` leaves things unchanged."""
+    if deadline is None:
+        yield current_deadline()
+        return
+    previous = current_deadline()
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap ``fn`` so it runs under the calling thread's current deadline.
+
+    Thread-local scopes don't follow work submitted to an executor; submit
+    ``bind(fn)`` instead of ``fn`` to carry the deadline along.
+    """
+    deadline = current_deadline()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with deadline_scope(deadline):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def check_deadline(what: str = "") -> None:
+    """Raise DeadlineExceeded if the current deadline (if any) has passed."""
+    deadline = current_deadline()
+    if deadline is not None:
+        deadline.check(what)
+
+
+def clamp_timeout(timeout: Any, what: str = "") -> Any:
+    """``Deadline.clamp`` against the current deadline; unchanged when there is none."""
+    deadline = current_deadline()
+    return timeout if deadline is None else deadline.clamp(timeout, what)
+
+
+def remaining_time() -> float:
+    """Seconds left on the current deadline (``math.inf`` without one)."""
+    deadline = current_deadline()
+    return math.inf if deadline is None else deadline.remaining()
+
+
+def sleep(seconds: float) -> None:
+    """``time.sleep`` that never sleeps past the current deadline."""
+    check_deadline("sleep")
+    time.sleep(max(0.0, min(seconds, remaining_time())))
@@ -0,0 +1,306 @@
+"""
+Shared HTTP client for all outbound requests.
+
+One process-wide ``requests.Session`` with keep-alive connection pooling, so
+repeated calls to the same host (api.congress.gov, www.congress.gov, the
+Census geocoder, ...) reuse TCP/TLS connections instead of re-handshaking.
+
+On top of the session this module adds:
+
+- A retry policy for idempotent requests: exponential backoff with full
+  jitter on connection errors, timeouts and 429/5xx responses, honouring the
+  server's ``Retry-After`` header when present.
+- Per-host concurrency limits (semaphores) so concurrent workers can't
+  stampede a single upstream.
+- Per-host request timing metrics (count, errors, retries, p50/p95 latency).
+- Per-host hooks (``register_host_hook``) run before each attempt and after
+  each response, e.g. the shared Congress.gov quota accountant.
+- Deadline awareness: inside a ``src.utils.deadline.deadline_scope`` every
+  attempt's timeout is clamped to the remaining budget, and retries that
+  would sleep past it are skipped.
+
+Usage:
+    from src.utils import http
+
+    resp = http.get(url, params=params, timeout=30)
+    resp.raise_for_status()
+"""
+
+import email.utils
+import logging
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.deadline import clamp_timeout, remaining_time
+
+logger = logging.getLogger(__name__)
+
+# ── Configuration ────────────────────────────────────────────────────────────
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_BASE_SECONDS = float(os.getenv("HTTP_BACKOFF_BASE_SECONDS", "1.0"))
+HTTP_BACKOFF_MAX_SECONDS = float(os.getenv("HTTP_BACKOFF_MAX_SECONDS", "30"))
+# Never sleep longer than this for a single Retry-After, whatever the server says
+HTTP_RETRY_AFTER_MAX_SECONDS = float(os.getenv("HTTP_RETRY_AFTER_MAX_SECONDS", "60"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "30"))
+HTTP_PER_HOST_LIMIT = int(os.getenv("HTTP_PER_HOST_LIMIT", "4"))
+
+# Host-specific concurrency overrides (host -> max in-flight requests)
+HOST_LIMITS: Dict[str, int] = {
+    "api.congress.gov": int(os.getenv("HTTP_LIMIT_CONGRESS_API", "4")),
+    "www.congress.gov": int(os.getenv("HTTP_LIMIT_CONGRESS_WEB", "2")),
+    "nominatim.openstreetmap.org": 1,  # usage policy: max 1 req/s
+}
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry number ``attempt`` (0-based)."""
+    cap = min(HTTP_BACKOFF_MAX_SECONDS, HTTP_BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+class _HostStats:
+    __slots__ = ("count", "errors", "retries", "latencies")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.latencies: List[float] = []
+
+
+class HttpClient:
+    """
+    Pooled, retrying, per-host-throttled HTTP client.
+
+    Thread-safe: a single instance is shared by every fetcher in the process
+    (see ``get_http_client()``).
+    """
+
+    # Keep a bounded latency sample per host for percentile estimates
+    _LATENCY_SAMPLE = 500
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE) -> None:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._sem_lock = threading.Lock()
+        self._stats: Dict[str, _HostStats] = defaultdict(_HostStats)
+        self._stats_lock = threading.Lock()
+        self._hooks: Dict[str, Dict[str, Tuple[Optional[Callable], Optional[Callable]]]] = defaultdict(dict)
+
+    # ── Per-host hooks ──────────────────────────────────────────────────────
+
+    def register_host_hook(self, host: str, name: str,
+                           before: Optional[Callable[[str, str], None]] = None,
+                           after: Optional[Callable[[requests.Response], None]] = None) -> None:
+        """
+        Register (or replace) a named hook for requests to ``host``.
+
+        ``before(method, url)`` runs before every attempt, including retries,
+        and may block or raise. ``after(response)`` runs on every response.
+        """
+        self._hooks[host][name] = (before, after)
+
+    # ── Per-host concurrency ────────────────────────────────────────────────
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._sem_lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(HOST_LIMITS.get(host, HTTP_PER_HOST_LIMIT))
+                self._semaphores[host] = sem
+            return sem
+
+    # ── Metrics ─────────────────────────────────────────────────────────────
+
+    def _record(self, host: str, elapsed: float, error: bool = False, retry: bool = False) -> None:
+        with self._stats_lock:
+            stats = self._stats[host]
+            stats.count += 1
+            stats.errors += int(error)
+            stats.retries += int(retry)
+            stats.latencies.append(elapsed)
+            if len(stats.latencies) > self._LATENCY_SAMPLE:
+                del stats.latencies[: len(stats.latencies) - self._LATENCY_SAMPLE]
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host request metrics: count, errors, retries, avg/p50/p95 ms."""
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._stats_lock:
+            for host, stats in self._stats.items():
+                lat = sorted(stats.latencies)
+                n = len(lat)
+                out[host] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "avg_ms": round(1000 * sum(lat) / n, 1) if n else 0.0,
+                    "p50_ms": round(1000 * lat[n // 2], 1) if n else 0.0,
+                    "p95_ms": round(1000 * lat[min(n - 1, int(n * 0.95))], 1) if n else 0.0,
+                }
+        return out
+
+    def log_metrics(self) -> None:
+        """Log a one-line summary per host."""
+        for host, m in sorted(self.get_metrics().items()):
+            logger.info(
+                f"🌐 HTTP {host}: {m['count']} req, {m['errors']} err, {m['retries']} retries, "
+                f"avg {m['avg_ms']}ms, p95 {m['p95_ms']}ms"
+            )
+
+    def reset_metrics(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+    # ── Requests ────────────────────────────────────────────────────────────
+
+    def request(self, method: str, url: str, *, retries: Optional[int] = None,
+                timeout: Any = None, **kwargs: Any) -> requests.Response:
+        """
+        Send a request with pooling, per-host limits and retries.
+
+        Non-idempotent methods (POST/PATCH) are not retried unless ``retries``
+        is passed explicitly. After the last attempt the final response is
+        returned as-is (callers keep using ``raise_for_status()``), or the
+        last connection/timeout exception is re-raised.
+        """
+        method = method.upper()
+        if retries is None:
+            retries = HTTP_MAX_RETRIES if method in IDEMPOTENT_METHODS else 0
+        if timeout is None:
+            timeout = HTTP_DEFAULT_TIMEOUT
+        host = urlsplit(url).hostname or ""
+        sem = self._semaphore(host)
+
+        hooks = list(self._hooks.get(host, {}).values())
+
+        attempt = 0
+        while True:
+            # Never wait longer than the caller's deadline (if one is in scope)
+            attempt_timeout = clamp_timeout(timeout, f"{method} {host}")
+            for before, _ in hooks:
+                if before:
+                    before(method, url)
+            start = time.monotonic()
+            try:
+                with sem:
+                    response = self.session.request(method, url, timeout=attempt_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = backoff_delay(attempt)
+                give_up = attempt >= retries or delay >= remaining_time()
+                self._record(host, time.monotonic() - start, error=True, retry=not give_up)
+                if give_up:
+                    raise
+                logger.warning(f"🔁 HTTP {method} {host}: {type(e).__name__}, retry {attempt + 1}/{retries} in {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            elapsed = time.monotonic() - start
+            for _, after in hooks:
+                if after:
+                    after(response)
+            retryable = response.status_code in RETRY_STATUSES and attempt < retries
+            if retryable:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    delay = min(retry_after, HTTP_RETRY_AFTER_MAX_SECONDS)
+                else:
+                    delay = backoff_delay(attempt)
+                retryable = delay < remaining_time()
+            self._record(host, elapsed, error=response.status_code >= 400, retry=retryable)
+            if not retryable:
+                return response
+
+            logger.warning(
+                f"🔁 HTTP {method} {host}: {response.status_code}, retry {attempt + 1}/{retries} in {delay:.1f}s"
+                + (" (Retry-After)" if retry_after is not None else "")
+            )
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+
+# ── Process-wide singleton ──────────────────────────────────────────────────
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get or create the shared HttpClient singleton."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return get_http_client().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return get_http_client().get(url, **kwargs)
+
+
+def head(url: str, **kwargs: Any) -> requests.Response:
+    return get_http_client().head(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return get_http_client().post(url, **kwargs)
+
+
+def register_host_hook(host: str, name: str, before: Optional[Callable] = None,
+                       after: Optional[Callable] = None) -> None:
+    get_http_client().register_host_hook(host, name, before=before, after=after)
+
+
+def get_metrics() -> Dict[str, Dict[str, Any]]:
+    return get_http_client().get_metrics()
+
+
+def log_metrics() -> None:
+    get_http_client().log_metrics()
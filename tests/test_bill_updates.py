@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for watermark-driven incremental bill ingestion.
+"""
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers import bill_updates
+from src.fetchers.bill_updates import BillUpdates, commit_bill_updates, fetch_bill_updates, filter_bills_with_text
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _bill(number, update_date, bill_type='HR'):
+    return {'type': bill_type, 'number': str(number), 'congress': 119, 'updateDate': update_date}
+
+
+def _page(bills, has_next=False, count=None):
+    resp = MagicMock()
+    resp.json.return_value = {
+        'bills': bills,
+        'pagination': {'count': count if count is not None else len(bills), **({'next': 'x'} if has_next else {})},
+    }
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test'})
+@patch('src.fetchers.bill_updates.INGEST_PAGE_SIZE', 2)
+class TestFetchBillUpdates(unittest.TestCase):
+
+    @patch('src.fetchers.bill_updates._load_watermark')
+    @patch('src.fetchers.bill_updates.http.get')
+    def test_pages_from_watermark_minus_lookback(self, mock_get, mock_wm):
+        mock_wm.return_value = NOW - timedelta(hours=12)
+        mock_get.side_effect = [
+            _page([_bill(1, '2026-03-10T01:00:00Z'), _bill(2, '2026-03-10T02:00:00Z')], has_next=True, count=3),
+            _page([_bill(3, '2026-03-10T03:00:00Z')], count=3),
+        ]
+
+        updates = fetch_bill_updates(now=NOW)
+
+        params = mock_get.call_args_list[0][1]['params']
+        expected_since = NOW - timedelta(hours=12 + bill_updates.INGEST_LOOKBACK_HOURS)
+        self.assertEqual(params['fromDateTime'], expected_since.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        self.assertEqual(mock_get.call_args_list[1][1]['params']['offset'], 2)
+        self.assertTrue(updates.complete)
+        self.assertFalse(updates.gap)
+        self.assertEqual(updates.bill_ids, ['hr3-119', 'hr2-119', 'hr1-119'])
+        self.assertEqual(updates.high_water, datetime(2026, 3, 10, 3, 0, tzinfo=timezone.utc))
+
+    @patch('src.fetchers.bill_updates.INGEST_MAX_PAGES', 1)
+    @patch('src.fetchers.bill_updates._load_watermark')
+    @patch('src.fetchers.bill_updates.http.get')
+    def test_truncated_read_only_advances_to_last_bill_seen(self, mock_get, mock_wm):
+        mock_wm.return_value = NOW - timedelta(days=5)
+        mock_get.return_value = _page(
+            [_bill(1, '2026-03-05T13:00:00Z'), _bill(2, '2026-03-05T14:00:00Z')], has_next=True, count=40)
+
+        updates = fetch_bill_updates(now=NOW)
+
+        self.assertTrue(updates.gap)
+        self.assertFalse(updates.complete)
+        self.assertEqual(updates.high_water, datetime(2026, 3, 5, 14, 0, tzinfo=timezone.utc))
+
+    @patch('src.fetchers.bill_updates._load_watermark', return_value=None)
+    @patch('src.fetchers.bill_updates.http.get')
+    def test_first_run_uses_initial_lookback(self, mock_get, _wm):
+        mock_get.return_value = _page([])
+
+        updates = fetch_bill_updates(now=NOW)
+
+        self.assertEqual(updates.since, NOW - timedelta(hours=bill_updates.INGEST_INITIAL_LOOKBACK_HOURS))
+        self.assertIsNone(updates.high_water)
+
+    @patch('src.fetchers.bill_updates._load_watermark', return_value=NOW)
+    @patch('src.fetchers.bill_updates.http.get', side_effect=requests.ConnectionError("down"))
+    def test_first_page_failure_returns_none(self, _get, _wm):
+        self.assertIsNone(fetch_bill_updates(now=NOW))
+
+
+class TestCommit(unittest.TestCase):
+
+    @patch('src.database.db.save_ingestion_watermark', return_value=True)
+    def test_commit_saves_high_water(self, mock_save):
+        updates = BillUpdates(name='bill_updates_119', since=NOW, high_water=NOW)
+        self.assertTrue(commit_bill_updates(updates))
+        mock_save.assert_called_once_with('bill_updates_119', NOW)
+
+    @patch('src.database.db.save_ingestion_watermark')
+    def test_nothing_read_leaves_watermark_alone(self, mock_save):
+        self.assertTrue(commit_bill_updates(BillUpdates(name='x', since=NOW)))
+        mock_save.assert_not_called()
+
+    @patch('src.database.db.save_ingestion_watermark', return_value=True)
+    def test_pending_bills_hold_the_watermark(self, mock_save):
+        updates = BillUpdates(name='x', since=NOW, high_water=NOW, bills=[
+            _bill(1, '2026-03-10T08:00:00Z'), _bill(2, '2026-03-10T10:00:00Z'), _bill(3, '2026-03-10T12:00:00Z'),
+        ])
+        commit_bill_updates(updates, pending=['hr2-119', 'hr3-119'])
+        mock_save.assert_called_once_with('x', datetime(2026, 3, 10, 10, 0, tzinfo=timezone.utc))
+
+    @patch('src.fetchers.bill_updates.INGEST_MAX_HOLD_HOURS', 24)
+    @patch('src.database.db.save_ingestion_watermark', return_value=True)
+    def test_hold_is_capped_by_age(self, mock_save):
+        updates = BillUpdates(name='x', since=NOW, high_water=NOW, bills=[
+            _bill(1, '2026-03-08T08:00:00Z'), _bill(2, '2026-03-09T18:00:00Z'), _bill(3, '2026-03-10T12:00:00Z'),
+        ])
+        commit_bill_updates(updates, pending=['hr1-119', 'hr2-119'])
+        mock_save.assert_called_once_with('x', datetime(2026, 3, 9, 18, 0, tzinfo=timezone.utc))
+
+        mock_save.reset_mock()
+        commit_bill_updates(updates, pending=['hr1-119'])
+        mock_save.assert_called_once_with('x', NOW)
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test'})
+class TestFilterBillsWithText(unittest.TestCase):
+
+    @patch('src.fetchers.bill_updates._has_text_versions', side_effect=lambda bid, key: bid != 'hr2-119')
+    def test_checks_are_capped(self, mock_check):
+        kept, unchecked = filter_bills_with_text(['hr1-119', 'hr2-119', 'hr3-119', 'hr4-119'], limit=3)
+        self.assertEqual(kept, ['hr1-119', 'hr3-119'])
+        self.assertEqual(unchecked, ['hr4-119'])
+        self.assertEqual(mock_check.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
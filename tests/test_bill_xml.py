@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the structure-aware bill XML parser.
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers.bill_xml import parse_bill_xml
+
+USLM = """<?xml version="1.0" encoding="UTF-8"?>
+<bill xmlns="http://schemas.gpo.gov/xml/uslm" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <meta><dc:title>METADATA TITLE</dc:title></meta>
+  <main>
+    <longTitle><docTitle>An Act</docTitle><officialTitle>To support school libraries.</officialTitle></longTitle>
+    <section><num>SEC. 1.</num><heading>Short title.</heading>
+      <content>This Act may be cited as the <quotedText>Library Act</quotedText>.</content>
+    </section>
+    <title><num>TITLE I</num><heading>Grants</heading>
+      <section><num>SEC. 101.</num><heading>Grants authorized.</heading>
+        <subsection><num>(a)</num><heading>In general.—</heading><content>The Secretary may award grants.</content></subsection>
+        <subsection><num>(b)</num><chapeau>A grant shall</chapeau>
+          <paragraph><num>(1)</num><content>last 3 years; and</content></paragraph>
+        </subsection>
+      </section>
+      <section><num>SEC. 102.</num><heading>Conforming amendment.</heading>
+        <content>Section 5 is amended by adding at the end:
+          <quotedContent><section><num>SEC. 5A.</num><heading>Libraries.</heading><content>Quoted law.</content></section></quotedContent>
+        </content>
+      </section>
+    </title>
+  </main>
+</bill>
+""".encode()
+
+LEGACY = b"""<?xml version="1.0"?>
+<bill>
+  <metadata><dublinCore><dc:title xmlns:dc="http://purl.org/dc/elements/1.1/">META</dc:title></dublinCore></metadata>
+  <form><official-title>To protect student data.</official-title></form>
+  <legis-body>
+    <section><enum>1.</enum><header>Short title</header><text>This Act may be cited as the Data Act.</text></section>
+    <title><enum>I</enum><header>Privacy</header>
+      <section><enum>101.</enum><header>Definitions</header><text>In this title:</text>
+        <paragraph><enum>(1)</enum><header>Agency</header><text>The term agency means a school.</text></paragraph>
+      </section>
+    </title>
+  </legis-body>
+</bill>
+"""
+
+
+class TestUslm(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = parse_bill_xml(USLM)
+
+    def test_tree_mirrors_units_and_ignores_quoted_sections(self):
+        labels = [(s.kind, s.label) for s in self.doc.walk()]
+        self.assertEqual(labels, [
+            ('section', 'SEC. 1. Short title.'),
+            ('title', 'TITLE I Grants'),
+            ('section', 'SEC. 101. Grants authorized.'),
+            ('section', 'SEC. 102. Conforming amendment.'),
+        ])
+
+    def test_offsets_slice_each_unit(self):
+        title = self.doc.sections[1]
+        body = self.doc.text[title.start:title.end]
+        self.assertTrue(body.startswith('TITLE I Grants\nSEC. 101. Grants authorized.'))
+        self.assertTrue(body.endswith('Quoted law.'))
+        sec101 = title.children[0]
+        self.assertEqual(self.doc.text[sec101.start:sec101.end].splitlines(), [
+            'SEC. 101. Grants authorized.',
+            '(a) In general.— The Secretary may award grants.',
+            '(b) A grant shall',
+            '(1) last 3 years; and',
+        ])
+        sec102 = title.children[1]
+        self.assertEqual(self.doc.text[sec102.start:sec102.end].splitlines(), [
+            'SEC. 102. Conforming amendment.',
+            'Section 5 is amended by adding at the end:',
+            'SEC. 5A. Libraries. Quoted law.',
+        ])
+
+    def test_text_skips_metadata_and_keeps_inline_markup(self):
+        self.assertNotIn('METADATA TITLE', self.doc.text)
+        self.assertIn('This Act may be cited as the Library Act.', self.doc.text)
+        self.assertTrue(self.doc.text.startswith('An Act\nTo support school libraries.'))
+
+
+class TestLegacyDtd(unittest.TestCase):
+
+    def test_enums_get_unit_prefixes(self):
+        doc = parse_bill_xml(LEGACY)
+        self.assertEqual([s.label for s in doc.walk()],
+                         ['SEC. 1. Short title', 'TITLE I Privacy', 'SEC. 101. Definitions'])
+        self.assertIn('\n(1) Agency The term agency means a school.', doc.text)
+        self.assertNotIn('META', doc.text)
+
+    def test_empty_document(self):
+        doc = parse_bill_xml(b'<bill><legis-body/></bill>')
+        self.assertEqual((doc.text, doc.sections), ('', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
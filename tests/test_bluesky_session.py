@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for Bluesky session persistence and reuse.
+"""
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.publishers.bluesky_publisher as bsky
+from src.publishers.bluesky_publisher import BlueskyPublisher
+
+
+def _publisher():
+    pub = BlueskyPublisher()
+    pub._handle = "teencivics.bsky.social"
+    pub._app_password = "app-pass"
+    return pub
+
+
+class TestBlueskySessionReuse(unittest.TestCase):
+
+    def setUp(self):
+        bsky._shared_clients.clear()
+        self.addCleanup(bsky._shared_clients.clear)
+        if importlib.util.find_spec("atproto") is None:
+            self.skipTest("atproto not installed")
+
+    @patch('src.publishers.bluesky_publisher.store_session')
+    @patch('src.publishers.bluesky_publisher.load_stored_session', return_value="stored-session")
+    @patch('atproto.Client')
+    def test_stored_session_skips_password_login(self, mock_client_cls, mock_load, mock_store):
+        client = mock_client_cls.return_value
+
+        result = _publisher()._get_client()
+
+        self.assertIs(result, client)
+        client.login.assert_called_once_with(session_string="stored-session")
+
+    @patch('src.publishers.bluesky_publisher.clear_stored_session')
+    @patch('src.publishers.bluesky_publisher.load_stored_session', return_value="stale")
+    @patch('atproto.Client')
+    def test_invalid_stored_session_falls_back_to_login(self, mock_client_cls, mock_load, mock_clear):
+        stale_client, fresh_client = MagicMock(), MagicMock()
+        stale_client.login.side_effect = Exception("ExpiredToken")
+        mock_client_cls.side_effect = [stale_client, fresh_client]
+
+        result = _publisher()._get_client()
+
+        self.assertIs(result, fresh_client)
+        fresh_client.login.assert_called_once_with("teencivics.bsky.social", "app-pass")
+        mock_clear.assert_called_once_with("teencivics.bsky.social")
+
+    @patch('src.publishers.bluesky_publisher.load_stored_session', return_value=None)
+    @patch('atproto.Client')
+    def test_client_shared_across_instances(self, mock_client_cls, mock_load):
+        first = _publisher()._get_client()
+        second = _publisher()._get_client()
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_client_cls.call_count, 1)
+
+    @patch('src.publishers.bluesky_publisher.store_session')
+    @patch('src.publishers.bluesky_publisher.load_stored_session', return_value=None)
+    @patch('atproto.Client')
+    def test_session_change_is_persisted(self, mock_client_cls, mock_load, mock_store):
+        client = mock_client_cls.return_value
+        _publisher()._get_client()
+
+        callback = client.on_session_change.call_args[0][0]
+        session = MagicMock()
+        session.export.return_value = "new-session"
+        event = MagicMock(value="refresh")
+        callback(event, session)
+
+        mock_store.assert_called_once_with("teencivics.bsky.social", "new-session")
+
+
+class TestSessionFileStore(unittest.TestCase):
+
+    def test_file_roundtrip_encrypted(self):
+        if not bsky.CRYPTOGRAPHY_AVAILABLE:
+            self.skipTest("cryptography not installed")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bsky.session")
+            with patch.object(bsky, 'BLUESKY_SESSION_FILE', path), \
+                 patch.object(bsky, 'BLUESKY_SESSION_KEY', 'secret'):
+                bsky.store_session("h", "session-string")
+                with open(path) as fh:
+                    self.assertNotIn("session-string", fh.read())
+                self.assertEqual(bsky.load_stored_session("h"), "session-string")
+                bsky.clear_stored_session("h")
+                self.assertIsNone(bsky.load_stored_session("h"))
+
+    @patch('src.database.db.get_social_session', return_value="stored-blob")
+    @patch('src.database.db.save_social_session')
+    def test_no_key_skips_persistence(self, mock_save, mock_get):
+        with patch.object(bsky, 'BLUESKY_SESSION_FILE', None), \
+             patch.object(bsky, 'BLUESKY_SESSION_KEY', None), \
+             patch.object(bsky, '_warned_no_session_key', False), \
+             self.assertLogs(bsky.logger, level='WARNING') as logs:
+            bsky.store_session("h", "session-string")
+            self.assertIsNone(bsky.load_stored_session("h"))
+            bsky.store_session("h", "session-string")
+        mock_save.assert_not_called()
+        mock_get.assert_not_called()
+        self.assertEqual(len(logs.output), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
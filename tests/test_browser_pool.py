@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Playwright browser pool and the scrapers built on it.
+"""
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers.browser_pool import BrowserPool, PageResult
+from src.fetchers import feed_parser
+
+
+TRACKER_HTML = """
+<ol class="bill_progress">
+  <li class="first">Introduced<div class="sol-step-info">hidden</div></li>
+  <li class="selected">Passed House</li>
+  <li>Passed Senate</li>
+</ol>
+"""
+
+
+class TestRouteBlocking(unittest.TestCase):
+
+    def _route(self, resource_type, url):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.request.url = url
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+        return route
+
+    def test_blocks_images_fonts_and_analytics(self):
+        pool = BrowserPool(size=1)
+        blocked = [
+            self._route("image", "https://www.congress.gov/img/logo.png"),
+            self._route("font", "https://www.congress.gov/fonts/a.woff2"),
+            self._route("script", "https://www.googletagmanager.com/gtm.js"),
+        ]
+        allowed = self._route("document", "https://www.congress.gov/bill/119th-congress/house-bill/1")
+
+        for route in blocked + [allowed]:
+            asyncio.run(pool._route(route))
+
+        for route in blocked:
+            route.abort.assert_awaited_once()
+        allowed.continue_.assert_awaited_once()
+        self.assertEqual(pool.get_metrics()["blocked_requests"], 3)
+
+    def test_metrics_track_page_latency(self):
+        pool = BrowserPool(size=1)
+        pool._record(0.2, error=False)
+        pool._record(0.4, error=True)
+
+        m = pool.get_metrics()
+        self.assertEqual((m["fetches"], m["errors"]), (2, 1))
+        self.assertEqual(m["page_avg_ms"], 300.0)
+
+    def test_concurrent_first_fetches_launch_once(self):
+        pool = BrowserPool(size=2)
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+
+        async def launch(**kwargs):
+            await asyncio.sleep(0.01)
+            return browser
+
+        playwright = MagicMock()
+        playwright.chromium.launch = AsyncMock(side_effect=launch)
+        starter = MagicMock()
+        starter.return_value.start = AsyncMock(return_value=playwright)
+
+        async def first_fetches():
+            await asyncio.gather(*(pool._ensure_browser() for _ in range(3)))
+
+        with patch('src.fetchers.browser_pool.async_playwright', starter, create=True):
+            asyncio.run(first_fetches())
+
+        starter.assert_called_once()
+        playwright.chromium.launch.assert_awaited_once()
+        self.assertEqual(pool.get_metrics()["launches"], 1)
+
+
+class TestTrackerScraping(unittest.TestCase):
+
+    def test_parse_tracker_html(self):
+        steps = feed_parser._parse_tracker_html(TRACKER_HTML, "https://example.test")
+        self.assertEqual([s["name"] for s in steps], ["Introduced", "Passed House", "Passed Senate"])
+        self.assertTrue(steps[1]["selected"])
+
+    @patch('src.fetchers.feed_parser.PLAYWRIGHT_AVAILABLE', True)
+    @patch('src.fetchers.feed_parser.get_browser_pool')
+    def test_scrape_uses_pool_without_relaunching(self, mock_get_pool):
+        pool = mock_get_pool.return_value
+        pool.fetch.return_value = PageResult("u", 200, TRACKER_HTML, 0.1)
+
+        steps = feed_parser.scrape_bill_tracker("https://example.test/bill", force_scrape=True)
+
+        self.assertEqual(len(steps), 3)
+        pool.fetch.assert_called_once()
+
+    @patch('src.fetchers.feed_parser.scrape_bill_tracker')
+    def test_scrape_multiple_dedupes_and_maps_results(self, mock_scrape):
+        mock_scrape.side_effect = lambda u, force_scrape=False: [{"name": u, "selected": True}]
+        urls = ["https://a.test", "https://b.test", "https://a.test"]
+
+        results = feed_parser.scrape_multiple_bill_trackers(urls, force_scrape=True)
+
+        self.assertEqual(mock_scrape.call_count, 2)
+        self.assertEqual(results["https://b.test"][0]["name"], "https://b.test")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the resumable bulk backfill and the summarization queue worker.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.bulk_backfill import advance_cursor, build_bill_row, initial_cursor, run_bulk_backfill
+from src.processors import summarization_queue
+
+
+def _bill(number, update_date):
+    return {'type': 'HR', 'number': str(number), 'congress': 119, 'updateDate': update_date}
+
+
+def _enriched(bill_id):
+    return {
+        'bill_id': bill_id, 'title': f'Title {bill_id}', 'congress': '119',
+        'source_url': 'https://www.congress.gov/bill/119th-congress/house-bill/1',
+        'tracker': [{'name': 'Introduced', 'selected': True}], 'full_text': 'x' * 200,
+    }
+
+
+class TestCursor(unittest.TestCase):
+
+    def test_newer_timestamp_moves_lower_bound(self):
+        bills = [_bill(1, '2025-01-01T00:00:00Z'), _bill(2, '2025-01-02T00:00:00Z'), _bill(3, '2025-01-02T00:00:00Z')]
+        cursor = advance_cursor(initial_cursor(), bills)
+        self.assertEqual(cursor, {'from': '2025-01-02T00:00:00Z', 'offset': 2})
+
+    def test_page_of_ties_grows_offset(self):
+        start = {'from': '2025-01-02T00:00:00Z', 'offset': 2}
+        bills = [_bill(n, '2025-01-02T00:00:00Z') for n in range(4, 7)]
+        self.assertEqual(advance_cursor(start, bills), {'from': '2025-01-02T00:00:00Z', 'offset': 5})
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test'})
+@patch('src.bulk_backfill.congress_quota.set_default_priority')
+@patch('src.bulk_backfill.enqueue_summarization_jobs', side_effect=lambda ids, archive_only: len(ids))
+@patch('src.bulk_backfill.bulk_insert_bills', side_effect=lambda rows: [r['bill_id'] for r in rows])
+@patch('src.bulk_backfill.save_backfill_checkpoint', return_value=True)
+@patch('src.bulk_backfill.get_existing_bill_ids', return_value={'hr2-119'})
+@patch('src.bulk_backfill.enrich_single_bill', side_effect=lambda bid, deadline: _enriched(bid))
+class TestRunBulkBackfill(unittest.TestCase):
+
+    @patch('src.bulk_backfill.get_backfill_checkpoint', return_value=None)
+    @patch('src.bulk_backfill.fetch_bill_list_page')
+    def test_pages_skip_existing_and_checkpoint(self, mock_page, _ckpt, _enrich, _existing,
+                                                mock_save, mock_insert, mock_enqueue, _prio):
+        mock_page.side_effect = [
+            ([_bill(1, '2025-01-01T00:00:00Z'), _bill(2, '2025-01-01T00:00:00Z')], True),
+            ([_bill(3, '2025-01-03T00:00:00Z')], False),
+        ]
+
+        stats = run_bulk_backfill(workers=2)
+
+        self.assertEqual(stats['listed'], 3)
+        self.assertEqual(stats['skipped_existing'], 1)
+        self.assertEqual(stats['inserted'], 2)
+        self.assertEqual(stats['queued'], 2)
+        inserted_ids = [r['bill_id'] for call in mock_insert.call_args_list for r in call[0][0]]
+        self.assertEqual(inserted_ids, ['hr1-119', 'hr3-119'])
+        self.assertEqual(mock_insert.call_args_list[0][0][0][0]['status'], 'Introduced')
+        # One checkpoint per page; only the last marks the job complete
+        self.assertEqual(mock_save.call_count, 2)
+        self.assertFalse(mock_save.call_args_list[0][1]['completed'])
+        self.assertTrue(mock_save.call_args_list[1][1]['completed'])
+        self.assertEqual(mock_page.call_args_list[1][0][1], {'from': '2025-01-01T00:00:00Z', 'offset': 2})
+
+    @patch('src.bulk_backfill.get_backfill_checkpoint', return_value=None)
+    @patch('src.bulk_backfill.fetch_bill_list_page')
+    def test_failed_enrichment_is_checkpointed_and_retried(self, mock_page, _ckpt, mock_enrich, _existing,
+                                                           mock_save, mock_insert, *_):
+        attempts = {}
+
+        def flaky(bid, deadline):
+            attempts[bid] = attempts.get(bid, 0) + 1
+            return None if bid == 'hr1-119' and attempts[bid] == 1 else _enriched(bid)
+
+        mock_enrich.side_effect = flaky
+        mock_page.side_effect = [
+            ([_bill(1, '2025-01-01T00:00:00Z')], True),
+            ([_bill(3, '2025-01-03T00:00:00Z')], False),
+        ]
+
+        stats = run_bulk_backfill(workers=1)
+
+        self.assertEqual(stats['failed'], 1)
+        first_cursor = mock_save.call_args_list[0][0][1]
+        self.assertEqual(first_cursor['failed'], {'hr1-119': 1})
+        inserted_ids = [r['bill_id'] for call in mock_insert.call_args_list for r in call[0][0]]
+        self.assertEqual(inserted_ids, ['hr3-119', 'hr1-119'])
+        last_cursor = mock_save.call_args_list[-1][0][1]
+        self.assertNotIn('failed', last_cursor)
+        self.assertTrue(mock_save.call_args_list[-1][1]['completed'])
+
+    @patch('src.bulk_backfill.get_backfill_checkpoint', return_value=None)
+    @patch('src.bulk_backfill.fetch_bill_list_page', return_value=([_bill(1, '2025-01-01T00:00:00Z')], False))
+    def test_pending_failures_keep_job_open(self, _page, _ckpt, mock_enrich, _existing, mock_save, *_):
+        mock_enrich.side_effect = lambda bid, deadline: None
+
+        run_bulk_backfill()
+
+        self.assertEqual(mock_save.call_args[0][1]['failed'], {'hr1-119': 1})
+        self.assertFalse(mock_save.call_args[1]['completed'])
+
+    @patch('src.bulk_backfill.get_backfill_checkpoint')
+    @patch('src.bulk_backfill.fetch_bill_list_page', return_value=([], False))
+    def test_resumes_from_checkpoint(self, mock_page, mock_ckpt, *_):
+        saved = {'from': '2025-02-01T00:00:00Z', 'offset': 7}
+        mock_ckpt.return_value = {'cursor': saved, 'processed': 500, 'completed_at': None}
+
+        run_bulk_backfill()
+
+        self.assertEqual(mock_page.call_args[0][1], saved)
+
+
+class TestBulkDateProcessed(unittest.TestCase):
+
+    def test_uses_bill_dates_not_load_time(self):
+        from src.database.db import _bulk_date_processed
+        row = build_bill_row({**_enriched('hr1-119'), 'date_introduced': '2025-01-03',
+                              'latest_action_date': '2025-02-01'})
+        self.assertEqual(_bulk_date_processed(row, 'NOW'), '2025-01-03')
+        self.assertEqual(_bulk_date_processed({**row, 'date_introduced': ''}, 'NOW'), '2025-02-01')
+        self.assertEqual(_bulk_date_processed({}, 'NOW'), 'NOW')
+
+
+class TestSummarizationQueue(unittest.TestCase):
+
+    @patch('src.processors.summarization_queue.complete_summarization_job')
+    @patch('src.processors.summarization_queue.summarize_queued_bill')
+    def test_success_completes_job(self, mock_summarize, mock_complete):
+        self.assertEqual(summarization_queue._run_job({'bill_id': 'hr1-119', 'archive_only': True, 'attempts': 1}), 'succeeded')
+        mock_summarize.assert_called_once_with('hr1-119', True, force_refresh=False)
+        mock_complete.assert_called_once_with('hr1-119')
+
+    @patch('src.processors.summarization_queue.complete_summarization_job')
+    @patch('src.processors.summarization_queue.summarize_queued_bill')
+    def test_retry_skips_llm_cache(self, mock_summarize, _complete):
+        summarization_queue._run_job({'bill_id': 'hr1-119', 'attempts': 2})
+        mock_summarize.assert_called_once_with('hr1-119', False, force_refresh=True)
+
+    @patch('src.processors.summarization_queue.fail_summarization_job')
+    @patch('src.processors.summarization_queue.summarize_queued_bill', side_effect=RuntimeError("llm down"))
+    def test_failure_backs_off_then_dies(self, _summarize, mock_fail):
+        self.assertEqual(summarization_queue._run_job({'bill_id': 'hr1-119', 'attempts': 1}), 'retrying')
+        self.assertIsNotNone(mock_fail.call_args[0][2])
+
+        last = summarization_queue.SUMMARY_QUEUE_MAX_ATTEMPTS
+        self.assertEqual(summarization_queue._run_job({'bill_id': 'hr1-119', 'attempts': last}), 'dead')
+        self.assertIsNone(mock_fail.call_args[0][2])
+
+
+if __name__ == '__main__':
+    unittest.main()
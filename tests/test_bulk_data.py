@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the BILLSTATUS/BILLS bulk XML readers and the bulk XML ingest.
+
+Fixture zips are written to a temp dir, so no dumps need to be downloaded.
+"""
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import bulk_backfill
+from src.database.db import _bulk_date_processed
+from src.fetchers.bulk_data import BillTextIndex, extract_bill_text, iter_bill_records
+
+STATUS_V3 = """<?xml version="1.0" encoding="UTF-8"?>
+<billStatus>
+  <version>3.0.0</version>
+  <bill>
+    <number>42</number>
+    <updateDate>2025-03-01T12:00:00Z</updateDate>
+    <type>HR</type>
+    <introducedDate>2025-01-15</introducedDate>
+    <congress>119</congress>
+    <relatedBills>
+      <item><title>Companion</title><congress>119</congress><number>7</number><type>S</type></item>
+    </relatedBills>
+    <actions>
+      <item><actionDate>2025-01-15</actionDate><text>Introduced in House</text><type>IntroReferral</type></item>
+      <item><actionDate>2025-02-20</actionDate><text>Passed/agreed to in House: On passage Passed by recorded vote.</text><type>Floor</type></item>
+    </actions>
+    <sponsors>
+      <item><fullName>Rep. Doe, Jane [D-CA-12]</fullName><party>D</party><state>CA</state></item>
+    </sponsors>
+    <textVersions>
+      <item><type>Introduced in House</type><date>2025-01-15T05:00:00Z</date>
+        <formats><item><url>https://www.govinfo.gov/content/pkg/BILLS-119hr42ih/xml/BILLS-119hr42ih.xml</url></item></formats></item>
+      <item><type>Engrossed in House</type><date>2025-02-20T05:00:00Z</date>
+        <formats><item><url>https://www.govinfo.gov/content/pkg/BILLS-119hr42eh/xml/BILLS-119hr42eh.xml</url></item></formats></item>
+    </textVersions>
+    <latestAction><actionDate>2025-02-20</actionDate><text>Received in the Senate.</text></latestAction>
+    <title>Student Data Privacy Act</title>
+  </bill>
+</billStatus>
+"""
+
+STATUS_LEGACY = """<?xml version="1.0" encoding="UTF-8"?>
+<billStatus>
+  <bill>
+    <billNumber>9</billNumber>
+    <billType>S</billType>
+    <congress>119</congress>
+    <actions>
+      <item><actionDate>2025-01-03</actionDate><text>Read twice and referred to the Committee.</text></item>
+    </actions>
+    <title>Legacy Shape Act</title>
+  </bill>
+</billStatus>
+"""
+
+TEXT_EH = """<?xml version="1.0" encoding="UTF-8"?>
+<bill xmlns="http://schemas.gpo.gov/xml/uslm">
+  <meta><dc:title xmlns:dc="http://purl.org/dc/elements/1.1/">IGNORED METADATA</dc:title></meta>
+  <main>
+    <longTitle><docTitle>An Act</docTitle></longTitle>
+    <section><num>SEC. 1.</num><heading>Short title</heading>
+      <content>This Act may be cited as the <quotedText>Student Data Privacy Act</quotedText>.</content>
+    </section>
+    <section><num>SEC. 2.</num><heading>Limits on sharing</heading>
+      <content>An educational agency may not sell or share student records with a third party.</content>
+    </section>
+  </main>
+</bill>
+"""
+
+
+def _zip(directory, name, members):
+    path = os.path.join(directory, name)
+    with zipfile.ZipFile(path, 'w') as zf:
+        for member, body in members.items():
+            zf.writestr(member, body)
+    return path
+
+
+class BulkXmlTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.status_zip = _zip(self.tmp.name, 'BILLSTATUS-119.zip', {
+            'BILLSTATUS-119hr42.xml': STATUS_V3,
+            'BILLSTATUS-119s9.xml': STATUS_LEGACY,
+            'BILLSTATUS-119hr99.xml': '<billStatus><bill><type>',
+        })
+        self.text_zip = _zip(self.tmp.name, 'BILLS-119-1-hr.zip', {
+            'BILLS-119hr42ih.xml': TEXT_EH.replace('An Act', 'A Bill'),
+            'BILLS-119hr42eh.xml': TEXT_EH,
+        })
+
+
+class TestBillStatusRecords(BulkXmlTestCase):
+
+    def test_maps_both_schema_generations_and_skips_broken_documents(self):
+        records = {r['bill_id']: r for r in iter_bill_records([self.status_zip])}
+        self.assertEqual(set(records), {'hr42-119', 's9-119'})  # related bill s7 is not a record
+
+        hr = records['hr42-119']
+        self.assertEqual(hr['title'], 'Student Data Privacy Act')
+        self.assertEqual(hr['date_introduced'], '2025-01-15')
+        self.assertEqual(hr['latest_action'], 'Received in the Senate.')
+        self.assertEqual((hr['sponsor_name'], hr['sponsor_party'], hr['sponsor_state']),
+                         ('Rep. Doe, Jane [D-CA-12]', 'D', 'CA'))
+        self.assertTrue(any(step['name'] == 'Passed House' and step['selected'] for step in hr['tracker']))
+        self.assertEqual(hr['text_source'], 'none')
+
+        legacy = records['s9-119']
+        self.assertEqual(legacy['title'], 'Legacy Shape Act')
+        self.assertEqual(legacy['sponsor_name'], '')
+
+    def test_fills_text_from_newest_version(self):
+        records = {r['bill_id']: r for r in iter_bill_records([self.status_zip], [self.text_zip])}
+        hr = records['hr42-119']
+        self.assertEqual(hr['text_source'], 'bulk-xml')
+        self.assertIn('This Act may be cited as the Student Data Privacy Act.', hr['full_text'])
+        self.assertNotIn('IGNORED METADATA', hr['full_text'])
+        self.assertEqual(records['s9-119']['full_text'], '')
+
+
+class TestBillText(BulkXmlTestCase):
+
+    def test_index_is_case_insensitive_and_lazy(self):
+        index = BillTextIndex([self.text_zip])
+        self.addCleanup(index.close)
+        self.assertEqual(len(index), 2)
+        self.assertIn('bills-119HR42EH.xml', index)
+        self.assertEqual(index.text_for('BILLS-119hr1ih.xml'), '')
+
+    def test_extracts_one_line_per_block(self):
+        with zipfile.ZipFile(self.text_zip) as zf, zf.open('BILLS-119hr42eh.xml') as fh:
+            lines = extract_bill_text(fh).splitlines()
+        self.assertEqual(lines[:2], ['An Act', 'SEC. 1. Short title'])
+
+
+class TestRunBulkXmlIngest(BulkXmlTestCase):
+
+    @patch('src.bulk_backfill.enqueue_summarization_jobs', return_value=1)
+    @patch('src.bulk_backfill.bulk_upsert_bills')
+    def test_upserts_in_batches_and_queues_new_bills_with_text(self, upsert, enqueue):
+        upsert.side_effect = [
+            {'inserted': ['hr42-119'], 'updated': []},
+            {'inserted': [], 'updated': ['s9-119']},
+        ]
+        stats = bulk_backfill.run_bulk_xml_ingest([self.status_zip], [self.text_zip], batch_size=1)
+
+        self.assertEqual(upsert.call_count, 2)
+        row = upsert.call_args_list[0].args[0][0]
+        self.assertEqual(row['sponsor_state'], 'CA')
+        self.assertTrue(row['website_slug'])
+        # New rows are dated by the bill, not the load time
+        self.assertEqual(_bulk_date_processed(row, 'NOW'), '2025-01-15')
+        # Only the newly inserted bill is queued; s9 has no text to summarize anyway
+        self.assertEqual(enqueue.call_args_list[0].args[0], ['hr42-119'])
+        self.assertEqual(enqueue.call_args_list[1].args[0], [])
+        self.assertEqual(stats['read'], 2)
+        self.assertEqual((stats['inserted'], stats['updated']), (1, 1))
+
+    @patch('src.bulk_backfill.bulk_upsert_bills')
+    def test_dry_run_writes_nothing(self, upsert):
+        stats = bulk_backfill.run_bulk_xml_ingest([self.status_zip], dry_run=True)
+        upsert.assert_not_called()
+        self.assertEqual(stats['read'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the combined summary + tweet + tags + arguments generation mode.
+"""
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import argument_generator, summarizer
+
+BILL = {
+    "bill_id": "hr1-119",
+    "title": "Student Loan Fairness Act",
+    "full_text": "SEC. 1. Short title.\nThis Act may be cited as the Student Loan Fairness Act. " * 5,
+}
+
+COMBINED = {
+    "overview": "Caps interest on federal student loans.",
+    "detailed": "🔎 Overview\nCaps interest.\n👥 Who does this affect?\nBorrowers.\nTeen impact score: 7/10",
+    "tweet": "Congress proposes capping federal student loan interest rates.",
+    "subject_tags": "education-youth",
+    "argument_support": "it would keep college affordable for students like me who can't afford crushing debt.",
+    "argument_oppose": "it would shift loan costs onto taxpayers without fixing why tuition keeps rising so fast.",
+}
+
+
+def _completion(payload):
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = json.dumps(payload)
+    return resp
+
+
+class _SchemaRejected(Exception):
+    status_code = 400
+
+
+@patch.dict(os.environ, {'VENICE_API_KEY': 'test-key'})
+@patch.object(summarizer, 'SUMMARIZER_STREAMING', False)
+class TestCombinedSummary(unittest.TestCase):
+
+    def _summarize(self, client):
+        with patch.object(summarizer, '_get_venice_client', return_value=client):
+            return summarizer.summarize_bill_enhanced(dict(BILL))
+
+    @patch.object(argument_generator, '_call_venice_argument_generation')
+    def test_one_call_returns_every_field(self, mock_arg_call):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion(COMBINED)
+        summary = self._summarize(client)
+
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+        kwargs = client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs['response_format']['type'], 'json_schema')
+        self.assertIn("argument_support", kwargs['messages'][1]['content'])
+        self.assertEqual(summary['tweet'], COMBINED['tweet'])
+        self.assertEqual(summary['subject_tags'], 'education-youth')
+
+        args = argument_generator.arguments_for_summary(BILL['title'], summary)
+        self.assertEqual(args['support'], COMBINED['argument_support'])
+        self.assertEqual(args['oppose'], COMBINED['argument_oppose'])
+        mock_arg_call.assert_not_called()
+
+    @patch.object(argument_generator, '_call_venice_argument_generation',
+                  return_value="it would protect families in my community from unfair costs.")
+    def test_missing_arguments_fall_back_to_per_side_calls(self, mock_arg_call):
+        summary = dict(COMBINED, argument_oppose="")
+        args = argument_generator.arguments_for_summary(BILL['title'], summary)
+        self.assertEqual(mock_arg_call.call_count, 2)
+        self.assertIn("protect families", args['oppose'])
+
+    def test_schema_rejection_retries_without_schema(self):
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [_SchemaRejected("unsupported response_format"),
+                                                      _completion(COMBINED)]
+        summary = self._summarize(client)
+        first, second = client.chat.completions.create.call_args_list
+        self.assertIn('response_format', first.kwargs)
+        self.assertNotIn('response_format', second.kwargs)
+        self.assertEqual(summary['overview'], COMBINED['overview'])
+
+    def test_combined_mode_off_sends_legacy_prompt(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion(COMBINED)
+        with patch.object(summarizer, 'SUMMARIZER_COMBINED_OUTPUT', False):
+            summary = self._summarize(client)
+        kwargs = client.chat.completions.create.call_args.kwargs
+        self.assertNotIn('response_format', kwargs)
+        self.assertNotIn('argument_support', summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk Congress.gov response cache.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers.congress_cache import ResponseCache, cached_get, normalize_url, ttl_for
+
+BILL_URL = "https://api.congress.gov/v3/bill/119/hr/1?format=json&api_key=SECRET"
+
+
+def _response(status, content=b'{"bill": {"number": "1"}}', headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.content = content
+    resp.encoding = "utf-8"
+    resp.headers = headers or {"Content-Type": "application/json"}
+    return resp
+
+
+class TestKeysAndTtls(unittest.TestCase):
+
+    def test_api_key_stripped_and_params_merged(self):
+        a = normalize_url(BILL_URL)
+        b = normalize_url("https://api.congress.gov/v3/bill/119/hr/1", params={"api_key": "OTHER", "format": "json"})
+        self.assertEqual(a, b)
+        self.assertNotIn("SECRET", a)
+
+    def test_per_endpoint_ttls(self):
+        actions = ttl_for("https://api.congress.gov/v3/bill/119/hr/1/actions?format=json")
+        text = ttl_for("https://api.congress.gov/v3/bill/119/hr/1/text?format=json")
+        pdf = ttl_for("https://www.congress.gov/119/bills/hr1/BILLS-119hr1ih.pdf")
+        self.assertLess(actions, text)
+        self.assertLess(text, pdf)
+
+
+@patch('src.fetchers.congress_cache.CONGRESS_CACHE_ENABLED', True)
+class TestCachedGet(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = ResponseCache(directory=self.tmp, max_bytes=10 * 1024 * 1024)
+        patcher = patch('src.fetchers.congress_cache._cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+
+    @patch('src.fetchers.congress_cache.http.get')
+    def test_second_fetch_served_from_disk(self, mock_get):
+        mock_get.return_value = _response(200)
+
+        first = cached_get(BILL_URL, timeout=30)
+        second = cached_get(BILL_URL, timeout=30)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), {"bill": {"number": "1"}})
+        self.assertIs(first, mock_get.return_value)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    @patch('src.fetchers.congress_cache.http.get')
+    def test_stale_entry_revalidated_with_etag(self, mock_get):
+        mock_get.side_effect = [
+            _response(200, headers={"Content-Type": "application/json", "ETag": '"abc"'}),
+            _response(304, content=b""),
+        ]
+        cached_get(BILL_URL, timeout=30)
+
+        resp = cached_get(BILL_URL, ttl=0, timeout=30)
+
+        sent_headers = mock_get.call_args_list[1][1]["headers"]
+        self.assertEqual(sent_headers["If-None-Match"], '"abc"')
+        self.assertEqual(resp.json(), {"bill": {"number": "1"}})
+        self.assertEqual(self.cache.get_stats()["revalidated"], 1)
+
+    @patch('src.fetchers.congress_cache.http.get')
+    def test_errors_not_cached(self, mock_get):
+        mock_get.return_value = _response(500)
+
+        cached_get(BILL_URL, timeout=30)
+        cached_get(BILL_URL, timeout=30)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.cache.get_stats()["stores"], 0)
+
+    def test_lru_eviction_respects_size_cap(self):
+        cache = ResponseCache(directory=self.tmp, max_bytes=250)
+        for i in range(3):
+            cache.store(f"{i:064x}", {"fetched_at": time.time()}, b"x" * 100)
+            os.utime(cache._paths(f"{i:064x}")[1], (i, i))
+
+        cache.store(f"{3:064x}", {"fetched_at": time.time()}, b"x" * 100)
+
+        self.assertIsNone(cache.load(f"{0:064x}"))
+        self.assertIsNotNone(cache.load(f"{3:064x}"))
+        self.assertGreater(cache.get_stats()["evictions"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Congress.gov API quota accountant.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers import congress_quota
+from src.fetchers.congress_quota import QuotaAccountant, QuotaExhausted
+
+
+PATCH_CONSUME = 'src.database.db.consume_api_quota'
+
+
+class TestQuotaAccountant(unittest.TestCase):
+
+    def setUp(self):
+        self.acct = QuotaAccountant(hourly_limit=3600, lease_size=5)
+
+    @patch(PATCH_CONSUME, return_value=(True, 100.0))
+    def test_lease_serves_several_calls_per_db_round_trip(self, mock_consume):
+        for _ in range(5):
+            self.acct.acquire("daily")
+
+        self.assertEqual(mock_consume.call_count, 1)
+        self.assertEqual(self.acct.stats["acquired"], 5)
+
+    @patch(PATCH_CONSUME, return_value=(True, 100.0))
+    def test_priority_reserves_passed_to_db(self, mock_consume):
+        self.acct.acquire("web")
+        self.acct.acquire("backfill")
+
+        web_reserve = mock_consume.call_args_list[0][0][2]
+        backfill_reserve = mock_consume.call_args_list[1][0][2]
+        self.assertEqual(web_reserve, 0.0)
+        self.assertAlmostEqual(backfill_reserve, 3600 * congress_quota.QUOTA_RESERVE_BACKFILL)
+
+    @patch('src.fetchers.congress_quota.time.sleep')
+    @patch(PATCH_CONSUME)
+    def test_backfill_pauses_until_refilled(self, mock_consume, mock_sleep):
+        # Lease and single-token attempts both refused once, then granted
+        mock_consume.side_effect = [(False, 0.0), (False, 0.0), (True, 2000.0)]
+
+        self.acct.acquire("backfill")
+
+        mock_sleep.assert_called_once()
+        self.assertEqual(self.acct.stats["waits"], 1)
+
+    @patch(PATCH_CONSUME, return_value=(False, 0.0))
+    def test_web_fails_fast_when_empty(self, mock_consume):
+        with self.assertRaises(QuotaExhausted):
+            self.acct.acquire("web")
+
+    @patch(PATCH_CONSUME, side_effect=Exception("db down"))
+    def test_fails_open_without_db(self, mock_consume):
+        self.acct.acquire("daily")  # must not raise
+
+    @patch('src.database.db.drain_api_quota')
+    def test_429_drains_bucket_and_leases(self, mock_drain):
+        self.acct._leased["daily"] = 3
+        resp = MagicMock(status_code=429)
+
+        self.acct.on_response(resp)
+
+        mock_drain.assert_called_once_with(congress_quota.QUOTA_NAME)
+        self.assertEqual(self.acct._leased["daily"], 0)
+
+
+class TestPriorityContext(unittest.TestCase):
+
+    def test_thread_local_override(self):
+        congress_quota.set_default_priority("daily")
+        with congress_quota.priority("web"):
+            self.assertEqual(congress_quota.current_priority(), "web")
+        self.assertEqual(congress_quota.current_priority(), "daily")
+
+    def test_unknown_priority_rejected(self):
+        with self.assertRaises(ValueError):
+            congress_quota.set_default_priority("urgent")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -93,7 +93,7 @@ class TestValidateContactUrl(unittest.TestCase):
         """validate_contact_url(None) should return False."""
         self.assertFalse(validate_contact_url(None))
 
-    @patch('src.fetchers.contact_form_sync.requests.head')
+    @patch('src.fetchers.contact_form_sync.http.head')
     def test_validate_contact_url_rejects_homepage(self, mock_head):
         """A URL that resolves to the homepage root should be rejected."""
         mock_response = MagicMock()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for deadline propagation (src/utils/deadline.py) and its users.
+"""
+import os
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.deadline import (
+    Deadline, DeadlineExceeded, check_deadline, clamp_timeout, current_deadline, deadline_scope,
+)
+from src.utils.http import HttpClient
+
+
+class TestDeadline(unittest.TestCase):
+
+    def test_clamp_shrinks_timeouts_to_remaining(self):
+        d = Deadline(5)
+        self.assertLessEqual(d.clamp(30), 5)
+        self.assertEqual(d.clamp(1), 1)
+        connect, read = d.clamp((3, 60))
+        self.assertEqual(connect, 3)
+        self.assertLessEqual(read, 5)
+
+    def test_expired_deadline_raises(self):
+        d = Deadline(0)
+        with self.assertRaises(DeadlineExceeded):
+            d.clamp(30)
+        self.assertTrue(issubclass(DeadlineExceeded, requests.Timeout))
+
+    def test_scope_is_thread_local_and_restored(self):
+        self.assertIsNone(current_deadline())
+        with deadline_scope(Deadline(0)):
+            with self.assertRaises(DeadlineExceeded):
+                check_deadline("step")
+        self.assertIsNone(current_deadline())
+        self.assertEqual(clamp_timeout(30), 30)
+
+
+class TestHttpHonoursDeadline(unittest.TestCase):
+
+    def setUp(self):
+        self.client = HttpClient()
+        self.client.session = MagicMock()
+
+    def test_request_timeout_clamped(self):
+        self.client.session.request.return_value = MagicMock(status_code=200, headers={})
+
+        with deadline_scope(Deadline(2)):
+            self.client.get("https://example.com/", timeout=30)
+
+        self.assertLessEqual(self.client.session.request.call_args[1]["timeout"], 2)
+
+    @patch('src.utils.http.time.sleep')
+    def test_no_retry_sleep_past_deadline(self, mock_sleep):
+        self.client.session.request.return_value = MagicMock(status_code=503, headers={"Retry-After": "30"})
+
+        with deadline_scope(Deadline(2)):
+            resp = self.client.get("https://example.com/", retries=3)
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(self.client.session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_expired_deadline_skips_request(self):
+        with deadline_scope(Deadline(0)):
+            with self.assertRaises(DeadlineExceeded):
+                self.client.get("https://example.com/")
+        self.client.session.request.assert_not_called()
+
+
+class TestEnrichWithTimeout(unittest.TestCase):
+
+    @patch('src.orchestrator.enrich_single_bill')
+    def test_returns_at_timeout_without_waiting_for_worker(self, mock_enrich):
+        from src.orchestrator import enrich_with_timeout
+
+        def hang(bill_id, deadline):
+            self.assertIsInstance(deadline, Deadline)
+            time.sleep(1.0)
+            return {"bill_id": bill_id}
+        mock_enrich.side_effect = hang
+
+        start = time.monotonic()
+        result = enrich_with_timeout("hr1-119", timeout=0.2)
+
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - start, 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent sub-requests inside single-bill enrichment.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers.feed_parser import enrich_single_bill
+from src.utils.deadline import Deadline, current_deadline
+
+BILL = {
+    'title': 'Test Act',
+    'introducedDate': '2025-01-03',
+    'latestAction': {'text': 'Referred to committee.', 'actionDate': '2025-01-03'},
+    'sponsors': [{'fullName': 'Rep. Doe', 'party': 'D', 'state': 'CA'}],
+}
+TRACKER = [{'name': 'Introduced', 'selected': True}]
+
+
+def _slow(seconds, value, seen=None):
+    def fn(*args, **kwargs):
+        if seen is not None:
+            seen.append(current_deadline())
+        time.sleep(seconds)
+        return value
+    return fn
+
+
+def _detail_response(*args, **kwargs):
+    time.sleep(0.3)
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {'bill': BILL}
+    return resp
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test'})
+class TestConcurrentEnrichment(unittest.TestCase):
+
+    @patch('src.fetchers.congress_fetcher.resolve_bill_tracker', return_value=TRACKER)
+    @patch('src.fetchers.congress_fetcher.fetch_bill_text_from_api')
+    @patch('src.fetchers.congress_fetcher.fetch_bill_actions_from_api')
+    @patch('src.fetchers.feed_parser.cached_get', side_effect=_detail_response)
+    def test_latency_bounded_by_slowest_branch(self, _get, mock_actions, mock_text, _resolve):
+        seen = []
+        mock_actions.side_effect = _slow(0.3, [{'text': 'Introduced in House'}], seen)
+        mock_text.side_effect = _slow(0.3, ('x' * 500, 'htm'), seen)
+
+        deadline = Deadline(60)
+        start = time.monotonic()
+        with self.assertLogs('src.fetchers.feed_parser', level='INFO') as logs:
+            enriched = enrich_single_bill('hr1-119', deadline)
+        elapsed = time.monotonic() - start
+
+        self.assertIsNotNone(enriched)
+        self.assertLess(elapsed, 0.8)  # three 0.3s branches, not 0.9s in sequence
+        self.assertEqual(enriched['tracker'], TRACKER)
+        self.assertEqual(enriched['text_source'], 'api-htm')
+        self.assertEqual(enriched['sponsor_name'], 'Rep. Doe')
+        # Timings are logged but kept out of the bill dict (it goes into the LLM prompt)
+        self.assertNotIn('enrichment_timings', enriched)
+        timing_line = next(line for line in logs.output if 'Enrichment timings' in line)
+        for step in ('details', 'actions', 'text', 'tracker', 'total'):
+            self.assertIn(f"{step}=", timing_line)
+        # Worker threads ran under the caller's deadline
+        self.assertEqual(seen, [deadline, deadline])
+
+    @patch('src.fetchers.congress_fetcher.fetch_bill_text_from_api')
+    @patch('src.fetchers.congress_fetcher.fetch_bill_actions_from_api', return_value=[])
+    @patch('src.fetchers.feed_parser.cached_get')
+    def test_missing_details_returns_none_without_waiting_for_text(self, mock_get, _actions, mock_text):
+        mock_get.return_value = MagicMock(status_code=404)
+        release = threading.Event()
+        mock_text.side_effect = lambda *a, **k: (release.wait(5), ('', None))[1]
+
+        start = time.monotonic()
+        self.assertIsNone(enrich_single_bill('hr1-119'))
+        self.assertLess(time.monotonic() - start, 2)
+        release.set()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,7 +20,7 @@ class TestFeedParser:
     
     def test_parse_empty_feed(self):
         """Test handling of empty feed"""
-        with patch('src.fetchers.feed_parser.requests.get') as mock_get:
+        with patch('src.fetchers.feed_parser.http.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b'<html><body><p>No bills today</p></body></html>'
@@ -47,7 +47,7 @@ class TestFeedParser:
         </html>
         """
         
-        with patch('src.fetchers.feed_parser.requests.get') as mock_get:
+        with patch('src.fetchers.feed_parser.http.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = sample_html.encode('utf-8')
@@ -58,7 +58,7 @@ class TestFeedParser:
     
     def test_parse_feed_network_error(self):
         """Test handling of network errors"""
-        with patch('src.fetchers.feed_parser.requests.get') as mock_get:
+        with patch('src.fetchers.feed_parser.http.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             with pytest.raises(Exception):
@@ -67,7 +67,7 @@ class TestFeedParser:
     def test_parse_feed_timeout(self):
         """Test handling of timeout errors"""
         import requests
-        with patch('src.fetchers.feed_parser.requests.get') as mock_get:
+        with patch('src.fetchers.feed_parser.http.get') as mock_get:
             mock_get.side_effect = requests.Timeout("Request timeout")
             
             with pytest.raises(requests.Timeout):
@@ -93,7 +93,7 @@ class TestFeedParser:
         </html>
         """
         
-        with patch('src.fetchers.feed_parser.requests.get') as mock_get:
+        with patch('src.fetchers.feed_parser.http.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = sample_html.encode('utf-8')
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTTP client (src/utils/http.py).
+"""
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils import http
+from src.utils.http import HttpClient, parse_retry_after
+
+
+def _response(status, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    return resp
+
+
+@patch('src.utils.http.time.sleep')
+class TestHttpClientRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.client = HttpClient()
+        self.session = MagicMock()
+        self.client.session = self.session
+
+    def test_retries_5xx_then_succeeds(self, mock_sleep):
+        self.session.request.side_effect = [_response(503), _response(200)]
+
+        resp = self.client.get("https://api.congress.gov/v3/bill")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.session.request.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    def test_honours_retry_after(self, mock_sleep):
+        self.session.request.side_effect = [_response(429, {"Retry-After": "7"}), _response(200)]
+
+        self.client.get("https://api.congress.gov/v3/bill")
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_is_capped(self, mock_sleep):
+        self.session.request.side_effect = [_response(429, {"Retry-After": "100000"}), _response(200)]
+
+        self.client.get("https://api.congress.gov/v3/bill")
+
+        mock_sleep.assert_called_once_with(http.HTTP_RETRY_AFTER_MAX_SECONDS)
+
+    def test_returns_last_response_when_retries_exhausted(self, mock_sleep):
+        self.session.request.return_value = _response(502)
+
+        resp = self.client.get("https://example.com/", retries=2)
+
+        self.assertEqual(resp.status_code, 502)
+        self.assertEqual(self.session.request.call_count, 3)
+
+    def test_connection_error_reraised_after_retries(self, mock_sleep):
+        self.session.request.side_effect = requests.ConnectionError("down")
+
+        with self.assertRaises(requests.ConnectionError):
+            self.client.get("https://example.com/", retries=1)
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_post_not_retried_by_default(self, mock_sleep):
+        self.session.request.return_value = _response(503)
+
+        resp = self.client.post("https://graph.facebook.com/x")
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(self.session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_client_errors_not_retried(self, mock_sleep):
+        self.session.request.return_value = _response(404)
+
+        self.client.get("https://example.com/missing")
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_metrics_recorded_per_host(self, mock_sleep):
+        self.session.request.side_effect = [_response(503), _response(200), _response(200)]
+
+        self.client.get("https://api.congress.gov/v3/a")
+        self.client.get("https://www.congress.gov/b")
+
+        metrics = self.client.get_metrics()
+        self.assertEqual(metrics["api.congress.gov"]["count"], 2)
+        self.assertEqual(metrics["api.congress.gov"]["retries"], 1)
+        self.assertEqual(metrics["api.congress.gov"]["errors"], 1)
+        self.assertEqual(metrics["www.congress.gov"]["count"], 1)
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("12"), 12.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_per_host_semaphore_limits(self):
+        client = HttpClient()
+        sem = client._semaphore("www.congress.gov")
+        self.assertIs(sem, client._semaphore("www.congress.gov"))
+        self.assertEqual(sem._initial_value, http.HOST_LIMITS["www.congress.gov"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental validation of streamed JSON summaries.
+"""
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import summarizer
+from src.processors.json_stream import JsonExpectation, JsonStreamValidator, StreamValidationError
+
+EXPECT = JsonExpectation(required=("overview", "detailed"))
+
+
+def _feed(text, expect=EXPECT, size=7):
+    validator = JsonStreamValidator(expect)
+    for i in range(0, len(text), size):
+        validator.feed(text[i:i + size])
+        if validator.done:
+            break
+    return validator
+
+
+class TestJsonStreamValidator(unittest.TestCase):
+
+    def test_complete_object_with_fence_and_trailing_text(self):
+        text = '```json\n{"overview": "a \\"quoted\\" b", "detailed": "x", "n": [1, true, {"k": null}]}\n```'
+        validator = _feed(text)
+        self.assertTrue(validator.done)
+        self.assertEqual(json.loads(validator.finish())['overview'], 'a "quoted" b')
+
+    def test_short_preamble_before_object_is_skipped(self):
+        validator = _feed('Here is the JSON:\n{"overview": "a", "detailed": "x"}')
+        self.assertTrue(validator.done)
+        self.assertEqual(json.loads(validator.finish())['overview'], 'a')
+
+    def test_long_prose_without_object_fails(self):
+        validator = JsonStreamValidator(EXPECT)
+        with self.assertRaises(StreamValidationError):
+            validator.feed("I cannot summarize this bill. " * 10)
+        self.assertEqual(validator.length, 0)
+
+    def test_structural_error_fails_at_the_error(self):
+        with self.assertRaises(StreamValidationError) as ctx:
+            _feed('{"overview" "a", "detailed": "' + 'x' * 5000 + '"}')
+        self.assertIn('after 13 chars', str(ctx.exception))
+
+    def test_failed_value_check_stops_before_later_keys(self):
+        expect = JsonExpectation(required=("overview", "detailed"), checks={"detailed": lambda v: "Overview" in v})
+        validator = JsonStreamValidator(expect)
+        validator.feed('{"overview": "a", "detailed": "no head')
+        with self.assertRaises(StreamValidationError):
+            validator.feed('ers", "tweet": "t"}')
+        self.assertNotIn('tweet', validator.keys)
+
+    def test_missing_required_key(self):
+        with self.assertRaises(StreamValidationError):
+            _feed('{"overview": "a"}')
+
+    def test_empty_object_is_accepted(self):
+        self.assertEqual(_feed('{}').finish(), '{}')
+
+    def test_truncated_tail_is_closed_locally(self):
+        for text in ('{"overview": "a", "detailed": "cut mid sent',
+                     '{"overview": "a", "detailed": "b", "tags": ["x", "y',
+                     '{"overview": "a", "detailed": "b\\',
+                     '{"overview": "a", "detailed": "b", "tweet":',
+                     '{"overview": "a", "detailed": "b",'):
+            validator = _feed(text)
+            repaired = json.loads(validator.finish(), strict=False)
+            self.assertTrue(validator.repaired)
+            self.assertEqual(repaired['overview'], 'a')
+
+    def test_truncated_scalar_is_dropped(self):
+        for text, key in (('{"overview": "a", "detailed": "b", "n": tru', 'n'),
+                          ('{"overview": "a", "detailed": "b", "xs": [1, 2.', 'xs')):
+            repaired = json.loads(_feed(text).finish())
+            self.assertIn(repaired[key], ("", [1]))
+
+    def test_truncated_value_must_pass_its_check(self):
+        expect = JsonExpectation(required=("overview", "detailed"), checks={"detailed": lambda v: "Overview" in v})
+        with self.assertRaises(StreamValidationError):
+            _feed('{"overview": "a", "detailed": "no headers, cut off by max_tok', expect).finish()
+        repaired = json.loads(_feed('{"overview": "a", "detailed": "🔎 Overview\\nx', expect).finish())
+        self.assertIn("Overview", repaired["detailed"])
+
+    def test_truncation_before_required_keys_fails(self):
+        with self.assertRaises(StreamValidationError):
+            _feed('{"overview": "a", "deta').finish()
+
+
+def _chunk(text):
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = text
+    return chunk
+
+
+def _stream(text, size=16):
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([_chunk(text[i:i + size]) for i in range(0, len(text), size)])
+    return stream
+
+
+GOOD = json.dumps({"overview": "ok", "detailed": "🔎 Overview\nx\n👥 Who does this affect?\ny"})
+
+
+@patch.object(summarizer, 'SUMMARIZER_STREAMING', True)
+@patch.object(summarizer, 'SUMMARIZER_HEDGE_ENABLED', False)
+class TestStreamedCalls(unittest.TestCase):
+
+    def test_malformed_stream_is_retried_early(self):
+        bad = _stream('Sorry, I cannot produce JSON for this bill because ' + 'x' * 5000)
+        good = _stream(GOOD)
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [bad, good]
+        raw = summarizer._model_call_with_fallback(client, 'sys', 'user', expect=summarizer._SUMMARY_EXPECT)
+        self.assertEqual(json.loads(raw)['overview'], 'ok')
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+        self.assertTrue(client.chat.completions.create.call_args.kwargs['stream'])
+        bad.close.assert_called_once()
+
+    def test_summary_without_section_headers_is_rejected(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _stream(json.dumps({"overview": "a", "detailed": "plain text"}))
+        with self.assertRaises(StreamValidationError):
+            summarizer._stream_venice_once(client, 'm', 'sys', 'user', summarizer._SUMMARY_EXPECT)
+
+    @patch.object(summarizer.llm_cache, 'store')
+    def test_repaired_output_is_returned_but_not_cached(self, mock_store):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _stream(GOOD[:-2])
+        raw = summarizer._model_call_with_fallback(client, 'sys', 'user', expect=summarizer._SUMMARY_EXPECT)
+        self.assertEqual(json.loads(raw)['overview'], 'ok')
+        mock_store.assert_not_called()
+
+    def test_calls_without_expectation_are_not_streamed(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value.choices = [MagicMock()]
+        client.chat.completions.create.return_value.choices[0].message.content = 'plain'
+        self.assertEqual(summarizer._model_call_with_fallback(client, 'sys', 'user'), 'plain')
+        self.assertNotIn('stream', client.chat.completions.create.call_args.kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
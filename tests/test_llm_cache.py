@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent LLM response cache and its summarizer integration.
+"""
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import llm_cache, summarizer
+
+
+def _completion(text):
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = text
+    return resp
+
+
+@patch.object(llm_cache, 'LLM_CACHE_ENABLED', True)
+@patch.object(llm_cache, '_purged', True)
+class TestLlmCache(unittest.TestCase):
+
+    def setUp(self):
+        for key in llm_cache._stats:
+            llm_cache._stats[key] = 0
+
+    def test_key_is_stable_and_covers_every_input(self):
+        key = llm_cache.cache_key('m', 'sys', 'user', 0.2)
+        self.assertEqual(key, llm_cache.cache_key('m', 'sys', 'user', 0.2))
+        self.assertEqual(len(key), 64)
+        others = {llm_cache.cache_key('m2', 'sys', 'user', 0.2), llm_cache.cache_key('m', 'sys2', 'user', 0.2),
+                  llm_cache.cache_key('m', 'sys', 'user2', 0.2), llm_cache.cache_key('m', 'sys', 'user', 0.7)}
+        self.assertNotIn(key, others)
+        self.assertEqual(len(others), 4)
+
+    @patch('src.database.db.get_llm_response', return_value='{"overview": "cached"}')
+    def test_hit_skips_the_model(self, mock_get):
+        client = MagicMock()
+        self.assertEqual(summarizer._model_call_with_fallback(client, 'sys', 'user'), '{"overview": "cached"}')
+        client.chat.completions.create.assert_not_called()
+        self.assertEqual(llm_cache.get_cache_stats()['hits'], 1)
+
+    @patch('src.database.db.save_llm_response', return_value=True)
+    @patch('src.database.db.get_llm_response', return_value=None)
+    def test_miss_calls_the_model_and_stores(self, mock_get, mock_save):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion('fresh')
+        self.assertEqual(summarizer._model_call_with_fallback(client, 'sys', 'user'), 'fresh')
+        key, model, response = mock_save.call_args[0]
+        self.assertEqual(key, llm_cache.cache_key(model, 'sys', 'user', summarizer.SUMMARIZER_TEMPERATURE))
+        self.assertEqual(response, 'fresh')
+        stats = llm_cache.get_cache_stats()
+        self.assertEqual((stats['misses'], stats['stores']), (1, 1))
+
+    @patch('src.database.db.save_llm_response', return_value=True)
+    @patch('src.database.db.get_llm_response', return_value='stale')
+    def test_bypass_skips_lookup_but_replaces_entry(self, mock_get, mock_save):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion('fresh')
+        with llm_cache.bypass():
+            self.assertEqual(summarizer._model_call_with_fallback(client, 'sys', 'user'), 'fresh')
+        mock_get.assert_not_called()
+        mock_save.assert_called_once()
+        self.assertFalse(llm_cache.is_bypassed())
+        self.assertEqual(llm_cache.get_cache_stats()['bypassed'], 1)
+
+    def test_bind_carries_bypass_into_worker_threads(self):
+        with llm_cache.bypass():
+            task = llm_cache.bind(llm_cache.is_bypassed)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            self.assertTrue(pool.submit(task).result())
+            self.assertFalse(pool.submit(llm_cache.is_bypassed).result())
+
+    @patch('src.database.db.get_llm_response', side_effect=RuntimeError("db down"))
+    def test_db_error_fails_open(self, mock_get):
+        self.assertIsNone(llm_cache.lookup('m', 'sys', 'user', 0.2))
+        self.assertEqual(llm_cache.get_cache_stats()['errors'], 1)
+
+    @patch('src.database.db.save_llm_response')
+    @patch('src.database.db.get_llm_response')
+    def test_disabled_cache_never_touches_db(self, mock_get, mock_save):
+        with patch.object(llm_cache, 'LLM_CACHE_ENABLED', False):
+            self.assertIsNone(llm_cache.lookup('m', 'sys', 'user', 0.2))
+            llm_cache.store('m', 'sys', 'user', 0.2, 'text')
+        mock_get.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch('src.database.db.purge_llm_responses', return_value=3)
+    @patch('src.database.db.save_llm_response', return_value=True)
+    def test_first_store_purges_expired_entries_once(self, mock_save, mock_purge):
+        with patch.object(llm_cache, '_purged', False):
+            llm_cache.store('m', 'sys', 'user', 0.2, 'a')
+            llm_cache.store('m', 'sys', 'user2', 0.2, 'b')
+        mock_purge.assert_called_once_with(llm_cache.LLM_CACHE_MAX_AGE_DAYS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-model LLM circuit breaker.
+"""
+import json
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import argument_generator, llm_circuit, summarizer
+from src.processors.llm_circuit import LlmCircuitOpen
+
+PRIMARY = summarizer.PREFERRED_MODEL
+SECONDARY = summarizer.FALLBACK_MODEL
+
+
+class _ServerError(Exception):
+    status_code = 503
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+def _trip(model):
+    for _ in range(llm_circuit.LLM_CB_CONSECUTIVE_FAILURES):
+        llm_circuit.record(model, 1.0, TimeoutError("read timed out"))
+
+
+class TestCircuitStates(unittest.TestCase):
+
+    def setUp(self):
+        llm_circuit.reset_circuits()
+
+    def test_consecutive_failures_open_the_circuit(self):
+        _trip('m')
+        with self.assertRaises(LlmCircuitOpen):
+            llm_circuit.check('m')
+        m = llm_circuit.get_circuit_metrics()['m']
+        self.assertEqual((m['state'], m['times_opened'], m['rejected']), ('open', 1, 1))
+
+    def test_error_rate_over_window_opens_the_circuit(self):
+        for i in range(llm_circuit.LLM_CB_MIN_CALLS):
+            llm_circuit.record('m', 1.0, _ServerError() if i % 2 else None)
+        self.assertFalse(llm_circuit.available('m'))
+
+    def test_slow_calls_open_the_circuit(self):
+        with patch.object(llm_circuit, 'LLM_CB_SLOW_SECONDS', 10):
+            for _ in range(llm_circuit.LLM_CB_MIN_CALLS):
+                llm_circuit.record('m', 30.0)
+        self.assertIn('slower than', llm_circuit.get_circuit_metrics()['m']['reason'])
+
+    def test_client_errors_and_bad_output_do_not_count(self):
+        for _ in range(10):
+            llm_circuit.record('m', 1.0, _BadRequest())
+            llm_circuit.record('m', 1.0, ValueError("malformed JSON"))
+        llm_circuit.check('m')  # must not raise
+
+    @patch.object(llm_circuit, 'LLM_CB_RECOVERY_SECONDS', 0)
+    def test_half_open_probe_closes_or_reopens(self):
+        _trip('m')
+        llm_circuit.check('m')  # the probe
+        llm_circuit.record('m', 1.0, TimeoutError())
+        self.assertEqual(llm_circuit.get_circuit_metrics()['m']['times_opened'], 2)
+
+        llm_circuit.check('m')
+        llm_circuit.record('m', 1.0)
+        self.assertEqual(llm_circuit.get_circuit_metrics()['m']['state'], 'closed')
+
+    def test_only_one_probe_at_a_time(self):
+        _trip('m')
+        with patch.object(llm_circuit, 'LLM_CB_RECOVERY_SECONDS', 0):
+            llm_circuit.check('m')
+        with patch.object(llm_circuit, 'LLM_CB_RECOVERY_SECONDS', 60):
+            with self.assertRaises(LlmCircuitOpen):
+                llm_circuit.check('m')
+
+
+def _completion(text):
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = text
+    return resp
+
+
+@patch.object(summarizer, 'SUMMARIZER_STREAMING', False)
+class TestFailFast(unittest.TestCase):
+
+    def setUp(self):
+        llm_circuit.reset_circuits()
+
+    def test_open_primary_goes_straight_to_fallback(self):
+        _trip(PRIMARY)
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion('{"overview": "ok"}')
+        raw = summarizer._model_call_with_fallback(client, 'sys', 'user')
+        self.assertEqual(json.loads(raw)['overview'], 'ok')
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+        self.assertEqual(client.chat.completions.create.call_args.kwargs['model'], SECONDARY)
+
+    def test_all_circuits_open_raises_without_calling(self):
+        _trip(PRIMARY)
+        _trip(SECONDARY)
+        client = MagicMock()
+        with self.assertRaises(LlmCircuitOpen):
+            summarizer._model_call_with_fallback(client, 'sys', 'user')
+        client.chat.completions.create.assert_not_called()
+
+    def test_metadata_path_falls_back_to_deterministic_synthesis(self):
+        _trip(PRIMARY)
+        _trip(SECONDARY)
+        bill = {"title": "A resolution designating Civics Week", "bill_type": "sres",
+                "bill_number": "12", "congress": "119"}
+        result = summarizer._generate_from_metadata_model(MagicMock(), bill)
+        self.assertIn("Civics Week", result['overview'])
+
+    @patch.object(argument_generator, 'get_client')
+    def test_arguments_use_templates_while_models_are_down(self, mock_get_client):
+        _trip(argument_generator.ARGUMENT_MODEL)
+        _trip(argument_generator.ARGUMENT_FALLBACK)
+        args = argument_generator.generate_bill_arguments("Clean Water Act", "Protects rivers.")
+        self.assertTrue(args['support'] and args['oppose'])
+        mock_get_client.return_value.chat.completions.create.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
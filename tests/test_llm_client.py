@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Venice AI client and prompt-caching markers.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import llm_client, summarizer
+
+
+class TestSharedClient(unittest.TestCase):
+
+    def setUp(self):
+        llm_client.close_client()
+
+    def tearDown(self):
+        llm_client.close_client()
+
+    @patch.dict(os.environ, {'VENICE_API_KEY': 'key-1'})
+    def test_client_is_reused(self):
+        first = llm_client.get_client()
+        self.assertIs(llm_client.get_client(), first)
+        self.assertIs(summarizer._get_venice_client(), first)
+
+    def test_client_rebuilt_when_key_changes(self):
+        with patch.dict(os.environ, {'VENICE_API_KEY': 'key-1'}):
+            first = llm_client.get_client()
+        with patch.dict(os.environ, {'VENICE_API_KEY': 'key-2'}):
+            second = llm_client.get_client()
+        self.assertIsNot(first, second)
+        self.assertEqual(second.api_key, 'key-2')
+
+    def test_missing_key_raises(self):
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(ValueError):
+                llm_client.get_client()
+
+
+class TestPromptCaching(unittest.TestCase):
+
+    def test_long_prompt_is_marked_for_claude(self):
+        system = "x" * llm_client.LLM_PROMPT_CACHE_MIN_CHARS
+        message = llm_client.system_message(system, 'claude-sonnet-4-6')
+        self.assertEqual(message['content'][0]['text'], system)
+        self.assertEqual(message['content'][0]['cache_control'], {'type': 'ephemeral'})
+
+    def test_short_prompt_and_other_models_stay_plain(self):
+        long_prompt = "x" * llm_client.LLM_PROMPT_CACHE_MIN_CHARS
+        self.assertEqual(llm_client.system_message('short', 'claude-sonnet-4-6'),
+                         {'role': 'system', 'content': 'short'})
+        self.assertEqual(llm_client.system_message(long_prompt, 'kimi-k2-5')['content'], long_prompt)
+        with patch.object(llm_client, 'LLM_PROMPT_CACHING', False):
+            self.assertEqual(llm_client.system_message(long_prompt, 'claude-sonnet-4-6')['content'], long_prompt)
+
+    def test_summary_call_sends_cacheable_system_prompt(self):
+        client = MagicMock()
+        system = summarizer._build_enhanced_system_prompt()
+        self.assertIs(summarizer._build_enhanced_system_prompt(), system)
+        summarizer._call_venice_once(client, 'claude-sonnet-4-6', system, 'user')
+        messages = client.chat.completions.create.call_args.kwargs['messages']
+        self.assertIn('cache_control', messages[0]['content'][0])
+        self.assertEqual(messages[1], {'role': 'user', 'content': 'user'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for hedged model requests and per-model latency metrics.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import llm_client, summarizer
+
+PRIMARY = summarizer.PREFERRED_MODEL
+SECONDARY = summarizer.FALLBACK_MODEL
+
+
+def _completion(text):
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = text
+    return resp
+
+
+def _client(primary_release):
+    """Client whose preferred model blocks until ``primary_release`` is set."""
+    def create(**kwargs):
+        if kwargs['model'] == PRIMARY:
+            primary_release.wait(5)
+            return _completion('{"overview": "primary"}')
+        return _completion('{"overview": "secondary"}')
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    return client
+
+
+@patch.object(summarizer, 'SUMMARIZER_HEDGE_DEFAULT_SECONDS', 0.05)
+class TestHedgedCalls(unittest.TestCase):
+
+    def setUp(self):
+        llm_client.reset_latency_metrics()
+        summarizer._hedge_stats.update(hedged=0, hedge_wins=0)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+
+    def test_slow_preferred_model_is_hedged(self):
+        raw = summarizer._model_call_with_fallback(_client(self.release), 'sys', 'user')
+        self.assertEqual(raw, '{"overview": "secondary"}')
+        self.assertEqual(summarizer.get_hedge_stats()['hedge_wins'], 1)
+
+    def test_fast_preferred_model_is_not_hedged(self):
+        self.release.set()
+        client = _client(self.release)
+        raw = summarizer._model_call_with_fallback(client, 'sys', 'user')
+        self.assertEqual(raw, '{"overview": "primary"}')
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+        self.assertEqual(summarizer.get_hedge_stats()['hedged'], 0)
+
+    def test_hedges_are_capped_per_run(self):
+        threading.Timer(0.2, self.release.set).start()
+        client = _client(self.release)
+        with patch.object(summarizer, 'SUMMARIZER_HEDGE_MAX_PER_RUN', 0):
+            raw = summarizer._model_call_with_fallback(client, 'sys', 'user')
+        self.assertEqual(raw, '{"overview": "primary"}')
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+
+    def test_abandoned_losers_do_not_queue_later_calls(self):
+        client = _client(self.release)
+        start = time.monotonic()
+        with patch.object(summarizer, 'SUMMARIZER_HEDGE_MAX_PER_RUN', 100):
+            for _ in range(3 * summarizer.SUMMARIZER_CHUNK_WORKERS + 2):
+                raw = summarizer._model_call_with_fallback(client, 'sys', 'user')
+                self.assertEqual(raw, '{"overview": "secondary"}')
+        # Every primary is still blocked; none of them held up the next call
+        self.assertLess(time.monotonic() - start, 3)
+
+    def test_non_json_hedge_answer_waits_for_the_other(self):
+        def create(**kwargs):
+            if kwargs['model'] == PRIMARY:
+                self.release.wait(5)
+                return _completion('{"overview": "primary"}')
+            threading.Timer(0.05, self.release.set).start()
+            return _completion('not json')
+        client = MagicMock()
+        client.chat.completions.create.side_effect = create
+        self.assertEqual(summarizer._model_call_with_fallback(client, 'sys', 'user'), '{"overview": "primary"}')
+
+    def test_threshold_follows_observed_p95(self):
+        for seconds in (10, 12, 14, 16, 30):
+            llm_client.record_latency(PRIMARY, seconds)
+        with patch.object(summarizer, 'SUMMARIZER_HEDGE_MIN_SAMPLES', 5):
+            self.assertEqual(summarizer._hedge_threshold(PRIMARY), 30)
+            self.assertEqual(summarizer._hedge_threshold('unseen-model'), 0.05)
+
+
+class TestLatencyMetrics(unittest.TestCase):
+
+    def setUp(self):
+        llm_client.reset_latency_metrics()
+
+    def test_histogram_and_percentiles(self):
+        for seconds in (1, 2, 7, 15, 100):
+            llm_client.record_latency('m', seconds)
+        llm_client.record_latency('m', 3, error=True)
+        m = llm_client.get_latency_metrics()['m']
+        self.assertEqual((m['count'], m['errors']), (6, 1))
+        self.assertEqual(m['histogram']['<=5s'], 3)
+        self.assertEqual(m['histogram']['>80s'], 1)
+        self.assertEqual(m['p50_s'], 7)
+        self.assertEqual(llm_client.latency_quantile('m', 0.95), 100)
+        self.assertIsNone(llm_client.latency_quantile('m', 0.95, min_samples=10))
+
+    def test_calls_are_timed_per_model(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = _completion('x')
+        summarizer._call_venice_once(client, 'model-a', 'sys', 'user')
+        client.chat.completions.create.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            summarizer._call_venice_once(client, 'model-a', 'sys', 'user')
+        m = llm_client.get_latency_metrics()['model-a']
+        self.assertEqual((m['count'], m['errors']), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Venice AI request/token rate limiter.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import llm_rate_limit
+from src.processors.llm_rate_limit import LlmRateLimiter, RateLimitExhausted
+
+
+PATCH_CONSUME = 'src.database.db.consume_api_quota'
+
+
+class TestLlmRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = LlmRateLimiter(requests_per_minute=60, tokens_per_minute=60000)
+
+    @patch(PATCH_CONSUME, return_value=(True, 100.0))
+    def test_takes_tokens_then_one_request(self, mock_consume):
+        self.limiter.acquire(500, "daily")
+
+        (tok_name, tok_cost, tok_reserve, _, _), (req_name, req_cost, _, _, _) = \
+            [c[0] for c in mock_consume.call_args_list]
+        self.assertEqual((tok_name, tok_cost), (llm_rate_limit.TOKENS_BUCKET, 500))
+        self.assertAlmostEqual(tok_reserve, 60000 * llm_rate_limit.LLM_RATE_RESERVE_DAILY)
+        self.assertEqual((req_name, req_cost), (llm_rate_limit.REQUESTS_BUCKET, 1))
+        self.assertEqual(self.limiter.stats["acquired"], 1)
+
+    @patch('src.processors.llm_rate_limit.time.sleep')
+    @patch(PATCH_CONSUME)
+    def test_backfill_pauses_until_refilled(self, mock_consume, mock_sleep):
+        mock_consume.side_effect = [(False, 0.0), (True, 50000.0), (True, 50.0)]
+
+        self.limiter.acquire(500, "backfill")
+
+        mock_sleep.assert_called_once()
+        backfill_reserve = mock_consume.call_args_list[0][0][2]
+        self.assertAlmostEqual(backfill_reserve, 60000 * llm_rate_limit.LLM_RATE_RESERVE_BACKFILL)
+
+    @patch(PATCH_CONSUME, return_value=(False, 0.0))
+    def test_web_gives_up_after_max_wait(self, mock_consume):
+        with self.assertRaises(RateLimitExhausted):
+            self.limiter.acquire(500, "web", max_wait=0)
+        self.assertEqual(self.limiter.stats["exhausted"], 1)
+
+    @patch(PATCH_CONSUME)
+    def test_tokens_refunded_when_request_denied(self, mock_consume):
+        mock_consume.side_effect = [(True, 50000.0), (False, 0.0), (True, 50500.0)]
+
+        with self.assertRaises(RateLimitExhausted):
+            self.limiter.acquire(500, "web", max_wait=0)
+
+        refund = mock_consume.call_args_list[2][0]
+        self.assertEqual((refund[0], refund[1]), (llm_rate_limit.TOKENS_BUCKET, -500))
+
+    @patch(PATCH_CONSUME, side_effect=Exception("db down"))
+    def test_fails_open_without_db(self, mock_consume):
+        self.limiter.acquire(500, "web")  # must not raise
+
+    @patch('src.database.db.drain_api_quota', return_value=True)
+    def test_429_drains_both_buckets(self, mock_drain):
+        self.assertTrue(self.limiter.on_rate_limited())
+        drained = {c[0][0] for c in mock_drain.call_args_list}
+        self.assertEqual(drained, {llm_rate_limit.REQUESTS_BUCKET, llm_rate_limit.TOKENS_BUCKET})
+
+    @patch('src.database.db.drain_api_quota', side_effect=Exception("db down"))
+    def test_429_without_db_tells_caller_to_sleep(self, mock_drain):
+        self.assertFalse(self.limiter.on_rate_limited())
+
+
+class TestEstimateTokens(unittest.TestCase):
+
+    def test_prompt_plus_share_of_completion(self):
+        with patch.object(llm_rate_limit, 'LLM_RATE_OUTPUT_SHARE', 0.5):
+            self.assertEqual(llm_rate_limit.estimate_tokens(4000, 1000), 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
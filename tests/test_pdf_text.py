@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for capped, streaming PDF text extraction.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import fitz
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers import pdf_text
+from src.fetchers.pdf_text import extract_pdf_pages, extract_pdf_text
+from src.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+
+
+def _pdf(pages):
+    doc = fitz.open()
+    for n in range(pages):
+        doc.new_page().insert_text((72, 72), f"Section {n + 1}. The Secretary shall report annually.")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestExtractPdfPages(unittest.TestCase):
+
+    def test_reads_every_page_without_a_cap(self):
+        result = extract_pdf_pages(_pdf(3), max_chars=None)
+        self.assertEqual((result.pages_read, result.page_count, result.truncated), (3, 3, False))
+        self.assertIn('Section 3.', result.text)
+
+    def test_stops_at_character_cap(self):
+        result = extract_pdf_pages(_pdf(20), max_chars=120)
+        self.assertEqual(len(result.text), 120)
+        self.assertTrue(result.truncated)
+        self.assertLess(result.pages_read, 20)
+
+    def test_spent_budget_raises(self):
+        with self.assertRaises(DeadlineExceeded):
+            extract_pdf_pages(_pdf(2), budget_seconds=0)
+
+
+@patch.object(pdf_text, 'PDF_PROCESS_WORKERS', 0)
+class TestExtractPdfTextInProcess(unittest.TestCase):
+
+    def test_returns_text(self):
+        self.assertIn('Section 1.', extract_pdf_text(_pdf(1)))
+
+    def test_invalid_pdf_returns_empty(self):
+        self.assertEqual(extract_pdf_text(b'not a pdf'), '')
+
+    def test_expired_deadline_returns_empty(self):
+        with deadline_scope(Deadline(0)):
+            self.assertEqual(extract_pdf_text(_pdf(1)), '')
+
+
+class TestExtractPdfTextPool(unittest.TestCase):
+
+    def tearDown(self):
+        pdf_text.shutdown_pool()
+
+    @patch.object(pdf_text, 'PDF_PROCESS_WORKERS', 1)
+    def test_extracts_in_worker_process(self):
+        with deadline_scope(Deadline(60)):
+            text = extract_pdf_text(_pdf(2), max_chars=50)
+        self.assertEqual(len(text), 50)
+        self.assertIsNotNone(pdf_text._pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the publish outbox drain worker.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.publishers import publish_outbox
+from src.publishers.publish_outbox import compute_backoff, drain_publish_outbox
+from src.publishers.publisher_manager import PlatformResult, PublishResult
+
+
+def _result(**platforms):
+    return PublishResult(platforms={
+        name: PlatformResult(name, ok, url, error=None if ok else "boom")
+        for name, (ok, url) in platforms.items()
+    })
+
+
+@patch('src.publishers.publish_outbox.mark_bill_published', return_value=True)
+@patch('src.publishers.publish_outbox.fail_publish_job', return_value=True)
+@patch('src.publishers.publish_outbox.complete_publish_job', return_value=True)
+@patch('src.publishers.publish_outbox.get_bill_by_id')
+@patch('src.publishers.publish_outbox.get_publisher_manager')
+@patch('src.publishers.publish_outbox.claim_publish_jobs')
+class TestDrainPublishOutbox(unittest.TestCase):
+
+    def test_no_due_jobs(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = []
+        summary = drain_publish_outbox()
+        self.assertEqual(summary["claimed"], 0)
+        mock_mgr.return_value.publish_bill_to_all.assert_not_called()
+
+    def test_success_and_retry_are_recorded(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [
+            {"id": 1, "bill_id": "hr1-119", "platform": "bluesky", "attempts": 1},
+            {"id": 2, "bill_id": "hr1-119", "platform": "threads", "attempts": 1},
+        ]
+        mock_get_bill.return_value = {"bill_id": "hr1-119"}
+        mock_mgr.return_value.publish_bill_to_all.return_value = _result(
+            bluesky=(True, "https://bsky.app/post/1"), threads=(False, None),
+        )
+
+        summary = drain_publish_outbox()
+
+        mock_mgr.return_value.publish_bill_to_all.assert_called_once_with(
+            {"bill_id": "hr1-119"}, tweet_text=None, platforms=["bluesky", "threads"],
+        )
+        mock_complete.assert_called_once_with(1, "https://bsky.app/post/1")
+        job_id, error, delay = mock_fail.call_args[0]
+        self.assertEqual(job_id, 2)
+        self.assertIsNotNone(delay)
+        mock_update.assert_called_once_with("hr1-119")
+        self.assertEqual(summary["succeeded"], 1)
+        self.assertEqual(summary["retrying"], 1)
+        self.assertEqual(summary["published"], 1)
+
+    def test_exhausted_attempts_mark_dead(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [
+            {"id": 3, "bill_id": "s5-119", "platform": "facebook",
+             "attempts": publish_outbox.OUTBOX_MAX_ATTEMPTS},
+        ]
+        mock_get_bill.return_value = {"bill_id": "s5-119"}
+        mock_mgr.return_value.publish_bill_to_all.return_value = _result(facebook=(False, None))
+
+        summary = drain_publish_outbox()
+
+        mock_fail.assert_called_once_with(3, "boom", None)
+        mock_update.assert_not_called()
+        self.assertEqual(summary["dead"], 1)
+
+    @patch('src.publishers.publish_outbox.mark_publish_job_unknown', return_value=True)
+    def test_timeout_is_parked_unknown_not_retried(self, mock_unknown, mock_claim, mock_mgr, mock_get_bill,
+                                                   mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [{"id": 5, "bill_id": "hr2-119", "platform": "threads", "attempts": 1}]
+        mock_get_bill.return_value = {"bill_id": "hr2-119"}
+        mock_mgr.return_value.publish_bill_to_all.return_value = PublishResult(platforms={
+            "threads": PlatformResult("threads", False, error="timed out after 45s", timed_out=True),
+        })
+
+        summary = drain_publish_outbox()
+
+        mock_unknown.assert_called_once_with(5, "timed out after 45s")
+        mock_fail.assert_not_called()
+        mock_update.assert_called_once_with("hr2-119")
+        self.assertEqual(summary["unknown"], 1)
+        self.assertEqual(summary["retrying"], 0)
+
+    def test_missing_bill_is_dead_without_posting(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [{"id": 4, "bill_id": "hr9-119", "platform": "twitter", "attempts": 1}]
+        mock_get_bill.return_value = None
+
+        summary = drain_publish_outbox()
+
+        mock_mgr.return_value.publish_bill_to_all.assert_not_called()
+        mock_fail.assert_called_once_with(4, "bill not found", None)
+        self.assertEqual(summary["dead"], 1)
+
+    def test_preloaded_bill_and_tweet_text_used_for_target_bill(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [{"id": 5, "bill_id": "hr1-119", "platform": "twitter", "attempts": 1}]
+        mock_mgr.return_value.publish_bill_to_all.return_value = _result(twitter=(True, "https://x.com/t/1"))
+        bill = {"bill_id": "hr1-119", "title": "T"}
+
+        drain_publish_outbox(bill_id="hr1-119", bill=bill, tweet_text="hello")
+
+        mock_claim.assert_called_once_with(limit=publish_outbox.OUTBOX_BATCH_SIZE, bill_id="hr1-119")
+        mock_get_bill.assert_not_called()
+        mock_mgr.return_value.publish_bill_to_all.assert_called_once_with(
+            bill, tweet_text="hello", platforms=["twitter"],
+        )
+
+    def test_already_published_bill_not_counted(self, mock_claim, mock_mgr, mock_get_bill, mock_complete, mock_fail, mock_update):
+        mock_claim.return_value = [{"id": 6, "bill_id": "hr1-119", "platform": "threads", "attempts": 2}]
+        mock_get_bill.return_value = {"bill_id": "hr1-119"}
+        mock_mgr.return_value.publish_bill_to_all.return_value = _result(threads=(True, "https://threads.net/p/1"))
+        mock_update.return_value = False
+
+        summary = drain_publish_outbox()
+
+        self.assertEqual(summary["succeeded"], 1)
+        self.assertEqual(summary["published"], 0)
+        self.assertEqual(summary["already_published"], 1)
+
+
+class TestSimulateMode(unittest.TestCase):
+
+    @patch('src.database.db.db_connect')
+    def test_claim_is_read_only(self, mock_connect):
+        from src.database import db
+        with patch.object(db, '_SIMULATE', True):
+            self.assertEqual(db.claim_publish_jobs(limit=5), [])
+            self.assertEqual(db.cancel_publish_jobs("hr1-119", "test"), 0)
+        mock_connect.assert_not_called()
+
+
+class TestComputeBackoff(unittest.TestCase):
+
+    def test_exponential_with_cap(self):
+        with patch('src.publishers.publish_outbox.random.uniform', return_value=1.0):
+            base = publish_outbox.OUTBOX_BACKOFF_BASE_SECONDS
+            self.assertEqual(compute_backoff(1), base)
+            self.assertEqual(compute_backoff(3), base * 4)
+            self.assertEqual(compute_backoff(50), publish_outbox.OUTBOX_BACKOFF_MAX_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
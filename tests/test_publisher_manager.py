@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent multi-platform publishing in PublisherManager.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.publishers.publisher_manager import (
+    PlatformResult,
+    PublisherManager,
+    PublishResult,
+)
+
+
+def _fake_publisher(name, result=(True, None), delay=0.0, exc=None):
+    pub = MagicMock()
+    pub.platform_name = name
+
+    def _publish(bill):
+        if delay:
+            time.sleep(delay)
+        if exc:
+            raise exc
+        return result
+
+    pub.publish_bill.side_effect = _publish
+    return pub
+
+
+def _manager(publishers, twitter=False):
+    with patch.object(PublisherManager, '_load_publishers'):
+        manager = PublisherManager()
+    manager.publishers = publishers
+    manager._twitter_configured = twitter
+    return manager
+
+
+class TestPublishBillToAll(unittest.TestCase):
+
+    def test_platforms_run_concurrently(self):
+        pubs = [_fake_publisher(n, (True, f"https://{n}/1"), delay=0.3)
+                for n in ("bluesky", "threads", "facebook")]
+        manager = _manager(pubs)
+
+        start = time.monotonic()
+        result = manager.publish_bill_to_all({"bill_id": "hr1-119"})
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.8)
+        self.assertTrue(result.any_posted)
+        self.assertEqual(sorted(result.succeeded), ["bluesky", "facebook", "threads"])
+
+    def test_timeout_does_not_block_other_platforms(self):
+        release = threading.Event()
+        hung = _fake_publisher("threads")
+        hung.publish_bill.side_effect = lambda bill: (release.wait(5), (True, "late"))[1]
+        ok = _fake_publisher("bluesky", (True, "https://bsky.app/post/1"))
+        manager = _manager([hung, ok])
+
+        try:
+            with patch.dict(os.environ, {"PUBLISH_TIMEOUT_THREADS_SECONDS": "0.2"}):
+                start = time.monotonic()
+                result = manager.publish_bill_to_all({"bill_id": "hr1-119"})
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 2.0)
+        self.assertTrue(result["threads"].timed_out)
+        self.assertFalse(result["threads"].success)
+        self.assertEqual(result.unknown, ["threads"])
+        self.assertEqual(result.failed, [])
+        self.assertTrue(result["bluesky"].success)
+        self.assertEqual(result.primary_url, "https://bsky.app/post/1")
+
+    def test_exception_is_isolated(self):
+        bad = _fake_publisher("bluesky", exc=RuntimeError("boom"))
+        good = _fake_publisher("facebook", (True, "https://facebook.com/1"))
+        result = _manager([bad, good]).publish_bill_to_all({})
+
+        self.assertFalse(result["bluesky"].success)
+        self.assertIn("boom", result["bluesky"].error)
+        self.assertTrue(result["facebook"].success)
+
+    @patch('src.publishers.twitter_publisher.post_tweet', return_value=(True, "https://x.com/t/1"))
+    def test_twitter_url_preferred_and_pre_formatted_text_used(self, mock_post):
+        other = _fake_publisher("bluesky", (True, "https://bsky.app/post/1"))
+        manager = _manager([other], twitter=True)
+
+        result = manager.publish_bill_to_all({"bill_id": "hr1-119"}, tweet_text="hello")
+
+        mock_post.assert_called_once_with("hello")
+        self.assertEqual(result.primary_url, "https://x.com/t/1")
+
+    def test_result_unpacks_like_legacy_tuple(self):
+        success, url = PlatformResult("bluesky", True, "u")
+        self.assertTrue(success)
+        self.assertEqual(url, "u")
+
+        empty = PublishResult()
+        self.assertFalse(empty.any_posted)
+        self.assertIsNone(empty.primary_url)
+
+
+if __name__ == '__main__':
+    unittest.main()
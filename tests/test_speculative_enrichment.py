@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for speculative Phase 3 enrichment (SpeculativeEnricher).
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.orchestrator import SpeculativeEnricher
+
+
+class TestSpeculativeEnricher(unittest.TestCase):
+
+    @patch('src.orchestrator.enrich_single_bill')
+    def test_yields_in_candidate_order(self, mock_enrich):
+        mock_enrich.side_effect = lambda bid, deadline=None: {"bill_id": bid}
+
+        results = [bid for bid, _ in SpeculativeEnricher(["a-119", "b-119", "c-119"], ahead=2, timeout=5)]
+
+        self.assertEqual(results, ["a-119", "b-119", "c-119"])
+
+    @patch('src.orchestrator.enrich_single_bill')
+    def test_enriches_ahead_while_caller_works(self, mock_enrich):
+        started = []
+        lock = threading.Lock()
+
+        def enrich(bid, deadline=None):
+            with lock:
+                started.append(bid)
+            return {"bill_id": bid}
+        mock_enrich.side_effect = enrich
+
+        enricher = SpeculativeEnricher(["a-119", "b-119", "c-119", "d-119"], ahead=2, timeout=5)
+        first_bid, _ = next(iter(enricher))
+        time.sleep(0.1)
+
+        self.assertEqual(first_bid, "a-119")
+        # a (consumed) plus the next three: b, c already started, d topped up
+        self.assertEqual(sorted(started), ["a-119", "b-119", "c-119", "d-119"])
+
+        surplus = enricher.drain_surplus()
+        self.assertEqual([bid for bid, _ in surplus], ["b-119", "c-119", "d-119"])
+
+    @patch('src.orchestrator.enrich_single_bill')
+    def test_timeout_and_failures_yield_none(self, mock_enrich):
+        def enrich(bid, deadline=None):
+            if bid == "slow-119":
+                time.sleep(0.5)
+            if bid == "bad-119":
+                raise RuntimeError("boom")
+            return {"bill_id": bid}
+        mock_enrich.side_effect = enrich
+
+        results = dict(SpeculativeEnricher(["slow-119", "bad-119", "ok-119"], ahead=1, timeout=0.1))
+
+        self.assertIsNone(results["slow-119"])
+        self.assertIsNone(results["bad-119"])
+        self.assertEqual(results["ok-119"], {"bill_id": "ok-119"})
+
+    @patch('src.orchestrator.enrich_single_bill')
+    def test_deadline_stops_new_enrichments(self, mock_enrich):
+        mock_enrich.side_effect = lambda bid, deadline=None: {"bill_id": bid}
+
+        results = list(SpeculativeEnricher(["a-119", "b-119"], ahead=2, timeout=5, deadline=time.time() - 1))
+
+        self.assertEqual(results, [])
+        mock_enrich.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental status refresh of published bills.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers import congress_cache
+from src.fetchers.bill_updates import BillUpdates
+from src.status_refresh import refresh_published_statuses
+
+INTRODUCED = [{'actionDate': '2025-01-03', 'text': 'Introduced in House'}]
+BECAME_LAW = INTRODUCED + [{'actionDate': '2025-06-01', 'text': 'Became Public Law No: 119-12.'}]
+
+
+def _updates(*bill_ids):
+    bills = [{'type': b.split('-')[0].rstrip('0123456789').upper(),
+              'number': ''.join(c for c in b.split('-')[0] if c.isdigit()),
+              'congress': 119, 'updateDate': '2025-06-02T00:00:00Z'} for b in bill_ids]
+    return BillUpdates(name='status_refresh_119', since=datetime(2025, 6, 1, tzinfo=timezone.utc), bills=bills,
+                       high_water=datetime(2025, 6, 2, tzinfo=timezone.utc))
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test-key'})
+@patch('src.status_refresh.congress_quota.set_default_priority')
+@patch('src.status_refresh.invalidate_bill_cache')
+@patch('src.status_refresh.commit_bill_updates')
+@patch('src.status_refresh.bulk_update_bill_statuses')
+@patch('src.status_refresh.get_published_bill_statuses')
+@patch('src.status_refresh.fetch_bill_actions_from_api')
+@patch('src.status_refresh.fetch_bill_updates')
+class TestRefreshPublishedStatuses(unittest.TestCase):
+
+    def test_only_changed_published_statuses_are_written(self, updates, actions, current, bulk_update, commit, invalidate, _prio):
+        updates.return_value = _updates('hr1-119', 'hr2-119', 'hr3-119')
+        # hr3 isn't published, so it's never looked at
+        current.return_value = {'hr1-119': ('Introduced', 'introduced'), 'hr2-119': ('Introduced', 'introduced')}
+        actions.side_effect = lambda congress, bill_type, number, key: BECAME_LAW if number == '1' else INTRODUCED
+        bulk_update.side_effect = len
+
+        stats = refresh_published_statuses('119', workers=2)
+
+        changes = bulk_update.call_args.args[0]
+        self.assertEqual([c[0] for c in changes], ['hr1-119'])
+        self.assertEqual(changes[0][2], 'became_law')
+        self.assertEqual(sorted(c.args[0] for c in invalidate.call_args_list), ['hr1-119', 'hr2-119'])
+        commit.assert_called_once()
+        self.assertEqual((stats['changed'], stats['published'], stats['updated']), (3, 2, 1))
+
+    def test_failed_fetch_keeps_watermark(self, updates, actions, current, bulk_update, commit, _inv, _prio):
+        updates.return_value = _updates('hr1-119', 'hr2-119')
+        current.return_value = {'hr1-119': ('Introduced', 'introduced'), 'hr2-119': ('Introduced', 'introduced')}
+        actions.side_effect = [BECAME_LAW, requests.ConnectionError('boom')]
+        bulk_update.side_effect = len
+
+        stats = refresh_published_statuses('119', workers=1)
+
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(stats['updated'], 1)
+        commit.assert_not_called()
+
+    def test_dry_run_writes_nothing(self, updates, actions, current, bulk_update, commit, _inv, _prio):
+        updates.return_value = _updates('hr1-119')
+        current.return_value = {'hr1-119': ('Introduced', 'introduced')}
+        actions.return_value = BECAME_LAW
+
+        refresh_published_statuses('119', dry_run=True)
+
+        bulk_update.assert_not_called()
+        commit.assert_not_called()
+
+
+class TestInvalidate(unittest.TestCase):
+
+    def test_invalidate_drops_entry_regardless_of_api_key(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(congress_cache, 'CONGRESS_CACHE_ENABLED', True), \
+                patch.object(congress_cache, '_cache', congress_cache.ResponseCache(directory=tmp)):
+            resp = MagicMock(status_code=200, content=b'{}', encoding='utf-8', headers={})
+            with patch('src.fetchers.congress_cache.http.get', return_value=resp) as get:
+                url = 'https://api.congress.gov/v3/bill/119/hr/1/actions?format=json'
+                congress_cache.cached_get(url + '&api_key=secret')
+                self.assertTrue(congress_cache.invalidate(url))
+                self.assertFalse(congress_cache.invalidate(url))
+                congress_cache.cached_get(url + '&api_key=secret')
+                self.assertEqual(get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for section-aware chunking and map-reduce summarization of large bills.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.processors import summarizer
+from src.processors.summarizer import _split_bill_text, _summarize_large_bill_in_chunks
+
+
+def _bill_text(sections, body_chars):
+    return "An Act\n" + "".join(f"SEC. {n}. Heading {n}.\n" + ("x" * (body_chars - 1)) + "\n"
+                                for n in range(1, sections + 1))
+
+
+class TestSplitBillText(unittest.TestCase):
+
+    def test_chunks_start_on_section_boundaries(self):
+        text = _bill_text(12, 3000)
+        chunks = _split_bill_text(text, max_tokens=2500)  # 10k chars: three sections each
+        self.assertEqual(''.join(chunks), text)
+        self.assertTrue(all(len(c) <= 10000 for c in chunks))
+        self.assertTrue(all(c.startswith('SEC. ') for c in chunks[1:]))
+
+    def test_oversized_section_is_split_on_lines(self):
+        text = "SEC. 1. Huge.\n" + ("line of text\n" * 2000)
+        chunks = _split_bill_text(text, max_tokens=1000)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), text)
+        self.assertTrue(all(c.endswith('\n') for c in chunks))
+
+    def test_title_and_division_headings_are_boundaries(self):
+        text = "DIVISION A—X\n" + "a" * 5000 + "\nTITLE II—Y\n" + "b" * 5000
+        chunks = _split_bill_text(text, max_tokens=1500)
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(chunks[1].startswith('TITLE II'))
+
+
+def _reply(overview):
+    return json.dumps({"overview": overview, "detailed": "d", "tweet": "t", "subject_tags": "education"})
+
+
+class TestMapReduce(unittest.TestCase):
+
+    @patch.object(summarizer, 'SUMMARIZER_CHUNK_WORKERS', 4)
+    @patch.object(summarizer, 'SUMMARIZER_CHUNK_TOKENS', 2500)
+    def test_chunks_are_summarized_concurrently(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def call(client, system, user, response_format=None, expect=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _reply("part" if "This is part" in user else "final")
+
+        bill = {"bill_id": "hr1-119", "title": "Big Act", "full_text": _bill_text(12, 3000)}
+        with patch.object(summarizer, '_model_call_with_fallback', side_effect=call) as model:
+            result = _summarize_large_bill_in_chunks(MagicMock(), bill, "system")
+
+        self.assertEqual(result["overview"], "final")
+        self.assertEqual(model.call_count, 5)  # 4 chunks + final synthesis
+        self.assertGreater(peak[0], 1)
+        final_prompt = model.call_args_list[-1].args[2]
+        self.assertIn("Part 4 of 4 overview:\\npart", final_prompt)
+
+    @patch.object(summarizer, 'SUMMARIZER_CHUNK_TOKENS', 2500)
+    @patch.object(summarizer, 'SUMMARIZER_REDUCE_MAX_TOKENS', 120)
+    def test_oversized_partials_are_reduced_hierarchically(self):
+        def call(client, system, user, response_format=None, expect=None):
+            if "This is part" in user:
+                return _reply("p" * 100)
+            if "partial summaries (group" in user:
+                return _reply("merged")
+            return _reply("final")
+
+        bill = {"bill_id": "hr1-119", "title": "Big Act", "full_text": _bill_text(12, 3000)}
+        with patch.object(summarizer, '_model_call_with_fallback', side_effect=call) as model:
+            result = _summarize_large_bill_in_chunks(MagicMock(), bill, "system")
+
+        prompts = [c.args[2] for c in model.call_args_list]
+        self.assertEqual(sum("partial summaries (group" in p for p in prompts), 2)
+        self.assertIn("Combined group 1 of 2 overview:\\nmerged", prompts[-1])
+        self.assertEqual(result["overview"], "final")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for API-first tracker resolution (resolve_bill_tracker).
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fetchers import congress_fetcher
+from src.fetchers.congress_fetcher import classify_latest_action, resolve_bill_tracker
+
+URL = "https://www.congress.gov/bill/119th-congress/house-bill/1"
+
+INTRODUCED = [{"actionDate": "2025-01-03", "text": "Introduced in House"},
+              {"actionDate": "2025-01-03", "text": "Referred to the House Committee on Ways and Means."}]
+PASSED_HOUSE = INTRODUCED + [{"actionDate": "2025-02-10", "text": "Passed/agreed to in House: On passage Passed by recorded vote."},
+                             {"actionDate": "2025-02-11", "text": "Received in the Senate."}]
+
+
+def _selected(tracker):
+    return [s["name"] for s in tracker if s["selected"]][-1]
+
+
+@patch('src.fetchers.congress_fetcher.TRACKER_SOURCE_MODE', 'api_first')
+@patch('src.fetchers.congress_fetcher.scrape_bill_tracker')
+class TestResolveBillTracker(unittest.TestCase):
+
+    def setUp(self):
+        for key in congress_fetcher._tracker_stats:
+            congress_fetcher._tracker_stats[key] = 0
+
+    def test_unambiguous_latest_action_skips_browser(self, mock_scrape):
+        tracker = resolve_bill_tracker(PASSED_HOUSE, source_url=URL)
+
+        mock_scrape.assert_not_called()
+        self.assertEqual(_selected(tracker), "Passed House")
+        self.assertEqual(congress_fetcher.get_tracker_agreement_stats()["api_trusted"], 1)
+
+    def test_ambiguous_latest_action_scrapes(self, mock_scrape):
+        mock_scrape.return_value = [{"name": "Introduced", "selected": True}]
+        actions = INTRODUCED + [{"actionDate": "2025-03-01", "text": "Placed on the Union Calendar, Calendar No. 12."}]
+
+        tracker = resolve_bill_tracker(actions, source_url=URL)
+
+        mock_scrape.assert_called_once_with(URL, force_scrape=True)
+        self.assertIs(tracker, mock_scrape.return_value)
+        stats = congress_fetcher.get_tracker_agreement_stats()
+        self.assertEqual((stats["ambiguous"], stats["scrape_agreed"]), (1, 1))
+
+    def test_feed_text_version_contradiction_scrapes(self, mock_scrape):
+        mock_scrape.return_value = [{"name": "Passed House", "selected": True},
+                                    {"name": "Passed Senate", "selected": True}]
+
+        resolve_bill_tracker(PASSED_HOUSE, source_url=URL, text_version="enr")
+
+        mock_scrape.assert_called_once()
+        stats = congress_fetcher.get_tracker_agreement_stats()
+        self.assertEqual((stats["contradiction"], stats["scrape_disagreed"]), (1, 1))
+
+    def test_failed_scrape_falls_back_to_api(self, mock_scrape):
+        mock_scrape.return_value = None
+
+        tracker = resolve_bill_tracker(INTRODUCED + [{"actionDate": "2025-04-01", "text": "Vetoed by President."}],
+                                       source_url=URL)
+
+        self.assertEqual(_selected(tracker), "Introduced")
+        self.assertEqual(congress_fetcher.get_tracker_agreement_stats()["scrape_failed"], 1)
+
+    def test_api_only_mode_never_scrapes(self, mock_scrape):
+        with patch('src.fetchers.congress_fetcher.TRACKER_SOURCE_MODE', 'api_only'):
+            resolve_bill_tracker(INTRODUCED + [{"actionDate": "2025-03-01", "text": "Reported by the Committee."}],
+                                 source_url=URL)
+
+        mock_scrape.assert_not_called()
+
+
+@patch.dict(os.environ, {'CONGRESS_API_KEY': 'test'})
+class TestFetchAndEnrichBills(unittest.TestCase):
+
+    @patch('src.fetchers.congress_fetcher.TRACKER_SOURCE_MODE', 'api_first')
+    @patch('src.fetchers.congress_fetcher.fetch_bill_text_from_api', return_value=('x' * 200, 'txt'))
+    @patch('src.fetchers.congress_fetcher.fetch_bill_details_from_api')
+    @patch('src.fetchers.congress_fetcher.fetch_bill_actions_from_api', return_value=INTRODUCED)
+    @patch('src.fetchers.feed_parser.cached_get')
+    @patch('src.fetchers.feed_parser.fetch_bill_ids_from_texts_received_today', return_value=['hr1-119'])
+    def test_reuses_fetched_details(self, _ids, mock_get, mock_actions, mock_details, _text):
+        from src.fetchers.feed_parser import fetch_and_enrich_bills
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {'bill': {
+            'type': 'HR', 'number': '1', 'congress': 119, 'title': 'A bill',
+            'introducedDate': '2025-01-03',
+            'latestAction': {'actionDate': '2025-01-03', 'text': 'Referred to the House Committee on Ways and Means.'},
+        }}
+
+        bills = fetch_and_enrich_bills(limit=1)
+
+        self.assertEqual(_selected(bills[0]['tracker']), 'Introduced')
+        mock_actions.assert_called_once()
+        mock_details.assert_not_called()
+        self.assertEqual(mock_get.call_count, 1)
+
+
+class TestClassifyLatestAction(unittest.TestCase):
+
+    def test_classification(self):
+        self.assertEqual(classify_latest_action("Became Public Law No: 119-1."), "Became Law")
+        self.assertEqual(classify_latest_action("Presented to President."), "To President")
+        self.assertEqual(classify_latest_action("Received in the Senate."), "Passed House")
+        self.assertEqual(classify_latest_action("Referred to the Committee on Finance."), "Introduced")
+        self.assertIsNone(classify_latest_action("Vetoed by President."))
+        self.assertIsNone(classify_latest_action(""))
+
+
+if __name__ == '__main__':
+    unittest.main()